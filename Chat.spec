@@ -54,7 +54,7 @@ a = Analysis(
         get_samplerate_binary(),
     ],
     datas=[('./src', '.'), (str(Path(pysilero_vad.__file__).resolve().parent / 'models' / 'silero_vad.onnx'), './pysilero_vad/models')],
-    hiddenimports=['comtypes.stream', 'audiostretchy.stretch', 'audiostretchy.interface.tdhs', 'samplerate'],
+    hiddenimports=['comtypes.stream', 'audiostretchy.stretch', 'audiostretchy.interface.tdhs', 'samplerate', 'faster_whisper'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,65 @@
+import argparse
+import copy
+from time import perf_counter
+from typing import Any, cast
+
+import numpy as np
+
+from lib.Config import CharacterTTSPostprocessingConfig, get_default_character_tts_postprocessing
+from lib.TTS import TTS
+
+SAMPLE_RATE = 24_000
+CHUNK_SAMPLES = 1024
+EFFECTS = ['lowpass', 'highpass', 'distortion', 'chorus', 'reverb', 'glitch']
+
+
+def make_speech_like_signal(seconds: float) -> bytes:
+    """A voiced tone with harmonics and a syllable-rate envelope, plus some noise, as 16-bit PCM."""
+    rng = np.random.default_rng(0)
+    time_axis = np.arange(int(seconds * SAMPLE_RATE), dtype=np.float64) / SAMPLE_RATE
+    pitch = 140.0 + 25.0 * np.sin(2 * np.pi * 0.7 * time_axis)
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    voiced = sum(np.sin(harmonic * phase) / harmonic for harmonic in range(1, 12))
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4.0 * time_axis) ** 2
+    signal = 0.25 * voiced * envelope + 0.02 * rng.standard_normal(time_axis.shape[0])
+    return (np.clip(signal, -1.0, 1.0) * 32767.0).astype(np.int16).tobytes()
+
+
+def make_config(effect: str | None) -> CharacterTTSPostprocessingConfig:
+    config = copy.deepcopy(get_default_character_tts_postprocessing())
+    if effect:
+        # the effect is picked by name on the command line, so it is looked up dynamically
+        effects = cast(dict[str, dict[str, Any]], config.get('effects', {}))
+        effects[effect]['enabled'] = True
+    return config
+
+
+def measure(tts: TTS, pcm: bytes, effect: str | None, repeats: int) -> float:
+    """Returns the best processing time over `repeats` runs, feeding the audio in playback-sized chunks."""
+    chunk_bytes = CHUNK_SAMPLES * 2
+    best = float('inf')
+    for _ in range(repeats):
+        chunks = (pcm[start:start + chunk_bytes] for start in range(0, len(pcm), chunk_bytes))
+        start_time = perf_counter()
+        for _ in tts._postprocess_audio(chunks, make_config(effect)):
+            pass
+        best = min(best, perf_counter() - start_time)
+    return best
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measures the real-time factor of each TTS post-processing effect.')
+    parser.add_argument('--seconds', type=float, default=10.0, help='length of the synthetic speech signal')
+    parser.add_argument('--repeats', type=int, default=3, help='runs per effect, the fastest one is reported')
+    args = parser.parse_args()
+
+    tts = TTS(None)
+    pcm = make_speech_like_signal(args.seconds)
+    baseline = measure(tts, pcm, None, args.repeats)
+
+    # real-time factor: processing time / audio duration, must stay well below 1.0 to avoid playback underflows
+    print(f'{"effect":<12} {"seconds":>10} {"rtf":>10} {"effect rtf":>12}')
+    print(f'{"none":<12} {baseline:>10.4f} {baseline / args.seconds:>10.5f} {"-":>12}')
+    for effect in EFFECTS:
+        elapsed = measure(tts, pcm, effect, args.repeats)
+        print(f'{effect:<12} {elapsed:>10.4f} {elapsed / args.seconds:>10.5f} {max(0.0, elapsed - baseline) / args.seconds:>12.5f}')
@@ -1,4 +1,3 @@
-import copy
 import sys
 from time import sleep
 from typing import Any, cast, final
@@ -30,6 +29,7 @@ from lib.PluginHelper import PluginHelper
 from lib.Config import (
     Config,
     assign_ptt,
+    get_cn_appdata_path,
     get_ed_appdata_path,
     get_ed_journals_path,
     get_system_info,
@@ -44,6 +44,7 @@ from lib.Config import (
 )
 from lib.PluginManager import PluginManager
 from lib.ActionManager import ActionManager
+from lib.SemanticActionCache import SemanticActionCache
 
 
 def parse_plugin_provider(provider: str) -> tuple[str, str] | None:
@@ -81,13 +82,15 @@ from lib.Projections import registerProjections
 from lib.PromptGenerator import PromptGenerator
 from lib.STT import STT
 from lib.TTS import TTS
+from lib.TTSCache import TTSCache
 from lib.StatusParser import StatusParser
 from lib.EDJournal import *
 from lib.EventManager import EventManager
-from lib.UI import send_message, emit_message
+from lib.UI import make_json_patch, send_message, emit_message
 from lib.QuestCatalogManager import QuestCatalogManager
 from lib.SystemDatabase import SystemDatabase
-from lib.Database import ModelUsageStore, QuestDatabase, VectorStore
+from lib.EventBus import EventBus
+from lib.Database import KeyValueStore, ModelUsageStore, QuestDatabase, VectorStore, close_connections
 from lib.Assistant import Assistant
 
 
@@ -168,8 +171,15 @@ class Chat:
         except Exception:
             self.action_manager.set_allowed_actions({})
 
+        # journal, status, STT, TTS and event manager all wake up the main loop through this bus
+        self.event_bus = EventBus()
+
         log("debug", "Initializing EDJournal...")
-        self.jn = EDJournal(get_ed_journals_path(config))
+        self.jn = EDJournal(
+            get_ed_journals_path(config),
+            index_store=KeyValueStore("journal_index"),
+            event_bus=self.event_bus,
+        )
 
         # gets API Key from config.json
         # LLM model - check for plugin provider
@@ -237,6 +247,14 @@ class Chat:
                 embedding_provider, self.config, "embedding"
             )
 
+        if self.embeddingModel and self.config.get("use_semantic_action_cache_var"):
+            self.action_manager.set_semantic_cache(
+                SemanticActionCache(
+                    self.embeddingModel,
+                    float(self.config.get("semantic_action_cache_threshold", 0.92)),
+                )
+            )
+
         # vision
         self.visionModel: LLMModel | None = None
         if self.config["vision_var"]:
@@ -310,11 +328,15 @@ class Chat:
             output_volume_multiplier=float(
                 self.config.get("output_volume_multiplier", 1.0)
             ),
+            event_bus=self.event_bus,
+            cache=TTSCache(os.path.join(get_cn_appdata_path(), "tts_cache")),
         )
         self.stt = STT(
             stt_model=self.sttModel,
             input_device_name=self.config["input_device_name"],
             required_word=self.config["stt_required_word"],
+            event_bus=self.event_bus,
+            streaming=bool(self.sttModel and self.sttModel.supports_streaming),
         )
 
         log("debug", "Initializing SystemDatabase...")
@@ -329,7 +351,7 @@ class Chat:
             prefer_primary_bindings=self.config.get("prefer_primary_bindings", False),
         )
         log("debug", "Initializing status parser...")
-        self.status_parser = StatusParser(get_ed_journals_path(config))
+        self.status_parser = StatusParser(get_ed_journals_path(config), event_bus=self.event_bus)
         log("debug", "Initializing prompt generator...")
         self.prompt_generator = PromptGenerator(
             self.config["commander_name"],
@@ -338,12 +360,18 @@ class Chat:
             system_db=self.system_database,
             weapon_types=cast(list[dict], self.config.get("weapon_types", [])),
             disabled_game_events=disabled_events,
+            cache_friendly_layout=bool(self.config.get("cache_friendly_prompt_var", False)),
         )
 
         log("debug", "Initializing event manager...")
         self.event_manager = EventManager(
             game_events=self.enabled_game_events,
+            event_bus=self.event_bus,
         )
+        self.prompt_generator.set_projection_revisions(self.event_manager.get_projection_revisions)
+        # the journal read position is only persisted once the events behind it are stored
+        self.event_manager.register_commit_hook(self._commit_journal_position)
+        self.event_manager.set_history_loader(self.jn.read_skipped_history)
 
         log("debug", message="Initializing assistant...")
         self.assistant = Assistant(
@@ -381,25 +409,57 @@ class Chat:
         )
         log("debug", "Plugin helper is ready...")
 
-        self.previous_states = {}
+        # projection states as last sent to the UI, changes are detected by revision and sent as JSON patches
+        self.sent_state_revisions: dict[str, int] = {}
+        self.sent_states: dict[str, dict[str, Any]] = {}
+
+    def reset_sent_states(self):
+        self.sent_state_revisions = {}
+        self.sent_states = {}
 
     def emit_runtime_state(self):
-        _, projected_states = self.event_manager.get_current_state()
+        revisions, states = self.event_manager.get_projection_snapshot()
         emit_message("running_config", config=self.config)
         emit_message("system", system=get_system_info())
-        emit_message("states", states=projected_states)
-        self.previous_states = copy.deepcopy(projected_states)
+        emit_message("states", states=states)
+        self.sent_state_revisions = revisions
+        self.sent_states = states
+
+    def emit_state_changes(self):
+        full_states: dict[str, dict[str, Any]] = {}
+        patches: dict[str, list[dict[str, Any]]] = {}
+        for key, revision in self.event_manager.get_projection_revisions().items():
+            if self.sent_state_revisions.get(key) == revision:
+                continue
+            state = self.event_manager.get_projection_state_dump(key)
+            if state is None:
+                continue
+            previous_state = self.sent_states.get(key)
+            if previous_state is None:
+                full_states[key] = state
+            else:
+                patch = make_json_patch(previous_state, state)
+                if patch:
+                    patches[key] = patch
+            self.sent_state_revisions[key] = revision
+            self.sent_states[key] = state
+        if full_states:
+            send_message(
+                {
+                    "type": "states",
+                    "states": full_states,
+                }
+            )
+        if patches:
+            send_message(
+                {
+                    "type": "states_patch",
+                    "patches": patches,
+                }
+            )
 
     def on_event(self, event: Event, projected_states: dict[str, Any]):
-        for key, value in projected_states.items():
-            if self.previous_states.get(key, None) != value:
-                send_message(
-                    {
-                        "type": "states",
-                        "states": {key: value},
-                    }
-                )
-        self.previous_states = copy.deepcopy(projected_states)
+        self.emit_state_changes()
         send_message(
             {
                 "type": "event",
@@ -795,6 +855,9 @@ class Chat:
             self.character.get("idle_timeout_var", 300),
             self.character.get("bounty_scanned_min_bounty_var", 1),
         )
+        # historic events up to the stored history only live in the projection states now
+        self.event_manager.save_projections(force=True)
+        self.jn.commit_position(self.event_manager.max_history_id)
 
         self.event_manager.process()
 
@@ -843,6 +906,13 @@ class Chat:
         self.plugin_manager.on_chat_start(self.plugin_helper)
         show_chat_message("info", "Plugins ready.")
 
+        # Synthesize recurring lines up front, so they play without waiting for the TTS provider
+        prewarm_lines: list[tuple[str, str | None]] = [
+            (description, None) for description in self.action_manager.get_known_action_descs()
+        ]
+        prewarm_lines.extend(self.assistant.get_quest_npc_lines())
+        self.tts.prewarm_cache(prewarm_lines)
+
         # Cue the user that we're ready to go.
         show_chat_message("info", "System Ready.")
 
@@ -869,11 +939,19 @@ class Chat:
                     if self.tts.get_is_playing():
                         log("debug", "interrupting TTS")
                         self.tts.abort()
-                else:
+                elif self.listening:
                     self.listening = False
+                    # the phrase ended, its partials are superseded by the final transcription
+                    while not self.stt.partialQueue.empty():
+                        self.stt.partialQueue.get()
+                    emit_message("stt_partial", text="")
+
+                # show what the user is saying while they are still speaking
+                while not self.stt.partialQueue.empty():
+                    emit_message("stt_partial", text=self.stt.partialQueue.get())
 
                 # check STT result queue
-                if not self.stt.resultQueue.empty():
+                while not self.stt.resultQueue.empty():
                     text = self.stt.resultQueue.get().text
                     self.tts.abort()
                     self.event_manager.add_conversation_event("user", text)
@@ -894,20 +972,33 @@ class Chat:
                     _events, projected_states = self.event_manager.get_current_state()
                     self.assistant.reply(projected_states)
 
-                # Infinite loops are bad for processors, must sleep.
-                sleep(0.1)
+                # Block until a producer has new work, the timeout only guards against missed notifications.
+                self.event_bus.wait(timeout=1.0)
             except KeyboardInterrupt:
                 break
             except Exception as e:
                 log("error", e, traceback.format_exc())
                 break
 
+        # Persist projection states that are still waiting for the next flush
+        self.event_manager.save_projections(force=True)
+        close_connections()
+
         # Teardown TTS
         self.tts.quit()
 
         # Execute plugin chat stop hooks
         self.plugin_manager.on_chat_stop(self.plugin_helper)
 
+    def _commit_journal_position(self, events: list[Event]):
+        event_ids: list[str] = []
+        for event in events:
+            event_id = event.content.get("id") if isinstance(event, GameEvent) else None
+            if isinstance(event_id, str):
+                event_ids.append(event_id)
+        if event_ids:
+            self.jn.commit_position(max(event_ids))
+
     def web_search(self, query: str):
         """Perform a web search using the assistant's action manager"""
         _, projected_states = self.event_manager.get_current_state()
@@ -1056,7 +1147,7 @@ def read_stdin(chat: Chat):
             if data.get("type") == "reset_state_machine":
                 chat.event_manager.reset_state_machine()
                 chat.assistant.reset_runtime_state()
-                chat.previous_states = {}
+                chat.reset_sent_states()
                 emit_message("history_cleared", scope="state_machine")
             if data.get("type") == "delete_current_logbook":
                 try:
@@ -2,16 +2,20 @@ from hashlib import md5
 from collections.abc import Iterator
 import json
 import random
-from typing import Any, Callable, Literal
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
 from openai.types.chat import ChatCompletionMessageFunctionToolCall
 from pydantic import BaseModel
 
 
-from .Database import KeyValueStore
+from .Database import KeyValueStore, release_connection
 from .Logger import log
 import traceback
 
+if TYPE_CHECKING:
+    from .SemanticActionCache import SemanticActionCache
+
 # Type alias for projected states dictionary
 ProjectedStates = dict[str, BaseModel]
 
@@ -22,23 +26,58 @@ class ActionManager:
         """clear action cache"""
         action_cache: KeyValueStore = KeyValueStore("action_cache")
         action_cache.delete_all()
+        ActionManager.action_cache_generation += 1
     
     actions = {}
+    # bumped whenever the stored action cache is cleared, so the in-memory indexes know to reload
+    action_cache_generation = 0
+    # bumped whenever an action is registered, so the memoized tool lists know to rebuild
+    actions_revision = 0
 
     def __init__(self):
         self.action_cache = KeyValueStore("action_cache")
         self.allowed_actions: dict[str, bool] = {}
+        # cleaned user input -> (cache key, function) of confirmed cache entries for the registered tool schemas
+        self._confirmed_index: dict[str, list[tuple[str, dict]]] | None = None
+        self._confirmed_index_generation = ActionManager.action_cache_generation
+        self.semantic_cache: 'SemanticActionCache | None' = None
+        # a rephrased command only reuses a cached action if no other action is (almost) as similar
+        self.semantic_ambiguity_margin = 0.02
+        # (mode, flags, permissions, in_station) -> tool list, the same list object is handed out for every request
+        # so the serialized tools block stays byte-identical and the provider's prompt cache keeps matching
+        self._tool_lists: dict[tuple, list[dict]] = {}
+        self._tool_lists_revision = ActionManager.actions_revision
+        self._tool_lists_actions = self.actions
+
+    def set_semantic_cache(self, semantic_cache: 'SemanticActionCache | None'):
+        """Match rephrased user input against the confirmed cache entries by embedding similarity"""
+        self.semantic_cache = semantic_cache
+        self._confirmed_index = None
 
     def set_allowed_actions(self, allowed_actions: dict[str, bool] | None):
         """Set enabled states by permission key. Missing keys are disabled."""
         self.allowed_actions = allowed_actions if isinstance(allowed_actions, dict) else {}
+        self._tool_lists = {}
 
     def getToolsList(self, active_mode: str, uses_actions: bool, uses_web_actions: bool, uses_ui_actions: bool, allowed_actions: dict[str, bool] | None = None, in_station: bool = False):
-        """return list of functions as passed to gpt"""
+        """return list of functions as passed to gpt, the returned list is shared and must not be modified"""
+        if self._tool_lists_revision != ActionManager.actions_revision or self._tool_lists_actions is not self.actions:
+            self._tool_lists = {}
+            self._tool_lists_revision = ActionManager.actions_revision
+            self._tool_lists_actions = self.actions
 
+        action_permissions = allowed_actions if isinstance(allowed_actions, dict) else {}
+        enabled_permissions = frozenset(key for key, enabled in action_permissions.items() if enabled is True)
+        key = (active_mode, bool(uses_actions), bool(uses_web_actions), bool(uses_ui_actions), enabled_permissions, bool(in_station))
+        tool_list = self._tool_lists.get(key)
+        if tool_list is None:
+            tool_list = self._build_tools_list(active_mode, uses_actions, uses_web_actions, uses_ui_actions, action_permissions, in_station)
+            self._tool_lists[key] = tool_list
+        return tool_list
+
+    def _build_tools_list(self, active_mode: str, uses_actions: bool, uses_web_actions: bool, uses_ui_actions: bool, action_permissions: dict[str, bool], in_station: bool) -> list[dict]:
         actions = self.actions.values()
         valid_actions = []
-        action_permissions = allowed_actions if isinstance(allowed_actions, dict) else {}
         for action in actions:
             permission_key = action.get("permission")
             if permission_key and action_permissions.get(permission_key) is not True:
@@ -83,6 +122,22 @@ class ActionManager:
                 input_desc = ' '.join(input_desc.split())
                 return input_desc
         return None
+
+    def get_known_action_descs(self) -> list[str]:
+        """ render the input templates for the known example arguments, these are spoken whenever the action is used """
+        descriptions: list[str] = []
+        for action_descriptor in self.actions.values():
+            input_template = action_descriptor.get("input_template")
+            if not input_template:
+                continue
+            for arguments in (action_descriptor.get("cache_prefill") or {}).values():
+                try:
+                    input_desc = ' '.join(input_template(arguments, {}).split())
+                except Exception:
+                    continue
+                if input_desc and input_desc not in descriptions:
+                    descriptions.append(input_desc)
+        return descriptions
     
 
     def runAction(
@@ -144,20 +199,28 @@ class ActionManager:
             log("debug", f"Action '{name}' skipped registration due to missing permission '{permission}'")
             return
 
+        tool = {
+            "type": "function",
+            "function": {
+                "name": name,
+                "description": description,
+                "parameters": parameters,
+            },
+        }
         self.actions[name] = {
             "method": method,
             "type": action_type,
             "permission": permission,
             "input_template": input_template,
-            "tool": {
-                "type": "function",
-                "function": {
-                    "name": name,
-                    "description": description,
-                    "parameters": parameters,
-                },
-            }
+            "cache_prefill": cache_prefill,
+            "tool": tool,
+            # serialized once, every action cache key includes it
+            "tool_json": json.dumps(tool),
         }
+        # cache entries made for a previous schema of this tool must no longer match
+        self._confirmed_index = None
+        ActionManager.actions_revision += 1
+        self._tool_lists = {}
         if cache_prefill is not None:
             for user_input, arguments in cache_prefill.items():
                 #log('debug', 'Cache: prefilling', name, user_input, arguments)
@@ -183,31 +246,124 @@ class ActionManager:
         """
             hash user input
         """
-        user_input = self.clean_user_input(user_input)
-        return md5(json.dumps([user_input, tool]).encode()).hexdigest()
+        action = self.actions.get(tool.get("function", {}).get("name"))
+        tool_json = action["tool_json"] if action and action.get("tool") is tool else json.dumps(tool)
+        return self._make_cache_key(self.clean_user_input(user_input), tool_json)
+
+    def _make_cache_key(self, cleaned_input: str, tool_json: str) -> str:
+        # same bytes as json.dumps([cleaned_input, tool]), so existing cache entries keep matching
+        return md5(f'[{json.dumps(cleaned_input)}, {tool_json}]'.encode()).hexdigest()
+
+    def _get_confirmed_index(self) -> dict[str, list[tuple[str, dict]]]:
+        if self._confirmed_index_generation != ActionManager.action_cache_generation:
+            self._confirmed_index = None
+            self._confirmed_index_generation = ActionManager.action_cache_generation
+        if self._confirmed_index is None:
+            index: dict[str, list[tuple[str, dict]]] = {}
+            input_texts: dict[str, str] = {}
+            for input_hash, entry in self.action_cache.get_all().items():
+                if not isinstance(entry, dict) or entry.get("status") != "confirmed":
+                    continue
+                function = entry.get("function") or {}
+                action = self.actions.get(function.get("name"))
+                if not action:
+                    continue
+                cleaned_input = self.clean_user_input(entry.get("input") or "")
+                # entries stored for an older schema of the tool are never hit
+                if self._make_cache_key(cleaned_input, action["tool_json"]) != input_hash:
+                    continue
+                index.setdefault(cleaned_input, []).append((input_hash, function))
+                input_texts.setdefault(cleaned_input, entry.get("input") or cleaned_input)
+            self._confirmed_index = index
+            if self.semantic_cache is not None:
+                # inputs that were never embedded take one request each, so don't hold up the prediction
+                threading.Thread(target=self._sync_semantic_cache, args=(input_texts,), daemon=True).start()
+        return self._confirmed_index
+
+    def _sync_semantic_cache(self, input_texts: dict[str, str]):
+        try:
+            if self.semantic_cache is not None:
+                self.semantic_cache.sync(input_texts)
+        finally:
+            release_connection()
+
+    def _index_confirmed_action(self, input_hash: str, user_input: str, function: dict):
+        if self._confirmed_index is None:
+            return
+        cleaned_input = self.clean_user_input(user_input)
+        entries = self._confirmed_index.setdefault(cleaned_input, [])
+        entries[:] = [entry for entry in entries if entry[0] != input_hash]
+        entries.append((input_hash, function))
+        if self.semantic_cache is not None:
+            self.semantic_cache.add(cleaned_input, user_input)
+
+    def _unindex_action(self, input_hash: str, user_input: str):
+        if self._confirmed_index is None:
+            return
+        entries = self._confirmed_index.get(self.clean_user_input(user_input))
+        if entries:
+            entries[:] = [entry for entry in entries if entry[0] != input_hash]
 
     def predict_action(self, user_input: str, tool_list) -> list[ChatCompletionMessageFunctionToolCall] | None:
         """
             predict action based on user input and available tools
         """
-        # get the hash for user input with each tool
-        input_hashes = [self.hash_action_input(user_input, tool) for tool in tool_list]
-        # check if any of the input hashes match the predicted actions
-        for input_hash in input_hashes:
-            prediction = self.action_cache.get(input_hash)
-            if prediction is not None and prediction.get("status") == "confirmed":
-                # if prediction is confirmed, return the tool call
-                new_id = str(random.randint(100000, 999999))
-                tool_call = ChatCompletionMessageFunctionToolCall(
-                    type="function",
-                    id=new_id,
-                    function=prediction.get("function")
-                )
-                log("debug", f"Cache: Action prediction found in cache with hash {input_hash}, returning tool call {new_id}")
-                return [tool_call]
-                
+        index = self._get_confirmed_index()
+        predictions = index.get(self.clean_user_input(user_input))
+        if not predictions and self.semantic_cache is not None:
+            predictions = self._predict_semantic(user_input, index)
+        if not predictions:
+            return None
+
+        tool_names = {tool.get("function", {}).get("name") for tool in tool_list}
+        for input_hash, function in predictions:
+            if function.get("name") not in tool_names:
+                continue
+            # if prediction is confirmed, return the tool call
+            new_id = str(random.randint(100000, 999999))
+            tool_call = ChatCompletionMessageFunctionToolCall(
+                type="function",
+                id=new_id,
+                function=function  # pyright: ignore[reportArgumentType]
+            )
+            log("debug", f"Cache: Action prediction found in cache with hash {input_hash}, returning tool call {new_id}")
+            return [tool_call]
+
         return None
 
+    def _predict_semantic(self, user_input: str, index: dict[str, list[tuple[str, dict]]]) -> list[tuple[str, dict]] | None:
+        if self.semantic_cache is None:
+            return None
+        matches = [(cleaned_input, similarity) for cleaned_input, similarity in self.semantic_cache.find(user_input) if index.get(cleaned_input)]
+        if not matches:
+            return None
+
+        best_input, best_similarity = matches[0]
+        best_functions = [function for _, function in index[best_input]]
+        for cleaned_input, similarity in matches[1:]:
+            if best_similarity - similarity > self.semantic_ambiguity_margin:
+                break
+            if [function for _, function in index[cleaned_input]] != best_functions:
+                log("debug", f"Cache: Similar inputs '{best_input}' and '{cleaned_input}' map to different actions, skipping")
+                return None
+
+        # a similar input can ask for other arguments ("set speed to 75%" vs. "set speed to 50%"), only calls without any are reused
+        if any(self._has_arguments(function) for _, function in index[best_input]):
+            log("debug", f"Cache: Similar input '{best_input}' maps to an action with arguments, skipping")
+            return None
+
+        log("debug", f"Cache: Input '{user_input}' matches cached input '{best_input}' with similarity {best_similarity:.3f}")
+        return index[best_input]
+
+    def _has_arguments(self, function: dict) -> bool:
+        arguments = function.get("arguments")
+        if not arguments:
+            return False
+        try:
+            return bool(json.loads(arguments)) if isinstance(arguments, str) else bool(arguments)
+        except json.JSONDecodeError:
+            return True
+
     def suggest_action_for_cache(self, user_input: str, action: ChatCompletionMessageFunctionToolCall, tool_list):
         """
             suggest action for cache
@@ -263,18 +419,21 @@ class ActionManager:
         if suggested_action.get("function") != action.function.model_dump():
             log("debug", "Cache: Suggested action function does not match")
             self.action_cache.delete(input_hash)
+            self._unindex_action(input_hash, user_input)
             log("debug", "Cache: Deleted action from cache due to mismatch")
             return
 
         # update action in cache
+        function = {
+            "name": action.function.name,
+            "arguments": action.function.arguments
+        }
         self.action_cache.set(input_hash, {
             "status": "confirmed",
             "input": user_input,
-            "function": {
-                "name": action.function.name,
-                "arguments": action.function.arguments
-            }
+            "function": function
         })
+        self._index_confirmed_action(input_hash, user_input, function)
         log("info", f"Cache: Action {action.function.name} confirmed in cache with hash {input_hash}")
 
     def prefill_action_in_cache(self, user_input: str, action: ChatCompletionMessageFunctionToolCall, tool):
@@ -287,14 +446,16 @@ class ActionManager:
             return
         
         # add action to cache
+        function = {
+            "name": action.function.name,
+            "arguments": action.function.arguments
+        }
         self.action_cache.set(input_hash, {
             "status": "confirmed",
             "input": user_input,
-            "function": {
-                "name": action.function.name,
-                "arguments": action.function.arguments
-            }
+            "function": function
         })
+        self._index_confirmed_action(input_hash, user_input, function)
         log("info", f"Cache: Action {action.function.name} prefilled in cache with hash {input_hash}")
 
     def has_action_in_cache(self, user_input: str, action: ChatCompletionMessageFunctionToolCall, tool_list) -> Literal["suggested", "confirmed", False]:
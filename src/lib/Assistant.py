@@ -11,6 +11,7 @@ from pydantic import BaseModel
 from .Models import LLMModel, EmbeddingModel, LLMError
 from .Logger import (
     CacheUsageStats,
+    ModelUsageStats,
     PromptUsageStats,
     log,
     log_action_cache_usage,
@@ -25,15 +26,16 @@ from .Config import (
     TTS_ENVIRONMENT_EFFECTS_ON_FOOT,
     TTS_ENVIRONMENT_EFFECTS_OVERHEATING,
 )
-from .Database import QuestDatabase, QuestState
+from .Database import QuestDatabase, QuestState, release_connection
 from .Event import ConversationEvent, Event, GameEvent, StatusEvent, ToolEvent, ExternalEvent, ProjectedEvent, MemoryEvent, QuestEvent
 from .EventManager import EventManager
 from .ActionManager import ActionManager
 from .PromptGenerator import PromptGenerator
-from .TTS import TTS
+from .SentenceSegmenter import SentenceSegmenter
+from .TTS import TTS, TTSLine
 from typing import Any,  Callable, final
 import yaml
-from threading import Thread
+from threading import Thread, Event as ThreadEvent
 from .actions.Actions import engine_boost, set_speed, fire_weapons, get_visuals
 from .Projections import get_state_dict, ProjectedStates
 from .QuestCatalogManager import remove_orphaned_quest_states
@@ -126,13 +128,14 @@ class Assistant:
             log('error', 'Auto action on Screenshot failed', e, traceback.format_exc())
 
         if isinstance(event, ConversationEvent) and event.kind == 'assistant':
-            short_term = self.event_manager.get_short_term_memory(1000)
+            # counted incrementally by the event manager, the events are only fetched once summarization starts
+            event_count, conversational_count = self.event_manager.get_short_term_memory_counts()
             # Rate-limit by wall-clock time since the last MemoryEvent summary
             last_memory_time = self.short_term_memories[-1].processed_at if len(self.short_term_memories) else 0.0
-            conversational_messages = [1 for e in short_term if isinstance(e, ConversationEvent) or isinstance(e, ToolEvent)]
             
-            log(prefix='info', message=f'Short-term memory length: {len(short_term)} events ({len(conversational_messages)} conversational) since {last_memory_time}, already summarizing: {self.is_summarizing}')
-            if (len(conversational_messages) > 40 or len(short_term) > 120) and not self.is_summarizing and (time() - last_memory_time) >= 300:
+            log(prefix='info', message=f'Short-term memory length: {event_count} events ({conversational_count} conversational) since {last_memory_time}, already summarizing: {self.is_summarizing}')
+            if (conversational_count > 40 or event_count > 120) and not self.is_summarizing and (time() - last_memory_time) >= 300:
+                short_term = self.event_manager.get_short_term_memory(1000)
                 log('info', f'Starting summarization of {len(short_term[30:])} events into long-term memory')
                 self.is_summarizing = True
                 Thread(target=self.summarize_memory, args=(short_term[30:],), daemon=True).start()
@@ -339,6 +342,25 @@ class Assistant:
             self.quest_actors = {}
             self.quests_loaded = False
 
+    def get_quest_npc_lines(self) -> list[tuple[str, str]]:
+        """Returns the (transcription, voice) of every npc_message in the loaded quests."""
+        lines: list[tuple[str, str]] = []
+
+        def collect(node: Any) -> None:
+            if isinstance(node, list):
+                for child in node:
+                    collect(child)
+            elif isinstance(node, dict):
+                if node.get('action') == 'npc_message' and isinstance(node.get('transcription'), str):
+                    actor = self.quest_actors.get(node.get('actor_id', ''))
+                    voice = actor.get('voice') if isinstance(actor, dict) else None
+                    lines.append((node['transcription'], voice if isinstance(voice, str) and voice else self._get_character_tts_voice()))
+                for child in node.values():
+                    collect(child)
+
+        collect(list(self.quest_catalog.values()))
+        return lines
+
     def _sync_quests_to_db(self) -> None:
         remove_orphaned_quest_states(self.quest_db, set(self.quest_catalog.keys()))
         for quest_id, quest in self.quest_catalog.items():
@@ -794,6 +816,7 @@ class Assistant:
             log("error", "Error during memory summarization:", e, traceback.format_exc())
         finally:
             self.is_summarizing = False
+            release_connection()
 
 
     @observe()
@@ -855,6 +878,62 @@ class Assistant:
             return
 
 
+    def _stream_reply(self, prompt: list, tool_list: list | None, projected_states: ProjectedStates) -> tuple[str | None, list[Any] | None, ModelUsageStats, list[TTSLine], ThreadEvent]:
+        """
+        Streams the reply from the LLM and queues every completed sentence for speech right away,
+        so the pilot hears the start of the reply while the rest is still being generated.
+        Speech stops once the model starts calling tools or the pilot interrupts, only the spoken text is returned.
+        """
+        segmenter = SentenceSegmenter()
+        postprocessing_layers = self._get_tts_postprocessing_layers(projected_states)
+        abort_count = self.tts.abort_count
+        spoken: list[str] = []
+        lines: list[TTSLine] = []
+        speaking_started = ThreadEvent()
+
+        def on_speaking():
+            try:
+                self.event_manager.add_assistant_speaking()
+            finally:
+                speaking_started.set()
+
+        def say(segment: str):
+            lines.append(self.tts.say(
+                segment,
+                context="assistant",
+                postprocessing_layers=postprocessing_layers,
+                on_start=None if lines else on_speaking,
+                drop_if=lambda: self.tts.abort_count != abort_count,
+            ))
+            spoken.append(segment)
+
+        has_text = False
+        tool_call_started = False
+        response_actions = None
+        model_usage = ModelUsageStats()
+        for delta in self.llmModel.generate_stream(messages=prompt, tools=tool_list):  # pyright: ignore[reportArgumentType]
+            if self.tts.abort_count != abort_count and not tool_call_started:
+                log('debug', 'Reply interrupted while streaming')
+                break
+            if delta.tool_call_started:
+                tool_call_started = True
+            if delta.text:
+                has_text = True
+                if not tool_call_started:
+                    for segment in segmenter.feed(delta.text):
+                        say(segment)
+            if delta.usage is not None:
+                model_usage = delta.usage
+                response_actions = delta.tool_calls
+
+        remainder = segmenter.flush()
+        if remainder and not tool_call_started and self.tts.abort_count == abort_count:
+            say(remainder)
+        if not has_text and not response_actions and self.tts.abort_count == abort_count:
+            say("...")
+
+        return (" ".join(spoken) or None, response_actions, model_usage, lines, speaking_started)
+
     def reply(self, projected_states: ProjectedStates):
         if self.is_replying:
             log('debug', 'Cache: Reply already in progress, skipping new reply')
@@ -920,6 +999,8 @@ class Assistant:
             if tool_list and user_input and not tool_uses and self.config["use_action_cache_var"]:
                 predicted_actions = self.action_manager.predict_action(user_input[-1], tool_list)
                 
+            spoken_lines: list[TTSLine] = []
+            speaking_started = ThreadEvent()
             if predicted_actions:
                 #log('info', 'predicted_actions', predicted_actions)
                 response_text = None
@@ -934,46 +1015,41 @@ class Assistant:
                 start_time = time()
                     
                 try:
-                    response_text, response_actions, model_usage = self.llmModel.generate(
-                        messages=prompt,
-                        tools=tool_list,  # pyright: ignore[reportArgumentType]
-                    )
+                    response_text, response_actions, model_usage, spoken_lines, speaking_started = self._stream_reply(prompt, tool_list, projected_states)
 
                     log_llm_usage("assistant", model_usage=model_usage, prompt_usage=prompt_usage, llm_model=self.llmModel)
 
-                    if not response_text and not response_actions:
-                        response_text = "..."
                     end_time = time()
                     log('debug', 'Response time LLM', end_time - start_time)
                 except LLMError as e:
                     show_chat_message('error', 'LLM Error:', str(e))
                     return
 
-            if response_text and not response_actions:
-                line = self.tts.say(
-                    response_text,
-                    context="assistant",
-                    postprocessing_layers=self._get_tts_postprocessing_layers(projected_states),
-                )
-                line.wait_for_speaking()
-                self.event_manager.add_assistant_speaking()
+            if response_text:
+                if spoken_lines[0].wait_for_speaking():
+                    speaking_started.wait()
                 self.event_manager.add_conversation_event('assistant', response_text, reasons=reasons, processed_at=max_conversation_processed)
-                line.wait_for_completion()
-                self.event_manager.add_assistant_complete_event()
 
             if response_actions:
                 self.event_manager.add_assistant_acting(processed_at=max_conversation_processed)
                 self.execute_actions(response_actions, projected_states)
 
-                if not predicted_actions and self.config["use_action_cache_var"] and tool_list:
+                # actions predicted from a similar input are verified for this input like any other
+                if self.config["use_action_cache_var"] and tool_list:
                     if len(response_actions) == 1 and len(user_input):
                         self.verify_action(user_input[-1], response_actions[0], prompt, tool_list)
+
+            if response_text:
+                spoken_lines[-1].wait_for_completion()
+                self.event_manager.add_assistant_complete_event()
                     
         except Exception as e:
             log("debug", "LLM error during reply:", e, traceback.format_exc())
             show_chat_message("error", "LLM error: An unknown error occurred during reply")
         finally:
             self.is_replying = False
+            self.event_manager.event_bus.notify()
+            release_connection()
 
     def should_reply(self, states:dict[str, Any]):
         character = self.config['characters'][self.config['active_character_index']]
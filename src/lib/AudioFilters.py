@@ -0,0 +1,81 @@
+from functools import lru_cache
+
+import numpy as np
+from numpy.typing import NDArray
+
+ONE_POLE_BLOCK_SIZE = 64
+
+
+@lru_cache(maxsize=32)
+def _one_pole_block_response(a: float, b: float, block_size: int) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Returns the zero-state response matrix of `y[n] = a * y[n - 1] + b * x[n]` for one block,
+    and the decay `a ** (n + 1)` of the state carried into the block.
+    Only non-negative powers of `a` are used, so the response stays bounded for any block length.
+    """
+    powers = a ** np.arange(block_size, dtype=np.float64)
+    lags = np.subtract.outer(np.arange(block_size), np.arange(block_size))
+    response = np.where(lags >= 0, b * powers[np.clip(lags, 0, None)], 0.0)
+    response.setflags(write=False)
+    decay = powers * a
+    decay.setflags(write=False)
+    return response, decay
+
+
+def apply_one_pole(
+    audio_array: NDArray[np.float32],
+    a: float,
+    b: float,
+    y_prev: float,
+    block_size: int = ONE_POLE_BLOCK_SIZE,
+) -> tuple[NDArray[np.float32], float]:
+    """
+    Filters `audio_array` with `y[n] = a * y[n - 1] + b * x[n]`, starting from the output `y_prev` of the previous
+    chunk. Returns the filtered audio and the last output, so consecutive chunks filter like one continuous signal.
+
+    The signal is split into blocks whose zero-state responses are computed with a single matrix product,
+    and the output carried from block to block is itself a one-pole filter over the block ends with pole `a ** block_size`.
+    """
+    if audio_array.size == 0:
+        return audio_array, y_prev
+
+    output = _apply_one_pole_float64(audio_array, float(a), float(b), float(y_prev), block_size)
+    return output.astype(np.float32), float(output[-1])
+
+
+def _apply_one_pole_float64(
+    signal: NDArray[np.floating],
+    a: float,
+    b: float,
+    y_prev: float,
+    block_size: int,
+) -> NDArray[np.float64]:
+    sample_count = signal.shape[0]
+    block_count = -(-sample_count // block_size)
+    response, decay = _one_pole_block_response(a, b, block_size)
+
+    blocks = np.zeros(block_count * block_size, dtype=np.float64)
+    blocks[:sample_count] = signal
+    blocks = blocks.reshape(block_count, block_size) @ response.T
+
+    carried = np.empty(block_count, dtype=np.float64)
+    carried[0] = y_prev
+    if block_count > 1:
+        # the output at the end of each block is the state carried into the next one
+        carried[1:] = _apply_one_pole_float64(blocks[:-1, -1], float(decay[-1]), 1.0, y_prev, block_size)
+    blocks += carried[:, np.newaxis] * decay
+
+    return blocks.reshape(-1)[:sample_count]
+
+
+def one_pole_lowpass_coefficients(sample_rate: int, cutoff: float) -> tuple[float, float]:
+    rc = 1.0 / (2.0 * np.pi * cutoff)
+    dt = 1.0 / sample_rate
+    alpha = dt / (rc + dt)
+    return 1.0 - alpha, alpha
+
+
+def one_pole_highpass_coefficient(sample_rate: int, cutoff: float) -> float:
+    rc = 1.0 / (2.0 * np.pi * cutoff)
+    dt = 1.0 / sample_rate
+    return rc / (rc + dt)
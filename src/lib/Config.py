@@ -901,7 +901,7 @@ class Config(TypedDict):
     vision_model_name: str
     vision_endpoint: str
     vision_api_key: str
-    stt_provider: Literal['openai', 'custom', 'custom-multi-modal', 'google-ai-studio', 'none', 'local-ai-server']
+    stt_provider: Literal['openai', 'custom', 'custom-multi-modal', 'google-ai-studio', 'none', 'local-ai-server', 'local-whisper']
     stt_model_name: str
     stt_api_key: str
     stt_endpoint: str
@@ -918,6 +918,7 @@ class Config(TypedDict):
     embedding_endpoint: str
     embedding_api_key: str
     tools_var: bool
+    cache_friendly_prompt_var: bool
     vision_var: bool
     ptt_var: Literal['voice_activation', 'push_to_talk', 'push_to_mute', 'toggle']
     ptt_inverted_var: bool
@@ -926,6 +927,8 @@ class Config(TypedDict):
     web_search_actions_var: bool
     ui_actions_var: bool
     use_action_cache_var: bool
+    use_semantic_action_cache_var: bool
+    semantic_action_cache_threshold: float
     allowed_actions: dict[str, bool]
     discovery_primary_var: bool
     discovery_firegroup_var: int  # 0 keeps the current firegroup; 1-8 select one
@@ -1431,6 +1434,7 @@ def load_config() -> Config:
         'active_character_index': 0,  # -1 means using the default legacy character
         'api_key': "",
         'tools_var': True,
+        'cache_friendly_prompt_var': False,
         'vision_var': False,
         'ptt_var': 'voice_activation',
         'ptt_inverted_var': False,
@@ -1439,6 +1443,8 @@ def load_config() -> Config:
         'web_search_actions_var': True,
         'ui_actions_var': True,
         'use_action_cache_var': True,
+        'use_semantic_action_cache_var': False,
+        'semantic_action_cache_threshold': 0.92,
         'allowed_actions': default_allowed_actions.copy(),
         'discovery_primary_var': True,
         'discovery_firegroup_var': 1,
@@ -1887,6 +1893,11 @@ def update_config(config: Config, data: dict) -> Config:
             data["stt_model_name"] = "whisper-1"
             data["stt_api_key"] = ""
 
+        if data["stt_provider"] == "local-whisper":
+            data["stt_endpoint"] = ""
+            data["stt_model_name"] = "base"
+            data["stt_api_key"] = ""
+
         if data["stt_provider"] == "custom":
             data["stt_endpoint"] = "https://api.openai.com/v1"
             data["stt_model_name"] = "whisper-1"
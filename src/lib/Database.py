@@ -1,17 +1,23 @@
 import json
 import math
 import os
+import zlib
+from contextlib import contextmanager
 from numpy import insert
 import pysqlite3 as sqlite3
 from dataclasses import dataclass
 from datetime import date
-from typing import Any, Mapping, TypedDict, final
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, TypedDict, final
 import sqlite_vec
 import threading
 
 from .Logger import log
 from .Config import get_cn_appdata_path
 
+if TYPE_CHECKING:
+    # pysqlite3 ships no type information, its API is the one of the standard library module
+    from sqlite3 import Connection
+
 def get_db_path() -> str:
     return os.path.join(get_cn_appdata_path(), 'covas.db')
 
@@ -25,18 +31,250 @@ def sanitize_fts5_query(query: str) -> str:
     # Wrap in double quotes to treat as literal phrase
     return f'"{escaped}"'
 
+# Applied to every new connection. WAL with synchronous=NORMAL only syncs on checkpoints instead of every commit.
+# Stores can add or override PRAGMAs with their `pragmas` argument, see register_pragmas().
+DEFAULT_SQLITE_PRAGMAS: dict[str, str | int] = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+    'cache_size': -16000,  # negative values are KiB, so 16 MiB
+    'mmap_size': 256 * 1024 * 1024,
+}
+# Prepared statements kept per connection, keyed by SQL text, so the per-store queries are only compiled once
+SQLITE_CACHED_STATEMENTS = 256
+
+def apply_pragmas(conn: 'Connection', pragmas: Mapping[str, str | int]) -> None:
+    for name, value in pragmas.items():
+        conn.execute(f"PRAGMA {name}={value};")
+
+def create_connection(pragmas: Mapping[str, str | int] = DEFAULT_SQLITE_PRAGMAS) -> 'Connection':
+    conn = sqlite3.connect(get_db_path(), timeout=3, check_same_thread=False, cached_statements=SQLITE_CACHED_STATEMENTS)
+    apply_pragmas(conn, pragmas)
+    conn.enable_load_extension(True)
+    sqlite_vec.load(conn)
+    conn.enable_load_extension(False)
+    return conn
+
+
+@final
+class ConnectionPool():
+    """
+    Hands out connections to threads and takes them back when they are released,
+    so connections of short-lived threads are reused instead of being opened and leaked per thread.
+    At most max_connections are open at once, acquire() blocks until one is released and raises TimeoutError
+    after acquire_timeout seconds. At most max_idle unused connections are kept open, surplus ones are closed on release.
+    """
+    def __init__(
+        self,
+        max_connections: int = 16,
+        max_idle: int = 4,
+        acquire_timeout: float = 10.0,
+        pragmas: Mapping[str, str | int] | None = None,
+    ):
+        self.max_connections = max_connections
+        self.max_idle = max_idle
+        self.acquire_timeout = acquire_timeout
+        self._pragmas: dict[str, str | int] = dict(DEFAULT_SQLITE_PRAGMAS if pragmas is None else pragmas)
+        # bumped whenever PRAGMAs are added, connections that applied an older revision get them on their next use
+        self._pragma_revision = 0
+        self._applied_revision: dict['Connection', int] = {}
+        self._idle: list['Connection'] = []
+        self._open = 0
+        self._available = threading.Condition()
+
+    def add_pragmas(self, pragmas: Mapping[str, str | int]) -> None:
+        """PRAGMAs are per connection, so they apply to every connection of the pool, not just to the store asking for them."""
+        with self._available:
+            if all(self._pragmas.get(name) == value for name, value in pragmas.items()):
+                return
+            self._pragmas.update(pragmas)
+            self._pragma_revision += 1
+
+    def refresh(self, conn: 'Connection') -> None:
+        """Applies the PRAGMAs added since `conn` was configured, called by the thread that owns `conn`."""
+        with self._available:
+            if self._applied_revision.get(conn) == self._pragma_revision:
+                return
+            pragmas = dict(self._pragmas)
+            revision = self._pragma_revision
+        apply_pragmas(conn, pragmas)
+        with self._available:
+            self._applied_revision[conn] = revision
+
+    def acquire(self, timeout: float | None = None) -> 'Connection':
+        timeout = self.acquire_timeout if timeout is None else timeout
+        with self._available:
+            if not self._available.wait_for(lambda: self._idle or self._open < self.max_connections, timeout):
+                raise TimeoutError(f'No database connection became available within {timeout}s, all {self._open} are in use')
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                conn = None
+                self._open += 1
+            pragmas = dict(self._pragmas)
+            revision = self._pragma_revision
+        if conn is not None:
+            self.refresh(conn)
+            return conn
+        try:
+            conn = create_connection(pragmas)
+        except BaseException:
+            with self._available:
+                self._open -= 1
+                self._available.notify()
+            raise
+        with self._available:
+            self._applied_revision[conn] = revision
+        return conn
+
+    def release(self, conn: 'Connection') -> None:
+        try:
+            # don't leak uncommitted changes of the previous owner into the next one
+            conn.rollback()
+        except Exception:
+            self.discard(conn)
+            return
+        with self._available:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                self._available.notify()
+                return
+        self.discard(conn)
+
+    def discard(self, conn: 'Connection') -> None:
+        """Closes a connection that was acquired from the pool, making room for a new one."""
+        with self._available:
+            self._open -= 1
+            self._applied_revision.pop(conn, None)
+            self._available.notify()
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        with self._available:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            self.discard(conn)
+
+
+class _ConnectionLease():
+    """
+    Connection owned by one thread. Stored thread-locally and returned to the pool by release_connection(),
+    or when the thread exits as a fallback for threads that never release it.
+    """
+    def __init__(self, conn: 'Connection', pool: ConnectionPool | None):
+        self.conn = conn
+        self.pool = pool
+        self.transaction_depth = 0
+
+    def __del__(self):
+        self.release()
+
+    def release(self) -> None:
+        pool, self.pool = self.pool, None
+        if pool is not None:
+            try:
+                pool.release(self.conn)
+            except Exception:
+                pass
+
+
+_pool = ConnectionPool()
+
 # Thread-local storage for connections
 _thread_local = threading.local()
 
-def get_connection():
-    # Check if this thread already has a connection
-    if not hasattr(_thread_local, 'conn'):
-        _thread_local.conn = sqlite3.connect(get_db_path(), timeout=3) # Added timeout
-        _thread_local.conn.execute("PRAGMA journal_mode=WAL;") # Enable WAL mode
-        _thread_local.conn.enable_load_extension(True)
-        sqlite_vec.load(_thread_local.conn)
-        _thread_local.conn.enable_load_extension(False)
-    return _thread_local.conn
+def _get_lease() -> _ConnectionLease:
+    lease = getattr(_thread_local, 'lease', None)
+    if lease is None:
+        lease = _ConnectionLease(_pool.acquire(), _pool)
+        _thread_local.lease = lease
+    elif lease.pool is not None:
+        lease.pool.refresh(lease.conn)
+    return lease
+
+def get_connection() -> 'Connection':
+    return _get_lease().conn
+
+def release_connection() -> None:
+    """
+    Returns the connection of the current thread to the pool, e.g. at the end of a worker thread.
+    Rolls back what the thread did not commit, the next get_connection() of the thread acquires a connection again.
+    """
+    lease = getattr(_thread_local, 'lease', None)
+    if lease is None or lease.pool is None:
+        return
+    del _thread_local.lease
+    lease.transaction_depth = 0
+    lease.release()
+
+def register_pragmas(pragmas: Mapping[str, str | int] | None) -> None:
+    """
+    Adds PRAGMAs requested by a store. They are per connection, so they apply to all connections and thereby all stores,
+    PRAGMAs registered later override earlier ones with the same name.
+    """
+    if not pragmas:
+        return
+    _pool.add_pragmas(pragmas)
+    lease = getattr(_thread_local, 'lease', None)
+    if lease is not None:
+        if lease.pool is not None:
+            lease.pool.refresh(lease.conn)
+        else:
+            apply_pragmas(lease.conn, pragmas)
+
+def close_connections() -> None:
+    """Returns the connection of the current thread and closes all pooled connections, e.g. on shutdown."""
+    lease = getattr(_thread_local, 'lease', None)
+    if lease is not None:
+        del _thread_local.lease
+        pool, lease.pool = lease.pool, None
+        if pool is not None:
+            pool.discard(lease.conn)
+    _pool.close()
+
+def commit_changes(conn: 'Connection') -> None:
+    """Commits, unless the current thread is inside a transaction(), which commits once at its end."""
+    if _get_lease().transaction_depth == 0:
+        conn.commit()
+
+@contextmanager
+def transaction() -> Iterator['Connection']:
+    """
+    Groups all writes of the current thread into a single commit. Can be nested, only the outermost one commits.
+    Rolls back if the outermost block raises.
+    """
+    lease = _get_lease()
+    lease.transaction_depth += 1
+    try:
+        yield lease.conn
+    except BaseException:
+        lease.transaction_depth -= 1
+        if lease.transaction_depth == 0:
+            lease.conn.rollback()
+        raise
+    lease.transaction_depth -= 1
+    if lease.transaction_depth == 0:
+        lease.conn.commit()
+
+def ensure_incremental_vacuum() -> None:
+    """
+    Switches the database to auto_vacuum=INCREMENTAL, so freed pages can be returned with incremental_vacuum().
+    Existing databases need a one-time full VACUUM for this to take effect.
+    """
+    conn = get_connection()
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+        return
+    log('info', 'Enabling incremental vacuum for the database, this may take a moment')
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    conn.execute("VACUUM")
+
+def incremental_vacuum(pages: int = 1000) -> None:
+    """Returns up to `pages` free pages to the file system, a no-op unless ensure_incremental_vacuum() ran before."""
+    conn = get_connection()
+    conn.execute(f"PRAGMA incremental_vacuum({int(pages)})").fetchall()
 
 
 def instantiate_class_by_name(classes: list[Any], class_name: str, data: dict[str, Any]) -> Any:
@@ -47,7 +285,7 @@ def instantiate_class_by_name(classes: list[Any], class_name: str, data: dict[st
 
 # For testing purposes only
 def set_connection_for_testing(conn):
-    _thread_local.conn = conn
+    _thread_local.lease = _ConnectionLease(conn, None)
 
 
 @dataclass
@@ -105,7 +343,8 @@ class CodeEntry:
 
 @final
 class ModelUsageStore():
-    def __init__(self, store_name: str = "model_usage"):
+    def __init__(self, store_name: str = "model_usage", pragmas: Mapping[str, str | int] | None = None):
+        register_pragmas(pragmas)
         self.store_name = store_name
         self.table_name = f'{store_name}_v1'
 
@@ -128,7 +367,7 @@ class ModelUsageStore():
             CREATE INDEX IF NOT EXISTS {self.table_name}_kind_timestamp_idx
             ON {self.table_name} (usage_kind, timestamp)
         ''')
-        conn.commit()
+        commit_changes(conn)
 
     def insert(self, timestamp: str, usage_kind: str, payload: Mapping[str, Any]) -> int:
         conn = get_connection()
@@ -137,7 +376,7 @@ class ModelUsageStore():
             INSERT INTO {self.table_name} (timestamp, usage_kind, payload_json)
             VALUES (?, ?, ?)
         ''', (timestamp, usage_kind, json.dumps(dict(payload))))
-        conn.commit()
+        commit_changes(conn)
         return int(cursor.lastrowid)
 
     def get_history(
@@ -205,13 +444,15 @@ class ModelUsageStore():
         cursor.execute(f'''
             DELETE FROM {self.table_name}
         ''')
-        conn.commit()
+        commit_changes(conn)
 
 @final
 class EventStore():
-    def __init__(self, store_name: str, event_classes: list[Any]):
+    def __init__(self, store_name: str, event_classes: list[Any], pragmas: Mapping[str, str | int] | None = None):
+        register_pragmas(pragmas)
         self.store_name = store_name
         self.table_name = f'{store_name}_v1'
+        self.archive_table_name = f'{store_name}_archive_v1'
         self.event_classes = event_classes
         
         conn = get_connection()
@@ -241,13 +482,40 @@ class EventStore():
                 ALTER TABLE {self.table_name}
                 ADD COLUMN memorized_at FLOAT DEFAULT null
             ''')
+
+        # get_latest, replied_before and memorize_before only look at the few rows that are not memorized/responded yet
+        cursor.execute(f'''
+            CREATE INDEX IF NOT EXISTS {self.table_name}_processed_at_idx
+            ON {self.table_name} (processed_at)
+        ''')
+        cursor.execute(f'''
+            CREATE INDEX IF NOT EXISTS {self.table_name}_unmemorized_idx
+            ON {self.table_name} (processed_at) WHERE memorized_at IS NULL
+        ''')
+        cursor.execute(f'''
+            CREATE INDEX IF NOT EXISTS {self.table_name}_unresponded_idx
+            ON {self.table_name} (processed_at) WHERE responded_at IS NULL
+        ''')
+
+        # memorized events are moved here by archive_memorized, with zlib compressed data
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS {self.archive_table_name} (
+                id INTEGER PRIMARY KEY,
+                class TEXT,
+                data BLOB,
+                processed_at FLOAT,
+                memorized_at FLOAT,
+                responded_at FLOAT,
+                inserted_at DATETIME
+            )
+        ''')
             
-        conn.commit()
+        commit_changes(conn)
         
     def commit(self) -> None:
-        get_connection().commit()
+        commit_changes(get_connection())
     
-    def insert_event(self, event: Any, processed_at: float, commit: bool = True) -> None:
+    def insert_event(self, event: Any, processed_at: float, commit: bool = True) -> int | None:
         conn = get_connection()
         cursor = conn.cursor()
         event_data = json.dumps(event.__dict__)
@@ -257,7 +525,34 @@ class EventStore():
             VALUES (?, ?, ?, ?, ?)
         ''', (event_class, event_data, processed_at, None, None))
         if commit:
-            conn.commit()
+            commit_changes(conn)
+        return cursor.lastrowid
+
+    def iterate(self, until_id: int, batch_size: int = 500) -> Iterator[Any]:
+        """Yields the events up to row `until_id` in insertion order, loading `batch_size` rows at a time."""
+        conn = get_connection()
+        last_id = 0
+        while last_id < until_id:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT id, class, data, processed_at, memorized_at, responded_at
+                FROM {self.table_name}
+                WHERE id > ? AND id <= ?
+                ORDER BY id
+                LIMIT ?
+            ''', (last_id, until_id, batch_size))
+            rows = cursor.fetchall()
+            if not rows:
+                return
+            for row in rows:
+                instance = instantiate_class_by_name(self.event_classes, row[1], json.loads(row[2]))
+                if instance is None:
+                    continue
+                instance.processed_at = row[3]
+                instance.memorized_at = row[4]
+                instance.responded_at = row[5]
+                yield instance
+            last_id = rows[-1][0]
 
     def get_latest(self, limit: int = 100) -> list[Any]:
         conn = get_connection()
@@ -291,7 +586,55 @@ class EventStore():
             SET responded_at = ?
             WHERE processed_at <= ? and responded_at is NULL
         ''', (processed_at,processed_at,))
-        conn.commit()
+        commit_changes(conn)
+
+    def archive_memorized(self, before: float, limit: int = 1000) -> int:
+        """
+        Moves up to `limit` memorized events processed before `before` into the archive table.
+        Returns the number of archived events.
+        """
+        with transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT id, class, data, processed_at, memorized_at, responded_at, inserted_at
+                FROM {self.table_name}
+                WHERE memorized_at IS NOT NULL AND processed_at < ?
+                ORDER BY processed_at
+                LIMIT ?
+            ''', (before, limit))
+            rows = cursor.fetchall()
+            if not rows:
+                return 0
+            cursor.executemany(f'''
+                INSERT OR REPLACE INTO {self.archive_table_name} (id, class, data, processed_at, memorized_at, responded_at, inserted_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', [(row[0], row[1], zlib.compress(row[2].encode('utf-8')), *row[3:]) for row in rows])
+            cursor.executemany(f'''
+                DELETE FROM {self.table_name}
+                WHERE id = ?
+            ''', [(row[0],) for row in rows])
+        return len(rows)
+
+    def get_archived(self, limit: int = 100) -> list[Any]:
+        """Returns the most recently processed archived events."""
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            SELECT class, data, processed_at, memorized_at, responded_at
+            FROM {self.archive_table_name}
+            ORDER BY processed_at DESC
+            LIMIT ?
+        ''', (limit,))
+        events = []
+        for row in cursor.fetchall():
+            instance = instantiate_class_by_name(self.event_classes, row[0], json.loads(zlib.decompress(row[1]).decode('utf-8')))
+            if instance is None:
+                continue
+            instance.processed_at = row[2]
+            instance.memorized_at = row[3]
+            instance.responded_at = row[4]
+            events.append(instance)
+        return events
 
     def memorize_before(self, processed_at: float) -> None:
         """Mark events as memorized before a certain processed_at timestamp"""
@@ -302,7 +645,7 @@ class EventStore():
             SET memorized_at = ?
             WHERE processed_at <= ? and memorized_at is NULL
         ''', (processed_at,processed_at,))
-        conn.commit()
+        commit_changes(conn)
 
     def delete_all(self) -> None:
         conn = get_connection()
@@ -310,7 +653,10 @@ class EventStore():
         _ = cursor.execute(f'''
             DELETE FROM {self.table_name}
         ''')
-        conn.commit()
+        _ = cursor.execute(f'''
+            DELETE FROM {self.archive_table_name}
+        ''')
+        commit_changes(conn)
 
     def delete_classes(self, class_names: list[str]) -> None:
         if not class_names:
@@ -322,13 +668,18 @@ class EventStore():
             DELETE FROM {self.table_name}
             WHERE class IN ({placeholders})
         ''', class_names)
-        conn.commit()
+        _ = cursor.execute(f'''
+            DELETE FROM {self.archive_table_name}
+            WHERE class IN ({placeholders})
+        ''', class_names)
+        commit_changes(conn)
 
 @final
 class VectorStore():
     RRF_K = 0
 
-    def __init__(self, store_name: str):
+    def __init__(self, store_name: str, pragmas: Mapping[str, str | int] | None = None):
+        register_pragmas(pragmas)
         self.store_name = store_name
         self.table_name = f'{store_name}_v1'
         self.vector_table = f'{store_name}_vec_v1'
@@ -464,7 +815,7 @@ class VectorStore():
             VALUES ('embedding_dim', ?)
             ON CONFLICT(key) DO UPDATE SET value = excluded.value
         ''', (str(embedding_dim),))
-        conn.commit()
+        commit_changes(conn)
         
         self.initialized = True
 
@@ -509,7 +860,7 @@ class VectorStore():
                 VALUES (?, ?)
             ''', (row_id, content))
 
-        conn.commit()
+        commit_changes(conn)
 
     def search(self, query: str, model_name: str, query_embedding: list[float], n: int = 5) -> list[VectorSearchResult]:
         """
@@ -702,7 +1053,7 @@ class VectorStore():
                 WHERE rowid = ?
             ''', (id,))
 
-        conn.commit()
+        commit_changes(conn)
 
     def delete_all(self) -> None:
         """Delete all embeddings"""
@@ -724,7 +1075,7 @@ class VectorStore():
                 DELETE FROM {self.keyword_table}
             ''')
 
-        conn.commit()
+        commit_changes(conn)
     
     def get_most_recent_entries(self, limit: int = 10) -> list[VectorStoreEntry]:
         """Return the most recently stored entries."""
@@ -813,7 +1164,8 @@ class VectorStore():
 
 @final
 class KeyValueStore():
-    def __init__(self, store_name: str):
+    def __init__(self, store_name: str, pragmas: Mapping[str, str | int] | None = None):
+        register_pragmas(pragmas)
         self.store_name = store_name
         self.table_name = f'{store_name}_v1'
         
@@ -827,7 +1179,7 @@ class KeyValueStore():
                 inserted_at DATETIME DEFAULT CURRENT_TIMESTAMP
             )
         ''')
-        conn.commit()
+        commit_changes(conn)
                         
     def get_version(self, key: str) -> str | None:
         conn = get_connection()
@@ -860,7 +1212,7 @@ class KeyValueStore():
                 INSERT INTO {self.table_name} (key, version, value)
                 VALUES (?, ?, ?)
             ''', (key, version, json.dumps(value)))
-            conn.commit()
+            commit_changes(conn)
             return value
         
         existing_version, existing_value = row
@@ -872,39 +1224,63 @@ class KeyValueStore():
                 SET version = ?, value = ?
                 WHERE key = ?
             ''', (version, json.dumps(value), key))
-            conn.commit()
+            commit_changes(conn)
             return value
             
         # Version is the same, return existing value without changing it
         return json.loads(existing_value)
-    
-    def set(self, key: str, value: Any) -> None:
+
+    def init_many(self, entries: Mapping[str, tuple[str, Any]]) -> tuple[dict[str, Any], set[str]]:
+        """
+        Like init for several keys mapped to (version, value), reads them in one query and writes in one transaction.
+        Also returns the keys that were (re)initialized, because they were missing or had another version.
+        """
+        if not entries:
+            return {}, set()
         conn = get_connection()
         cursor = conn.cursor()
-        
-        # Check if the key exists
+        keys = list(entries.keys())
+        placeholders = ",".join("?" for _ in keys)
         cursor.execute(f'''
-            SELECT COUNT(*)
+            SELECT key, version, value
             FROM {self.table_name}
-            WHERE key = ?
-        ''', (key,))
-        row = cursor.fetchone()
-        
-        if row and row[0] > 0:
-            # Key exists, update it
-            cursor.execute(f'''
-                UPDATE {self.table_name}
-                SET value = ?
-                WHERE key = ?
-            ''', (json.dumps(value), key))
-        else:
-            # Key doesn't exist, insert it with a default version
-            cursor.execute(f'''
+            WHERE key IN ({placeholders})
+        ''', keys)
+        existing = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+
+        values: dict[str, Any] = {}
+        changed: list[tuple[str, str, str]] = []
+        for key, (version, value) in entries.items():
+            row = existing.get(key)
+            if row is not None and row[0] == version:
+                values[key] = json.loads(row[1])
+                continue
+            values[key] = value
+            changed.append((key, version, json.dumps(value)))
+        if changed:
+            cursor.executemany(f'''
                 INSERT INTO {self.table_name} (key, version, value)
                 VALUES (?, ?, ?)
-            ''', (key, "1.0", json.dumps(value)))
-        
-        conn.commit()
+                ON CONFLICT(key) DO UPDATE SET version = excluded.version, value = excluded.value
+            ''', changed)
+            commit_changes(conn)
+        return values, {key for key, _, _ in changed}
+    
+    def set(self, key: str, value: Any) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, values: Mapping[str, Any]) -> None:
+        """Upsert several keys in a single transaction, new keys get a default version"""
+        if not values:
+            return
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.executemany(f'''
+            INSERT INTO {self.table_name} (key, version, value)
+            VALUES (?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value
+        ''', [(key, "1.0", json.dumps(value)) for key, value in values.items()])
+        commit_changes(conn)
     
     def get(self, key: str, default: Any = None) -> Any:
         conn = get_connection()
@@ -936,7 +1312,7 @@ class KeyValueStore():
             DELETE FROM {self.table_name}
             WHERE key = ?
         ''', (key,))
-        conn.commit()
+        commit_changes(conn)
     
     def delete_all(self) -> None:
         conn = get_connection()
@@ -944,7 +1320,7 @@ class KeyValueStore():
         _ = cursor.execute(f'''
             DELETE FROM {self.table_name}
         ''')
-        conn.commit()
+        commit_changes(conn)
 
 
 @final
@@ -971,7 +1347,7 @@ class QuestDatabase():
                 ALTER TABLE {self.table_name}
                 ADD COLUMN version TEXT
             ''')
-        conn.commit()
+        commit_changes(conn)
 
     def exists(self, quest_id: str) -> bool:
         conn = get_connection()
@@ -1039,7 +1415,7 @@ class QuestDatabase():
                 version = excluded.version,
                 updated_at = CURRENT_TIMESTAMP
         ''', (quest_id, stage_id, int(active), version))
-        conn.commit()
+        commit_changes(conn)
 
     def set_active(self, quest_id: str, active: bool) -> None:
         conn = get_connection()
@@ -1049,7 +1425,7 @@ class QuestDatabase():
             SET active = ?, updated_at = CURRENT_TIMESTAMP
             WHERE quest_id = ?
         ''', (int(active), quest_id))
-        conn.commit()
+        commit_changes(conn)
 
     def delete(self, quest_id: str) -> None:
         conn = get_connection()
@@ -1058,7 +1434,7 @@ class QuestDatabase():
             DELETE FROM {self.table_name}
             WHERE quest_id = ?
         ''', (quest_id,))
-        conn.commit()
+        commit_changes(conn)
 
     def delete_all(self) -> None:
         conn = get_connection()
@@ -1066,11 +1442,12 @@ class QuestDatabase():
         cursor.execute(f'''
             DELETE FROM {self.table_name}
         ''')
-        conn.commit()
+        commit_changes(conn)
 
 @final
 class CodeStore():
-    def __init__(self, store_name: str):
+    def __init__(self, store_name: str, pragmas: Mapping[str, str | int] | None = None):
+        register_pragmas(pragmas)
         self.store_name = store_name
         self.table_name = f'{store_name}_code_v1'
         
@@ -1086,7 +1463,7 @@ class CodeStore():
                 inserted_at DATETIME DEFAULT CURRENT_TIMESTAMP
             )
         ''')
-        conn.commit()
+        commit_changes(conn)
 
     def init(self, key: str, default_code: str, default_commit_message: str, version: str = "1.0") -> CodeEntry:
         conn = get_connection()
@@ -1108,7 +1485,7 @@ class CodeStore():
             INSERT INTO {self.table_name} (key, code, commit_message, version)
             VALUES (?, ?, ?, ?)
         ''', (key, default_code, default_commit_message, version))
-        conn.commit()
+        commit_changes(conn)
         
         cursor.execute(f'''
             SELECT code, commit_message, version, unixepoch(inserted_at)
@@ -1127,7 +1504,7 @@ class CodeStore():
             INSERT INTO {self.table_name} (key, code, commit_message, version)
             VALUES (?, ?, ?, ?)
         ''', (key, code, commit_message, version))
-        conn.commit()
+        commit_changes(conn)
 
     def get_latest(self, key: str) -> CodeEntry | None:
         conn = get_connection()
@@ -1170,5 +1547,5 @@ class CodeStore():
                 LIMIT 1
             )
         ''', (key,))
-        conn.commit()
+        commit_changes(conn)
         return cursor.rowcount > 0
@@ -3,12 +3,16 @@ import json
 from os import listdir
 import os
 from os.path import join, isfile, getmtime
+from collections import deque
 from queue import Queue
 import threading
 from time import sleep
 import traceback
 from typing import TypedDict
 
+from .Database import KeyValueStore
+from .EventBus import EventBus
+from .FileWatcher import FileWatcher, create_file_watcher
 from .Logger import log
 
 class JournalEntry(TypedDict):
@@ -16,10 +20,44 @@ class JournalEntry(TypedDict):
     timestamp: str
     event: str
 
+class JournalIndexEntry(TypedDict):
+    path: str
+    size: int
+    mtime: float
+    offset: int
+    line_count: int
+    last_event_id: str | None
+
+# Events whose full payload is written to a companion file next to the journal
+AUGMENTED_EVENT_FILES: dict[str, str] = {
+    "NavRoute": "NavRoute.json",
+    "Market": "Market.json",
+    "Outfitting": "Outfitting.json",
+    "Shipyard": "Shipyard.json",
+    "Cargo": "Cargo.json",
+    "ModuleInfo": "ModulesInfo.json",
+    "ShipLocker": "ShipLocker.json",
+    "Backpack": "Backpack.json",
+}
+
 class EDJournal:
-    def __init__(self, logs_path: str):
-        self.events: Queue[JournalEntry] = Queue()
+    def __init__(self, logs_path: str, index_store: KeyValueStore | None = None, event_bus: EventBus | None = None):
+        self.events: Queue[JournalEntry] = event_bus.create_queue() if event_bus else Queue()
         self.logs_path: str = logs_path
+        # seconds between safety rescans of the journal folder, in case the watcher missed a notification
+        self.rescan_interval: float = 5.0
+        self.watcher: FileWatcher = create_file_watcher(logs_path)
+        self.latest_log: str | None = None
+
+        # persisted read position per journal file, so startup only parses lines we haven't seen yet
+        self.index_store = index_store
+        # (event id, journal, offset, line count) after each handed out entry, saved once the entry is committed
+        self._positions: deque[tuple[str, str, int, int]] = deque()
+        self._positions_lock = threading.Lock()
+        self.history_log: str | None = None
+        self.history_start_offset: int = 0
+        self.history_offset: int = 0
+        self.history_file_index: int = 0
         
         self.historic_events: list[JournalEntry] = []
         self.load_history()
@@ -32,22 +70,9 @@ class EDJournal:
         return log.replace('\\', '/').split('/')[-1] + '.' + str(file_index).zfill(6)
         
     def augment_event(self, entry: JournalEntry) -> JournalEntry:
-        if entry.get('event') == "NavRoute":
-            entry = self.augment_event_from_file(entry, "NavRoute.json")
-        if entry.get('event') == "Market":
-            entry = self.augment_event_from_file(entry, "Market.json")
-        if entry.get('event') == "Outfitting":
-            entry = self.augment_event_from_file(entry, "Outfitting.json")
-        if entry.get('event') == "Shipyard":
-            entry = self.augment_event_from_file(entry, "Shipyard.json")
-        if entry.get('event') == "Cargo":
-            entry = self.augment_event_from_file(entry, "Cargo.json")
-        if entry.get('event') == "ModuleInfo":
-            entry = self.augment_event_from_file(entry, "ModulesInfo.json")
-        if entry.get('event') == "ShipLocker":
-            entry = self.augment_event_from_file(entry, "ShipLocker.json")
-        if entry.get('event') == "Backpack":
-            entry = self.augment_event_from_file(entry, "Backpack.json")
+        filename = AUGMENTED_EVENT_FILES.get(entry.get('event'))
+        if filename:
+            entry = self.augment_event_from_file(entry, filename)
         return entry
 
     def augment_event_from_file(self, entry: JournalEntry, filename: str) -> JournalEntry:
@@ -67,27 +92,111 @@ class EDJournal:
         except Exception as e:
             log('error', f"Failed to augment event {entry.get('event')} with data from {filename}", e, traceback.format_exc())
         return entry
-        
-    def load_history(self):
-        latest_log = self.get_latest_log()
-        if latest_log is None:
+
+    def _get_resume_point(self, journal_log: str) -> tuple[int, int]:
+        """Returns the byte offset and line count to continue reading a journal from, based on the persisted index"""
+        if self.index_store is None:
+            return 0, 0
+        try:
+            entry: JournalIndexEntry | None = self.index_store.get(os.path.basename(journal_log))
+            if not entry or entry.get('path') != journal_log:
+                return 0, 0
+            size = os.path.getsize(journal_log)
+            # journals only ever grow, anything else means the file was replaced
+            if entry['size'] > size or entry['offset'] > size:
+                return 0, 0
+            return entry['offset'], entry['line_count']
+        except Exception as e:
+            log('warn', f"Ignoring journal index for {journal_log}", e)
+            return 0, 0
+
+    def _save_index(self, journal_log: str, offset: int, file_index: int):
+        if self.index_store is None:
             return
+        try:
+            stat = os.stat(journal_log)
+            entry = JournalIndexEntry(
+                path=journal_log,
+                size=stat.st_size,
+                mtime=stat.st_mtime,
+                offset=offset,
+                line_count=file_index,
+                last_event_id=self.get_event_id(journal_log, file_index) if file_index else None,
+            )
+            self.index_store.set(os.path.basename(journal_log), entry)
+        except Exception as e:
+            log('warn', f"Failed to save journal index for {journal_log}", e)
+        
+    def _add_position(self, event_id: str, journal_log: str, offset: int, file_index: int):
+        with self._positions_lock:
+            self._positions.append((event_id, journal_log, offset, file_index))
 
-        with open(latest_log, 'r', encoding='utf-8') as f:
-            file_index = 0
-            # read the file from start to finish, line by line
+    def commit_position(self, event_id: str):
+        """
+        Persists the read position after the given entry, once it and every entry before it are stored.
+        Until then a restart reads these lines again, so a crash can't skip events that were never processed.
+        """
+        position = None
+        with self._positions_lock:
+            while self._positions and self._positions[0][0] <= event_id:
+                position = self._positions.popleft()
+        if position is not None:
+            _, journal_log, offset, file_index = position
+            self._save_index(journal_log, offset, file_index)
+
+    def _read_entries(self, journal_log: str, offset: int, file_index: int, end: int | None = None) -> tuple[list[JournalEntry], int, int]:
+        """Parses the complete lines from `offset` up to `end`, returns the entries and the position after them"""
+        entries: list[JournalEntry] = []
+        # companion files only hold the latest payload, so only the last event of each kind can match
+        last_augmentable: dict[str, int] = {}
+        with open(journal_log, 'rb') as f:
+            f.seek(offset)
+            # read the file from the last known position to the end, line by line
             for line in f:
-                #log("debug", f"Loading history from {latest_log} at line {file_index}")
+                if not line.endswith(b'\n') or (end is not None and offset + len(line) > end):
+                    # incomplete line, the reading loop will pick it up once it is written
+                    break
+                offset += len(line)
                 file_index += 1
                 try:
                     entry: JournalEntry = json.loads(line)
-                    entry['id'] = self.get_event_id(latest_log, file_index)
-                    entry = self.augment_event(entry)
+                    entry['id'] = self.get_event_id(journal_log, file_index)
+                    if entry.get('event') in AUGMENTED_EVENT_FILES:
+                        last_augmentable[entry.get('event')] = len(entries)
 
-                    self.historic_events.append(entry)
+                    entries.append(entry)
                 except json.JSONDecodeError:
                     continue
-            log("debug", f"Loaded {len(self.historic_events)} historicevents from {latest_log}")
+        for index in last_augmentable.values():
+            entries[index] = self.augment_event(entries[index])
+        return entries, offset, file_index
+
+    def load_history(self):
+        latest_log = self.refresh_latest_log()
+        if latest_log is None:
+            return
+
+        start_offset, start_index = self._get_resume_point(latest_log)
+        self.historic_events, offset, file_index = self._read_entries(latest_log, start_offset, start_index)
+        if self.historic_events:
+            self._add_position(self.historic_events[-1]['id'], latest_log, offset, file_index)
+
+        self.history_log = latest_log
+        self.history_start_offset = start_offset
+        self.history_offset = offset
+        self.history_file_index = file_index
+        log("debug", f"Loaded {len(self.historic_events)} historicevents from {latest_log}")
+
+    def read_skipped_history(self) -> list[JournalEntry]:
+        """Returns the entries of the current journal that load_history skipped because of the persisted index"""
+        if self.history_log is None or self.history_start_offset == 0:
+            return []
+        try:
+            entries, _, _ = self._read_entries(self.history_log, 0, 0, end=self.history_start_offset)
+            return entries
+        except Exception as e:
+            log('error', f"Failed to read skipped journal history from {self.history_log}", e, traceback.format_exc())
+            return []
                 
     def _reading_thread(self):
         backoff = 1
@@ -100,22 +209,48 @@ class EDJournal:
                 log('info', 'Attempting to restart journal processing after failure')
                 backoff *= 2
     
+    def _wait_for_journal_changes(self) -> bool:
+        """Blocks until the watcher reports activity, returns True if the set of journal files may have changed"""
+        changes = self.watcher.wait(self.rescan_interval)
+        if not changes:
+            return True
+        return any(
+            change.kind != 'modified' and (not change.name or change.name.startswith('Journal.'))
+            for change in changes
+        )
+
     def _reading_loop(self):
+        latest_log = self.latest_log or self.refresh_latest_log()
         while True:
-            latest_log = self.get_latest_log()
             if latest_log is None:
-                sleep(1)
+                self._wait_for_journal_changes()
+                latest_log = self.refresh_latest_log()
                 continue
-            with open(latest_log, 'r', encoding='utf-8') as f:
-                file_index = 0
+            self.watcher.track(os.path.basename(latest_log))
+            with open(latest_log, 'rb') as f:
+                offset, file_index = 0, 0
+                if latest_log == self.history_log:
+                    offset, file_index = self.history_offset, self.history_file_index
+                    f.seek(offset)
+                partial_line = b''
+                switching = False
                 while True:
-                    line = f.readline() # this is blocking, so we need to check if the file has changed somehow
+                    line = f.readline()
+                    if line and not line.endswith(b'\n'):
+                        # the game is still writing this line, wait for the rest of it
+                        partial_line += line
+                        line = b''
                     if not line:
-                        if latest_log != self.get_latest_log():
+                        if switching:
                             break
-                        sleep(0.01)
+                        if self._wait_for_journal_changes() and latest_log != self.refresh_latest_log():
+                            # drain what is left in the current file before switching over
+                            switching = True
                         continue
 
+                    line = partial_line + line
+                    partial_line = b''
+                    offset += len(line)
                     file_index += 1 
                     try:
                         entry: JournalEntry = json.loads(line)
@@ -124,11 +259,16 @@ class EDJournal:
                     
                         if self.historic_events and self.historic_events[-1].get('id') >= entry.get('id'):
                             continue
+                        self._add_position(entry['id'], latest_log, offset, file_index)
                         self.events.put(entry)
                     except json.JSONDecodeError:
-                        sleep(0.1)
                         continue
-            sleep(0.01)
+            latest_log = self.latest_log
+
+    def refresh_latest_log(self) -> str | None:
+        """Rescans the journal folder and caches the newest journal file"""
+        self.latest_log = self.get_latest_log()
+        return self.latest_log
 
     def get_latest_log(self):
         try:
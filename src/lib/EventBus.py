@@ -0,0 +1,46 @@
+import threading
+from queue import Queue
+from typing import TypeVar
+
+T = TypeVar('T')
+
+
+class EventBus:
+    """
+    Wakes up the main loop whenever any producer has work for it.
+    Producers either put items into a queue created by `create_queue`, or call `notify` after changing a flag
+    the main loop reacts to (e.g. STT recording, TTS playback), so the main loop can block in `wait` instead of polling.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._notified = False
+
+    def notify(self) -> None:
+        with self._condition:
+            self._notified = True
+            self._condition.notify_all()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Blocks until notified since the last call or `timeout` seconds passed. Returns False on timeout."""
+        with self._condition:
+            if not self._notified:
+                self._condition.wait(timeout)
+            notified = self._notified
+            self._notified = False
+            return notified
+
+    def create_queue(self) -> 'BusQueue':
+        return BusQueue(self)
+
+
+class BusQueue(Queue[T]):
+    """A regular queue that notifies its EventBus whenever an item is put into it."""
+
+    def __init__(self, event_bus: EventBus, maxsize: int = 0):
+        super().__init__(maxsize)
+        self.event_bus = event_bus
+
+    def put(self, item: T, block: bool = True, timeout: float | None = None) -> None:
+        super().put(item, block, timeout)
+        self.event_bus.notify()
@@ -0,0 +1,85 @@
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from time import time
+
+from .Database import EventStore
+from .Event import Event
+from .Logger import log
+
+
+class EventHistory:
+    """
+    The events processed in this session, oldest first, as replayed into projections that are registered later on.
+    Only the newest `max_size` events of the last `max_age` seconds are kept in memory, older ones are spilled to an
+    EventStore that is cleared on startup. Historic journal events are processed at 0.0, so they are the first to go.
+    """
+
+    def __init__(self, store: EventStore, max_size: int = 5000, max_age: float = 3600.0):
+        self.store = store
+        self.max_size = max_size
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._events: deque[Event] = deque()
+        # row id of the newest spilled event, iterating the store up to it yields all spilled events in order
+        self._spilled_until_id = 0
+        self.store.delete_all()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[Event]:
+        """Yields all events of the session, the spilled ones are loaded back from the store in batches."""
+        with self._lock:
+            events = list(self._events)
+            spilled_until_id = self._spilled_until_id
+        if spilled_until_id:
+            yield from self.store.iterate(spilled_until_id)
+        yield from events
+
+    def recent(self) -> list[Event]:
+        """Returns the events that are still in memory."""
+        with self._lock:
+            return list(self._events)
+
+    def append(self, event: Event) -> None:
+        with self._lock:
+            self._events.append(event)
+
+    def extend(self, events: Iterable[Event]) -> None:
+        with self._lock:
+            self._events.extend(events)
+
+    def prepend(self, events: list[Event]) -> None:
+        """Adds older events in front of the ones in memory, `events` is ordered oldest first."""
+        with self._lock:
+            self._events.extendleft(reversed(events))
+
+    def remove_classes(self, class_names: list[str]) -> None:
+        with self._lock:
+            self._events = deque(event for event in self._events if event.__class__.__name__ not in class_names)
+            self.store.delete_classes(class_names)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._spilled_until_id = 0
+            self.store.delete_all()
+
+    def trim(self) -> int:
+        """Spills the events that exceed the size or age limit to the store, returns how many were spilled."""
+        cutoff = time() - self.max_age
+        with self._lock:
+            spilled: list[Event] = []
+            while self._events and (len(self._events) > self.max_size or self._events[0].processed_at < cutoff):
+                spilled.append(self._events.popleft())
+            if not spilled:
+                return 0
+            try:
+                for event in spilled:
+                    row_id = self.store.insert_event(event, event.processed_at, commit=False)
+                    self._spilled_until_id = row_id or self._spilled_until_id
+                self.store.commit()
+            except Exception as e:
+                log('error', 'Could not spill event history to the store, dropping', len(spilled), 'events', e)
+        return len(spilled)
@@ -1,20 +1,26 @@
 from pydantic import ValidationError
 import hashlib
 import inspect
+import os
 import traceback
 from abc import ABC, abstractmethod
 from datetime import timezone, datetime
-from typing import Any, Generic, Literal, Callable, TypeVar, final, get_type_hints, get_args, get_origin, cast
+from time import monotonic
+from typing import Any, ClassVar, Generic, Iterable, Literal, Callable, TypeVar, final, get_type_hints, get_args, get_origin, cast
 from typing_extensions import deprecated
 from pydantic import BaseModel, ValidationError
 
-from .Database import EventStore, KeyValueStore, VectorStore
+from .Database import EventStore, KeyValueStore, VectorStore, ensure_incremental_vacuum, incremental_vacuum, transaction
+from .EventBus import EventBus
+from .EventHistory import EventHistory
 from .EDJournal import *
 from .Event import Event, EventClasses, GameEvent, ConversationEvent, MemoryEvent, PluginEvent, StatusEvent, ToolEvent, ToolProcessingEvent, ExternalEvent, ProjectedEvent, QuestEvent
 from .Logger import log, show_chat_message
+from .RecentEventWindow import RecentEventWindow
 
 import threading
 from collections import defaultdict
+from itertools import chain
 
 # Type alias for projected states dictionary
 ProjectedStates = dict[str, BaseModel]
@@ -25,8 +31,12 @@ class Projection(ABC, Generic[StateModel]):
     """
     Base class for projections. Subclasses should define a StateModel class attribute
     that is a Pydantic BaseModel with default values.
+    Subclasses may also define subscribed_events, a set of event names (e.g. "FSDJump")
+    and/or event kinds (e.g. "status"). Only matching events are passed to process().
+    If it is None, the projection receives every event.
     """
     StateModel: type[BaseModel]  # Should be overridden by subclasses
+    subscribed_events: ClassVar[set[str] | None] = None
     
     def __init__(self):
         # Get the StateModel from class attribute or type hints
@@ -74,6 +84,24 @@ class Projection(ABC, Generic[StateModel]):
     def process_timer(self) -> None | list[ProjectedEvent]:
         return []
 
+    def is_subscribed(self, event_kind: str, event_name: str | None) -> bool:
+        if self.subscribed_events is None:
+            return True
+        return event_kind in self.subscribed_events or (event_name is not None and event_name in self.subscribed_events)
+
+
+def get_event_name(event: Event) -> str | None:
+    """Returns the name used to route an event to projections, e.g. the journal event name."""
+    if isinstance(event, (GameEvent, ProjectedEvent, ExternalEvent, QuestEvent)):
+        name = event.content.get('event')
+    elif isinstance(event, StatusEvent):
+        name = event.status.get('event')
+    elif isinstance(event, PluginEvent):
+        name = event.plugin_event_name
+    else:
+        return None
+    return name if isinstance(name, str) else None
+
 @final
 class EventManager:
     @staticmethod
@@ -91,6 +119,9 @@ class EventManager:
         event_store.delete_all()
         projection_store = KeyValueStore('projections')
         projection_store.delete_all()
+        # projections are rebuilt from scratch, so the journal has to be replayed from the start again
+        journal_index_store = KeyValueStore('journal_index')
+        journal_index_store.delete_all()
 
     def _is_conversation_history_event(self, event: Event) -> bool:
         return isinstance(event, (ConversationEvent, ToolEvent, ToolProcessingEvent))
@@ -102,10 +133,7 @@ class EventManager:
                 event for event in self.pending
                 if not self._is_conversation_history_event(event)
             ]
-            self.processed = [
-                event for event in self.processed
-                if not self._is_conversation_history_event(event)
-            ]
+            self.processed.remove_classes(["ConversationEvent", "ToolEvent", "ToolProcessingEvent"])
             kept_incoming: list[Event] = []
             while not self.incoming.empty():
                 event = self.incoming.get()
@@ -118,23 +146,34 @@ class EventManager:
         with self._processing_lock:
             self.short_term_memory.delete_all()
             self.projection_store.delete_all()
+            KeyValueStore('journal_index').delete_all()
             self.pending = []
-            self.processed = []
+            self.processed.clear()
             while not self.incoming.empty():
                 self.incoming.get()
+            self._saved_projection_payloads = {}
             for projection in self.projections:
                 projection.state = projection.get_default_state()
                 projection.last_processed = 0.0
-            self.save_projections()
+                self._record_projection_state(projection.__class__.__name__, projection.state.model_dump())
+                self.mark_projection_dirty(projection)
+            self.save_projections(force=True)
     
     def __init__(
             self, 
             game_events: list[str],
             memory_hook: Callable[[Any, list[Event]], None] = lambda manager, events: None,
+            projection_flush_interval: float = 1.0,
+            event_bus: EventBus | None = None,
+            event_retention_days: float = 30.0,
+            maintenance_interval: float = 3600.0,
+            history_max_events: int = 5000,
+            history_max_age: float = 3600.0,
         ):
-        self.incoming: Queue[Event] = Queue()
+        # events added from any thread wake up the main loop through the bus
+        self.event_bus = event_bus or EventBus()
+        self.incoming: Queue[Event] = self.event_bus.create_queue()
         self.pending: list[Event] = []
-        self.processed: list[Event] = []
         self.game_events = game_events
         self._conditions_registry = defaultdict(list)
         self._registry_lock = threading.Lock()
@@ -142,9 +181,38 @@ class EventManager:
         self.event_classes: list[type[Event]] = EventClasses
         self.projections: list[Projection] = []
         self.sideeffects: list[Callable[[Event, ProjectedStates], None]] = []
+        # called with each batch of events once it is committed to the store
+        self.commit_hooks: list[Callable[[list[Event]], None]] = []
+        # returns older journal entries that are not part of the history anymore, used to rebuild reset projections
+        self.history_loader: Callable[[], list[JournalEntry]] | None = None
         
-        self.short_term_memory = EventStore('events', self.event_classes)
+        try:
+            ensure_incremental_vacuum()
+        except Exception as e:
+            log('warn', 'Could not enable incremental vacuum', e)
+        # unmemorized events are kept in memory as well, so reading recent history doesn't query the store
+        self.short_term_memory = RecentEventWindow(EventStore('events', self.event_classes))
+        # events of this session, older ones are spilled to disk and only read back to replay new projections
+        self.processed = EventHistory(EventStore('history', self.event_classes), history_max_events, history_max_age)
+        # memorized events older than this are moved to the archive table by the maintenance job
+        self.event_retention_days = event_retention_days
+        self.maintenance_interval = maintenance_interval
+        self._maintenance_at: float | None = None
         self.projection_store = KeyValueStore('projections')
+        # source hashes of the projection classes, keyed by the modification time and size of their module file
+        self.projection_version_store = KeyValueStore('projection_versions')
+        self._projection_versions: dict[str, Any] | None = None
+        # projection states are written in batches, at most once per interval, and only if they changed
+        self.projection_flush_interval = projection_flush_interval
+        self._dirty_projections: set[str] = set()
+        self._saved_projection_payloads: dict[str, dict[str, Any]] = {}
+        self._projections_flushed_at: float = 0.0
+        # (event kind, event name) -> subscribed projections, in registration order
+        self._projection_routes: dict[tuple[str, str | None], list[Projection]] = {}
+        # last validated state dump per projection, so unchanged states are not validated again
+        self._projection_state_dumps: dict[str, dict[str, Any]] = {}
+        # bumped whenever the dump of a projection changes, lets consumers detect changes without comparing states
+        self._projection_revisions: dict[str, int] = {}
         self.long_term_memory = VectorStore('memory')
         self._processing_lock = threading.Lock()
         self._timer_interval = 10.0
@@ -170,19 +238,19 @@ class EventManager:
         event = QuestEvent(content=content)
         self.incoming.put(event)
 
-    def add_historic_game_events(self, events = list[dict[str, Any]]):
+    def add_historic_game_events(self, events: list[JournalEntry]):
         events_before = []
         events_after = []
-        while events:
-            content = events.pop(0)
+        for content in events:
             event = GameEvent(content=content, historic=True)
             id = event.content.get('id')
             if id > self.max_history_id:
                 events_after.append(event)
             elif id < self.min_history_id:
-                events_before.insert(0, event)
-        for event in events_before:
-            self.processed.insert(0, event)
+                events_before.append(event)
+        # the journal entries are not needed anymore once they are events
+        events.clear()
+        self.processed.prepend(events_before)
         for event in events_after:
             self.incoming.put(event)
         
@@ -302,6 +370,10 @@ class EventManager:
     def get_short_term_memory(self, limit: int = 100) -> list[Event]:
         return self.short_term_memory.get_latest(limit=limit)
 
+    def get_short_term_memory_counts(self) -> tuple[int, int]:
+        """Returns the number of unmemorized events and how many of them are conversation or tool events"""
+        return self.short_term_memory.get_counts()
+
     def get_latest_memories(self, limit: int = 10) -> list[MemoryEvent]:
         mems = self.long_term_memory.get_most_recent_entries(limit=limit)
         return [MemoryEvent(content=mem['content'], metadata=mem['metadata'], embedding=[]) for mem in mems]
@@ -310,20 +382,11 @@ class EventManager:
         with self._processing_lock:
             projected_states: ProjectedStates | None = None
             while not self.incoming.empty():
-                event = self.incoming.get()
-
-                timestamp = datetime.now(timezone.utc).timestamp()
-                event.processed_at = timestamp
-
-                self.short_term_memory.insert_event(event, event.processed_at, commit=False)
-                projected_events = self.update_projections(event, save_later=True)
-
-                self.pending.append(event)
-
-                if isinstance(event, GameEvent) and event.historic:
-                    #self.processed.append(event)
-                    continue
-
+                stored = self._store_incoming()
+                if stored is None:
+                    break
+                # the sideeffects only run once the event is committed, so they never see state that is rolled back
+                event, projected_events = stored
                 projected_states = {}
                 for projection in self.projections:
                     projected_states[projection.__class__.__name__] = projection.state
@@ -331,13 +394,82 @@ class EventManager:
                 self.trigger_sideeffects(event, projected_states)
                 for projected_event in projected_events:
                     self.trigger_sideeffects(projected_event, projected_states)
-
-            self.short_term_memory.commit()
-            self.save_projections()
-            self.processed += self.pending
-            self.pending = []
+            self.processed.trim()
 
             return projected_states
+
+    def _store_incoming(self) -> tuple[Event, list[ProjectedEvent]] | None:
+        """
+        Processes incoming events up to and including the next live one and writes them, their projected events and
+        the projection states in one commit. Returns the live event and its projected events, None if only historic
+        events were left.
+        """
+        live: tuple[Event, list[ProjectedEvent]] | None = None
+        written: list[Event] = []
+        # the event being written, until the projections processed it
+        unprojected: Event | None = None
+        try:
+            with transaction():
+                while not self.incoming.empty():
+                    event = self.incoming.get()
+
+                    timestamp = datetime.now(timezone.utc).timestamp()
+                    event.processed_at = timestamp
+
+                    unprojected = event
+                    written.append(event)
+                    self.short_term_memory.insert_event(event, event.processed_at, commit=False)
+                    projected_events = self.update_projections(event, save_later=True)
+                    unprojected = None
+
+                    self.pending.append(event)
+                    written.extend(projected_events)
+
+                    if not (isinstance(event, GameEvent) and event.historic):
+                        live = (event, projected_events)
+                        break
+
+                self.save_projections()
+        except Exception as e:
+            log('error', 'Error storing events, writing them again', e, traceback.format_exc())
+            if unprojected is not None:
+                # it failed before reaching the projections, they process it now so no event is lost
+                projected_events = self.update_projections(unprojected, save_later=True)
+                self.pending.append(unprojected)
+                if not (isinstance(unprojected, GameEvent) and unprojected.historic):
+                    live = (unprojected, projected_events)
+            if not self._store_again(written):
+                # not stored, so the journal position is not advanced and the events are read again on the next start
+                self.processed.extend(self.pending)
+                self.pending = []
+                return live
+        committed = self.pending
+        self.processed.extend(committed)
+        self.pending = []
+        self.trigger_commit_hooks(committed)
+        return live
+
+    def _store_again(self, events: list[Event]) -> bool:
+        """
+        Writes events of a rolled back transaction and all projection states again, as the projections in memory
+        already processed them. Returns whether it succeeded, otherwise the store is left as before the events.
+        """
+        # the rolled back projection states may have been recorded as saved
+        self._saved_projection_payloads = {}
+        self._dirty_projections.update(projection.__class__.__name__ for projection in self.projections)
+        try:
+            with transaction():
+                for event in events:
+                    self.short_term_memory.store.insert_event(event, event.processed_at, commit=False)
+                self.save_projections(force=True)
+        except Exception as e:
+            log('error', 'Error storing events again, they are only kept in memory', e, traceback.format_exc())
+            self._dirty_projections.update(projection.__class__.__name__ for projection in self.projections)
+            return False
+        finally:
+            # keep the in-memory window in line with what the store holds now
+            self.short_term_memory.reload()
+        return True
     
 
     def trigger_sideeffects(self, event: Event, projected_states: ProjectedStates):
@@ -349,6 +481,19 @@ class EventManager:
     
     def register_sideeffect(self, sideeffect: Callable[[Event, ProjectedStates], None]):
         self.sideeffects.append(sideeffect)
+
+    def register_commit_hook(self, hook: Callable[[list[Event]], None]):
+        self.commit_hooks.append(hook)
+
+    def set_history_loader(self, loader: Callable[[], list[JournalEntry]]):
+        self.history_loader = loader
+
+    def trigger_commit_hooks(self, events: list[Event]):
+        for hook in self.commit_hooks:
+            try:
+                hook(events)
+            except Exception as e:
+                log('error', 'Error triggering commit hook', hook, e, traceback.format_exc())
         
     def get_current_state(self) -> tuple[list[Event], ProjectedStates]:
         """
@@ -358,11 +503,19 @@ class EventManager:
         projected_states: ProjectedStates = {}
         for projection in self.projections:
             projected_states[projection.__class__.__name__] = projection.state
-        return self.processed, projected_states
+        return self.processed.recent(), projected_states
+
+    def get_subscribed_projections(self, event: Event) -> list[Projection]:
+        route_key = (event.kind, get_event_name(event))
+        projections = self._projection_routes.get(route_key)
+        if projections is None:
+            projections = [projection for projection in self.projections if projection.is_subscribed(*route_key)]
+            self._projection_routes[route_key] = projections
+        return projections
 
     def update_projections(self, event: Event, save_later: bool = False) -> list[ProjectedEvent]:
         projected_events: list[ProjectedEvent] = []
-        for projection in self.projections:
+        for projection in self.get_subscribed_projections(event):
             evts = self.update_projection(projection, event, save_later=save_later)
             projected_events.extend(evts)
         return projected_events
@@ -371,13 +524,16 @@ class EventManager:
         projection_name = projection.__class__.__name__
         try:
             projected_events = projection.process(event)
-            try:
-                cls = type(projection.state)
-                # Re-run validation using the same model class
-                cls.model_validate(projection.state.model_dump())
-            except ValidationError as ve:
-                log('error', 'Validation error in projection state after processing event', event, 'in projection', projection_name, ve)
-                raise ve
+            state_dump = projection.state.model_dump()
+            if state_dump != self._projection_state_dumps.get(projection_name):
+                try:
+                    cls = type(projection.state)
+                    # Re-run validation using the same model class
+                    cls.model_validate(state_dump)
+                except ValidationError as ve:
+                    log('error', 'Validation error in projection state after processing event', event, 'in projection', projection_name, ve)
+                    raise ve
+                self._record_projection_state(projection_name, state_dump)
 
             self.check_conditions(projection_name, projection.state)
             if projected_events:
@@ -391,8 +547,9 @@ class EventManager:
             log('warn', 'Projection', projection_name, 'is running backwards in time!', 'Event:', event.processed_at, 'Projection:', projection.last_processed)
         if event.processed_at > 0:
             projection.last_processed = max(projection.last_processed, event.processed_at)
+        self.mark_projection_dirty(projection)
         if not save_later:
-            self.projection_store.set(projection_name, {"state": projection.state.model_dump(), "last_processed": projection.last_processed})
+            self.save_projections(force=True)
         return projected_events if projected_events else []
 
     def _run_projection_timer(self):
@@ -401,6 +558,29 @@ class EventManager:
                 self.process_timer_tick()
             except Exception as e:
                 log('error', 'Error running projection timer', e, traceback.format_exc())
+            if self._maintenance_at is None or monotonic() - self._maintenance_at >= self.maintenance_interval:
+                self._maintenance_at = monotonic()
+                try:
+                    self.run_maintenance()
+                except Exception as e:
+                    log('error', 'Error running event store maintenance', e, traceback.format_exc())
+
+    def run_maintenance(self, batch_size: int = 1000) -> int:
+        """Archives memorized events older than the retention period and returns free pages to the file system."""
+        before = datetime.now(timezone.utc).timestamp() - self.event_retention_days * 24 * 60 * 60
+        archived = 0
+        while True:
+            # in batches, so event processing is only blocked briefly
+            with self._processing_lock:
+                count = self.short_term_memory.archive_memorized(before, limit=batch_size)
+            archived += count
+            if count < batch_size:
+                break
+        with self._processing_lock:
+            incremental_vacuum()
+        if archived:
+            log('debug', 'Archived', archived, 'memorized events')
+        return archived
 
     def process_timer_tick(self):
         with self._processing_lock:
@@ -415,6 +595,7 @@ class EventManager:
                 projection_name = projection.__class__.__name__
                 try:
                     evts = projection.process_timer() or []
+                    self._record_projection_state(projection_name, projection.state.model_dump())
                     self.check_conditions(projection_name, projection.state)
                     if evts:
                         projected_events.extend(evts)
@@ -422,11 +603,7 @@ class EventManager:
                     log('error', 'Error processing timer for projection', projection_name, e, traceback.format_exc())
                     continue
                 projection.last_processed = timestamp
-                # Persist Pydantic state as plain dict to keep JSON serialization working
-                self.projection_store.set(
-                    projection_name,
-                    {"state": projection.state.model_dump(), "last_processed": projection.last_processed},
-                )
+                self.mark_projection_dirty(projection)
 
             if projected_events:
                 projected_states = {p.__class__.__name__: p.state.copy() for p in self.projections}
@@ -437,51 +614,204 @@ class EventManager:
                     self.trigger_sideeffects(evt, projected_states)
 
                 self.short_term_memory.commit()
-                self.save_projections()
-                self.processed += self.pending
+                self.processed.extend(self.pending)
                 self.pending = []
+            self.processed.trim()
+
+            # also flushes states that were deferred by the flush interval while no new events arrived
+            self.save_projections()
+
+    def _record_projection_state(self, projection_name: str, state_dump: dict[str, Any]) -> bool:
+        if self._projection_state_dumps.get(projection_name) == state_dump:
+            return False
+        self._projection_state_dumps[projection_name] = state_dump
+        self._projection_revisions[projection_name] = self._projection_revisions.get(projection_name, 0) + 1
+        return True
 
-    def save_projections(self):
+    def get_projection_revisions(self) -> dict[str, int]:
+        """Returns the current revision of every projection state, it increases whenever the state changes."""
+        return dict(self._projection_revisions)
+
+    def get_projection_state_dump(self, projection_name: str) -> dict[str, Any] | None:
+        """Returns the dumped state of a projection as of its current revision. Must not be mutated."""
+        return self._projection_state_dumps.get(projection_name)
+
+    def get_projection_snapshot(self) -> tuple[dict[str, int], dict[str, dict[str, Any]]]:
+        """Returns matching revisions and state dumps of all projections, safe to call from other threads."""
+        with self._processing_lock:
+            return dict(self._projection_revisions), dict(self._projection_state_dumps)
+
+    def mark_projection_dirty(self, projection: Projection):
+        self._dirty_projections.add(projection.__class__.__name__)
+
+    def save_projections(self, force: bool = False):
+        """
+        Persists the states of all dirty projections in a single transaction.
+        Unless forced, this happens at most once per projection_flush_interval.
+        """
+        now = monotonic()
+        if not force and now - self._projections_flushed_at < self.projection_flush_interval:
+            return
+        self._projections_flushed_at = now
+        if not self._dirty_projections:
+            return
+
+        changed: dict[str, dict[str, Any]] = {}
         for projection in self.projections:
-            self.projection_store.set(projection.__class__.__name__, {"state": projection.state.model_dump(), "last_processed": projection.last_processed})
+            projection_name = projection.__class__.__name__
+            if projection_name not in self._dirty_projections:
+                continue
+            payload = {"state": projection.state.model_dump(), "last_processed": projection.last_processed}
+            if self._saved_projection_payloads.get(projection_name) != payload:
+                changed[projection_name] = payload
+        self._dirty_projections.clear()
+        if not changed:
+            return
+
+        try:
+            self.projection_store.set_many(changed)
+            self._saved_projection_payloads.update(changed)
+        except Exception as e:
+            log('error', 'Error saving projection states', e, traceback.format_exc())
+            self._dirty_projections.update(changed.keys())
     
     def register_projection(self, projection: Projection, raise_error: bool = True):
-        projection_class_name = projection.__class__.__name__
-        projection_source = inspect.getsource(projection.__class__)
-        projection_version = hashlib.sha256(projection_source.encode()).hexdigest()
-        log('debug', 'Register projection', projection_class_name, 'version', projection_version)
-        
-        try:
-            # Get the state model type for deserialization
-            state_model_type = projection._get_state_model_type()
-            default_state_dict = projection.get_default_state().model_dump()
-            stored = self.projection_store.init(projection_class_name, projection_version, {"state": default_state_dict, "last_processed": 0.0})
+        self.register_projections([projection], raise_error=raise_error)
 
-            # Deserialize state from dict to Pydantic model
+    def register_projections(self, projections: list[Projection], raise_error: bool = True):
+        """
+        Registers several projections at once: their versions and stored states are loaded together and
+        the history is replayed in a single pass, each event going to the projections that have not seen it yet.
+        """
+        started_at = monotonic()
+        candidates: list[Projection] = []
+        versions: dict[str, str] = {}
+        defaults: dict[str, dict[str, Any]] = {}
+        for projection in projections:
+            projection_class_name = projection.__class__.__name__
             try:
-                projection.state = state_model_type.model_validate(stored["state"])
-                projection.last_processed = stored["last_processed"]
-            except ValidationError as ve:
-                log('error', 'Validation error while deserializing state for projection', projection_class_name, ve)
-                try:
-                    projection.state = state_model_type.model_validate(default_state_dict)
-                except ValidationError as default_exc:
-                    log('error', 'Default state validation failed for projection', projection_class_name, default_exc)
-                    projection.state = state_model_type.model_construct()  # type: ignore[assignment]
-                    projection.last_processed = 0.0
+                versions[projection_class_name] = self._get_projection_version(projection.__class__)
+                defaults[projection_class_name] = projection.get_default_state().model_dump()
+                candidates.append(projection)
+            except Exception as e:
+                if raise_error:
+                    raise
+                log('error', 'Error registering projection', projection, e, traceback.format_exc())
+        versions_at = monotonic()
+
+        stored_payloads, reset_names = self.projection_store.init_many({
+            name: (versions[name], {"state": default_state_dict, "last_processed": 0.0})
+            for name, default_state_dict in defaults.items()
+        })
+        registered: list[Projection] = []
+        # new projections and those whose version or stored state changed start over from the default state
+        reset: list[Projection] = []
+        for projection in candidates:
+            projection_class_name = projection.__class__.__name__
+            log('debug', 'Register projection', projection_class_name, 'version', versions[projection_class_name])
+            try:
+                restored = self._load_projection_state(projection, stored_payloads[projection_class_name], defaults[projection_class_name])
+                registered.append(projection)
+                if projection_class_name in reset_names or not restored:
+                    reset.append(projection)
+            except Exception as e:
+                if raise_error:
+                    raise
+                log('error', 'Error registering projection', projection, e, traceback.format_exc())
+        states_at = monotonic()
 
-            for event in self.processed + self.pending:
-                if event.processed_at > 0.0 and event.processed_at <= projection.last_processed:
-                    # log('debug', 'skipping update due to timestamp')
-                    continue
-                self.update_projection(projection, event, save_later=True)
-            
-            self.projections.append(projection)
-            self.save_projections()
+        replayed = 0
+        try:
+            # projected events of the replay are written to the short-term memory in one commit
+            with transaction():
+                if reset:
+                    # the journal lines before the resume point are only part of the stored projection states
+                    replayed += self._replay_history(self._get_skipped_history(), reset)
+                replayed += self._replay_history(chain(self.processed, list(self.pending)), registered)
         except Exception as e:
             if raise_error:
                 raise
-            log('error', 'Error registering projection', projection, e, traceback.format_exc())
+            log('error', 'Error replaying history for projections', registered, e, traceback.format_exc())
+            return
+
+        self.projections.extend(registered)
+        self._projection_routes.clear()
+        self.save_projections()
+        finished_at = monotonic()
+        log('info', f'Registered {len(registered)} projections in {finished_at - started_at:.3f}s '
+            f'(versions {versions_at - started_at:.3f}s, states {states_at - versions_at:.3f}s, '
+            f'replay of {replayed} events {finished_at - states_at:.3f}s)')
+
+    def _get_skipped_history(self) -> list[Event]:
+        if self.history_loader is None:
+            return []
+        return [
+            GameEvent(content=entry, historic=True) for entry in self.history_loader()
+            if not self.min_history_id or entry.get('id', '') < self.min_history_id
+        ]
+
+    def _replay_history(self, events: Iterable[Event], projections: list[Projection]) -> int:
+        """Sends each event to the subscribed projections that have not processed it yet, returns the number of events"""
+        replayed = 0
+        routes: dict[tuple[str, str | None], list[Projection]] = {}
+        for event in events:
+            route_key = (event.kind, get_event_name(event))
+            route = routes.get(route_key)
+            if route is None:
+                route = routes[route_key] = [p for p in projections if p.is_subscribed(*route_key)]
+            for projection in route:
+                if event.processed_at > 0.0 and event.processed_at <= projection.last_processed:
+                    continue
+                self.update_projection(projection, event, save_later=True)
+            replayed += 1
+        return replayed
+
+    def _get_projection_version(self, projection_class: type) -> str:
+        """Hashes the source of a projection class, reusing the stored hash while its module file is unchanged"""
+        key = f'{projection_class.__module__}.{projection_class.__qualname__}'
+        try:
+            source_file = inspect.getsourcefile(projection_class)
+            file_stat = os.stat(source_file) if source_file else None
+        except (TypeError, OSError):
+            file_stat = None
+        file_key = [file_stat.st_mtime_ns, file_stat.st_size] if file_stat else None
+
+        if self._projection_versions is None:
+            self._projection_versions = self.projection_version_store.get_all()
+        cached = self._projection_versions.get(key)
+        if file_key and cached and cached.get("file") == file_key:
+            return cached["version"]
+
+        projection_source = inspect.getsource(projection_class)
+        projection_version = hashlib.sha256(projection_source.encode()).hexdigest()
+        if file_key:
+            self._projection_versions[key] = {"file": file_key, "version": projection_version}
+            self.projection_version_store.set(key, self._projection_versions[key])
+        return projection_version
+
+    def _load_projection_state(self, projection: Projection, stored: dict[str, Any], default_state_dict: dict[str, Any]) -> bool:
+        """Restores the stored state of a projection, returns False if it had to fall back to the default state"""
+        projection_class_name = projection.__class__.__name__
+        # Get the state model type for deserialization
+        state_model_type = projection._get_state_model_type()
+
+        # Deserialize state from dict to Pydantic model
+        restored = True
+        try:
+            projection.state = state_model_type.model_validate(stored["state"])
+            projection.last_processed = stored["last_processed"]
+        except ValidationError as ve:
+            log('error', 'Validation error while deserializing state for projection', projection_class_name, ve)
+            restored = False
+            try:
+                projection.state = state_model_type.model_validate(default_state_dict)
+            except ValidationError as default_exc:
+                log('error', 'Default state validation failed for projection', projection_class_name, default_exc)
+                projection.state = state_model_type.model_construct()  # type: ignore[assignment]
+                projection.last_processed = 0.0
+        self._saved_projection_payloads[projection_class_name] = {"state": projection.state.model_dump(), "last_processed": projection.last_processed}
+        self._record_projection_state(projection_class_name, self._saved_projection_payloads[projection_class_name]["state"])
+        return restored
 
     def wait_for_condition(self, projection_name: str, condition_fn, timeout=None):
         """
@@ -0,0 +1,190 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Literal
+
+from .Logger import log
+
+FileChangeKind = Literal['created', 'modified', 'deleted']
+
+
+@dataclass
+class FileChange:
+    kind: FileChangeKind
+    name: str
+
+
+class FileWatcher(ABC):
+    """
+    Watches a single directory and reports changes to the files inside it.
+    Callers block in `wait` instead of polling the files themselves.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def track(self, filename: str) -> None:
+        """Request modification reports for a file. Backends that see every file anyway may ignore this."""
+        pass
+
+    @abstractmethod
+    def wait(self, timeout: float | None = None) -> list[FileChange]:
+        """Block until at least one change is observed or `timeout` seconds passed. Returns an empty list on timeout."""
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class PollingFileWatcher(FileWatcher):
+    """
+    Portable fallback that stats the directory and the tracked files.
+    The directory is only listed when its own mtime changes, i.e. when entries were created or removed.
+    """
+
+    def __init__(self, directory: str, poll_interval: float = 0.05):
+        super().__init__(directory)
+        self.poll_interval = poll_interval
+        self._tracked: dict[str, tuple[int, int] | None] = {}
+        self._dir_mtime = self._stat_dir()
+        self._entries = self._list_dir()
+
+    def _stat_dir(self) -> int | None:
+        try:
+            return os.stat(self.directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def _list_dir(self) -> set[str]:
+        try:
+            return set(os.listdir(self.directory))
+        except OSError:
+            return set()
+
+    def _stat_file(self, filename: str) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(os.path.join(self.directory, filename))
+            return (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            return None
+
+    def track(self, filename: str) -> None:
+        if filename not in self._tracked:
+            self._tracked[filename] = self._stat_file(filename)
+
+    def _poll(self) -> list[FileChange]:
+        changes: list[FileChange] = []
+        dir_mtime = self._stat_dir()
+        if dir_mtime != self._dir_mtime:
+            self._dir_mtime = dir_mtime
+            entries = self._list_dir()
+            changes.extend(FileChange('created', name) for name in sorted(entries - self._entries))
+            changes.extend(FileChange('deleted', name) for name in sorted(self._entries - entries))
+            self._entries = entries
+
+        for filename, previous in self._tracked.items():
+            current = self._stat_file(filename)
+            if current != previous:
+                self._tracked[filename] = current
+                if current is not None and not any(change.name == filename for change in changes):
+                    changes.append(FileChange('modified', filename))
+        return changes
+
+    def wait(self, timeout: float | None = None) -> list[FileChange]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changes = self._poll()
+            if changes:
+                return changes
+            if deadline is None:
+                time.sleep(self.poll_interval)
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return []
+            time.sleep(min(self.poll_interval, remaining))
+
+
+class InotifyFileWatcher(FileWatcher):
+    """Linux backend using inotify through libc, so the reader only wakes up when the kernel reports a change."""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    _EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self, directory: str):
+        super().__init__(directory)
+        libc_name = ctypes.util.find_library('c')
+        if not libc_name:
+            raise OSError('libc not found')
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_FROM | self.IN_MOVED_TO | self.IN_CREATE | self.IN_DELETE
+        wd = libc.inotify_add_watch(fd, os.fsencode(directory), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, f'inotify_add_watch failed for {directory}')
+        self._fd: int | None = fd
+
+    def _parse(self, buffer: bytes) -> list[FileChange]:
+        changes: list[FileChange] = []
+        offset = 0
+        while offset + self._EVENT_HEADER.size <= len(buffer):
+            _wd, mask, _cookie, length = self._EVENT_HEADER.unpack_from(buffer, offset)
+            offset += self._EVENT_HEADER.size
+            name = buffer[offset:offset + length].rstrip(b'\0').decode('utf-8', errors='replace')
+            offset += length
+            if mask & self.IN_Q_OVERFLOW:
+                # Events were dropped, let the caller treat it like a directory change
+                changes.append(FileChange('created', ''))
+            elif mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                changes.append(FileChange('created', name))
+            elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                changes.append(FileChange('deleted', name))
+            elif mask & (self.IN_MODIFY | self.IN_CLOSE_WRITE):
+                changes.append(FileChange('modified', name))
+        return changes
+
+    def wait(self, timeout: float | None = None) -> list[FileChange]:
+        if self._fd is None:
+            raise RuntimeError('FileWatcher is closed')
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        return self._parse(buffer)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def create_file_watcher(directory: str) -> FileWatcher:
+    """Returns the most efficient watcher available on this platform, falling back to polling."""
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyFileWatcher(directory)
+        except Exception as e:
+            log('warn', f'inotify unavailable for {directory}, falling back to polling', e)
+    return PollingFileWatcher(directory)
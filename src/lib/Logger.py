@@ -283,6 +283,8 @@ class PromptUsageStats:
     web_search_chars: int = 0
     genui_chars: int = 0
     reuse_chars: int = 0
+    # leading chars of the prompt that are laid out to stay unchanged for the next request
+    cacheable_prefix_chars: int = 0
 
     def compute_total(self) -> int:
         return (
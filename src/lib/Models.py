@@ -1,13 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, Generator, Iterable
+from dataclasses import dataclass
+from typing import Any, List, Optional, Generator, Iterable, Iterator
 import io
 import base64
 import json
+import queue
 import speech_recognition as sr
 import soundfile as sf
 import numpy as np
 import threading
 import traceback
+from collections import OrderedDict
+from concurrent.futures import Future
 from time import sleep, time
 from uuid import uuid4
 import edge_tts
@@ -23,6 +27,17 @@ class LLMError(Exception):
         super().__init__(message)
         self.original_error = original_error
 
+@dataclass
+class LLMStreamDelta:
+    """
+    A piece of a streamed completion. Text arrives as it is generated, while tool calls are only handed out
+    fully assembled on the final delta, together with the usage of the whole request.
+    """
+    text: str | None = None
+    tool_call_started: bool = False
+    tool_calls: List[Any] | None = None
+    usage: ModelUsageStats | None = None
+
 class LLMModel(ABC):
     model_name: str
     provider_name: str | None
@@ -35,6 +50,13 @@ class LLMModel(ABC):
     def generate(self, messages: List[dict], tools: Optional[List[dict]] = None, tool_choice: Optional[Any] = None) -> tuple[str | None, List[Any] | None, ModelUsageStats]:
         pass
 
+    def generate_stream(self, messages: List[dict], tools: Optional[List[dict]] = None, tool_choice: Optional[Any] = None) -> Iterator[LLMStreamDelta]:
+        """Models without a streaming API hand out the whole response at once."""
+        response_text, response_actions, usage = self.generate(messages, tools, tool_choice)
+        if response_text:
+            yield LLMStreamDelta(text=response_text)
+        yield LLMStreamDelta(tool_calls=response_actions or None, usage=usage)
+
 class EmbeddingModel(ABC):
     model_name: str
 
@@ -153,13 +175,41 @@ def _normalize_tool_schema(schema: Any) -> Any:
     return normalized
 
 
+_NORMALIZED_TOOLS_CACHE_SIZE = 512
+# id(tool) -> (tool, normalized tool). The tool itself is kept alive so its id can't be reused by another object.
+_normalized_tools_cache: OrderedDict[int, tuple[Any, dict[str, Any] | None]] = OrderedDict()
+_normalized_tools_lock = threading.Lock()
+
+
+def _normalize_tool(tool: Any) -> dict[str, Any] | None:
+    """
+    Normalizes a tool once per tool object. Registered tools are the same objects on every request and are never
+    modified, so the normalized schemas (and with them the serialized tools block) are identical between requests.
+    """
+    with _normalized_tools_lock:
+        cached = _normalized_tools_cache.get(id(tool))
+        if cached is not None and cached[0] is tool:
+            _normalized_tools_cache.move_to_end(id(tool))
+            return cached[1]
+
+    normalized_tool = _model_dump_compatible(tool)
+    normalized_tool = _normalize_tool_schema(normalized_tool) if isinstance(normalized_tool, dict) else None
+
+    with _normalized_tools_lock:
+        _normalized_tools_cache[id(tool)] = (tool, normalized_tool)
+        if len(_normalized_tools_cache) > _NORMALIZED_TOOLS_CACHE_SIZE:
+            _normalized_tools_cache.popitem(last=False)
+    return normalized_tool
+
+
 def _normalize_tools_for_chat_template(tools: list[dict]) -> list[dict[str, Any]]:
+    """The returned schemas are shared between calls and must not be modified."""
     normalized_tools: list[dict[str, Any]] = []
     for tool in tools:
-        normalized_tool = _model_dump_compatible(tool)
-        if not isinstance(normalized_tool, dict):
+        normalized_tool = _normalize_tool(tool)
+        if normalized_tool is None:
             continue
-        normalized_tools.append(_normalize_tool_schema(normalized_tool))
+        normalized_tools.append(normalized_tool)
     return normalized_tools
 
 def _get_reasoning_tokens(usage: Any) -> int | None:
@@ -201,6 +251,24 @@ def _get_reasoning_tokens(usage: Any) -> int | None:
 
     return None
 
+def _to_llm_error(model: LLMModel, e: Exception) -> LLMError:
+    if isinstance(e, LLMError):
+        return e
+    if not isinstance(e, APIStatusError):
+        return LLMError(f'LLM Error: {str(e)}', e)
+
+    log("debug", "LLM error request:", e.request.method, e.request.url, e.request.headers, e.request.read().decode('utf-8', errors='replace'))
+    log("debug", "LLM error response:", e.response.status_code, e.response.headers, e.response.read().decode('utf-8', errors='replace'))
+    log("error", f"LLM request failed for {model.provider_name or 'unknown'}/{model.model_name}: HTTP {e.status_code}: {e.body}")
+
+    try:
+        error: dict = e.body[0] if hasattr(e, 'body') and e.body and isinstance(e.body, list) else e.body # pyright: ignore[reportAssignmentType]
+        message = error.get('error', {}).get('message', e.body if e.body else 'Unknown error')
+    except:
+        message = e.message
+
+    return LLMError(f'LLM {e.response.reason_phrase}: {message}', e)
+
 class OpenAILLMModel(LLMModel):
     def __init__(self, base_url: str, api_key: str, model_name: str, temperature: float, reasoning_effort: Optional[str] = None, extra_body: Optional[dict] = None, extra_headers: Optional[dict] = None, provider_name: str | None = None):
         super().__init__(model_name, provider_name=provider_name)
@@ -217,8 +285,7 @@ class OpenAILLMModel(LLMModel):
     def _extract_response_text(self, content: Any) -> str | None:
         return content if isinstance(content, str) and content else None
 
-    def generate(self, messages: List[dict], tools: Optional[List[dict]] = None, tool_choice: Optional[Any] = None) -> tuple[str | None, List[Any] | None, ModelUsageStats]:
-        started_at = time()
+    def _build_params(self, messages: List[dict], tools: Optional[List[dict]] = None, tool_choice: Optional[Any] = None) -> dict[str, Any]:
         kwargs = {}
         request_messages = self._prepare_messages(messages)
         # Special handling for specific models or providers if needed
@@ -268,24 +335,27 @@ class OpenAILLMModel(LLMModel):
         if self.extra_headers:
             params["extra_headers"] = self.extra_headers
 
+        return params
+
+    def _apply_usage(self, usage_metadata: ModelUsageStats, usage: Any) -> None:
+        log("debug", f'LLM completion usage', usage)
+        usage_metadata.input_tokens = usage.prompt_tokens
+        usage_metadata.output_tokens = usage.completion_tokens
+        usage_metadata.total_tokens = usage.total_tokens
+        if hasattr(usage, 'prompt_tokens_details') and usage.prompt_tokens_details:
+            usage_metadata.cached_tokens = getattr(usage.prompt_tokens_details, 'cached_tokens', 0)
+        usage_metadata.reasoning_tokens = _get_reasoning_tokens(usage)
+
+    def generate(self, messages: List[dict], tools: Optional[List[dict]] = None, tool_choice: Optional[Any] = None) -> tuple[str | None, List[Any] | None, ModelUsageStats]:
+        started_at = time()
+        params = self._build_params(messages, tools, tool_choice)
+
         try:
             raw_response = self.client.chat.completions.with_raw_response.create(**params)  # pyright: ignore[reportCallIssue]
             completion = raw_response.parse()
             retry_attempts = raw_response.retries_taken
-        except APIStatusError as e:
-            log("debug", "LLM error request:", e.request.method, e.request.url, e.request.headers, e.request.read().decode('utf-8', errors='replace'))
-            log("debug", "LLM error response:", e.response.status_code, e.response.headers, e.response.read().decode('utf-8', errors='replace'))
-            log("error", f"LLM request failed for {self.provider_name or 'unknown'}/{self.model_name}: HTTP {e.status_code}: {e.body}")
-            
-            try:
-                error: dict = e.body[0] if hasattr(e, 'body') and e.body and isinstance(e.body, list) else e.body # pyright: ignore[reportAssignmentType]
-                message = error.get('error', {}).get('message', e.body if e.body else 'Unknown error')
-            except:
-                message = e.message
-            
-            raise LLMError(f'LLM {e.response.reason_phrase}: {message}', e)
         except Exception as e:
-            raise LLMError(f'LLM Error: {str(e)}', e)
+            raise _to_llm_error(self, e)
 
         if not isinstance(completion, ChatCompletion) or hasattr(completion, 'error'):
             log("debug", "LLM completion error:", completion)
@@ -324,13 +394,7 @@ class OpenAILLMModel(LLMModel):
             retry_attempts=retry_attempts,
         )
         if hasattr(completion, 'usage') and completion.usage:
-            log("debug", f'LLM completion usage', completion.usage)
-            usage_metadata.input_tokens = completion.usage.prompt_tokens
-            usage_metadata.output_tokens = completion.usage.completion_tokens
-            usage_metadata.total_tokens = completion.usage.total_tokens
-            if hasattr(completion.usage, 'prompt_tokens_details') and completion.usage.prompt_tokens_details:
-                usage_metadata.cached_tokens = getattr(completion.usage.prompt_tokens_details, 'cached_tokens', 0)
-            usage_metadata.reasoning_tokens = _get_reasoning_tokens(completion.usage)
+            self._apply_usage(usage_metadata, completion.usage)
         
         response_text = None
         if hasattr(completion.choices[0].message, 'content'):
@@ -353,6 +417,75 @@ class OpenAILLMModel(LLMModel):
 
         return (response_text, response_actions, usage_metadata)
 
+    def generate_stream(self, messages: List[dict], tools: Optional[List[dict]] = None, tool_choice: Optional[Any] = None) -> Iterator[LLMStreamDelta]:
+        started_at = time()
+        params = self._build_params(messages, tools, tool_choice)
+        params["stream"] = True
+        params["stream_options"] = {"include_usage": True}
+
+        try:
+            raw_response = self.client.chat.completions.with_raw_response.create(**params)  # pyright: ignore[reportCallIssue]
+            stream = raw_response.parse()
+            retry_attempts = raw_response.retries_taken
+        except Exception as e:
+            raise _to_llm_error(self, e)
+
+        usage_metadata = ModelUsageStats(
+            provider=self.provider_name,
+            model_name=self.model_name,
+            retry_attempts=retry_attempts,
+        )
+        output_chars = 0
+        # tool call arguments arrive in fragments, keyed by the index of the call
+        tool_call_parts: dict[int, dict[str, str]] = {}
+        try:
+            for chunk in stream:
+                if getattr(chunk, 'usage', None):
+                    self._apply_usage(usage_metadata, chunk.usage)
+                if not chunk.choices or not chunk.choices[0].delta:
+                    continue
+                delta = chunk.choices[0].delta
+
+                text = self._extract_response_text(delta.content)
+                if text:
+                    if usage_metadata.time_to_first_token_ms is None:
+                        usage_metadata.time_to_first_token_ms = (time() - started_at) * 1000
+                    output_chars += len(text)
+                    yield LLMStreamDelta(text=text)
+
+                for tool_call in delta.tool_calls or []:
+                    parts = tool_call_parts.get(tool_call.index)
+                    if parts is None:
+                        parts = tool_call_parts[tool_call.index] = {"id": "", "name": "", "arguments": ""}
+                        yield LLMStreamDelta(tool_call_started=True)
+                    if tool_call.id:
+                        parts["id"] = tool_call.id
+                    if tool_call.function:
+                        if tool_call.function.name:
+                            parts["name"] = tool_call.function.name
+                        if tool_call.function.arguments:
+                            parts["arguments"] += tool_call.function.arguments
+        except Exception as e:
+            raise _to_llm_error(self, e)
+        finally:
+            stream.close()
+
+        tool_calls = [
+            ChatCompletionMessageFunctionToolCall.model_validate({
+                "type": "function",
+                "id": parts["id"] or f"call_{uuid4().hex}",
+                "function": {
+                    "name": parts["name"],
+                    "arguments": parts["arguments"] or "{}",
+                },
+            })
+            for _, parts in sorted(tool_call_parts.items())
+        ]
+        usage_metadata.response_ms = (time() - started_at) * 1000
+        if output_chars:
+            usage_metadata.output_chars = output_chars
+        yield LLMStreamDelta(tool_calls=tool_calls or None, usage=usage_metadata)
+
     def list_models(self) -> List[str]:
         try:
             models = self.client.models.list()
@@ -369,6 +502,8 @@ class OpenAIResponsesLLMModel(LLMModel):
         self.reasoning_effort = reasoning_effort
         self.extra_body = extra_body or {}
         self.extra_headers = extra_headers or {}
+        # the last tool list and its conversion, tool lists are reused between requests
+        self._converted_tools: tuple[List[dict], list[dict[str, Any]]] | None = None
 
     def _has_message_content(self, content: Any) -> bool:
         if content is None:
@@ -508,6 +643,10 @@ class OpenAIResponsesLLMModel(LLMModel):
         return converted_messages
 
     def _convert_tools(self, tools: List[dict]) -> list[dict[str, Any]]:
+        cached = self._converted_tools
+        if cached is not None and cached[0] is tools:
+            return cached[1]
+
         converted_tools: list[dict[str, Any]] = []
 
         for raw_tool in _normalize_tools_for_chat_template(tools):
@@ -531,6 +670,7 @@ class OpenAIResponsesLLMModel(LLMModel):
 
             converted_tools.append(tool)
 
+        self._converted_tools = (tools, converted_tools)
         return converted_tools
 
     def _convert_tool_choice(self, tool_choice: Any) -> Any:
@@ -568,8 +708,7 @@ class OpenAIResponsesLLMModel(LLMModel):
 
         return tool_calls or None
 
-    def generate(self, messages: List[dict], tools: Optional[List[dict]] = None, tool_choice: Optional[Any] = None) -> tuple[str | None, List[Any] | None, ModelUsageStats]:
-        started_at = time()
+    def _build_params(self, messages: List[dict], tools: Optional[List[dict]] = None, tool_choice: Optional[Any] = None) -> dict[str, Any]:
         params: dict[str, Any] = {
             "model": self.model_name,
             "input": self._convert_messages(messages),
@@ -593,24 +732,27 @@ class OpenAIResponsesLLMModel(LLMModel):
         if self.extra_headers:
             params["extra_headers"] = self.extra_headers
 
+        return params
+
+    def _apply_usage(self, usage_metadata: ModelUsageStats, usage: Any) -> None:
+        log("debug", "LLM response usage", usage)
+        usage_metadata.input_tokens = getattr(usage, "input_tokens", 0)
+        usage_metadata.output_tokens = getattr(usage, "output_tokens", 0)
+        usage_metadata.total_tokens = getattr(usage, "total_tokens", 0)
+        if hasattr(usage, "input_tokens_details") and usage.input_tokens_details:
+            usage_metadata.cached_tokens = getattr(usage.input_tokens_details, "cached_tokens", 0)
+        usage_metadata.reasoning_tokens = _get_reasoning_tokens(usage)
+
+    def generate(self, messages: List[dict], tools: Optional[List[dict]] = None, tool_choice: Optional[Any] = None) -> tuple[str | None, List[Any] | None, ModelUsageStats]:
+        started_at = time()
+        params = self._build_params(messages, tools, tool_choice)
+
         try:
             raw_response = self.client.responses.with_raw_response.create(**params)
             response = raw_response.parse()
             retry_attempts = raw_response.retries_taken
-        except APIStatusError as e:
-            log("debug", "LLM error request:", e.request.method, e.request.url, e.request.headers, e.request.read().decode('utf-8', errors='replace'))
-            log("debug", "LLM error response:", e.response.status_code, e.response.headers, e.response.read().decode('utf-8', errors='replace'))
-            log("error", f"LLM request failed for {self.provider_name or 'unknown'}/{self.model_name}: HTTP {e.status_code}: {e.body}")
-
-            try:
-                error: dict = e.body[0] if hasattr(e, 'body') and e.body and isinstance(e.body, list) else e.body # pyright: ignore[reportAssignmentType]
-                message = error.get('error', {}).get('message', e.body if e.body else 'Unknown error')
-            except:
-                message = e.message
-
-            raise LLMError(f'LLM {e.response.reason_phrase}: {message}', e)
         except Exception as e:
-            raise LLMError(f'LLM Error: {str(e)}', e)
+            raise _to_llm_error(self, e)
 
         if getattr(response, "error", None):
             log("debug", "LLM response error:", response)
@@ -623,13 +765,7 @@ class OpenAIResponsesLLMModel(LLMModel):
             retry_attempts=retry_attempts,
         )
         if hasattr(response, 'usage') and response.usage:
-            log("debug", "LLM response usage", response.usage)
-            usage_metadata.input_tokens = getattr(response.usage, "input_tokens", 0)
-            usage_metadata.output_tokens = getattr(response.usage, "output_tokens", 0)
-            usage_metadata.total_tokens = getattr(response.usage, "total_tokens", 0)
-            if hasattr(response.usage, "input_tokens_details") and response.usage.input_tokens_details:
-                usage_metadata.cached_tokens = getattr(response.usage.input_tokens_details, "cached_tokens", 0)
-            usage_metadata.reasoning_tokens = _get_reasoning_tokens(response.usage)
+            self._apply_usage(usage_metadata, response.usage)
 
         response_text = getattr(response, "output_text", None) or None
         response_actions = self._extract_tool_calls(response)
@@ -642,6 +778,57 @@ class OpenAIResponsesLLMModel(LLMModel):
 
         return (response_text, response_actions, usage_metadata)
 
+    def generate_stream(self, messages: List[dict], tools: Optional[List[dict]] = None, tool_choice: Optional[Any] = None) -> Iterator[LLMStreamDelta]:
+        started_at = time()
+        params = self._build_params(messages, tools, tool_choice)
+        params["stream"] = True
+
+        try:
+            raw_response = self.client.responses.with_raw_response.create(**params)
+            stream = raw_response.parse()
+            retry_attempts = raw_response.retries_taken
+        except Exception as e:
+            raise _to_llm_error(self, e)
+
+        usage_metadata = ModelUsageStats(
+            provider=self.provider_name,
+            model_name=self.model_name,
+            retry_attempts=retry_attempts,
+        )
+        output_chars = 0
+        response = None
+        try:
+            for event in stream:
+                event_type = getattr(event, "type", None)
+                if event_type == "response.output_text.delta" and event.delta:
+                    if usage_metadata.time_to_first_token_ms is None:
+                        usage_metadata.time_to_first_token_ms = (time() - started_at) * 1000
+                    output_chars += len(event.delta)
+                    yield LLMStreamDelta(text=event.delta)
+                elif event_type == "response.output_item.added" and getattr(event.item, "type", None) == "function_call":
+                    yield LLMStreamDelta(tool_call_started=True)
+                elif event_type in ("response.completed", "response.incomplete"):
+                    response = event.response
+                elif event_type == "response.failed":
+                    log("debug", "LLM response error:", event.response)
+                    raise LLMError("LLM error: No valid response received")
+                elif event_type == "error":
+                    raise LLMError(f"LLM Error: {getattr(event, 'message', event)}")
+        except Exception as e:
+            raise _to_llm_error(self, e)
+        finally:
+            stream.close()
+
+        if response is None:
+            raise LLMError("LLM error: No valid response received")
+
+        if hasattr(response, 'usage') and response.usage:
+            self._apply_usage(usage_metadata, response.usage)
+        usage_metadata.response_ms = (time() - started_at) * 1000
+        if output_chars:
+            usage_metadata.output_chars = output_chars
+        yield LLMStreamDelta(tool_calls=self._extract_tool_calls(response), usage=usage_metadata)
+
     def list_models(self) -> List[str]:
         try:
             models = self.client.models.list()
@@ -671,6 +858,8 @@ class OpenAIEmbeddingModel(EmbeddingModel):
 class STTModel(ABC):
     model_name: str
     provider_name: str | None
+    # whether the phrase may be transcribed repeatedly while it is spoken, cheap enough for local models only
+    supports_streaming: bool = False
 
     def __init__(self, model_name: str, provider_name: str | None = None):
         self.model_name = model_name
@@ -680,6 +869,10 @@ class STTModel(ABC):
     def transcribe(self, audio: sr.AudioData) -> str:
         pass
 
+    def transcribe_pcm(self, pcm: bytes) -> str:
+        """Transcribes raw 16 kHz 16-bit mono PCM."""
+        return self.transcribe(sr.AudioData(pcm, 16000, 2))
+
 class OpenAISTTModel(STTModel):
     def __init__(self, base_url: str, api_key: str, model_name: str, language: Optional[str] = None, prompt: Optional[str] = None, provider_name: str | None = None):
         super().__init__(model_name, provider_name=provider_name)
@@ -725,6 +918,75 @@ class OpenAISTTModel(STTModel):
         text = transcription.text
         return text
 
+class FasterWhisperSTTModel(STTModel):
+    """
+    Runs Whisper locally through CTranslate2, so speech recognition needs neither a network round trip nor an API key.
+    The model is loaded and warmed up once on a dedicated worker thread, which then runs every transcription.
+    """
+    supports_streaming = True
+
+    def __init__(self, model_name: str, language: Optional[str] = None, prompt: Optional[str] = None, device: str = "cpu", compute_type: str = "int8", provider_name: str | None = None):
+        super().__init__(model_name, provider_name=provider_name)
+        self.language = language or None
+        self.prompt = prompt or None
+        self.device = device
+        self.compute_type = compute_type
+        self.ready = threading.Event()
+        self._model: Any = None
+        self._load_error: Exception | None = None
+        self._requests: queue.Queue[tuple[np.ndarray, Future[str]]] = queue.Queue()
+
+        thread = threading.Thread(target=self._worker_thread, daemon=True)
+        thread.start()
+
+    def transcribe(self, audio: sr.AudioData) -> str:
+        return self.transcribe_pcm(audio.get_raw_data(convert_rate=16000, convert_width=2))
+
+    def transcribe_pcm(self, pcm: bytes) -> str:
+        self.ready.wait()
+        if self._load_error is not None:
+            raise LLMError(f'STT model {self.model_name} could not be loaded: {self._load_error}', self._load_error)
+
+        samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+        future: Future[str] = Future()
+        self._requests.put((samples, future))
+        return future.result()
+
+    def _worker_thread(self):
+        try:
+            from faster_whisper import WhisperModel
+
+            self._model = WhisperModel(self.model_name, device=self.device, compute_type=self.compute_type)
+            # the first inference initializes the CTranslate2 kernels, so run it before the user speaks
+            start_time = time()
+            self._run(np.zeros(16000, dtype=np.float32))
+            log('debug', 'Local STT model ready', self.model_name, 'warm-up took', time() - start_time)
+        except Exception as e:
+            log('error', 'Failed to load local STT model', self.model_name, e, traceback.format_exc())
+            self._load_error = e
+            return
+        finally:
+            self.ready.set()
+
+        while True:
+            samples, future = self._requests.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self._run(samples))
+            except Exception as e:
+                future.set_exception(e)
+
+    def _run(self, samples: np.ndarray) -> str:
+        segments, _ = self._model.transcribe(
+            samples,
+            language=self.language,
+            initial_prompt=self.prompt,
+            beam_size=1,
+            condition_on_previous_text=False,
+        )
+        return ' '.join(segment.text.strip() for segment in segments).strip()
+
 class OpenAIMultiModalSTTModel(STTModel):
     def __init__(self, base_url: str, api_key: str, model_name: str, prompt: Optional[str] = None, provider_name: str | None = None):
         super().__init__(model_name, provider_name=provider_name)
@@ -850,6 +1112,8 @@ class Mp3Stream(miniaudio.StreamableSource):
 class TTSModel(ABC):
     model_name: str
     provider_name: str | None
+    # whether the same text and voice always produce the same audio, so it may be cached on disk
+    cacheable: bool = True
 
     def __init__(self, model_name: str, provider_name: str | None = None):
         self.model_name = model_name
@@ -859,12 +1123,30 @@ class TTSModel(ABC):
     def synthesize(self, text: str, voice: str) -> Iterable[bytes]:
         pass
 
+    def cache_key_parts(self, voice: str) -> dict[str, Any] | None:
+        """
+        Everything besides the text that changes the audio synthesized for `voice`, used as the speech cache key.
+        Subclasses extend it with their own settings, None means the model's audio is never cached.
+        """
+        return None
+
 class OpenAITTSModel(TTSModel):
     def __init__(self, base_url: str, api_key: str, model_name: str, speed: float = 1.0, voice_instructions: str | None = None, provider_name: str | None = None):
         super().__init__(model_name, provider_name=provider_name)
         self.client = OpenAI(base_url=base_url, api_key=api_key)
         self.speed = speed
         self.voice_instructions = voice_instructions
+        self.base_url = base_url
+
+    def cache_key_parts(self, voice: str) -> dict[str, Any] | None:
+        return {
+            'provider': self.provider_name,
+            'base_url': self.base_url,
+            'model': self.model_name,
+            'voice': voice,
+            'speed': self.speed,
+            'instructions': self.voice_instructions,
+        }
 
     def synthesize(self, text: str, voice: str) -> Iterable[bytes]:
         try:
@@ -899,6 +1181,14 @@ class EdgeTTSModel(TTSModel):
         self.speed = speed
         self.prebuffer_size = 4
 
+    def cache_key_parts(self, voice: str) -> dict[str, Any] | None:
+        return {
+            'provider': self.provider_name,
+            'model': self.model_name,
+            'voice': voice,
+            'speed': self.speed,
+        }
+
     def synthesize(self, text: str, voice: str) -> Iterable[bytes]:
         rate = f"+{int((float(self.speed) - 1) * 100)}%" if float(self.speed) > 1 else f"-{int((1 - float(self.speed)) * 100)}%"
         response = edge_tts.Communicate(text, voice=voice, rate=rate)
@@ -1004,6 +1294,14 @@ def create_stt_model(provider: str, config: dict, prefix: str = "stt") -> STTMod
             provider_name=provider,
         )
 
+    elif provider == "local-whisper":
+        return FasterWhisperSTTModel(
+            model_name,
+            language,
+            prompt,
+            provider_name=provider,
+        )
+
     elif provider == "google-ai-studio" or provider == "custom-multi-modal":
         if provider == "google-ai-studio" and not base_url:
             base_url = "https://generativelanguage.googleapis.com/v1beta"
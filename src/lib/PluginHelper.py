@@ -145,6 +145,20 @@ class PluginHelper():
                 return False
         self._assistant.register_should_reply_handler(_should_reply_check)
         
+    def register_event_renderer(self, event_name: str, renderer: Callable[[dict[str, Any]], str | None]):
+        """Register a prompt template for a game event, replacing the built-in one
+
+        :param event_name: The name of the game event, e.g. "FSDJump"
+        :param renderer: A callable that takes the event content and returns the text to add to the assistant conversation, or None to leave the event out
+        """
+        def _renderer_wrapper(content: Any, projected_states: ProjectedStates | None) -> str | None:
+            try:
+                return renderer(content)
+            except Exception as e:
+                log('error', f"Plugin event renderer raised an exception: {e}")
+                return None
+        self._prompt_generator.register_event_renderer(event_name, _renderer_wrapper)
+
     def register_status_generator(self, status_generator: Callable[[ProjectedStates], list[tuple[str, Any]]]):
         """
         Register a status generator callback, for adding stuff to the models status context (Like ship info).
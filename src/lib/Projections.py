@@ -47,44 +47,47 @@ def registerProjections(
     idle_timeout: int,
     bounty_scanned_min_bounty: int,
 ):
-    event_manager.register_projection(EventCounter())
-    event_manager.register_projection(CurrentStatus())
-    event_manager.register_projection(Location())
-    event_manager.register_projection(Missions())
-    event_manager.register_projection(EngineerProgress())
-    event_manager.register_projection(RankProgress())
-    event_manager.register_projection(CommunityGoal())
-    event_manager.register_projection(Squadron())
-    event_manager.register_projection(Reputation())
-    event_manager.register_projection(Commander())
-    event_manager.register_projection(Statistics())
-    event_manager.register_projection(FleetCarriers())
-    event_manager.register_projection(ShipInfo())
-    event_manager.register_projection(Target(bounty_scanned_min_bounty))
-    event_manager.register_projection(NavInfo(system_db))
-    event_manager.register_projection(ExobiologyScan())
-    event_manager.register_projection(Cargo())
-    event_manager.register_projection(Backpack())
-    event_manager.register_projection(SuitLoadout())
-    event_manager.register_projection(Materials())
-    event_manager.register_projection(Friends())
-    event_manager.register_projection(Powerplay())
-    event_manager.register_projection(ColonisationConstruction())
-    event_manager.register_projection(DockingEvents())
-    event_manager.register_projection(InCombat())
-    event_manager.register_projection(Wing())
-    event_manager.register_projection(FSSSignals())
-    event_manager.register_projection(Idle(idle_timeout))
-    event_manager.register_projection(StoredModules())
-    event_manager.register_projection(StoredShips())
-    event_manager.register_projection(InDockingRange())
+    # registered together, so the history is replayed once for all of them
+    event_manager.register_projections([
+        EventCounter(),
+        CurrentStatus(),
+        Location(),
+        Missions(),
+        EngineerProgress(),
+        RankProgress(),
+        CommunityGoal(),
+        Squadron(),
+        Reputation(),
+        Commander(),
+        Statistics(),
+        FleetCarriers(),
+        ShipInfo(),
+        Target(bounty_scanned_min_bounty),
+        NavInfo(system_db),
+        ExobiologyScan(),
+        Cargo(),
+        Backpack(),
+        SuitLoadout(),
+        Materials(),
+        Friends(),
+        Powerplay(),
+        ColonisationConstruction(),
+        DockingEvents(),
+        InCombat(),
+        Wing(),
+        FSSSignals(),
+        Idle(idle_timeout),
+        StoredModules(),
+        StoredShips(),
+        InDockingRange(),
 
-    event_manager.register_projection(ModuleInfo())
-    event_manager.register_projection(ShipLocker())
-    event_manager.register_projection(Loadout())
-    event_manager.register_projection(Shipyard())
-    event_manager.register_projection(Market())
-    event_manager.register_projection(Outfitting())
+        ModuleInfo(),
+        ShipLocker(),
+        Loadout(),
+        Shipyard(),
+        Market(),
+        Outfitting(),
+    ])
 
 
 # Type aliases for backward compatibility with existing imports
@@ -2,7 +2,9 @@ from datetime import timedelta, datetime, timezone
 from functools import lru_cache
 from typing import Any, Callable, cast, Dict, Union, List, Optional
 from pathlib import Path
+from collections import OrderedDict
 import random
+import threading
 
 from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
@@ -55,12 +57,54 @@ DockingTimeoutEvent = dict
 LocationEvent = dict
 NavRouteEvent = dict
 
+EventRenderer = Callable[[Any, ProjectedStates | None], str | None]
+StatusSectionBuilder = Callable[[ProjectedStates, bool], tuple[list[tuple[str, Any]], bool]]
+
+
+def _represent_status_float(dumper, value):
+    text = '{:.3f}'.format(value)
+    if '.' in text:
+        text = text.rstrip('0').rstrip('.')
+    # Check if it's effectively an integer (no decimal part left or was never there)
+    if '.' not in text or text.endswith('.'):
+        text = text.rstrip('.')
+        return dumper.represent_scalar('tag:yaml.org,2002:int', text)
+    return dumper.represent_scalar('tag:yaml.org,2002:float', text)
+
+
+class StatusDumper(yaml.SafeDumper):
+    pass
+
+
+StatusDumper.add_representer(float, _represent_status_float)
+
+
+def event_renderer(event_name: str, uses_projected_states: bool = False):
+    """Marks a PromptGenerator method as the template for `event_name`. Templates that don't look at
+    `projected_states` only depend on the event, so their output is memoized per event."""
+    def decorator(method):
+        method.rendered_event = event_name
+        method.uses_projected_states = uses_projected_states
+        return method
+    return decorator
+
+
 class PromptGenerator:
     previous_prompt_json = ''
     
-    def __init__(self, commander_name: str, character_prompt: str, important_game_events: list[str], system_db: SystemDatabase, weapon_types: list[dict] | None = None, disabled_game_events: list[str] | None = None):
+    def __init__(self, commander_name: str, character_prompt: str, important_game_events: list[str], system_db: SystemDatabase, weapon_types: list[dict] | None = None, disabled_game_events: list[str] | None = None, cache_friendly_layout: bool = False):
         self.registered_prompt_event_handlers: list[Callable[[Event], str|None]] = []
         self.registered_status_generators: list[Callable[[ProjectedStates], list[tuple[str, Any]]]] = []
+        self.event_renderers: dict[str, EventRenderer] = {}
+        self.cacheable_event_templates: set[str] = set()
+        for attribute in type(self).__dict__.values():
+            if hasattr(attribute, 'rendered_event'):
+                self.event_renderers[attribute.rendered_event] = attribute.__get__(self)
+                if not attribute.uses_projected_states:
+                    self.cacheable_event_templates.add(attribute.rendered_event)
+        self.event_template_cache_size = 1000
+        self._event_template_cache: OrderedDict[int, tuple[Event, str | None]] = OrderedDict()
+        self._event_template_cache_lock = threading.Lock()
         self.commander_name = commander_name
         self.character_prompt = character_prompt
         self.important_game_events = important_game_events
@@ -68,6 +112,32 @@ class PromptGenerator:
         self.system_db = system_db
         self.weapon_types: list[dict] = weapon_types if weapon_types is not None else []
         self.quest_db = QuestDatabase()
+        self.cache_friendly_layout = cache_friendly_layout
+        # history window of the cache-friendly layout: (kind, timestamp, processed_at) of its oldest event
+        self._history_anchor: tuple | None = None
+        self.history_min_pieces = 25
+        self.history_max_pieces = 50
+
+        # status sections in prompt order: name, projections they read, extra key derived from CurrentStatus and the states, builder
+        self.status_sections: list[tuple[str, tuple[str, ...], Callable[[dict, ProjectedStates], Any] | None, StatusSectionBuilder]] = [
+            ('vehicle', ('CurrentStatus', 'InCombat', 'ShipInfo', 'Wing'), None, self._build_vehicle_status_section),
+            ('ship', ('ShipInfo', 'Cargo', 'Backpack', 'SuitLoadout', 'Loadout'), self._get_vehicle_key, self._build_ship_section),
+            ('location', ('Location',), self._get_location_key, self._build_location_section),
+            ('community_goal', ('CommunityGoal',), None, self._build_community_goal_section),
+            ('nav_route', ('NavInfo',), None, self._build_nav_route_section),
+            ('target', ('Target',), None, self._build_target_section),
+            ('fleet_carriers', ('FleetCarriers',), None, self._build_fleet_carrier_section),
+            ('transit', ('Location', 'StoredModules', 'StoredShips'), None, self._build_transit_section),
+            ('missions', ('Missions',), None, self._build_missions_section),
+            ('quests', (), None, self._build_quest_section),
+            ('colonisation', ('ColonisationConstruction',), None, self._build_colonisation_section),
+            ('friends', ('Friends',), None, self._build_friends_section),
+            ('engineers', ('EngineerProgress',), None, self._build_engineers_section),
+            ('plugins', (), None, self._build_plugin_status_section),
+        ]
+        # (section name, search_agent_context) -> (key, rendered section)
+        self._status_section_cache: dict[tuple[str, bool], tuple[Any, str]] = {}
+        self.get_projection_revisions: Callable[[], dict[str, int]] | None = None
 
         # Pad map for station docking positions
         self.pad_map = {
@@ -131,2246 +201,2563 @@ class PromptGenerator:
     def get_event_template(self, event: Union[GameEvent, ProjectedEvent, ExternalEvent, QuestEvent], projected_states: ProjectedStates | None = None):
         content: Any = event.content
         event_name = content.get('event')
-        
-        # System events
-        if event_name == 'Materials':
-            return None
-        if event_name == 'LoadGame':
-            load_game_event = cast(LoadGameEvent, content)
-            return f"{self.commander_name} is logging into the game in {load_game_event.get('GameMode', 'unknown')} mode."
-        if event_name == 'Shutdown':
-            return f"{self.commander_name} is shutting down the game."
-        if event_name == 'NewCommander':
-            return f"{self.commander_name} is starting a new career as  {content.get('Name')}"
-        if event_name == 'Missions':
+
+        # Templates that only depend on the event itself are rendered once per event
+        cacheable = event_name in self.cacheable_event_templates or event_name not in self.event_renderers
+        if cacheable:
+            with self._event_template_cache_lock:
+                cached = self._event_template_cache.get(id(event))
+            # the cache keeps the event alive, so its id can't be reused by another event while cached
+            if cached and cached[0] is event:
+                return cached[1]
+
+        renderer = self.event_renderers.get(event_name)
+        if renderer:
+            message = renderer(content, projected_states)
+        else:
+            log('debug', f'fallback for event', event_name, content)
+            message = f"Event: {event_name}\n{yaml.dump(content)}"
+
+        if cacheable:
+            with self._event_template_cache_lock:
+                self._event_template_cache[id(event)] = (event, message)
+                if len(self._event_template_cache) > self.event_template_cache_size:
+                    self._event_template_cache.popitem(last=False)
+        return message
+
+    # System events
+    @event_renderer('Materials')
+    def _render_materials(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
+
+    @event_renderer('LoadGame')
+    def _render_load_game(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        load_game_event = cast(LoadGameEvent, content)
+        return f"{self.commander_name} is logging into the game in {load_game_event.get('GameMode', 'unknown')} mode."
+
+    @event_renderer('Shutdown')
+    def _render_shutdown(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} is shutting down the game."
+
+    @event_renderer('NewCommander')
+    def _render_new_commander(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} is starting a new career as  {content.get('Name')}"
+
+    @event_renderer('Missions')
+    def _render_missions(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
+
+    # Message events
+    @event_renderer('ReceiveText')
+    def _render_receive_text(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        receive_text_event = cast(ReceiveTextEvent, content)
+        # Ignore system-entered channel messages
+        if (receive_text_event.get('Channel', '') == 'npc' and receive_text_event.get('From', '') == ''
+            and receive_text_event.get('Message', '').startswith('$COMMS_entered:#name=')):
             return None
+        return f'Message received from {receive_text_event.get("From_Localised", receive_text_event.get("From"))} on channel {receive_text_event.get("Channel")}: "{receive_text_event.get("Message_Localised", receive_text_event.get("Message"))}"'
+
+    @event_renderer('SendText')
+    def _render_send_text(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        send_text_event = cast(SendTextEvent, content)
+        return f'{self.commander_name} sent a message to {send_text_event.get("To")}: "{send_text_event.get("Message")}"'
+
+    # Jump events
+    @event_renderer('StartJump')
+    def _render_start_jump(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        start_jump_event = cast(StartJumpEvent, content)
+        if start_jump_event.get('JumpType') == 'Hyperspace':
+            taxi_info = " (in a taxi)" if start_jump_event.get('Taxi') else ""
+            return f"{self.commander_name} is charging FSD for hyperspace jump to {start_jump_event.get('StarSystem')} [{start_jump_event.get('StarClass')} class star]{taxi_info}."
+        else:
+            return f"{self.commander_name} is preparing to enter supercruise."
+
+    @event_renderer('FSDJump')
+    def _render_fsd_jump(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        fsd_jump_event = cast(FSDJumpEvent, content)
+        jump_details = []
+        if fsd_jump_event.get('JumpDist'):
+            jump_details.append(f"jump distance: {fsd_jump_event.get('JumpDist'):.2f} ly")
+        if fsd_jump_event.get('BoostUsed'):
+            jump_details.append(f"FSD boost used")
         
-        # Message events
-        if event_name == 'ReceiveText':
-            receive_text_event = cast(ReceiveTextEvent, content)
-            # Ignore system-entered channel messages
-            if (receive_text_event.get('Channel', '') == 'npc' and receive_text_event.get('From', '') == ''
-                and receive_text_event.get('Message', '').startswith('$COMMS_entered:#name=')):
-                return None
-            return f'Message received from {receive_text_event.get("From_Localised", receive_text_event.get("From"))} on channel {receive_text_event.get("Channel")}: "{receive_text_event.get("Message_Localised", receive_text_event.get("Message"))}"'
-        if event_name == 'SendText':
-            send_text_event = cast(SendTextEvent, content)
-            return f'{self.commander_name} sent a message to {send_text_event.get("To")}: "{send_text_event.get("Message")}"'
-        
-        # Jump events
-        if event_name == 'StartJump':
-            start_jump_event = cast(StartJumpEvent, content)
-            if start_jump_event.get('JumpType') == 'Hyperspace':
-                taxi_info = " (in a taxi)" if start_jump_event.get('Taxi') else ""
-                return f"{self.commander_name} is charging FSD for hyperspace jump to {start_jump_event.get('StarSystem')} [{start_jump_event.get('StarClass')} class star]{taxi_info}."
-            else:
-                return f"{self.commander_name} is preparing to enter supercruise."
-                
-        if event_name == 'FSDJump':
-            fsd_jump_event = cast(FSDJumpEvent, content)
-            jump_details = []
-            if fsd_jump_event.get('JumpDist'):
-                jump_details.append(f"jump distance: {fsd_jump_event.get('JumpDist'):.2f} ly")
-            if fsd_jump_event.get('BoostUsed'):
-                jump_details.append(f"FSD boost used")
-            
-            details_str = ", ".join(jump_details)
-            details_str = f" ({details_str})" if details_str else ""
-            
-            population = f", population: {fsd_jump_event.get('Population'):,}" if fsd_jump_event.get('Population') else ""
-            
-            system_details = []
-            if fsd_jump_event.get('SystemAllegiance'):
-                system_details.append(f"allegiance: {fsd_jump_event.get('SystemAllegiance')}")
-            if fsd_jump_event.get('SystemEconomy'):
-                economy = fsd_jump_event.get('SystemEconomy_Localised', fsd_jump_event.get('SystemEconomy'))
-                system_details.append(f"economy: {economy}")
-            if fsd_jump_event.get('SystemGovernment'):
-                government = fsd_jump_event.get('SystemGovernment_Localised', fsd_jump_event.get('SystemGovernment'))
-                system_details.append(f"government: {government}")
-            if fsd_jump_event.get('SystemSecurity'):
-                security = fsd_jump_event.get('SystemSecurity_Localised', fsd_jump_event.get('SystemSecurity'))
-                system_details.append(f"security: {security}")
-            
-            system_details_str = ", ".join(system_details)
-            system_details_str = f" ({system_details_str})" if system_details_str else ""
-            
-            faction_info = ""
-            if fsd_jump_event.get('SystemFaction'):
-                faction_name = fsd_jump_event.get('SystemFaction', {}).get('Name', '')
-                faction_state = fsd_jump_event.get('SystemFaction', {}).get('FactionState', '')
-                if faction_name and faction_state:
-                    faction_info = f" Controlling faction: {faction_name} ({faction_state})"
-                elif faction_name:
-                    faction_info = f" Controlling faction: {faction_name}"
-            
-            return f"{self.commander_name} has arrived at {fsd_jump_event.get('StarSystem')}{details_str}{system_details_str}{population}{faction_info}"
-
-        if event_name == 'FSDTarget':
-            fsd_target_event = cast(FSDTargetEvent, content)
-            remaining = ""
-            if fsd_target_event.get('RemainingJumpsInRoute') is not None:
-                remaining = f" (Remaining jumps in route: {fsd_target_event.get('RemainingJumpsInRoute')})"
-            return f"{self.commander_name} is targeting the next jump to {fsd_target_event.get('Name')} [{fsd_target_event.get('StarClass')} class star]{remaining}"
-            
-        if event_name == 'SupercruiseEntry':
-            supercruise_entry_event = cast(SupercruiseEntryEvent, content)
-            return f"{self.commander_name} has entered supercruise in the {supercruise_entry_event.get('StarSystem')} system."
-            
-        if event_name == 'SupercruiseExit':
-            supercruise_exit_event = cast(SupercruiseExitEvent, content)
-            body_type = f" ({supercruise_exit_event.get('BodyType')})" if supercruise_exit_event.get('BodyType') else ""
-            return f"{self.commander_name} has dropped from supercruise near {supercruise_exit_event.get('Body')}{body_type}."
-            
-        if event_name == 'SupercruiseDestinationDrop':
-            supercruise_destination_drop_event = cast(SupercruiseDestinationDropEvent, content)
-            threat = ""
-            if supercruise_destination_drop_event.get('Threat') is not None:
-                threat_level = int(supercruise_destination_drop_event.get('Threat', 0))
-                if threat_level > 2:
-                    threat = f" WARNING: Threat level {threat_level}!"
-                elif threat_level > 0:
-                    threat = f" (Threat level: {threat_level})"
-            
-            destination = supercruise_destination_drop_event.get('Type_Localised', supercruise_destination_drop_event.get('Type'))
-            return f"{self.commander_name} is dropping from supercruise at {destination}{threat}"
+        details_str = ", ".join(jump_details)
+        details_str = f" ({details_str})" if details_str else ""
+        
+        population = f", population: {fsd_jump_event.get('Population'):,}" if fsd_jump_event.get('Population') else ""
+        
+        system_details = []
+        if fsd_jump_event.get('SystemAllegiance'):
+            system_details.append(f"allegiance: {fsd_jump_event.get('SystemAllegiance')}")
+        if fsd_jump_event.get('SystemEconomy'):
+            economy = fsd_jump_event.get('SystemEconomy_Localised', fsd_jump_event.get('SystemEconomy'))
+            system_details.append(f"economy: {economy}")
+        if fsd_jump_event.get('SystemGovernment'):
+            government = fsd_jump_event.get('SystemGovernment_Localised', fsd_jump_event.get('SystemGovernment'))
+            system_details.append(f"government: {government}")
+        if fsd_jump_event.get('SystemSecurity'):
+            security = fsd_jump_event.get('SystemSecurity_Localised', fsd_jump_event.get('SystemSecurity'))
+            system_details.append(f"security: {security}")
+        
+        system_details_str = ", ".join(system_details)
+        system_details_str = f" ({system_details_str})" if system_details_str else ""
         
-        # Station events
+        faction_info = ""
+        if fsd_jump_event.get('SystemFaction'):
+            faction_name = fsd_jump_event.get('SystemFaction', {}).get('Name', '')
+            faction_state = fsd_jump_event.get('SystemFaction', {}).get('FactionState', '')
+            if faction_name and faction_state:
+                faction_info = f" Controlling faction: {faction_name} ({faction_state})"
+            elif faction_name:
+                faction_info = f" Controlling faction: {faction_name}"
+        
+        return f"{self.commander_name} has arrived at {fsd_jump_event.get('StarSystem')}{details_str}{system_details_str}{population}{faction_info}"
+
+    @event_renderer('FSDTarget')
+    def _render_fsd_target(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        fsd_target_event = cast(FSDTargetEvent, content)
+        remaining = ""
+        if fsd_target_event.get('RemainingJumpsInRoute') is not None:
+            remaining = f" (Remaining jumps in route: {fsd_target_event.get('RemainingJumpsInRoute')})"
+        return f"{self.commander_name} is targeting the next jump to {fsd_target_event.get('Name')} [{fsd_target_event.get('StarClass')} class star]{remaining}"
+
+    @event_renderer('SupercruiseEntry')
+    def _render_supercruise_entry(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        supercruise_entry_event = cast(SupercruiseEntryEvent, content)
+        return f"{self.commander_name} has entered supercruise in the {supercruise_entry_event.get('StarSystem')} system."
+
+    @event_renderer('SupercruiseExit')
+    def _render_supercruise_exit(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        supercruise_exit_event = cast(SupercruiseExitEvent, content)
+        body_type = f" ({supercruise_exit_event.get('BodyType')})" if supercruise_exit_event.get('BodyType') else ""
+        return f"{self.commander_name} has dropped from supercruise near {supercruise_exit_event.get('Body')}{body_type}."
+
+    @event_renderer('SupercruiseDestinationDrop')
+    def _render_supercruise_destination_drop(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        supercruise_destination_drop_event = cast(SupercruiseDestinationDropEvent, content)
+        threat = ""
+        if supercruise_destination_drop_event.get('Threat') is not None:
+            threat_level = int(supercruise_destination_drop_event.get('Threat', 0))
+            if threat_level > 2:
+                threat = f" WARNING: Threat level {threat_level}!"
+            elif threat_level > 0:
+                threat = f" (Threat level: {threat_level})"
+        
+        destination = supercruise_destination_drop_event.get('Type_Localised', supercruise_destination_drop_event.get('Type'))
+        return f"{self.commander_name} is dropping from supercruise at {destination}{threat}"
 
-        if event_name == "StoredModules":
-            return None
-        if event_name == "StoredShips":
-            return None
-        if event_name == "ColonisationConstructionDepot":
-            return None
+    # Station events
+    @event_renderer('StoredModules')
+    def _render_stored_modules(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
 
-        if event_name == 'Docked':
-            docked_event = cast(DockedEvent, content)
-            
-            station_services = []
-            if docked_event.get('StationServices'):
-                important_services = ['Shipyard', 'Outfitting', 'BlackMarket', 'Commodities', 'Refuel', 'Repair', 'Rearm']
-                available_services = [service for service in important_services if service in docked_event.get('StationServices', [])]
-                if available_services:
-                    station_services.append(f"Services: {', '.join(available_services)}")
-            
-            station_economy = ""
-            if docked_event.get('StationEconomy_Localised'):
-                station_economy = f", Economy: {docked_event.get('StationEconomy_Localised')}"
-            
-            faction_info = ""
-            if docked_event.get('StationFaction'):
-                faction_name = docked_event.get('StationFaction', {}).get('Name', '')
-                faction_state = docked_event.get('StationFaction', {}).get('FactionState', '')
-                if faction_name and faction_state:
-                    faction_info = f", Faction: {faction_name} ({faction_state})"
-                elif faction_name:
-                    faction_info = f", Faction: {faction_name}"
-            
-            status_info = ""
-            if docked_event.get('Wanted'):
-                status_info = " WARNING: You are wanted at this station!"
-            elif docked_event.get('ActiveFine'):
-                status_info = " You have active fines at this station."
-            elif docked_event.get('CockpitBreach'):
-                status_info = " WARNING: Your cockpit is breached!"
-            
-            service_str = f" {', '.join(station_services)}" if station_services else ""
-            
-            return f"Now docked at {docked_event.get('StationType')} {docked_event.get('StationName')} in {docked_event.get('StarSystem')}{station_economy}{faction_info}{service_str}{status_info}"
-            
-        if event_name == 'Undocked':
-            undocked_event = cast(UndockedEvent, content)
-            return f"{self.commander_name} has undocked from {undocked_event.get('StationName')}."
-            
-        if event_name == 'DockingDenied':
-            docking_denied_event = cast(DockingDeniedEvent, content)
-            reason_map = {
-                'NoSpace': 'no landing pads available',
-                'TooLarge': 'ship too large for available pads',
-                'Hostile': 'station is hostile',
-                'Offences': 'pilot has active offences',
-                'Distance': 'ship is too far away',
-                'ActiveFighter': 'active fighter deployed',
-                'NoReason': 'no reason provided'
-            }
-            reason = reason_map.get(docking_denied_event.get('Reason'), docking_denied_event.get('Reason'))
-            return f"Docking request denied at {docking_denied_event.get('StationName')}. Reason: {reason}"
-            
-        if event_name == 'DockingGranted':
-            docking_granted_event = cast(DockingGrantedEvent, content)
-            station_type = docking_granted_event.get('StationType')
-            
-            # Only provide detailed pad info for standard station types with known layouts
-            if station_type in ['Coriolis', 'Orbis', 'Ocellus']:
-                pad_info = self.announce_pad(docking_granted_event.get('LandingPad'))
-                return f"Docking request granted at {docking_granted_event.get('StationName')}, pad located at {pad_info}"
-            else:
-                return f"Docking request granted at {docking_granted_event.get('StationName')} on landing pad {docking_granted_event.get('LandingPad')}"
-            
-        if event_name == 'DockingRequested':
-            docking_requested_event = cast(DockingRequestedEvent, content)
-            pads_info = ""
-            if docking_requested_event.get('LandingPads'):
-                pads = docking_requested_event.get('LandingPads', {})
-                pads_details = []
-                if 'Small' in pads:
-                    pads_details.append(f"Small: {pads.get('Small')}")
-                if 'Medium' in pads:
-                    pads_details.append(f"Medium: {pads.get('Medium')}")
-                if 'Large' in pads:
-                    pads_details.append(f"Large: {pads.get('Large')}")
-                if pads_details:
-                    pads_info = f" (Available pads: {', '.join(pads_details)})"
-            return f"{self.commander_name} has requested docking at {docking_requested_event.get('StationName')}{pads_info}."
-            
-        if event_name == 'DockingCancelled':
-            docking_cancelled_event = cast(DockingCancelledEvent, content)
-            return f"{self.commander_name} has cancelled the docking request at {docking_cancelled_event.get('StationName')}."
-            
-        if event_name == 'DockingTimeout':
-            docking_timeout_event = cast(DockingTimeoutEvent, content)
-            return f"{self.commander_name}'s docking request at {docking_timeout_event.get('StationName')} has timed out."
-            
-        # Planetary events
-        if event_name == 'ApproachBody':
-            approach_body_event = cast(ApproachBodyEvent, content)
-            return f"{self.commander_name} is approaching {approach_body_event.get('Body')} and entering orbital cruise zone."
-            
-        if event_name == 'LeaveBody':
-            leave_body_event = cast(LeaveBodyEvent, content)
-            return f"{self.commander_name} is leaving the orbital cruise zone of {leave_body_event.get('Body')}."
-            
-        if event_name == 'Touchdown':
-            touchdown_event = cast(TouchdownEvent, content)
-            coordinates = ""
-            if touchdown_event.get('Latitude') is not None and touchdown_event.get('Longitude') is not None:
-                coordinates = f" at coordinates {touchdown_event.get('Latitude'):.4f}, {touchdown_event.get('Longitude'):.4f}"
-            
-            station_info = ""
-            if touchdown_event.get('OnStation'):
-                station_info = " on a planetary station"
-            elif touchdown_event.get('NearestDestination'):
-                dest = touchdown_event.get('NearestDestination_Localised', touchdown_event.get('NearestDestination'))
-                station_info = f" near {dest}"
-            
-            if touchdown_event.get('PlayerControlled'):
-                return f"{self.commander_name} has landed on {touchdown_event.get('Body')}{coordinates}{station_info}."
-            else:
-                return f"{self.commander_name}'s ship has auto-landed on {touchdown_event.get('Body')}{station_info}."
-            
-        if event_name == 'Liftoff':
-            liftoff_event = cast(LiftoffEvent, content)
-            coordinates = ""
-            if liftoff_event.get('Latitude') is not None and liftoff_event.get('Longitude') is not None:
-                coordinates = f" from coordinates {liftoff_event.get('Latitude'):.4f}, {liftoff_event.get('Longitude'):.4f}"
-            
-            station_info = ""
-            if liftoff_event.get('OnStation'):
-                station_info = " from a planetary station"
-            elif liftoff_event.get('NearestDestination'):
-                dest = liftoff_event.get('NearestDestination_Localised', liftoff_event.get('NearestDestination'))
-                station_info = f" near {dest}"
-            
-            if liftoff_event.get('PlayerControlled'):
-                return f"{self.commander_name} has lifted off from {liftoff_event.get('Body')}{coordinates}{station_info}."
-            else:
-                return f"{self.commander_name}'s ship has auto-lifted off from {liftoff_event.get('Body')}{station_info}."
+    @event_renderer('StoredShips')
+    def _render_stored_ships(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
 
-        if event_name == 'Location':
-            return None
+    @event_renderer('ColonisationConstructionDepot')
+    def _render_colonisation_construction_depot(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
 
-        if event_name == 'NavRoute':
-            nav_route_event = cast(NavRouteEvent, content)
-            if nav_route_event.get('Route'):
-                route_count = len(nav_route_event.get('Route', [])) - 1  # jump count is 1 less than systems in route
-                if route_count > 0:
-                    start = nav_route_event.get('Route', [])[0].get('StarSystem', 'Unknown')
-                    end = nav_route_event.get('Route', [])[-1].get('StarSystem', 'Unknown') 
-                    return f"{self.commander_name} has plotted a {route_count}-jump route from {start} to {end}."
-            return f"{self.commander_name} has plotted a new route."
-            
-        if event_name == 'NavRouteClear':
-            return f"{self.commander_name} has cleared the current navigation route."
-        
-        # Mission events
-        if event_name == 'MissionAccepted':
-            mission_accepted_event = cast(MissionAcceptedEvent, content)
-            return f"{self.commander_name} has accepted mission: {mission_accepted_event.get('LocalisedName')} from {mission_accepted_event.get('Faction')}."
-        if event_name == 'MissionCompleted':
-            mission_completed_event = cast(MissionCompletedEvent, content)
-            if mission_completed_event.get('Reward'):
-                return f"{self.commander_name} has completed mission: {mission_completed_event.get('LocalisedName')} for {mission_completed_event.get('Faction')}. Reward: {mission_completed_event.get('Reward'):,} credits."
-            else:
-                return f"{self.commander_name} has completed mission: {mission_completed_event.get('LocalisedName')} for {mission_completed_event.get('Faction')}."
-        if event_name == 'MissionFailed':
-            mission_failed_event = cast(MissionFailedEvent, content)
-            return f"{self.commander_name} has failed mission: {mission_failed_event.get('LocalisedName')}."
-        if event_name == 'MissionAbandoned':
-            mission_abandoned_event = cast(MissionAbandonedEvent, content)
-            return f"{self.commander_name} has abandoned mission: {mission_abandoned_event.get('LocalisedName')}."
-        if event_name == 'MissionRedirected':
-            mission_redirected_event = cast(MissionRedirectedEvent, content)
-            return f"{self.commander_name}'s mission '{mission_redirected_event.get('LocalisedName')}' has completed at least one target and been redirected to {mission_redirected_event.get('NewDestinationSystem')} - {mission_redirected_event.get('NewDestinationStation')}, check active mission states for details."
-        
-        # Financial events
-        if event_name == 'RedeemVoucher':
-            redeem_voucher_event = cast(RedeemVoucherEvent, content)
-            return f"{self.commander_name} has redeemed a {redeem_voucher_event.get('Type')} voucher for {redeem_voucher_event.get('Amount'):,} credits."
-        if event_name == 'PayFines':
-            pay_fines_event = cast(PayFinesEvent, content)
-            return f"{self.commander_name} has paid {pay_fines_event.get('Amount'):,} credits in fines."
-        if event_name == 'PayLegacyFines':
-            return f"{self.commander_name} has paid off legacy fines."
-        if event_name == 'PayBounties':
-            return f"{self.commander_name} has paid off their bounties."
-        
-        # Social events
-        if event_name == 'CrewAssign':
-            crew_assign_event = cast(CrewAssignEvent, content)
-            return f"{self.commander_name} has assigned {crew_assign_event.get('Name')} to {crew_assign_event.get('Role')} role."
-        if event_name == 'CrewHire':
-            return f"{self.commander_name} has hired a new crew member."
-        if event_name == 'CrewFire':
-            return f"{self.commander_name} has fired a crew member."
-        if event_name == 'CrewMemberJoins':
-            crew_member_joins_event = cast(CrewMemberJoinsEvent, content)
-            return f"{crew_member_joins_event.get('Crew')} has joined {self.commander_name}'s crew."
-        if event_name == 'CrewMemberQuits':
-            crew_member_quits_event = cast(CrewMemberQuitsEvent, content)
-            return f"{crew_member_quits_event.get('Crew')} has left {self.commander_name}'s crew."
-        if event_name == 'CrewMemberRoleChange':
-            crew_member_role_change_event = cast(CrewMemberRoleChangeEvent, content)
-            return f"{crew_member_role_change_event.get('Crew')} has changed role to {crew_member_role_change_event.get('Role')}."
-        if event_name == 'EndCrewSession':
-            end_crew_session_event = cast(EndCrewSessionEvent, content)
-            return f"{self.commander_name} has ended their crew session."
-        if event_name == 'JoinACrew':
-            return f"{self.commander_name} has joined another commander's crew."
-        if event_name == 'QuitACrew':
-            return f"{self.commander_name} has left the crew they were part of."
-        if event_name == 'KickCrewMember':
-            return f"{self.commander_name} has kicked a member from their crew."
-        if event_name == 'WingAdd':
-            wing_add_event = cast(WingAddEvent, content)
-            return f"{wing_add_event.get('Name')} has joined {self.commander_name}'s wing."
-        if event_name == 'WingJoin':
-            wing_join_event = cast(WingJoinEvent, content)
-            return f"{self.commander_name} has joined a wing."
-        if event_name == 'WingLeave':
-            wing_leave_event = cast(WingLeaveEvent, content)
-            return f"{self.commander_name} has left their wing."
-        if event_name == 'WingInvite':
-            return f"{self.commander_name} has invited someone to join their wing."
-        if event_name == 'Friends':
-            friends_event = cast(FriendsEvent, content)
-            return f"Friend status update: {friends_event.get('Name')} is now {friends_event.get('Status')}."
-
-        # Squadron events
-        if event_name == 'AppliedToSquadron':
-            return f"{self.commander_name} has applied to join a squadron."
-        if event_name == 'DisbandedSquadron':
-            if content.get('SquadronName'):
-                return f"{self.commander_name} has disbanded the squadron '{content.get('SquadronName')}'."
-            else:
-                return f"{self.commander_name} has disbanded their squadron."
-        if event_name == 'InvitedToSquadron':
-            if content.get('SquadronName'):
-                return f"{self.commander_name} has been invited to join the squadron '{content.get('SquadronName')}'."
-            else:
-                return f"{self.commander_name} has been invited to join a squadron."
-        if event_name == 'JoinedSquadron':
-            if content.get('SquadronName'):
-                return f"{self.commander_name} has joined the squadron '{content.get('SquadronName')}' with callsign {content.get('SquadronID', 'Unknown')}."
-            else:
-                return f"{self.commander_name} has joined a squadron."
-        if event_name == 'KickedFromSquadron':
-            if content.get('SquadronName'):
-                return f"{self.commander_name} has been kicked from the squadron '{content.get('SquadronName')}'."
-            else:
-                return f"{self.commander_name} has been kicked from their squadron."
-        if event_name == 'LeftSquadron':
-            if content.get('SquadronName'):
-                return f"{self.commander_name} has left the squadron '{content.get('SquadronName')}'."
-            else:
-                return f"{self.commander_name} has left their squadron."
-        if event_name == 'SharedBookmarkToSquadron':
-            bookmark_type = content.get('BookmarkType', 'Unknown')
-            system_name = content.get('SystemName', 'Unknown system')
-            if bookmark_type and system_name:
-                return f"{self.commander_name} has shared a {bookmark_type} bookmark in {system_name} with their squadron."
-            else:
-                return f"{self.commander_name} has shared a bookmark with their squadron."
-        if event_name == 'SquadronCreated':
-            if content.get('SquadronName'):
-                return f"{self.commander_name} has created a new squadron called '{content.get('SquadronName')}' with callsign {content.get('SquadronID', 'Unknown')}."
-            else:
-                return f"{self.commander_name} has created a new squadron."
-        if event_name == 'SquadronDemotion':
-            old_rank = content.get('OldRank', 'Unknown')
-            new_rank = content.get('NewRank', 'Unknown')
-            if content.get('SquadronName') and old_rank and new_rank:
-                return f"{self.commander_name} has been demoted from {old_rank} to {new_rank} in the squadron '{content.get('SquadronName')}'."
-            elif old_rank and new_rank:
-                return f"{self.commander_name} has been demoted from {old_rank} to {new_rank} in their squadron."
-            else:
-                return f"{self.commander_name} has been demoted in their squadron."
-        if event_name == 'SquadronPromotion':
-            old_rank = content.get('OldRank', 'Unknown')
-            new_rank = content.get('NewRank', 'Unknown')
-            if content.get('SquadronName') and old_rank and new_rank:
-                return f"{self.commander_name} has been promoted from {old_rank} to {new_rank} in the squadron '{content.get('SquadronName')}'."
-            elif old_rank and new_rank:
-                return f"{self.commander_name} has been promoted from {old_rank} to {new_rank} in their squadron."
-            else:
-                return f"{self.commander_name} has been promoted in their squadron."
-        if event_name == 'WonATrophyForSquadron':
-            if content.get('SquadronName') and content.get('TrophyName'):
-                return f"{self.commander_name} has won a '{content.get('TrophyName')}' trophy for their squadron '{content.get('SquadronName')}'."
-            elif content.get('TrophyName'):
-                return f"{self.commander_name} has won a '{content.get('TrophyName')}' trophy for their squadron."
-            else:
-                return f"{self.commander_name} has won a trophy for their squadron."
+    @event_renderer('Docked')
+    def _render_docked(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        docked_event = cast(DockedEvent, content)
+        
+        station_services = []
+        if docked_event.get('StationServices'):
+            important_services = ['Shipyard', 'Outfitting', 'BlackMarket', 'Commodities', 'Refuel', 'Repair', 'Rearm']
+            available_services = [service for service in important_services if service in docked_event.get('StationServices', [])]
+            if available_services:
+                station_services.append(f"Services: {', '.join(available_services)}")
+        
+        station_economy = ""
+        if docked_event.get('StationEconomy_Localised'):
+            station_economy = f", Economy: {docked_event.get('StationEconomy_Localised')}"
+        
+        faction_info = ""
+        if docked_event.get('StationFaction'):
+            faction_name = docked_event.get('StationFaction', {}).get('Name', '')
+            faction_state = docked_event.get('StationFaction', {}).get('FactionState', '')
+            if faction_name and faction_state:
+                faction_info = f", Faction: {faction_name} ({faction_state})"
+            elif faction_name:
+                faction_info = f", Faction: {faction_name}"
+        
+        status_info = ""
+        if docked_event.get('Wanted'):
+            status_info = " WARNING: You are wanted at this station!"
+        elif docked_event.get('ActiveFine'):
+            status_info = " You have active fines at this station."
+        elif docked_event.get('CockpitBreach'):
+            status_info = " WARNING: Your cockpit is breached!"
+        
+        service_str = f" {', '.join(station_services)}" if station_services else ""
+        
+        return f"Now docked at {docked_event.get('StationType')} {docked_event.get('StationName')} in {docked_event.get('StarSystem')}{station_economy}{faction_info}{service_str}{status_info}"
+
+    @event_renderer('Undocked')
+    def _render_undocked(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        undocked_event = cast(UndockedEvent, content)
+        return f"{self.commander_name} has undocked from {undocked_event.get('StationName')}."
+
+    @event_renderer('DockingDenied')
+    def _render_docking_denied(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        docking_denied_event = cast(DockingDeniedEvent, content)
+        reason_map = {
+            'NoSpace': 'no landing pads available',
+            'TooLarge': 'ship too large for available pads',
+            'Hostile': 'station is hostile',
+            'Offences': 'pilot has active offences',
+            'Distance': 'ship is too far away',
+            'ActiveFighter': 'active fighter deployed',
+            'NoReason': 'no reason provided'
+        }
+        reason = reason_map.get(docking_denied_event.get('Reason'), docking_denied_event.get('Reason'))
+        return f"Docking request denied at {docking_denied_event.get('StationName')}. Reason: {reason}"
 
-        # Promotion events
-        if event_name == 'Rank':
-            return None
-        if event_name == 'Promotion':
-            promotion_event = cast(PromotionEvent, content)
-            ranks = []
-            if promotion_event.get('Combat') is not None:
-                ranks.append(f"Combat: {promotion_event.get('Combat')}")
-            if promotion_event.get('Trade') is not None:
-                ranks.append(f"Trade: {promotion_event.get('Trade')}")
-            if promotion_event.get('Explore') is not None:
-                ranks.append(f"Exploration: {promotion_event.get('Explore')}")
-            if promotion_event.get('Soldier') is not None:
-                ranks.append(f"Mercenary: {promotion_event.get('Soldier')}")
-            if promotion_event.get('Exobiologist') is not None:
-                ranks.append(f"Exobiologist: {promotion_event.get('Exobiologist')}")
-            if promotion_event.get('Empire') is not None:
-                ranks.append(f"Empire: {promotion_event.get('Empire')}")
-            if promotion_event.get('Federation') is not None:
-                ranks.append(f"Federation: {promotion_event.get('Federation')}")
-            return f"{self.commander_name} has been promoted. New ranks: {', '.join(ranks)}"
-        
-        # Powerplay events
-        if event_name == 'Powerplay':
-            return None
-        if event_name == 'PowerplayJoin':
-            powerplay_join_event = cast(PowerplayJoinEvent, content)
-            return f"{self.commander_name} has pledged allegiance to {powerplay_join_event.get('Power')}."
-        if event_name == 'PowerplayLeave':
-            return f"{self.commander_name} has withdrawn their allegiance from {content.get('Power')}."
-        if event_name == 'PowerplayDefect':
-            return f"{self.commander_name} has defected from {content.get('FromPower')} to {content.get('ToPower')}."
-        if event_name == 'PowerplayCollect':
-            return f"{self.commander_name} has collected {content.get('Count')} units of {content.get('Type')} for {content.get('Power')}'s powerplay efforts."
-        if event_name == 'PowerplayDeliver':
-            return f"{self.commander_name} has delivered {content.get('Count')} units of {content.get('Type')} for {content.get('Power')}'s powerplay objectives."
-        if event_name == 'PowerplayFastTrack':
-            return f"{self.commander_name} has paid {content.get('Cost'):,} credits to fast-track allocation of powerplay commodities for {content.get('Power')}."
-        if event_name == 'PowerplaySalary':
-            return f"{self.commander_name} has received a salary payment of {content.get('Amount'):,} credits from {content.get('Power')}."
-        if event_name == 'PowerplayVote':
-            return f"{self.commander_name} has cast {content.get('Votes')} votes for {content.get('Power')}'s expansion into the {content.get('System')} system."
-        if event_name == 'PowerplayVoucher':
-            if content.get('Systems'):
-                systems_list = ', '.join(content.get('Systems', []))
-                return f"{self.commander_name} has received payment from {content.get('Power')} for combat operations in {systems_list}."
-            else:
-                return f"{self.commander_name} has received payment from {content.get('Power')} for powerplay combat operations."
+    @event_renderer('DockingGranted')
+    def _render_docking_granted(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        docking_granted_event = cast(DockingGrantedEvent, content)
+        station_type = docking_granted_event.get('StationType')
+        
+        # Only provide detailed pad info for standard station types with known layouts
+        if station_type in ['Coriolis', 'Orbis', 'Ocellus']:
+            pad_info = self.announce_pad(docking_granted_event.get('LandingPad'))
+            return f"Docking request granted at {docking_granted_event.get('StationName')}, pad located at {pad_info}"
+        else:
+            return f"Docking request granted at {docking_granted_event.get('StationName')} on landing pad {docking_granted_event.get('LandingPad')}"
+
+    @event_renderer('DockingRequested')
+    def _render_docking_requested(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        docking_requested_event = cast(DockingRequestedEvent, content)
+        pads_info = ""
+        if docking_requested_event.get('LandingPads'):
+            pads = docking_requested_event.get('LandingPads', {})
+            pads_details = []
+            if 'Small' in pads:
+                pads_details.append(f"Small: {pads.get('Small')}")
+            if 'Medium' in pads:
+                pads_details.append(f"Medium: {pads.get('Medium')}")
+            if 'Large' in pads:
+                pads_details.append(f"Large: {pads.get('Large')}")
+            if pads_details:
+                pads_info = f" (Available pads: {', '.join(pads_details)})"
+        return f"{self.commander_name} has requested docking at {docking_requested_event.get('StationName')}{pads_info}."
+
+    @event_renderer('DockingCancelled')
+    def _render_docking_cancelled(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        docking_cancelled_event = cast(DockingCancelledEvent, content)
+        return f"{self.commander_name} has cancelled the docking request at {docking_cancelled_event.get('StationName')}."
+
+    @event_renderer('DockingTimeout')
+    def _render_docking_timeout(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        docking_timeout_event = cast(DockingTimeoutEvent, content)
+        return f"{self.commander_name}'s docking request at {docking_timeout_event.get('StationName')} has timed out."
+
+    # Planetary events
+    @event_renderer('ApproachBody')
+    def _render_approach_body(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        approach_body_event = cast(ApproachBodyEvent, content)
+        return f"{self.commander_name} is approaching {approach_body_event.get('Body')} and entering orbital cruise zone."
+
+    @event_renderer('LeaveBody')
+    def _render_leave_body(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        leave_body_event = cast(LeaveBodyEvent, content)
+        return f"{self.commander_name} is leaving the orbital cruise zone of {leave_body_event.get('Body')}."
+
+    @event_renderer('Touchdown')
+    def _render_touchdown(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        touchdown_event = cast(TouchdownEvent, content)
+        coordinates = ""
+        if touchdown_event.get('Latitude') is not None and touchdown_event.get('Longitude') is not None:
+            coordinates = f" at coordinates {touchdown_event.get('Latitude'):.4f}, {touchdown_event.get('Longitude'):.4f}"
+        
+        station_info = ""
+        if touchdown_event.get('OnStation'):
+            station_info = " on a planetary station"
+        elif touchdown_event.get('NearestDestination'):
+            dest = touchdown_event.get('NearestDestination_Localised', touchdown_event.get('NearestDestination'))
+            station_info = f" near {dest}"
+        
+        if touchdown_event.get('PlayerControlled'):
+            return f"{self.commander_name} has landed on {touchdown_event.get('Body')}{coordinates}{station_info}."
+        else:
+            return f"{self.commander_name}'s ship has auto-landed on {touchdown_event.get('Body')}{station_info}."
+
+    @event_renderer('Liftoff')
+    def _render_liftoff(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        liftoff_event = cast(LiftoffEvent, content)
+        coordinates = ""
+        if liftoff_event.get('Latitude') is not None and liftoff_event.get('Longitude') is not None:
+            coordinates = f" from coordinates {liftoff_event.get('Latitude'):.4f}, {liftoff_event.get('Longitude'):.4f}"
+        
+        station_info = ""
+        if liftoff_event.get('OnStation'):
+            station_info = " from a planetary station"
+        elif liftoff_event.get('NearestDestination'):
+            dest = liftoff_event.get('NearestDestination_Localised', liftoff_event.get('NearestDestination'))
+            station_info = f" near {dest}"
+        
+        if liftoff_event.get('PlayerControlled'):
+            return f"{self.commander_name} has lifted off from {liftoff_event.get('Body')}{coordinates}{station_info}."
+        else:
+            return f"{self.commander_name}'s ship has auto-lifted off from {liftoff_event.get('Body')}{station_info}."
 
-        # Carrier events
-        if event_name == 'CarrierJump':
-            carrier_jump_event = cast(Dict[str, Any], content)
-            star_system = carrier_jump_event.get('StarSystem', 'Unknown System')
-            station_name = carrier_jump_event.get('StationName', 'Unknown Station')
-            
-            system_details = []
-            if carrier_jump_event.get('SystemAllegiance'):
-                system_details.append(f"allegiance: {carrier_jump_event.get('SystemAllegiance')}")
-            if carrier_jump_event.get('SystemEconomy'):
-                economy = carrier_jump_event.get('SystemEconomy_Localised', carrier_jump_event.get('SystemEconomy'))
-                system_details.append(f"economy: {economy}")
-            if carrier_jump_event.get('SystemGovernment'):
-                government = carrier_jump_event.get('SystemGovernment_Localised', carrier_jump_event.get('SystemGovernment'))
-                system_details.append(f"government: {government}")
-            if carrier_jump_event.get('SystemSecurity'):
-                security = carrier_jump_event.get('SystemSecurity_Localised', carrier_jump_event.get('SystemSecurity'))
-                system_details.append(f"security: {security}")
-            
-            system_details_str = ", ".join(system_details)
-            system_details_str = f" ({system_details_str})" if system_details_str else ""
-            
-            population = f", population: {carrier_jump_event.get('Population'):,}" if carrier_jump_event.get('Population') else ""
-            
-            body_info = ""
-            if carrier_jump_event.get('Body'):
-                body_type = f" ({carrier_jump_event.get('BodyType')})" if carrier_jump_event.get('BodyType') else ""
-                body_info = f" near {carrier_jump_event.get('Body')}{body_type}"
-            
-            if 'Docked' in carrier_jump_event and carrier_jump_event.get('Docked'):
-                return f"{self.commander_name} is docked at Fleet Carrier {station_name} which has jumped to the {star_system} system{body_info}{system_details_str}{population}."
-            else:
-                return f"Fleet Carrier {station_name} has jumped to the {star_system} system{body_info}{system_details_str}{population}."
-            
-        if event_name == 'CarrierBuy':
-            carrier_buy_event = cast(Dict[str, Any], content)
-            carrier_id = carrier_buy_event.get('CarrierID', 'Unknown ID')
-            price = carrier_buy_event.get('Price', 0)
-            location = carrier_buy_event.get('Location', 'an undisclosed location')
-            variant = carrier_buy_event.get('Variant', 'Unknown Type')
-            callsign = carrier_buy_event.get('Callsign', 'Unknown Callsign')
-            return f"{self.commander_name} has purchased a Fleet Carrier with callsign {callsign} ({variant}) for {price:,} credits at {location}."
-            
-        if event_name == 'CarrierStats':
-            carrier_stats_event = cast(Dict[str, Any], content)
-            callsign = carrier_stats_event.get('Callsign', 'Unknown Callsign')
-            carrier_name = carrier_stats_event.get('Name', callsign)
-            balance = carrier_stats_event.get('Balance', 0)
-            fuel = carrier_stats_event.get('Fuel', 0)
-            reserve_percent = carrier_stats_event.get('ReservePercent', 0)
-            services = carrier_stats_event.get('Services', [])
-            
-            service_str = ""
-            if services:
-                # Show just the first few services to avoid too long a message
-                service_list = [s.get('Name', '') for s in services if s.get('Status') == 'Activated']
-                if service_list:
-                    service_str = f" Active services: {', '.join(service_list[:3])}"
-                    if len(service_list) > 3:
-                        service_str += f" and {len(service_list) - 3} more"
-                
-            return f"{self.commander_name}'s Fleet Carrier '{carrier_name}' ({callsign}) status update: {balance:,} credits balance, {fuel} tons of tritium, {reserve_percent}% reserve.{service_str}"
-            
-        if event_name == 'CarrierJumpRequest':
-            carrier_jump_request_event = cast(Dict[str, Any], content)
-            system_name = carrier_jump_request_event.get('SystemName', 'an unknown destination')
-            
-            body_info = ""
-            if carrier_jump_request_event.get('Body'):
-                body_info = f" near {carrier_jump_request_event.get('Body')}"
-            
-            departure_time = ""
-            if carrier_jump_request_event.get('DepartureTime'):
-                departure_time_str = carrier_jump_request_event.get('DepartureTime')
+    @event_renderer('Location')
+    def _render_location(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
+
+    @event_renderer('NavRoute')
+    def _render_nav_route(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        nav_route_event = cast(NavRouteEvent, content)
+        if nav_route_event.get('Route'):
+            route_count = len(nav_route_event.get('Route', [])) - 1  # jump count is 1 less than systems in route
+            if route_count > 0:
+                start = nav_route_event.get('Route', [])[0].get('StarSystem', 'Unknown')
+                end = nav_route_event.get('Route', [])[-1].get('StarSystem', 'Unknown') 
+                return f"{self.commander_name} has plotted a {route_count}-jump route from {start} to {end}."
+        return f"{self.commander_name} has plotted a new route."
+
+    @event_renderer('NavRouteClear')
+    def _render_nav_route_clear(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has cleared the current navigation route."
+
+    # Mission events
+    @event_renderer('MissionAccepted')
+    def _render_mission_accepted(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        mission_accepted_event = cast(MissionAcceptedEvent, content)
+        return f"{self.commander_name} has accepted mission: {mission_accepted_event.get('LocalisedName')} from {mission_accepted_event.get('Faction')}."
+
+    @event_renderer('MissionCompleted')
+    def _render_mission_completed(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        mission_completed_event = cast(MissionCompletedEvent, content)
+        if mission_completed_event.get('Reward'):
+            return f"{self.commander_name} has completed mission: {mission_completed_event.get('LocalisedName')} for {mission_completed_event.get('Faction')}. Reward: {mission_completed_event.get('Reward'):,} credits."
+        else:
+            return f"{self.commander_name} has completed mission: {mission_completed_event.get('LocalisedName')} for {mission_completed_event.get('Faction')}."
+
+    @event_renderer('MissionFailed')
+    def _render_mission_failed(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        mission_failed_event = cast(MissionFailedEvent, content)
+        return f"{self.commander_name} has failed mission: {mission_failed_event.get('LocalisedName')}."
+
+    @event_renderer('MissionAbandoned')
+    def _render_mission_abandoned(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        mission_abandoned_event = cast(MissionAbandonedEvent, content)
+        return f"{self.commander_name} has abandoned mission: {mission_abandoned_event.get('LocalisedName')}."
+
+    @event_renderer('MissionRedirected')
+    def _render_mission_redirected(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        mission_redirected_event = cast(MissionRedirectedEvent, content)
+        return f"{self.commander_name}'s mission '{mission_redirected_event.get('LocalisedName')}' has completed at least one target and been redirected to {mission_redirected_event.get('NewDestinationSystem')} - {mission_redirected_event.get('NewDestinationStation')}, check active mission states for details."
+
+    # Financial events
+    @event_renderer('RedeemVoucher')
+    def _render_redeem_voucher(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        redeem_voucher_event = cast(RedeemVoucherEvent, content)
+        return f"{self.commander_name} has redeemed a {redeem_voucher_event.get('Type')} voucher for {redeem_voucher_event.get('Amount'):,} credits."
+
+    @event_renderer('PayFines')
+    def _render_pay_fines(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        pay_fines_event = cast(PayFinesEvent, content)
+        return f"{self.commander_name} has paid {pay_fines_event.get('Amount'):,} credits in fines."
+
+    @event_renderer('PayLegacyFines')
+    def _render_pay_legacy_fines(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has paid off legacy fines."
+
+    @event_renderer('PayBounties')
+    def _render_pay_bounties(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has paid off their bounties."
+
+    # Social events
+    @event_renderer('CrewAssign')
+    def _render_crew_assign(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        crew_assign_event = cast(CrewAssignEvent, content)
+        return f"{self.commander_name} has assigned {crew_assign_event.get('Name')} to {crew_assign_event.get('Role')} role."
+
+    @event_renderer('CrewHire')
+    def _render_crew_hire(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has hired a new crew member."
+
+    @event_renderer('CrewFire')
+    def _render_crew_fire(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has fired a crew member."
+
+    @event_renderer('CrewMemberJoins')
+    def _render_crew_member_joins(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        crew_member_joins_event = cast(CrewMemberJoinsEvent, content)
+        return f"{crew_member_joins_event.get('Crew')} has joined {self.commander_name}'s crew."
+
+    @event_renderer('CrewMemberQuits')
+    def _render_crew_member_quits(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        crew_member_quits_event = cast(CrewMemberQuitsEvent, content)
+        return f"{crew_member_quits_event.get('Crew')} has left {self.commander_name}'s crew."
+
+    @event_renderer('CrewMemberRoleChange')
+    def _render_crew_member_role_change(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        crew_member_role_change_event = cast(CrewMemberRoleChangeEvent, content)
+        return f"{crew_member_role_change_event.get('Crew')} has changed role to {crew_member_role_change_event.get('Role')}."
+
+    @event_renderer('EndCrewSession')
+    def _render_end_crew_session(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        end_crew_session_event = cast(EndCrewSessionEvent, content)
+        return f"{self.commander_name} has ended their crew session."
+
+    @event_renderer('JoinACrew')
+    def _render_join_a_crew(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has joined another commander's crew."
+
+    @event_renderer('QuitACrew')
+    def _render_quit_a_crew(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has left the crew they were part of."
+
+    @event_renderer('KickCrewMember')
+    def _render_kick_crew_member(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has kicked a member from their crew."
+
+    @event_renderer('WingAdd')
+    def _render_wing_add(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        wing_add_event = cast(WingAddEvent, content)
+        return f"{wing_add_event.get('Name')} has joined {self.commander_name}'s wing."
+
+    @event_renderer('WingJoin')
+    def _render_wing_join(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        wing_join_event = cast(WingJoinEvent, content)
+        return f"{self.commander_name} has joined a wing."
+
+    @event_renderer('WingLeave')
+    def _render_wing_leave(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        wing_leave_event = cast(WingLeaveEvent, content)
+        return f"{self.commander_name} has left their wing."
+
+    @event_renderer('WingInvite')
+    def _render_wing_invite(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has invited someone to join their wing."
+
+    @event_renderer('Friends')
+    def _render_friends(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        friends_event = cast(FriendsEvent, content)
+        return f"Friend status update: {friends_event.get('Name')} is now {friends_event.get('Status')}."
+
+    # Squadron events
+    @event_renderer('AppliedToSquadron')
+    def _render_applied_to_squadron(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has applied to join a squadron."
+
+    @event_renderer('DisbandedSquadron')
+    def _render_disbanded_squadron(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        if content.get('SquadronName'):
+            return f"{self.commander_name} has disbanded the squadron '{content.get('SquadronName')}'."
+        else:
+            return f"{self.commander_name} has disbanded their squadron."
+
+    @event_renderer('InvitedToSquadron')
+    def _render_invited_to_squadron(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        if content.get('SquadronName'):
+            return f"{self.commander_name} has been invited to join the squadron '{content.get('SquadronName')}'."
+        else:
+            return f"{self.commander_name} has been invited to join a squadron."
+
+    @event_renderer('JoinedSquadron')
+    def _render_joined_squadron(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        if content.get('SquadronName'):
+            return f"{self.commander_name} has joined the squadron '{content.get('SquadronName')}' with callsign {content.get('SquadronID', 'Unknown')}."
+        else:
+            return f"{self.commander_name} has joined a squadron."
+
+    @event_renderer('KickedFromSquadron')
+    def _render_kicked_from_squadron(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        if content.get('SquadronName'):
+            return f"{self.commander_name} has been kicked from the squadron '{content.get('SquadronName')}'."
+        else:
+            return f"{self.commander_name} has been kicked from their squadron."
+
+    @event_renderer('LeftSquadron')
+    def _render_left_squadron(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        if content.get('SquadronName'):
+            return f"{self.commander_name} has left the squadron '{content.get('SquadronName')}'."
+        else:
+            return f"{self.commander_name} has left their squadron."
+
+    @event_renderer('SharedBookmarkToSquadron')
+    def _render_shared_bookmark_to_squadron(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        bookmark_type = content.get('BookmarkType', 'Unknown')
+        system_name = content.get('SystemName', 'Unknown system')
+        if bookmark_type and system_name:
+            return f"{self.commander_name} has shared a {bookmark_type} bookmark in {system_name} with their squadron."
+        else:
+            return f"{self.commander_name} has shared a bookmark with their squadron."
+
+    @event_renderer('SquadronCreated')
+    def _render_squadron_created(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        if content.get('SquadronName'):
+            return f"{self.commander_name} has created a new squadron called '{content.get('SquadronName')}' with callsign {content.get('SquadronID', 'Unknown')}."
+        else:
+            return f"{self.commander_name} has created a new squadron."
+
+    @event_renderer('SquadronDemotion')
+    def _render_squadron_demotion(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        old_rank = content.get('OldRank', 'Unknown')
+        new_rank = content.get('NewRank', 'Unknown')
+        if content.get('SquadronName') and old_rank and new_rank:
+            return f"{self.commander_name} has been demoted from {old_rank} to {new_rank} in the squadron '{content.get('SquadronName')}'."
+        elif old_rank and new_rank:
+            return f"{self.commander_name} has been demoted from {old_rank} to {new_rank} in their squadron."
+        else:
+            return f"{self.commander_name} has been demoted in their squadron."
+
+    @event_renderer('SquadronPromotion')
+    def _render_squadron_promotion(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        old_rank = content.get('OldRank', 'Unknown')
+        new_rank = content.get('NewRank', 'Unknown')
+        if content.get('SquadronName') and old_rank and new_rank:
+            return f"{self.commander_name} has been promoted from {old_rank} to {new_rank} in the squadron '{content.get('SquadronName')}'."
+        elif old_rank and new_rank:
+            return f"{self.commander_name} has been promoted from {old_rank} to {new_rank} in their squadron."
+        else:
+            return f"{self.commander_name} has been promoted in their squadron."
+
+    @event_renderer('WonATrophyForSquadron')
+    def _render_won_a_trophy_for_squadron(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        if content.get('SquadronName') and content.get('TrophyName'):
+            return f"{self.commander_name} has won a '{content.get('TrophyName')}' trophy for their squadron '{content.get('SquadronName')}'."
+        elif content.get('TrophyName'):
+            return f"{self.commander_name} has won a '{content.get('TrophyName')}' trophy for their squadron."
+        else:
+            return f"{self.commander_name} has won a trophy for their squadron."
+
+    # Promotion events
+    @event_renderer('Rank')
+    def _render_rank(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
+
+    @event_renderer('Promotion')
+    def _render_promotion(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        promotion_event = cast(PromotionEvent, content)
+        ranks = []
+        if promotion_event.get('Combat') is not None:
+            ranks.append(f"Combat: {promotion_event.get('Combat')}")
+        if promotion_event.get('Trade') is not None:
+            ranks.append(f"Trade: {promotion_event.get('Trade')}")
+        if promotion_event.get('Explore') is not None:
+            ranks.append(f"Exploration: {promotion_event.get('Explore')}")
+        if promotion_event.get('Soldier') is not None:
+            ranks.append(f"Mercenary: {promotion_event.get('Soldier')}")
+        if promotion_event.get('Exobiologist') is not None:
+            ranks.append(f"Exobiologist: {promotion_event.get('Exobiologist')}")
+        if promotion_event.get('Empire') is not None:
+            ranks.append(f"Empire: {promotion_event.get('Empire')}")
+        if promotion_event.get('Federation') is not None:
+            ranks.append(f"Federation: {promotion_event.get('Federation')}")
+        return f"{self.commander_name} has been promoted. New ranks: {', '.join(ranks)}"
+
+    # Powerplay events
+    @event_renderer('Powerplay')
+    def _render_powerplay(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
+
+    @event_renderer('PowerplayJoin')
+    def _render_powerplay_join(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        powerplay_join_event = cast(PowerplayJoinEvent, content)
+        return f"{self.commander_name} has pledged allegiance to {powerplay_join_event.get('Power')}."
+
+    @event_renderer('PowerplayLeave')
+    def _render_powerplay_leave(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has withdrawn their allegiance from {content.get('Power')}."
+
+    @event_renderer('PowerplayDefect')
+    def _render_powerplay_defect(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has defected from {content.get('FromPower')} to {content.get('ToPower')}."
+
+    @event_renderer('PowerplayCollect')
+    def _render_powerplay_collect(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has collected {content.get('Count')} units of {content.get('Type')} for {content.get('Power')}'s powerplay efforts."
+
+    @event_renderer('PowerplayDeliver')
+    def _render_powerplay_deliver(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has delivered {content.get('Count')} units of {content.get('Type')} for {content.get('Power')}'s powerplay objectives."
+
+    @event_renderer('PowerplayFastTrack')
+    def _render_powerplay_fast_track(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has paid {content.get('Cost'):,} credits to fast-track allocation of powerplay commodities for {content.get('Power')}."
+
+    @event_renderer('PowerplaySalary')
+    def _render_powerplay_salary(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has received a salary payment of {content.get('Amount'):,} credits from {content.get('Power')}."
+
+    @event_renderer('PowerplayVote')
+    def _render_powerplay_vote(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has cast {content.get('Votes')} votes for {content.get('Power')}'s expansion into the {content.get('System')} system."
+
+    @event_renderer('PowerplayVoucher')
+    def _render_powerplay_voucher(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        if content.get('Systems'):
+            systems_list = ', '.join(content.get('Systems', []))
+            return f"{self.commander_name} has received payment from {content.get('Power')} for combat operations in {systems_list}."
+        else:
+            return f"{self.commander_name} has received payment from {content.get('Power')} for powerplay combat operations."
+
+    # Carrier events
+    @event_renderer('CarrierJump')
+    def _render_carrier_jump(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_jump_event = cast(Dict[str, Any], content)
+        star_system = carrier_jump_event.get('StarSystem', 'Unknown System')
+        station_name = carrier_jump_event.get('StationName', 'Unknown Station')
+        
+        system_details = []
+        if carrier_jump_event.get('SystemAllegiance'):
+            system_details.append(f"allegiance: {carrier_jump_event.get('SystemAllegiance')}")
+        if carrier_jump_event.get('SystemEconomy'):
+            economy = carrier_jump_event.get('SystemEconomy_Localised', carrier_jump_event.get('SystemEconomy'))
+            system_details.append(f"economy: {economy}")
+        if carrier_jump_event.get('SystemGovernment'):
+            government = carrier_jump_event.get('SystemGovernment_Localised', carrier_jump_event.get('SystemGovernment'))
+            system_details.append(f"government: {government}")
+        if carrier_jump_event.get('SystemSecurity'):
+            security = carrier_jump_event.get('SystemSecurity_Localised', carrier_jump_event.get('SystemSecurity'))
+            system_details.append(f"security: {security}")
+        
+        system_details_str = ", ".join(system_details)
+        system_details_str = f" ({system_details_str})" if system_details_str else ""
+        
+        population = f", population: {carrier_jump_event.get('Population'):,}" if carrier_jump_event.get('Population') else ""
+        
+        body_info = ""
+        if carrier_jump_event.get('Body'):
+            body_type = f" ({carrier_jump_event.get('BodyType')})" if carrier_jump_event.get('BodyType') else ""
+            body_info = f" near {carrier_jump_event.get('Body')}{body_type}"
+        
+        if 'Docked' in carrier_jump_event and carrier_jump_event.get('Docked'):
+            return f"{self.commander_name} is docked at Fleet Carrier {station_name} which has jumped to the {star_system} system{body_info}{system_details_str}{population}."
+        else:
+            return f"Fleet Carrier {station_name} has jumped to the {star_system} system{body_info}{system_details_str}{population}."
+
+    @event_renderer('CarrierBuy')
+    def _render_carrier_buy(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_buy_event = cast(Dict[str, Any], content)
+        carrier_id = carrier_buy_event.get('CarrierID', 'Unknown ID')
+        price = carrier_buy_event.get('Price', 0)
+        location = carrier_buy_event.get('Location', 'an undisclosed location')
+        variant = carrier_buy_event.get('Variant', 'Unknown Type')
+        callsign = carrier_buy_event.get('Callsign', 'Unknown Callsign')
+        return f"{self.commander_name} has purchased a Fleet Carrier with callsign {callsign} ({variant}) for {price:,} credits at {location}."
+
+    @event_renderer('CarrierStats')
+    def _render_carrier_stats(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_stats_event = cast(Dict[str, Any], content)
+        callsign = carrier_stats_event.get('Callsign', 'Unknown Callsign')
+        carrier_name = carrier_stats_event.get('Name', callsign)
+        balance = carrier_stats_event.get('Balance', 0)
+        fuel = carrier_stats_event.get('Fuel', 0)
+        reserve_percent = carrier_stats_event.get('ReservePercent', 0)
+        services = carrier_stats_event.get('Services', [])
+        
+        service_str = ""
+        if services:
+            # Show just the first few services to avoid too long a message
+            service_list = [s.get('Name', '') for s in services if s.get('Status') == 'Activated']
+            if service_list:
+                service_str = f" Active services: {', '.join(service_list[:3])}"
+                if len(service_list) > 3:
+                    service_str += f" and {len(service_list) - 3} more"
+            
+        return f"{self.commander_name}'s Fleet Carrier '{carrier_name}' ({callsign}) status update: {balance:,} credits balance, {fuel} tons of tritium, {reserve_percent}% reserve.{service_str}"
+
+    @event_renderer('CarrierJumpRequest')
+    def _render_carrier_jump_request(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_jump_request_event = cast(Dict[str, Any], content)
+        system_name = carrier_jump_request_event.get('SystemName', 'an unknown destination')
+        
+        body_info = ""
+        if carrier_jump_request_event.get('Body'):
+            body_info = f" near {carrier_jump_request_event.get('Body')}"
+        
+        departure_time = ""
+        if carrier_jump_request_event.get('DepartureTime'):
+            departure_time_str = carrier_jump_request_event.get('DepartureTime')
+            try:
+                # Try to convert the time string to a more readable format
+                dt = datetime.fromisoformat(departure_time_str.replace('Z', '+00:00'))
+                departure_time = f", departing at {dt.strftime('%H:%M:%S')}"
+            except:
+                departure_time = f", departing at {departure_time_str}"
+        
+        return f"{self.commander_name} has requested their Fleet Carrier to jump to {system_name}{body_info}{departure_time}."
+
+    @event_renderer('CarrierDecommission')
+    def _render_carrier_decommission(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_decommission_event = cast(Dict[str, Any], content)
+        refund = carrier_decommission_event.get('ScrapRefund', 0)
+        
+        scrap_time_info = ""
+        if carrier_decommission_event.get('ScrapTime'):
+            scrap_time = carrier_decommission_event.get('ScrapTime')
+            if scrap_time is not None:
                 try:
-                    # Try to convert the time string to a more readable format
-                    dt = datetime.fromisoformat(departure_time_str.replace('Z', '+00:00'))
-                    departure_time = f", departing at {dt.strftime('%H:%M:%S')}"
-                except:
-                    departure_time = f", departing at {departure_time_str}"
-            
-            return f"{self.commander_name} has requested their Fleet Carrier to jump to {system_name}{body_info}{departure_time}."
-            
-        if event_name == 'CarrierDecommission':
-            carrier_decommission_event = cast(Dict[str, Any], content)
-            refund = carrier_decommission_event.get('ScrapRefund', 0)
-            
-            scrap_time_info = ""
-            if carrier_decommission_event.get('ScrapTime'):
-                scrap_time = carrier_decommission_event.get('ScrapTime')
-                if scrap_time is not None:
-                    try:
-                        # Try to convert the timestamp to a readable time
-                        dt = datetime.fromtimestamp(float(scrap_time))
-                        scrap_time_info = f" The carrier will be decommissioned on {dt.strftime('%Y-%m-%d at %H:%M:%S')}."
-                    except (ValueError, TypeError):
-                        pass
-                
-            return f"{self.commander_name} has initiated the decommissioning process for their Fleet Carrier. Expected refund: {refund:,} credits.{scrap_time_info}"
-            
-        if event_name == 'CarrierCancelDecommission':
-            return f"{self.commander_name} has cancelled the decommissioning process for their Fleet Carrier."
-            
-        if event_name == 'CarrierBankTransfer':
-            carrier_bank_event = cast(Dict[str, Any], content)
-            deposit = carrier_bank_event.get('Deposit', 0)
-            withdraw = carrier_bank_event.get('Withdraw', 0)
-            player_balance = carrier_bank_event.get('PlayerBalance', 0)
-            carrier_balance = carrier_bank_event.get('CarrierBalance', 0)
-            
-            if deposit > 0:
-                return f"{self.commander_name} has deposited {deposit:,} credits to their Fleet Carrier account. Carrier balance: {carrier_balance:,} credits. Commander's balance: {player_balance:,} credits."
-            else:
-                return f"{self.commander_name} has withdrawn {withdraw:,} credits from their Fleet Carrier account. Carrier balance: {carrier_balance:,} credits. Commander's balance: {player_balance:,} credits."
-            
-        if event_name == 'CarrierDepositFuel':
-            carrier_fuel_event = cast(Dict[str, Any], content)
-            amount = carrier_fuel_event.get('Amount', 0)
-            total = carrier_fuel_event.get('Total', 0)
-            return f"{self.commander_name} has deposited {amount} tons of tritium fuel to their Fleet Carrier. Total fuel: {total} tons."
-            
-        if event_name == 'CarrierCrewServices':
-            carrier_crew_event = cast(Dict[str, Any], content)
-            operation = carrier_crew_event.get('Operation', 'Unknown')
-            crew_role = carrier_crew_event.get('CrewRole', 'Unknown')
-            crew_name = carrier_crew_event.get('CrewName', 'a crew member')
-            
-            operation_str = str(operation).lower()
-            if operation_str == 'activate':
-                return f"{self.commander_name} has activated the {crew_role} service on their Fleet Carrier, hiring {crew_name}."
-            elif operation_str == 'deactivate':
-                return f"{self.commander_name} has deactivated the {crew_role} service on their Fleet Carrier, dismissing {crew_name}."
-            elif operation_str == 'pause':
-                return f"{self.commander_name} has temporarily paused the {crew_role} service on their Fleet Carrier, operated by {crew_name}."
-            elif operation_str == 'resume':
-                return f"{self.commander_name} has resumed the {crew_role} service on their Fleet Carrier, operated by {crew_name}."
-            elif operation_str == 'replace':
-                return f"{self.commander_name} has replaced the crew member for the {crew_role} service on their Fleet Carrier, hiring {crew_name}."
-            else:
-                return f"{self.commander_name} has made changes to the {crew_role} service on their Fleet Carrier, affecting {crew_name}."
-            
-        if event_name == 'CarrierFinance':
-            carrier_finance_event = cast(Dict[str, Any], content)
-            tax_rate = carrier_finance_event.get('TaxRate', 0)
-            carrier_balance = carrier_finance_event.get('CarrierBalance', 0)
-            reserve_balance = carrier_finance_event.get('ReserveBalance', 0)
-            available_balance = carrier_finance_event.get('AvailableBalance', 0)
-            reserve_percent = carrier_finance_event.get('ReservePercent', 0)
-            
-            return f"{self.commander_name} has updated their Fleet Carrier finances. Tax rate: {tax_rate}%, Available balance: {available_balance:,} credits, Reserve: {reserve_balance:,} credits ({reserve_percent}%), Total balance: {carrier_balance:,} credits."
-            
-        if event_name == 'CarrierShipPack':
-            carrier_ship_pack_event = cast(Dict[str, Any], content)
-            operation = carrier_ship_pack_event.get('Operation', 'Unknown')
-            pack_theme = carrier_ship_pack_event.get('PackTheme', 'Unknown')
-            pack_tier = carrier_ship_pack_event.get('PackTier', '')
-            
-            tier_str = f" Tier {pack_tier}" if pack_tier else ""
-            
-            operation_str = str(operation).lower()
-            if operation_str == 'buypack':
-                cost = carrier_ship_pack_event.get('Cost', 0)
-                return f"{self.commander_name} has purchased the {pack_theme}{tier_str} ship pack for their Fleet Carrier for {cost:,} credits."
-            elif operation_str == 'sellpack':
-                refund = carrier_ship_pack_event.get('Refund', 0)
-                return f"{self.commander_name} has sold the {pack_theme}{tier_str} ship pack from their Fleet Carrier for {refund:,} credits."
-            elif operation_str == 'restockpack':
-                cost = carrier_ship_pack_event.get('Cost', 0)
-                return f"{self.commander_name} has restocked the {pack_theme}{tier_str} ship pack on their Fleet Carrier for {cost:,} credits."
-            else:
-                return f"{self.commander_name} has modified the {pack_theme}{tier_str} ship pack on their Fleet Carrier."
-                
-        if event_name == 'CarrierModulePack':
-            carrier_module_pack_event = cast(Dict[str, Any], content)
-            operation = carrier_module_pack_event.get('Operation', 'Unknown')
-            pack_theme = carrier_module_pack_event.get('PackTheme', 'Unknown')
-            pack_tier = carrier_module_pack_event.get('PackTier', '')
-            
-            tier_str = f" Tier {pack_tier}" if pack_tier else ""
-            
-            operation_str = str(operation).lower()
-            if operation_str == 'buypack':
-                cost = carrier_module_pack_event.get('Cost', 0)
-                return f"{self.commander_name} has purchased the {pack_theme}{tier_str} module pack for their Fleet Carrier for {cost:,} credits."
-            elif operation_str == 'sellpack':
-                refund = carrier_module_pack_event.get('Refund', 0)
-                return f"{self.commander_name} has sold the {pack_theme}{tier_str} module pack from their Fleet Carrier for {refund:,} credits."
-            elif operation_str == 'restockpack':
-                cost = carrier_module_pack_event.get('Cost', 0)
-                return f"{self.commander_name} has restocked the {pack_theme}{tier_str} module pack on their Fleet Carrier for {cost:,} credits."
-            else:
-                return f"{self.commander_name} has modified the {pack_theme}{tier_str} module pack on their Fleet Carrier."
-            
-        if event_name == 'CarrierTradeOrder':
-            carrier_trade_event = cast(Dict[str, Any], content)
-            black_market = " on the black market" if carrier_trade_event.get('BlackMarket') else ""
-            
-            if 'CancelTrade' in carrier_trade_event and carrier_trade_event.get('CancelTrade'):
-                commodity = carrier_trade_event.get('Commodity_Localised', carrier_trade_event.get('Commodity', 'commodities'))
-                return f"{self.commander_name} has cancelled trade orders for {commodity}{black_market} on their Fleet Carrier."
-            elif 'PurchaseOrder' in carrier_trade_event:
-                commodity = carrier_trade_event.get('Commodity_Localised', carrier_trade_event.get('Commodity', 'commodities'))
-                quantity = carrier_trade_event.get('PurchaseOrder', 0)
-                price = carrier_trade_event.get('Price', 0)
-                return f"{self.commander_name} has set up a buy order for {quantity} units of {commodity}{black_market} at {price:,} credits per unit on their Fleet Carrier."
-            elif 'SaleOrder' in carrier_trade_event:
-                commodity = carrier_trade_event.get('Commodity_Localised', carrier_trade_event.get('Commodity', 'commodities'))
-                quantity = carrier_trade_event.get('SaleOrder', 0)
-                price = carrier_trade_event.get('Price', 0)
-                return f"{self.commander_name} has set up a sell order for {quantity} units of {commodity}{black_market} at {price:,} credits per unit on their Fleet Carrier."
-            else:
-                return f"{self.commander_name} has modified trade orders on their Fleet Carrier."
-            
-        if event_name == 'CarrierDockingPermission':
-            carrier_docking_event = cast(Dict[str, Any], content)
-            access = carrier_docking_event.get('DockingAccess', 'Unknown')
-            allow_notorious = carrier_docking_event.get('AllowNotorious', False)
-            
-            access_map = {
-                'all': 'all pilots',
-                'none': 'no pilots',
-                'friends': 'friends only',
-                'squadron': 'squadron members only',
-                'squadronfriends': 'squadron members and friends'
-            }
-            
-            access_str = access_map.get(str(access).lower(), access)
-            notorious_str = " including those with notorious status" if allow_notorious else ""
-            
-            return f"{self.commander_name} has updated their Fleet Carrier docking permissions to allow {access_str}{notorious_str}."
-            
-        if event_name == 'CarrierNameChanged':
-            carrier_name_event = cast(Dict[str, Any], content)
-            callsign = carrier_name_event.get('Callsign', 'Unknown Callsign')
-            name = carrier_name_event.get('Name', 'Unknown Name')
-            return f"{self.commander_name} has changed their Fleet Carrier's name to '{name}' (callsign: {callsign})."
-            
-        if event_name == 'CarrierJumpCancelled':
-            return f"{self.commander_name} has cancelled the pending jump of their Fleet Carrier."
-            
-        if event_name == 'FCMaterials':
-            fc_materials_event = cast(Dict[str, Any], content)
-            carrier_name = fc_materials_event.get('CarrierName', 'their Fleet Carrier')
-            return f"{self.commander_name} has accessed the materials bartender on {carrier_name}."
-
-        # Exploration events
-        if event_name == 'CodexEntry':
-            codex_entry_event = cast(CodexEntryEvent, content)
-            codex_name = codex_entry_event.get('Name_Localised', codex_entry_event.get('Name', 'Unknown Discovery'))
-            category = codex_entry_event.get('Category_Localised', codex_entry_event.get('Category', ''))
-            system = codex_entry_event.get('System', '')
-            is_new = ' - New discovery!' if codex_entry_event.get('IsNewEntry') else ''
-            return f"{self.commander_name} has discovered a new codex entry: {codex_name} ({category}) in {system}{is_new}"
-            
-        if event_name == 'DiscoveryScan':
-            discovery_scan_event = cast(DiscoveryScanEvent, content)
-            bodies_count = discovery_scan_event.get('Bodies', 0)
-            return f"{self.commander_name} performed a discovery scan and found {bodies_count} new astronomical bodies."
-            
-        if event_name == 'Scan':
-            scan_event = cast(ScanEvent, content)
-            body_name = scan_event.get('BodyName', 'Unknown body')
-            body_type = None
-            
-            if scan_event.get('StarType'):
-                star_type = scan_event.get('StarType', '')
-                luminosity = scan_event.get('Luminosity', '')
-                stellar_mass = scan_event.get('StellarMass', 0)
-                body_type = f"star (Type: {star_type}, Mass: {stellar_mass} solar masses, Luminosity: {luminosity})"
-            elif scan_event.get('PlanetClass'):
-                planet_class = scan_event.get('PlanetClass', '')
-                atmosphere = scan_event.get('Atmosphere', 'None')
-                terraform_state = scan_event.get('TerraformState', 'Not terraformable')
-                is_landable = 'Landable' if scan_event.get('Landable') else 'Not landable'
-                body_type = f"{planet_class} ({terraform_state}, Atmosphere: {atmosphere}, {is_landable})"
-            
-            scan_type = scan_event.get('ScanType', 'Unknown scan')
-            
-            if body_type:
-                return f"{self.commander_name} performed a {scan_type} scan of {body_name}: {body_type}."
-            else:
-                return f"{self.commander_name} performed a {scan_type} scan of {body_name}."
-                
-        if event_name == 'FSSAllBodiesFound':
-            fss_all_bodies_event = cast(FSSAllBodiesFoundEvent, content)
-            system_name = fss_all_bodies_event.get('SystemName', 'current system')
-            body_count = fss_all_bodies_event.get('Count', 0)
-            return f"{self.commander_name} has discovered all {body_count} bodies in the {system_name} system."
-            
-        if event_name == 'FSSDiscoveryScan':
-            fss_discovery_scan_event = cast(FSSDiscoveryScanEvent, content)
-            progress = fss_discovery_scan_event.get('Progress', 0) * 100
-            body_count = fss_discovery_scan_event.get('BodyCount', 0)
-            non_body_count = fss_discovery_scan_event.get('NonBodyCount', 0)
-            return f"{self.commander_name} performed an FSS discovery scan. Progress: {progress:.1f}%, Bodies detected: {body_count}, Non-body signals: {non_body_count}."
-            
-        if event_name == 'FSSSignalDiscovered':
-            return None
+                    # Try to convert the timestamp to a readable time
+                    dt = datetime.fromtimestamp(float(scrap_time))
+                    scrap_time_info = f" The carrier will be decommissioned on {dt.strftime('%Y-%m-%d at %H:%M:%S')}."
+                except (ValueError, TypeError):
+                    pass
+            
+        return f"{self.commander_name} has initiated the decommissioning process for their Fleet Carrier. Expected refund: {refund:,} credits.{scrap_time_info}"
+
+    @event_renderer('CarrierCancelDecommission')
+    def _render_carrier_cancel_decommission(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has cancelled the decommissioning process for their Fleet Carrier."
+
+    @event_renderer('CarrierBankTransfer')
+    def _render_carrier_bank_transfer(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_bank_event = cast(Dict[str, Any], content)
+        deposit = carrier_bank_event.get('Deposit', 0)
+        withdraw = carrier_bank_event.get('Withdraw', 0)
+        player_balance = carrier_bank_event.get('PlayerBalance', 0)
+        carrier_balance = carrier_bank_event.get('CarrierBalance', 0)
+        
+        if deposit > 0:
+            return f"{self.commander_name} has deposited {deposit:,} credits to their Fleet Carrier account. Carrier balance: {carrier_balance:,} credits. Commander's balance: {player_balance:,} credits."
+        else:
+            return f"{self.commander_name} has withdrawn {withdraw:,} credits from their Fleet Carrier account. Carrier balance: {carrier_balance:,} credits. Commander's balance: {player_balance:,} credits."
+
+    @event_renderer('CarrierDepositFuel')
+    def _render_carrier_deposit_fuel(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_fuel_event = cast(Dict[str, Any], content)
+        amount = carrier_fuel_event.get('Amount', 0)
+        total = carrier_fuel_event.get('Total', 0)
+        return f"{self.commander_name} has deposited {amount} tons of tritium fuel to their Fleet Carrier. Total fuel: {total} tons."
+
+    @event_renderer('CarrierCrewServices')
+    def _render_carrier_crew_services(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_crew_event = cast(Dict[str, Any], content)
+        operation = carrier_crew_event.get('Operation', 'Unknown')
+        crew_role = carrier_crew_event.get('CrewRole', 'Unknown')
+        crew_name = carrier_crew_event.get('CrewName', 'a crew member')
+        
+        operation_str = str(operation).lower()
+        if operation_str == 'activate':
+            return f"{self.commander_name} has activated the {crew_role} service on their Fleet Carrier, hiring {crew_name}."
+        elif operation_str == 'deactivate':
+            return f"{self.commander_name} has deactivated the {crew_role} service on their Fleet Carrier, dismissing {crew_name}."
+        elif operation_str == 'pause':
+            return f"{self.commander_name} has temporarily paused the {crew_role} service on their Fleet Carrier, operated by {crew_name}."
+        elif operation_str == 'resume':
+            return f"{self.commander_name} has resumed the {crew_role} service on their Fleet Carrier, operated by {crew_name}."
+        elif operation_str == 'replace':
+            return f"{self.commander_name} has replaced the crew member for the {crew_role} service on their Fleet Carrier, hiring {crew_name}."
+        else:
+            return f"{self.commander_name} has made changes to the {crew_role} service on their Fleet Carrier, affecting {crew_name}."
+
+    @event_renderer('CarrierFinance')
+    def _render_carrier_finance(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_finance_event = cast(Dict[str, Any], content)
+        tax_rate = carrier_finance_event.get('TaxRate', 0)
+        carrier_balance = carrier_finance_event.get('CarrierBalance', 0)
+        reserve_balance = carrier_finance_event.get('ReserveBalance', 0)
+        available_balance = carrier_finance_event.get('AvailableBalance', 0)
+        reserve_percent = carrier_finance_event.get('ReservePercent', 0)
+        
+        return f"{self.commander_name} has updated their Fleet Carrier finances. Tax rate: {tax_rate}%, Available balance: {available_balance:,} credits, Reserve: {reserve_balance:,} credits ({reserve_percent}%), Total balance: {carrier_balance:,} credits."
+
+    @event_renderer('CarrierShipPack')
+    def _render_carrier_ship_pack(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_ship_pack_event = cast(Dict[str, Any], content)
+        operation = carrier_ship_pack_event.get('Operation', 'Unknown')
+        pack_theme = carrier_ship_pack_event.get('PackTheme', 'Unknown')
+        pack_tier = carrier_ship_pack_event.get('PackTier', '')
+        
+        tier_str = f" Tier {pack_tier}" if pack_tier else ""
+        
+        operation_str = str(operation).lower()
+        if operation_str == 'buypack':
+            cost = carrier_ship_pack_event.get('Cost', 0)
+            return f"{self.commander_name} has purchased the {pack_theme}{tier_str} ship pack for their Fleet Carrier for {cost:,} credits."
+        elif operation_str == 'sellpack':
+            refund = carrier_ship_pack_event.get('Refund', 0)
+            return f"{self.commander_name} has sold the {pack_theme}{tier_str} ship pack from their Fleet Carrier for {refund:,} credits."
+        elif operation_str == 'restockpack':
+            cost = carrier_ship_pack_event.get('Cost', 0)
+            return f"{self.commander_name} has restocked the {pack_theme}{tier_str} ship pack on their Fleet Carrier for {cost:,} credits."
+        else:
+            return f"{self.commander_name} has modified the {pack_theme}{tier_str} ship pack on their Fleet Carrier."
+
+    @event_renderer('CarrierModulePack')
+    def _render_carrier_module_pack(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_module_pack_event = cast(Dict[str, Any], content)
+        operation = carrier_module_pack_event.get('Operation', 'Unknown')
+        pack_theme = carrier_module_pack_event.get('PackTheme', 'Unknown')
+        pack_tier = carrier_module_pack_event.get('PackTier', '')
+        
+        tier_str = f" Tier {pack_tier}" if pack_tier else ""
+        
+        operation_str = str(operation).lower()
+        if operation_str == 'buypack':
+            cost = carrier_module_pack_event.get('Cost', 0)
+            return f"{self.commander_name} has purchased the {pack_theme}{tier_str} module pack for their Fleet Carrier for {cost:,} credits."
+        elif operation_str == 'sellpack':
+            refund = carrier_module_pack_event.get('Refund', 0)
+            return f"{self.commander_name} has sold the {pack_theme}{tier_str} module pack from their Fleet Carrier for {refund:,} credits."
+        elif operation_str == 'restockpack':
+            cost = carrier_module_pack_event.get('Cost', 0)
+            return f"{self.commander_name} has restocked the {pack_theme}{tier_str} module pack on their Fleet Carrier for {cost:,} credits."
+        else:
+            return f"{self.commander_name} has modified the {pack_theme}{tier_str} module pack on their Fleet Carrier."
 
-        if event_name == 'FleetCarrierDiscovered':
-            return f"{self.commander_name} discovered a fleet carrier signal: {content.get('SignalName', 'unknown signal')}."
-        if event_name == 'ResourceExtractionDiscovered':
-            return f"{self.commander_name} discovered a resource extraction signal: {content.get('SignalName', 'unknown signal')}."
-        if event_name == 'InstallationDiscovered':
-            return f"{self.commander_name} discovered an installation signal: {content.get('SignalName', 'unknown signal')}."
-        if event_name == 'NavBeaconDiscovered':
-            return f"{self.commander_name} discovered a navigation beacon signal: {content.get('SignalName', 'unknown signal')}."
-        if event_name == 'TouristBeaconDiscovered':
-            return f"{self.commander_name} discovered a tourist beacon signal: {content.get('SignalName', 'unknown signal')}."
-        if event_name == 'MegashipDiscovered':
-            return f"{self.commander_name} discovered a megaship signal: {content.get('SignalName', 'unknown signal')}."
-        if event_name == 'GenericDiscovered':
-            return f"{self.commander_name} discovered a signal: {content.get('SignalName', 'unknown signal')}."
-        if event_name == 'OutpostDiscovered':
-            return f"{self.commander_name} discovered an outpost signal: {content.get('SignalName', 'unknown signal')}."
-        if event_name == 'CombatDiscovered':
-            return f"{self.commander_name} discovered a combat signal: {content.get('SignalName', 'unknown signal')}."
-        if event_name == 'StationDiscovered':
-            return f"{self.commander_name} discovered a station signal: {content.get('SignalName', 'unknown signal')}."
-        if event_name == 'UnknownSignalDiscovered':
-            return f"{self.commander_name} discovered an unknown signal: {content.get('SignalName', 'unknown signal')}."
-            
-        if event_name == 'FSSBodySignals':
-            fss_body_signals_event = cast(FSSBodySignalsEvent, content)
-            body_name = fss_body_signals_event.get('BodyName', 'a body')
-            signal_count = sum(signal.get('Count', 0) for signal in fss_body_signals_event.get('Signals', []))
-            return f"{self.commander_name} detected {signal_count} signals on {body_name}."
-            
-        if event_name == 'SAASignalsFound':
-            saa_signals_event = cast(SAASignalsFoundEvent, content)
-            body_name = saa_signals_event.get('BodyName', 'the current body')
-            
-            signals_info = []
-            for signal in saa_signals_event.get('Signals', []):
-                sig_type = signal.get('Type_Localised', signal.get('Type', 'Unknown'))
-                count = signal.get('Count', 0)
-                signals_info.append(f"{count} {sig_type}")
-            
-            if 'Genuses' in saa_signals_event:
-                genus_info = []
-                for genus in saa_signals_event.get('Genuses', []):
-                    genus_name = genus.get('Genus_Localised', genus.get('Genus', 'Unknown species'))
-                    genus_info.append(genus_name)
-                
-                if genus_info:
-                    return f"{self.commander_name} scanned {body_name} and found: {', '.join(signals_info)}. Biological genuses detected: {', '.join(genus_info)}."
-            
-            if signals_info:
-                return f"{self.commander_name} scanned {body_name} and found: {', '.join(signals_info)}."
-            else:
-                return f"{self.commander_name} scanned {body_name} but found no significant signals."
-            
-        if event_name == 'SAAScanComplete':
-            saa_scan_complete_event = cast(SAAScanCompleteEvent, content)
-            body_name = saa_scan_complete_event.get('BodyName', 'the current body')
-            probes_used = saa_scan_complete_event.get('ProbesUsed', 0)
-            efficiency_target = saa_scan_complete_event.get('EfficiencyTarget', 0)
-            efficiency_text = f" (Efficiency target was {efficiency_target})" if efficiency_target else ""
-            
-            return f"{self.commander_name} has completed a full surface scan of {body_name} using {probes_used} probes{efficiency_text}."
-            
-        if event_name == 'ScanBaryCentre':
-            scan_bary_event = cast(ScanBaryCentreEvent, content)
-            system_name = scan_bary_event.get('StarSystem', 'current system')
-            return f"{self.commander_name} has scanned the barycenter in the {system_name} system."
-            
-        if event_name == 'MaterialCollected':
-            material_collected_event = cast(MaterialCollectedEvent, content)
-            material_name = material_collected_event.get('Name_Localised', material_collected_event.get('Name', 'unknown material'))
-            material_count = material_collected_event.get('Count', 1)
-            material_category = material_collected_event.get('Category', '')
-            
-            return f"{self.commander_name} has collected {material_count} units of {material_name} ({material_category})."
-            
-        if event_name == 'MaterialDiscarded':
-            material_discarded_event = cast(MaterialDiscardedEvent, content)
-            material_name = material_discarded_event.get('Name_Localised', material_discarded_event.get('Name', 'unknown material'))
-            material_count = material_discarded_event.get('Count', 1)
-            
-            return f"{self.commander_name} has discarded {material_count} units of {material_name}."
-            
-        if event_name == 'MaterialDiscovered':
-            material_discovered_event = cast(MaterialDiscoveredEvent, content)
-            material_name = material_discovered_event.get('Name_Localised', material_discovered_event.get('Name', 'unknown material'))
-            category = material_discovered_event.get('Category', '')
-            discovery_number = material_discovered_event.get('DiscoveryNumber', 0)
-            
-            return f"{self.commander_name} has discovered a new material: {material_name} ({category}). This is discovery #{discovery_number}."
-            
-        if event_name == 'BuyExplorationData':
-            buy_exploration_data_event = cast(BuyExplorationDataEvent, content)
-            system_name = buy_exploration_data_event.get('System', 'Unknown system')
-            cost = buy_exploration_data_event.get('Cost', 0)
-            
-            return f"{self.commander_name} has purchased exploration data for the {system_name} system for {cost:,} credits."
-            
-        if event_name == 'SellExplorationData':
-            sell_exploration_data_event = cast(SellExplorationDataEvent, content)
-            systems = sell_exploration_data_event.get('Systems', [])
-            systems_text = ', '.join(systems[:3])
-            if len(systems) > 3:
-                systems_text += f" and {len(systems) - 3} more"
-                
-            discovered_bodies = sell_exploration_data_event.get('Discovered', [])
-            discovered_count = len(discovered_bodies)
-            
-            base_value = sell_exploration_data_event.get('BaseValue', 0)
-            bonus = sell_exploration_data_event.get('Bonus', 0)
-            total = sell_exploration_data_event.get('TotalEarnings', 0)
-            
-            return f"{self.commander_name} has sold exploration data for {systems_text} ({discovered_count} bodies) for {total:,} credits (base: {base_value:,}, bonus: {bonus:,})."
-            
-        if event_name == 'MultiSellExplorationData':
-            multi_sell_event = cast(MultiSellExplorationDataEvent, content)
-            discovered_systems = multi_sell_event.get('Discovered', [])
-            system_count = len(discovered_systems)
-            body_count = sum(system.get('NumBodies', 0) for system in discovered_systems)
-            
-            base_value = multi_sell_event.get('BaseValue', 0)
-            bonus = multi_sell_event.get('Bonus', 0)
-            total = multi_sell_event.get('TotalEarnings', 0)
-            
-            return f"{self.commander_name} has sold exploration data for {system_count} systems ({body_count} bodies) for {total:,} credits (base: {base_value:,}, bonus: {bonus:,})."
-            
-        if event_name == 'NavBeaconScan':
-            nav_beacon_scan_event = cast(NavBeaconScanEvent, content)
-            body_count = nav_beacon_scan_event.get('NumBodies', 0)
-            
-            return f"{self.commander_name} has scanned a navigation beacon, revealing data for {body_count} bodies in the system."
+    @event_renderer('CarrierTradeOrder')
+    def _render_carrier_trade_order(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_trade_event = cast(Dict[str, Any], content)
+        black_market = " on the black market" if carrier_trade_event.get('BlackMarket') else ""
+        
+        if 'CancelTrade' in carrier_trade_event and carrier_trade_event.get('CancelTrade'):
+            commodity = carrier_trade_event.get('Commodity_Localised', carrier_trade_event.get('Commodity', 'commodities'))
+            return f"{self.commander_name} has cancelled trade orders for {commodity}{black_market} on their Fleet Carrier."
+        elif 'PurchaseOrder' in carrier_trade_event:
+            commodity = carrier_trade_event.get('Commodity_Localised', carrier_trade_event.get('Commodity', 'commodities'))
+            quantity = carrier_trade_event.get('PurchaseOrder', 0)
+            price = carrier_trade_event.get('Price', 0)
+            return f"{self.commander_name} has set up a buy order for {quantity} units of {commodity}{black_market} at {price:,} credits per unit on their Fleet Carrier."
+        elif 'SaleOrder' in carrier_trade_event:
+            commodity = carrier_trade_event.get('Commodity_Localised', carrier_trade_event.get('Commodity', 'commodities'))
+            quantity = carrier_trade_event.get('SaleOrder', 0)
+            price = carrier_trade_event.get('Price', 0)
+            return f"{self.commander_name} has set up a sell order for {quantity} units of {commodity}{black_market} at {price:,} credits per unit on their Fleet Carrier."
+        else:
+            return f"{self.commander_name} has modified trade orders on their Fleet Carrier."
 
-        if event_name == 'Screenshot':
-            screenshot_event = cast(ScreenshotEvent, content)
+    @event_renderer('CarrierDockingPermission')
+    def _render_carrier_docking_permission(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_docking_event = cast(Dict[str, Any], content)
+        access = carrier_docking_event.get('DockingAccess', 'Unknown')
+        allow_notorious = carrier_docking_event.get('AllowNotorious', False)
+        
+        access_map = {
+            'all': 'all pilots',
+            'none': 'no pilots',
+            'friends': 'friends only',
+            'squadron': 'squadron members only',
+            'squadronfriends': 'squadron members and friends'
+        }
+        
+        access_str = access_map.get(str(access).lower(), access)
+        notorious_str = " including those with notorious status" if allow_notorious else ""
+        
+        return f"{self.commander_name} has updated their Fleet Carrier docking permissions to allow {access_str}{notorious_str}."
+
+    @event_renderer('CarrierNameChanged')
+    def _render_carrier_name_changed(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_name_event = cast(Dict[str, Any], content)
+        callsign = carrier_name_event.get('Callsign', 'Unknown Callsign')
+        name = carrier_name_event.get('Name', 'Unknown Name')
+        return f"{self.commander_name} has changed their Fleet Carrier's name to '{name}' (callsign: {callsign})."
+
+    @event_renderer('CarrierJumpCancelled')
+    def _render_carrier_jump_cancelled(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has cancelled the pending jump of their Fleet Carrier."
+
+    @event_renderer('FCMaterials')
+    def _render_fc_materials(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        fc_materials_event = cast(Dict[str, Any], content)
+        carrier_name = fc_materials_event.get('CarrierName', 'their Fleet Carrier')
+        return f"{self.commander_name} has accessed the materials bartender on {carrier_name}."
+
+    # Exploration events
+    @event_renderer('CodexEntry')
+    def _render_codex_entry(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        codex_entry_event = cast(CodexEntryEvent, content)
+        codex_name = codex_entry_event.get('Name_Localised', codex_entry_event.get('Name', 'Unknown Discovery'))
+        category = codex_entry_event.get('Category_Localised', codex_entry_event.get('Category', ''))
+        system = codex_entry_event.get('System', '')
+        is_new = ' - New discovery!' if codex_entry_event.get('IsNewEntry') else ''
+        return f"{self.commander_name} has discovered a new codex entry: {codex_name} ({category}) in {system}{is_new}"
+
+    @event_renderer('DiscoveryScan')
+    def _render_discovery_scan(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        discovery_scan_event = cast(DiscoveryScanEvent, content)
+        bodies_count = discovery_scan_event.get('Bodies', 0)
+        return f"{self.commander_name} performed a discovery scan and found {bodies_count} new astronomical bodies."
+
+    @event_renderer('Scan')
+    def _render_scan(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        scan_event = cast(ScanEvent, content)
+        body_name = scan_event.get('BodyName', 'Unknown body')
+        body_type = None
+        
+        if scan_event.get('StarType'):
+            star_type = scan_event.get('StarType', '')
+            luminosity = scan_event.get('Luminosity', '')
+            stellar_mass = scan_event.get('StellarMass', 0)
+            body_type = f"star (Type: {star_type}, Mass: {stellar_mass} solar masses, Luminosity: {luminosity})"
+        elif scan_event.get('PlanetClass'):
+            planet_class = scan_event.get('PlanetClass', '')
+            atmosphere = scan_event.get('Atmosphere', 'None')
+            terraform_state = scan_event.get('TerraformState', 'Not terraformable')
+            is_landable = 'Landable' if scan_event.get('Landable') else 'Not landable'
+            body_type = f"{planet_class} ({terraform_state}, Atmosphere: {atmosphere}, {is_landable})"
+        
+        scan_type = scan_event.get('ScanType', 'Unknown scan')
+        
+        if body_type:
+            return f"{self.commander_name} performed a {scan_type} scan of {body_name}: {body_type}."
+        else:
+            return f"{self.commander_name} performed a {scan_type} scan of {body_name}."
+
+    @event_renderer('FSSAllBodiesFound')
+    def _render_fss_all_bodies_found(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        fss_all_bodies_event = cast(FSSAllBodiesFoundEvent, content)
+        system_name = fss_all_bodies_event.get('SystemName', 'current system')
+        body_count = fss_all_bodies_event.get('Count', 0)
+        return f"{self.commander_name} has discovered all {body_count} bodies in the {system_name} system."
+
+    @event_renderer('FSSDiscoveryScan')
+    def _render_fss_discovery_scan(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        fss_discovery_scan_event = cast(FSSDiscoveryScanEvent, content)
+        progress = fss_discovery_scan_event.get('Progress', 0) * 100
+        body_count = fss_discovery_scan_event.get('BodyCount', 0)
+        non_body_count = fss_discovery_scan_event.get('NonBodyCount', 0)
+        return f"{self.commander_name} performed an FSS discovery scan. Progress: {progress:.1f}%, Bodies detected: {body_count}, Non-body signals: {non_body_count}."
+
+    @event_renderer('FSSSignalDiscovered')
+    def _render_fss_signal_discovered(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
 
-            system = screenshot_event.get('System') or 'current system'
-            body = screenshot_event.get('Body') or ''
-            body_text = f" near {body}" if body else ""
+    @event_renderer('FleetCarrierDiscovered')
+    def _render_fleet_carrier_discovered(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} discovered a fleet carrier signal: {content.get('SignalName', 'unknown signal')}."
+
+    @event_renderer('ResourceExtractionDiscovered')
+    def _render_resource_extraction_discovered(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} discovered a resource extraction signal: {content.get('SignalName', 'unknown signal')}."
+
+    @event_renderer('InstallationDiscovered')
+    def _render_installation_discovered(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} discovered an installation signal: {content.get('SignalName', 'unknown signal')}."
+
+    @event_renderer('NavBeaconDiscovered')
+    def _render_nav_beacon_discovered(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} discovered a navigation beacon signal: {content.get('SignalName', 'unknown signal')}."
+
+    @event_renderer('TouristBeaconDiscovered')
+    def _render_tourist_beacon_discovered(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} discovered a tourist beacon signal: {content.get('SignalName', 'unknown signal')}."
+
+    @event_renderer('MegashipDiscovered')
+    def _render_megaship_discovered(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} discovered a megaship signal: {content.get('SignalName', 'unknown signal')}."
+
+    @event_renderer('GenericDiscovered')
+    def _render_generic_discovered(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} discovered a signal: {content.get('SignalName', 'unknown signal')}."
+
+    @event_renderer('OutpostDiscovered')
+    def _render_outpost_discovered(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} discovered an outpost signal: {content.get('SignalName', 'unknown signal')}."
+
+    @event_renderer('CombatDiscovered')
+    def _render_combat_discovered(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} discovered a combat signal: {content.get('SignalName', 'unknown signal')}."
+
+    @event_renderer('StationDiscovered')
+    def _render_station_discovered(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} discovered a station signal: {content.get('SignalName', 'unknown signal')}."
+
+    @event_renderer('UnknownSignalDiscovered')
+    def _render_unknown_signal_discovered(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} discovered an unknown signal: {content.get('SignalName', 'unknown signal')}."
+
+    @event_renderer('FSSBodySignals')
+    def _render_fss_body_signals(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        fss_body_signals_event = cast(FSSBodySignalsEvent, content)
+        body_name = fss_body_signals_event.get('BodyName', 'a body')
+        signal_count = sum(signal.get('Count', 0) for signal in fss_body_signals_event.get('Signals', []))
+        return f"{self.commander_name} detected {signal_count} signals on {body_name}."
+
+    @event_renderer('SAASignalsFound')
+    def _render_saa_signals_found(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        saa_signals_event = cast(SAASignalsFoundEvent, content)
+        body_name = saa_signals_event.get('BodyName', 'the current body')
+        
+        signals_info = []
+        for signal in saa_signals_event.get('Signals', []):
+            sig_type = signal.get('Type_Localised', signal.get('Type', 'Unknown'))
+            count = signal.get('Count', 0)
+            signals_info.append(f"{count} {sig_type}")
+        
+        if 'Genuses' in saa_signals_event:
+            genus_info = []
+            for genus in saa_signals_event.get('Genuses', []):
+                genus_name = genus.get('Genus_Localised', genus.get('Genus', 'Unknown species'))
+                genus_info.append(genus_name)
+            
+            if genus_info:
+                return f"{self.commander_name} scanned {body_name} and found: {', '.join(signals_info)}. Biological genuses detected: {', '.join(genus_info)}."
+        
+        if signals_info:
+            return f"{self.commander_name} scanned {body_name} and found: {', '.join(signals_info)}."
+        else:
+            return f"{self.commander_name} scanned {body_name} but found no significant signals."
+
+    @event_renderer('SAAScanComplete')
+    def _render_saa_scan_complete(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        saa_scan_complete_event = cast(SAAScanCompleteEvent, content)
+        body_name = saa_scan_complete_event.get('BodyName', 'the current body')
+        probes_used = saa_scan_complete_event.get('ProbesUsed', 0)
+        efficiency_target = saa_scan_complete_event.get('EfficiencyTarget', 0)
+        efficiency_text = f" (Efficiency target was {efficiency_target})" if efficiency_target else ""
+        
+        return f"{self.commander_name} has completed a full surface scan of {body_name} using {probes_used} probes{efficiency_text}."
+
+    @event_renderer('ScanBaryCentre')
+    def _render_scan_bary_centre(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        scan_bary_event = cast(ScanBaryCentreEvent, content)
+        system_name = scan_bary_event.get('StarSystem', 'current system')
+        return f"{self.commander_name} has scanned the barycenter in the {system_name} system."
+
+    @event_renderer('MaterialCollected')
+    def _render_material_collected(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        material_collected_event = cast(MaterialCollectedEvent, content)
+        material_name = material_collected_event.get('Name_Localised', material_collected_event.get('Name', 'unknown material'))
+        material_count = material_collected_event.get('Count', 1)
+        material_category = material_collected_event.get('Category', '')
+        
+        return f"{self.commander_name} has collected {material_count} units of {material_name} ({material_category})."
 
-            location_text = ""
-            if screenshot_event.get('Latitude') is not None and screenshot_event.get('Longitude') is not None and screenshot_event.get('Altitude') is not None:
-                lat = screenshot_event.get('Latitude', 0)
-                lon = screenshot_event.get('Longitude', 0)
-                alt = screenshot_event.get('Altitude', 0)
-                location_text = f" at coordinates {lat}, {lon}, altitude: {alt}m"
+    @event_renderer('MaterialDiscarded')
+    def _render_material_discarded(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        material_discarded_event = cast(MaterialDiscardedEvent, content)
+        material_name = material_discarded_event.get('Name_Localised', material_discarded_event.get('Name', 'unknown material'))
+        material_count = material_discarded_event.get('Count', 1)
+        
+        return f"{self.commander_name} has discarded {material_count} units of {material_name}."
+
+    @event_renderer('MaterialDiscovered')
+    def _render_material_discovered(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        material_discovered_event = cast(MaterialDiscoveredEvent, content)
+        material_name = material_discovered_event.get('Name_Localised', material_discovered_event.get('Name', 'unknown material'))
+        category = material_discovered_event.get('Category', '')
+        discovery_number = material_discovered_event.get('DiscoveryNumber', 0)
+        
+        return f"{self.commander_name} has discovered a new material: {material_name} ({category}). This is discovery #{discovery_number}."
 
-            return f"{self.commander_name} took a screenshot in {system}{body_text}{location_text}."
+    @event_renderer('BuyExplorationData')
+    def _render_buy_exploration_data(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        buy_exploration_data_event = cast(BuyExplorationDataEvent, content)
+        system_name = buy_exploration_data_event.get('System', 'Unknown system')
+        cost = buy_exploration_data_event.get('Cost', 0)
+        
+        return f"{self.commander_name} has purchased exploration data for the {system_name} system for {cost:,} credits."
+
+    @event_renderer('SellExplorationData')
+    def _render_sell_exploration_data(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        sell_exploration_data_event = cast(SellExplorationDataEvent, content)
+        systems = sell_exploration_data_event.get('Systems', [])
+        systems_text = ', '.join(systems[:3])
+        if len(systems) > 3:
+            systems_text += f" and {len(systems) - 3} more"
+            
+        discovered_bodies = sell_exploration_data_event.get('Discovered', [])
+        discovered_count = len(discovered_bodies)
+        
+        base_value = sell_exploration_data_event.get('BaseValue', 0)
+        bonus = sell_exploration_data_event.get('Bonus', 0)
+        total = sell_exploration_data_event.get('TotalEarnings', 0)
+        
+        return f"{self.commander_name} has sold exploration data for {systems_text} ({discovered_count} bodies) for {total:,} credits (base: {base_value:,}, bonus: {bonus:,})."
+
+    @event_renderer('MultiSellExplorationData')
+    def _render_multi_sell_exploration_data(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        multi_sell_event = cast(MultiSellExplorationDataEvent, content)
+        discovered_systems = multi_sell_event.get('Discovered', [])
+        system_count = len(discovered_systems)
+        body_count = sum(system.get('NumBodies', 0) for system in discovered_systems)
+        
+        base_value = multi_sell_event.get('BaseValue', 0)
+        bonus = multi_sell_event.get('Bonus', 0)
+        total = multi_sell_event.get('TotalEarnings', 0)
+        
+        return f"{self.commander_name} has sold exploration data for {system_count} systems ({body_count} bodies) for {total:,} credits (base: {base_value:,}, bonus: {bonus:,})."
 
-        # Station Services events
-        if event_name == 'BuyAmmo':
-            buy_ammo_event = cast(Dict[str, Any], content)
-            return f"{self.commander_name} has purchased ammunition for {buy_ammo_event.get('Cost', 0):,} credits."
-            
-        if event_name == 'BuyDrones':
-            buy_drones_event = cast(Dict[str, Any], content)
-            drone_type = buy_drones_event.get('Type', 'drones')
-            count = buy_drones_event.get('Count', 0)
-            total_cost = buy_drones_event.get('TotalCost', 0)
-            return f"{self.commander_name} has purchased {count} {drone_type} for {total_cost:,} credits."
-            
-        if event_name == 'SellDrones':
-            sell_drones_event = cast(Dict[str, Any], content)
-            count = sell_drones_event.get('Count', 0)
-            sell_price = sell_drones_event.get('SellPrice', 0)
-            total_sale = sell_drones_event.get('TotalSale', 0)
-            return f"{self.commander_name} has sold {count} drones for {total_sale:,} credits (at {sell_price:,} each)."
-            
-        if event_name == 'CommunityGoalJoin':
-            cg_join_event = cast(Dict[str, Any], content)
-            name = cg_join_event.get('Name', 'a community goal')
-            system = f" in {cg_join_event.get('System')}" if cg_join_event.get('System') else ""
-            return f"{self.commander_name} has signed up for the community goal: {name}{system}."
-            
-        if event_name == 'CommunityGoalDiscard':
-            cg_discard_event = cast(Dict[str, Any], content)
-            name = cg_discard_event.get('Name', 'a community goal')
-            system = f" in {cg_discard_event.get('System')}" if cg_discard_event.get('System') else ""
-            return f"{self.commander_name} has opted out of the community goal: {name}{system}."
-            
-        if event_name == 'CommunityGoalReward':
-            cg_reward_event = cast(Dict[str, Any], content)
-            name = cg_reward_event.get('Name', 'a community goal')
-            system = f" in {cg_reward_event.get('System')}" if cg_reward_event.get('System') else ""
-            reward = cg_reward_event.get('Reward', 0)
-            return f"{self.commander_name} has received a reward of {reward:,} credits for participation in community goal: {name}{system}."
-            
-        if event_name == 'RefuelAll':
-            refuel_all_event = cast(Dict[str, Any], content)
-            cost = refuel_all_event.get('Cost', 0)
-            amount = refuel_all_event.get('Amount', 0)
-            return f"{self.commander_name} has refueled the ship with {amount:.2f} tons of fuel for {cost:,} credits."
-            
-        if event_name == 'RefuelPartial':
-            refuel_partial_event = cast(Dict[str, Any], content)
-            cost = refuel_partial_event.get('Cost', 0)
-            amount = refuel_partial_event.get('Amount', 0)
-            return f"{self.commander_name} has partially refueled the ship with {amount:.2f} tons of fuel for {cost:,} credits."
-            
-        if event_name == 'Repair':
-            repair_event = cast(Dict[str, Any], content)
-            item = repair_event.get('Item', 'hull')
-            cost = repair_event.get('Cost', 0)
-            return f"{self.commander_name} has repaired the ship's {item} for {cost:,} credits."
-            
-        if event_name == 'RepairAll':
-            repair_all_event = cast(Dict[str, Any], content)
-            cost = repair_all_event.get('Cost', 0)
-            return f"{self.commander_name} has repaired all ship damage for {cost:,} credits."
-            
-        if event_name == 'RestockVehicle':
-            restock_vehicle_event = cast(Dict[str, Any], content)
-            vehicle = restock_vehicle_event.get('Type', 'vehicle')
-            cost = restock_vehicle_event.get('Cost', 0)
-            count = restock_vehicle_event.get('Count', 1)
-            return f"{self.commander_name} has restocked {count} {vehicle}(s) for {cost:,} credits."
-            
-        if event_name == 'ModuleBuy':
-            module_buy_event = cast(Dict[str, Any], content)
-            slot = module_buy_event.get('Slot', 'a slot')
-            module = module_buy_event.get('BuyItem_Localised', module_buy_event.get('BuyItem', 'a module'))
-            cost = module_buy_event.get('BuyPrice', 0)
-            return f"{self.commander_name} has purchased a {module} for {slot} for {cost:,} credits."
-            
-        if event_name == 'ModuleSell':
-            module_sell_event = cast(Dict[str, Any], content)
-            slot = module_sell_event.get('Slot', 'a slot')
-            module = module_sell_event.get('SellItem_Localised', module_sell_event.get('SellItem', 'a module'))
-            price = module_sell_event.get('SellPrice', 0)
-            return f"{self.commander_name} has sold a {module} from {slot} for {price:,} credits."
-            
-        if event_name == 'ModuleStore':
-            module_store_event = cast(Dict[str, Any], content)
-            slot = module_store_event.get('Slot', 'a slot')
-            module = module_store_event.get('Module_Localised', module_store_event.get('Module', 'a module'))
-            cost = module_store_event.get('Cost', 0)
-            cost_text = f" for {cost:,} credits" if cost > 0 else ""
-            return f"{self.commander_name} has stored a {module} from {slot}{cost_text}."
-            
-        if event_name == 'ModuleRetrieve':
-            module_retrieve_event = cast(Dict[str, Any], content)
-            slot = module_retrieve_event.get('Slot', 'a slot')
-            module = module_retrieve_event.get('Module_Localised', module_retrieve_event.get('Module', 'a module'))
-            cost = module_retrieve_event.get('Cost', 0)
-            cost_text = f" for {cost:,} credits" if cost > 0 else ""
-            return f"{self.commander_name} has retrieved a {module} to {slot}{cost_text}."
-            
-        if event_name == 'ModuleSwap':
-            module_swap_event = cast(Dict[str, Any], content)
-            from_slot = module_swap_event.get('FromSlot', 'a slot')
-            to_slot = module_swap_event.get('ToSlot', 'another slot')
-            from_module = module_swap_event.get('FromItem_Localised', module_swap_event.get('FromItem', 'a module'))
-            to_module = module_swap_event.get('ToItem_Localised', module_swap_event.get('ToItem', 'another module'))
-            return f"{self.commander_name} has swapped {from_module} in {from_slot} with {to_module} in {to_slot}."
-
-        if event_name == 'ShipyardBuy':
-            shipyard_buy_event = cast(Dict[str, Any], content)
-            ship_type = shipyard_buy_event.get('ShipType_Localised', shipyard_buy_event.get('ShipType', 'a ship'))
-            price = shipyard_buy_event.get('ShipPrice', 0)
-            sold_ship = shipyard_buy_event.get('SellOldShip', '')
-            sold_price = shipyard_buy_event.get('SellPrice', 0)
-            
-            if sold_ship:
-                sold_ship_name = shipyard_buy_event.get('SellShipId', sold_ship)
-                return f"{self.commander_name} has purchased a {ship_type} for {price:,} credits and traded in their {sold_ship_name} for {sold_price:,} credits."
-            else:
-                return f"{self.commander_name} has purchased a {ship_type} for {price:,} credits."
-                
-        if event_name == 'ShipyardSell':
-            shipyard_sell_event = cast(Dict[str, Any], content)
-            ship_type = shipyard_sell_event.get('ShipType_Localised', shipyard_sell_event.get('ShipType', 'a ship'))
-            ship_id = shipyard_sell_event.get('SellShipId', '')
-            price = shipyard_sell_event.get('ShipPrice', 0)
-            return f"{self.commander_name} has sold their {ship_type} ({ship_id}) for {price:,} credits."
-            
-        if event_name == 'ShipyardTransfer':
-            shipyard_transfer_event = cast(Dict[str, Any], content)
-            ship_type = shipyard_transfer_event.get('ShipType_Localised', shipyard_transfer_event.get('ShipType', 'a ship'))
-            ship_id = shipyard_transfer_event.get('ShipID', '')
-            system = shipyard_transfer_event.get('System', 'another system')
-            transfer_price = shipyard_transfer_event.get('TransferPrice', 0)
-            transfer_time = shipyard_transfer_event.get('TransferTime', 0)
-            
-            if transfer_time > 0:
-                time_str = f", arriving in {transfer_time} seconds"
-            else:
-                time_str = ", arriving immediately"
-                
-            return f"{self.commander_name} has requested a transfer of their {ship_type} ({ship_id}) from {system} for {transfer_price:,} credits{time_str}."
-            
-        if event_name == 'ShipyardSwap':
-            shipyard_swap_event = cast(Dict[str, Any], content)
-            ship_type = shipyard_swap_event.get('ShipType_Localised', shipyard_swap_event.get('ShipType', 'a ship'))
-            ship_id = shipyard_swap_event.get('ShipID', '')
-            store_old_ship = shipyard_swap_event.get('StoreOldShip', 0)
-            store_ship_type = shipyard_swap_event.get('StoreShipType', '')
-            
-            if store_old_ship:
-                return f"{self.commander_name} has swapped to their {ship_type} ({ship_id}) and stored their previous {store_ship_type}."
-            else:
-                return f"{self.commander_name} has swapped to their {ship_type} ({ship_id})."
-                
-        if event_name == 'MaterialTrade':
-            material_trade_event = cast(Dict[str, Any], content)
-            trader_type = material_trade_event.get('TraderType', 'material trader')
-            paid_material = material_trade_event.get('Paid_Localised', material_trade_event.get('Paid', 'materials'))
-            paid_quantity = material_trade_event.get('Paid_Quantity', 0)
-            received_material = material_trade_event.get('Received_Localised', material_trade_event.get('Received', 'materials'))
-            received_quantity = material_trade_event.get('Received_Quantity', 0)
-            
-            return f"{self.commander_name} has traded {paid_quantity} {paid_material} for {received_quantity} {received_material} at a {trader_type}."
-            
-        if event_name == 'EngineerProgress':
-            engineer_progress_event = cast(Dict[str, Any], content)
-            engineer = engineer_progress_event.get('Engineer', 'an engineer')
-            progress = engineer_progress_event.get('Progress', '')
-            rank = engineer_progress_event.get('Rank')
-            
-            if progress == 'Unlocked':
-                return f"{self.commander_name} has unlocked {engineer}."
-            elif progress == 'Invited':
-                return f"{self.commander_name} has been invited to meet {engineer}."
-            elif rank is not None:
-                return f"{self.commander_name} has reached rank {rank} with {engineer}."
-            else:
-                return f"{self.commander_name} has made progress with {engineer}: {progress}."
-                
-        if event_name == 'EngineerCraft':
-            engineer_craft_event = cast(Dict[str, Any], content)
-            engineer = engineer_craft_event.get('Engineer', 'an engineer')
-            blueprint = engineer_craft_event.get('Blueprint', 'a blueprint')
-            level = engineer_craft_event.get('Level', 0)
-            quality = engineer_craft_event.get('Quality', 0)
-            
-            return f"{self.commander_name} has crafted a level {level} {blueprint} modification with {engineer} (quality: {quality:.2f})."
-            
-        if event_name == 'EngineerApply':
-            engineer_apply_event = cast(Dict[str, Any], content)
-            engineer = engineer_apply_event.get('Engineer', 'an engineer')
-            blueprint = engineer_apply_event.get('Blueprint', 'a blueprint')
-            level = engineer_apply_event.get('Level', 0)
-            
-            return f"{self.commander_name} has applied a level {level} {blueprint} experimental effect with {engineer}."
-            
-        if event_name == 'PayBounties':
-            pay_bounties_event = cast(Dict[str, Any], content)
-            amount = pay_bounties_event.get('Amount', 0)
-            faction = pay_bounties_event.get('Faction', 'a faction')
-            
-            return f"{self.commander_name} has paid off {amount:,} credits in bounties to {faction}."
-
-        if event_name == 'ClearImpound':
-            clear_impound_event = cast(Dict[str, Any], content)
-            amount = clear_impound_event.get('Cost', 0)
-            ship_type = clear_impound_event.get('ShipType_Localised', clear_impound_event.get('ShipType', 'a ship'))
-            return f"{self.commander_name} has paid {amount:,} credits to reclaim their impounded {ship_type}."
-
-        if event_name == 'SearchAndRescue':
-            sar_event = cast(Dict[str, Any], content)
-            item = sar_event.get('Name_Localised', sar_event.get('Name', 'items'))
-            count = sar_event.get('Count', 0)
-            reward = sar_event.get('Reward', 0)
-            return f"{self.commander_name} has turned in {count} {item} for search and rescue, receiving a reward of {reward:,} credits."
-
-        if event_name == 'SetUserShipName':
-            set_ship_name_event = cast(Dict[str, Any], content)
-            ship_type = set_ship_name_event.get('Ship_Localised', set_ship_name_event.get('Ship', 'a ship'))
-            ship_name = set_ship_name_event.get('UserShipName', 'a name')
-            ship_ident = set_ship_name_event.get('UserShipId', '')
+    @event_renderer('NavBeaconScan')
+    def _render_nav_beacon_scan(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        nav_beacon_scan_event = cast(NavBeaconScanEvent, content)
+        body_count = nav_beacon_scan_event.get('NumBodies', 0)
+        
+        return f"{self.commander_name} has scanned a navigation beacon, revealing data for {body_count} bodies in the system."
+
+    @event_renderer('Screenshot')
+    def _render_screenshot(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        screenshot_event = cast(ScreenshotEvent, content)
+
+        system = screenshot_event.get('System') or 'current system'
+        body = screenshot_event.get('Body') or ''
+        body_text = f" near {body}" if body else ""
+
+        location_text = ""
+        if screenshot_event.get('Latitude') is not None and screenshot_event.get('Longitude') is not None and screenshot_event.get('Altitude') is not None:
+            lat = screenshot_event.get('Latitude', 0)
+            lon = screenshot_event.get('Longitude', 0)
+            alt = screenshot_event.get('Altitude', 0)
+            location_text = f" at coordinates {lat}, {lon}, altitude: {alt}m"
+
+        return f"{self.commander_name} took a screenshot in {system}{body_text}{location_text}."
+
+    # Station Services events
+    @event_renderer('BuyAmmo')
+    def _render_buy_ammo(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        buy_ammo_event = cast(Dict[str, Any], content)
+        return f"{self.commander_name} has purchased ammunition for {buy_ammo_event.get('Cost', 0):,} credits."
+
+    @event_renderer('BuyDrones')
+    def _render_buy_drones(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        buy_drones_event = cast(Dict[str, Any], content)
+        drone_type = buy_drones_event.get('Type', 'drones')
+        count = buy_drones_event.get('Count', 0)
+        total_cost = buy_drones_event.get('TotalCost', 0)
+        return f"{self.commander_name} has purchased {count} {drone_type} for {total_cost:,} credits."
+
+    @event_renderer('SellDrones')
+    def _render_sell_drones(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        sell_drones_event = cast(Dict[str, Any], content)
+        count = sell_drones_event.get('Count', 0)
+        sell_price = sell_drones_event.get('SellPrice', 0)
+        total_sale = sell_drones_event.get('TotalSale', 0)
+        return f"{self.commander_name} has sold {count} drones for {total_sale:,} credits (at {sell_price:,} each)."
+
+    @event_renderer('CommunityGoalJoin')
+    def _render_community_goal_join(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        cg_join_event = cast(Dict[str, Any], content)
+        name = cg_join_event.get('Name', 'a community goal')
+        system = f" in {cg_join_event.get('System')}" if cg_join_event.get('System') else ""
+        return f"{self.commander_name} has signed up for the community goal: {name}{system}."
+
+    @event_renderer('CommunityGoalDiscard')
+    def _render_community_goal_discard(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        cg_discard_event = cast(Dict[str, Any], content)
+        name = cg_discard_event.get('Name', 'a community goal')
+        system = f" in {cg_discard_event.get('System')}" if cg_discard_event.get('System') else ""
+        return f"{self.commander_name} has opted out of the community goal: {name}{system}."
+
+    @event_renderer('CommunityGoalReward')
+    def _render_community_goal_reward(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        cg_reward_event = cast(Dict[str, Any], content)
+        name = cg_reward_event.get('Name', 'a community goal')
+        system = f" in {cg_reward_event.get('System')}" if cg_reward_event.get('System') else ""
+        reward = cg_reward_event.get('Reward', 0)
+        return f"{self.commander_name} has received a reward of {reward:,} credits for participation in community goal: {name}{system}."
+
+    @event_renderer('RefuelAll')
+    def _render_refuel_all(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        refuel_all_event = cast(Dict[str, Any], content)
+        cost = refuel_all_event.get('Cost', 0)
+        amount = refuel_all_event.get('Amount', 0)
+        return f"{self.commander_name} has refueled the ship with {amount:.2f} tons of fuel for {cost:,} credits."
+
+    @event_renderer('RefuelPartial')
+    def _render_refuel_partial(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        refuel_partial_event = cast(Dict[str, Any], content)
+        cost = refuel_partial_event.get('Cost', 0)
+        amount = refuel_partial_event.get('Amount', 0)
+        return f"{self.commander_name} has partially refueled the ship with {amount:.2f} tons of fuel for {cost:,} credits."
+
+    @event_renderer('Repair')
+    def _render_repair(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        repair_event = cast(Dict[str, Any], content)
+        item = repair_event.get('Item', 'hull')
+        cost = repair_event.get('Cost', 0)
+        return f"{self.commander_name} has repaired the ship's {item} for {cost:,} credits."
+
+    @event_renderer('RepairAll')
+    def _render_repair_all(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        repair_all_event = cast(Dict[str, Any], content)
+        cost = repair_all_event.get('Cost', 0)
+        return f"{self.commander_name} has repaired all ship damage for {cost:,} credits."
+
+    @event_renderer('RestockVehicle')
+    def _render_restock_vehicle(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        restock_vehicle_event = cast(Dict[str, Any], content)
+        vehicle = restock_vehicle_event.get('Type', 'vehicle')
+        cost = restock_vehicle_event.get('Cost', 0)
+        count = restock_vehicle_event.get('Count', 1)
+        return f"{self.commander_name} has restocked {count} {vehicle}(s) for {cost:,} credits."
+
+    @event_renderer('ModuleBuy')
+    def _render_module_buy(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        module_buy_event = cast(Dict[str, Any], content)
+        slot = module_buy_event.get('Slot', 'a slot')
+        module = module_buy_event.get('BuyItem_Localised', module_buy_event.get('BuyItem', 'a module'))
+        cost = module_buy_event.get('BuyPrice', 0)
+        return f"{self.commander_name} has purchased a {module} for {slot} for {cost:,} credits."
+
+    @event_renderer('ModuleSell')
+    def _render_module_sell(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        module_sell_event = cast(Dict[str, Any], content)
+        slot = module_sell_event.get('Slot', 'a slot')
+        module = module_sell_event.get('SellItem_Localised', module_sell_event.get('SellItem', 'a module'))
+        price = module_sell_event.get('SellPrice', 0)
+        return f"{self.commander_name} has sold a {module} from {slot} for {price:,} credits."
+
+    @event_renderer('ModuleStore')
+    def _render_module_store(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        module_store_event = cast(Dict[str, Any], content)
+        slot = module_store_event.get('Slot', 'a slot')
+        module = module_store_event.get('Module_Localised', module_store_event.get('Module', 'a module'))
+        cost = module_store_event.get('Cost', 0)
+        cost_text = f" for {cost:,} credits" if cost > 0 else ""
+        return f"{self.commander_name} has stored a {module} from {slot}{cost_text}."
+
+    @event_renderer('ModuleRetrieve')
+    def _render_module_retrieve(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        module_retrieve_event = cast(Dict[str, Any], content)
+        slot = module_retrieve_event.get('Slot', 'a slot')
+        module = module_retrieve_event.get('Module_Localised', module_retrieve_event.get('Module', 'a module'))
+        cost = module_retrieve_event.get('Cost', 0)
+        cost_text = f" for {cost:,} credits" if cost > 0 else ""
+        return f"{self.commander_name} has retrieved a {module} to {slot}{cost_text}."
+
+    @event_renderer('ModuleSwap')
+    def _render_module_swap(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        module_swap_event = cast(Dict[str, Any], content)
+        from_slot = module_swap_event.get('FromSlot', 'a slot')
+        to_slot = module_swap_event.get('ToSlot', 'another slot')
+        from_module = module_swap_event.get('FromItem_Localised', module_swap_event.get('FromItem', 'a module'))
+        to_module = module_swap_event.get('ToItem_Localised', module_swap_event.get('ToItem', 'another module'))
+        return f"{self.commander_name} has swapped {from_module} in {from_slot} with {to_module} in {to_slot}."
+
+    @event_renderer('ShipyardBuy')
+    def _render_shipyard_buy(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        shipyard_buy_event = cast(Dict[str, Any], content)
+        ship_type = shipyard_buy_event.get('ShipType_Localised', shipyard_buy_event.get('ShipType', 'a ship'))
+        price = shipyard_buy_event.get('ShipPrice', 0)
+        sold_ship = shipyard_buy_event.get('SellOldShip', '')
+        sold_price = shipyard_buy_event.get('SellPrice', 0)
+        
+        if sold_ship:
+            sold_ship_name = shipyard_buy_event.get('SellShipId', sold_ship)
+            return f"{self.commander_name} has purchased a {ship_type} for {price:,} credits and traded in their {sold_ship_name} for {sold_price:,} credits."
+        else:
+            return f"{self.commander_name} has purchased a {ship_type} for {price:,} credits."
+
+    @event_renderer('ShipyardSell')
+    def _render_shipyard_sell(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        shipyard_sell_event = cast(Dict[str, Any], content)
+        ship_type = shipyard_sell_event.get('ShipType_Localised', shipyard_sell_event.get('ShipType', 'a ship'))
+        ship_id = shipyard_sell_event.get('SellShipId', '')
+        price = shipyard_sell_event.get('ShipPrice', 0)
+        return f"{self.commander_name} has sold their {ship_type} ({ship_id}) for {price:,} credits."
+
+    @event_renderer('ShipyardTransfer')
+    def _render_shipyard_transfer(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        shipyard_transfer_event = cast(Dict[str, Any], content)
+        ship_type = shipyard_transfer_event.get('ShipType_Localised', shipyard_transfer_event.get('ShipType', 'a ship'))
+        ship_id = shipyard_transfer_event.get('ShipID', '')
+        system = shipyard_transfer_event.get('System', 'another system')
+        transfer_price = shipyard_transfer_event.get('TransferPrice', 0)
+        transfer_time = shipyard_transfer_event.get('TransferTime', 0)
+        
+        if transfer_time > 0:
+            time_str = f", arriving in {transfer_time} seconds"
+        else:
+            time_str = ", arriving immediately"
             
-            if ship_ident:
-                return f"{self.commander_name} has renamed their {ship_type} to '{ship_name}' with ID '{ship_ident}'."
-            else:
-                return f"{self.commander_name} has renamed their {ship_type} to '{ship_name}'."
+        return f"{self.commander_name} has requested a transfer of their {ship_type} ({ship_id}) from {system} for {transfer_price:,} credits{time_str}."
 
-        if event_name == 'Loadout':
-            return None
+    @event_renderer('ShipyardSwap')
+    def _render_shipyard_swap(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        shipyard_swap_event = cast(Dict[str, Any], content)
+        ship_type = shipyard_swap_event.get('ShipType_Localised', shipyard_swap_event.get('ShipType', 'a ship'))
+        ship_id = shipyard_swap_event.get('ShipID', '')
+        store_old_ship = shipyard_swap_event.get('StoreOldShip', 0)
+        store_ship_type = shipyard_swap_event.get('StoreShipType', '')
+        
+        if store_old_ship:
+            return f"{self.commander_name} has swapped to their {ship_type} ({ship_id}) and stored their previous {store_ship_type}."
+        else:
+            return f"{self.commander_name} has swapped to their {ship_type} ({ship_id})."
+
+    @event_renderer('MaterialTrade')
+    def _render_material_trade(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        material_trade_event = cast(Dict[str, Any], content)
+        trader_type = material_trade_event.get('TraderType', 'material trader')
+        paid_material = material_trade_event.get('Paid_Localised', material_trade_event.get('Paid', 'materials'))
+        paid_quantity = material_trade_event.get('Paid_Quantity', 0)
+        received_material = material_trade_event.get('Received_Localised', material_trade_event.get('Received', 'materials'))
+        received_quantity = material_trade_event.get('Received_Quantity', 0)
+        
+        return f"{self.commander_name} has traded {paid_quantity} {paid_material} for {received_quantity} {received_material} at a {trader_type}."
+
+    @event_renderer('EngineerProgress')
+    def _render_engineer_progress(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        engineer_progress_event = cast(Dict[str, Any], content)
+        engineer = engineer_progress_event.get('Engineer', 'an engineer')
+        progress = engineer_progress_event.get('Progress', '')
+        rank = engineer_progress_event.get('Rank')
+        
+        if progress == 'Unlocked':
+            return f"{self.commander_name} has unlocked {engineer}."
+        elif progress == 'Invited':
+            return f"{self.commander_name} has been invited to meet {engineer}."
+        elif rank is not None:
+            return f"{self.commander_name} has reached rank {rank} with {engineer}."
+        else:
+            return f"{self.commander_name} has made progress with {engineer}: {progress}."
+
+    @event_renderer('EngineerCraft')
+    def _render_engineer_craft(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        engineer_craft_event = cast(Dict[str, Any], content)
+        engineer = engineer_craft_event.get('Engineer', 'an engineer')
+        blueprint = engineer_craft_event.get('Blueprint', 'a blueprint')
+        level = engineer_craft_event.get('Level', 0)
+        quality = engineer_craft_event.get('Quality', 0)
+        
+        return f"{self.commander_name} has crafted a level {level} {blueprint} modification with {engineer} (quality: {quality:.2f})."
+
+    @event_renderer('EngineerApply')
+    def _render_engineer_apply(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        engineer_apply_event = cast(Dict[str, Any], content)
+        engineer = engineer_apply_event.get('Engineer', 'an engineer')
+        blueprint = engineer_apply_event.get('Blueprint', 'a blueprint')
+        level = engineer_apply_event.get('Level', 0)
+        
+        return f"{self.commander_name} has applied a level {level} {blueprint} experimental effect with {engineer}."
+
+    @event_renderer('ClearImpound')
+    def _render_clear_impound(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        clear_impound_event = cast(Dict[str, Any], content)
+        amount = clear_impound_event.get('Cost', 0)
+        ship_type = clear_impound_event.get('ShipType_Localised', clear_impound_event.get('ShipType', 'a ship'))
+        return f"{self.commander_name} has paid {amount:,} credits to reclaim their impounded {ship_type}."
+
+    @event_renderer('SearchAndRescue')
+    def _render_search_and_rescue(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        sar_event = cast(Dict[str, Any], content)
+        item = sar_event.get('Name_Localised', sar_event.get('Name', 'items'))
+        count = sar_event.get('Count', 0)
+        reward = sar_event.get('Reward', 0)
+        return f"{self.commander_name} has turned in {count} {item} for search and rescue, receiving a reward of {reward:,} credits."
+
+    @event_renderer('SetUserShipName')
+    def _render_set_user_ship_name(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        set_ship_name_event = cast(Dict[str, Any], content)
+        ship_type = set_ship_name_event.get('Ship_Localised', set_ship_name_event.get('Ship', 'a ship'))
+        ship_name = set_ship_name_event.get('UserShipName', 'a name')
+        ship_ident = set_ship_name_event.get('UserShipId', '')
+        
+        if ship_ident:
+            return f"{self.commander_name} has renamed their {ship_type} to '{ship_name}' with ID '{ship_ident}'."
+        else:
+            return f"{self.commander_name} has renamed their {ship_type} to '{ship_name}'."
 
-        # If we don't have a specific handler for this event
-        # Trade events
-        if event_name == 'AsteroidCracked':
-            asteroid_cracked_event = cast(Dict[str, Any], content)
-            body = asteroid_cracked_event.get('Body', 'an unknown body')
-            return f"{self.commander_name} has cracked a motherlode asteroid near {body} for mining."
-            
-        if event_name == 'BuyTradeData':
-            buy_trade_data_event = cast(Dict[str, Any], content)
-            system = buy_trade_data_event.get('System', 'Unknown system')
-            cost = buy_trade_data_event.get('Cost', 0)
-            return f"{self.commander_name} has purchased trade data for the {system} system for {cost:,} credits."
-            
-        if event_name == 'CollectCargo':
-            collect_cargo_event = cast(Dict[str, Any], content)
-            cargo_type = collect_cargo_event.get('Type_Localised', collect_cargo_event.get('Type', 'unknown cargo'))
-            stolen = " (stolen)" if collect_cargo_event.get('Stolen', False) else ""
-            mission_related = " for a mission" if collect_cargo_event.get('MissionID') else ""
-            return f"{self.commander_name} has collected {cargo_type}{stolen}{mission_related}."
-            
-        if event_name == 'EjectCargo':
-            eject_cargo_event = cast(Dict[str, Any], content)
-            cargo_type = eject_cargo_event.get('Type_Localised', eject_cargo_event.get('Type', 'unknown cargo'))
-            count = eject_cargo_event.get('Count', 1)
-            abandoned = "abandoned" if eject_cargo_event.get('Abandoned', False) else "ejected"
-            mission_related = " from a mission" if eject_cargo_event.get('MissionID') else ""
-            
-            powerplay_info = ""
-            if eject_cargo_event.get('PowerplayOrigin'):
-                powerplay_info = f" (from {eject_cargo_event.get('PowerplayOrigin')})"
-            
-            return f"{self.commander_name} has {abandoned} {count} units of {cargo_type}{mission_related}{powerplay_info}."
-            
-        if event_name == 'MarketBuy':
-            market_buy_event = cast(Dict[str, Any], content)
-            item_type = market_buy_event.get('Type_Localised', market_buy_event.get('Type', 'unknown goods'))
-            count = market_buy_event.get('Count', 0)
-            buy_price = market_buy_event.get('BuyPrice', 0)
-            total_cost = market_buy_event.get('TotalCost', 0)
-            
-            return f"{self.commander_name} has purchased {count} units of {item_type} for {buy_price:,} credits each (total: {total_cost:,} credits)."
-            
-        if event_name == 'MarketSell':
-            market_sell_event = cast(Dict[str, Any], content)
-            item_type = market_sell_event.get('Type_Localised', market_sell_event.get('Type', 'unknown goods'))
-            count = market_sell_event.get('Count', 0)
-            sell_price = market_sell_event.get('SellPrice', 0)
-            total_sale = market_sell_event.get('TotalSale', 0)
-            avg_price_paid = market_sell_event.get('AvgPricePaid', 0)
-            
-            special_flags = []
-            if market_sell_event.get('IllegalGoods'):
-                special_flags.append("illegal goods")
-            if market_sell_event.get('StolenGoods'):
-                special_flags.append("stolen goods")
-            if market_sell_event.get('BlackMarket'):
-                special_flags.append("using black market")
-                
-            special_info = f" ({', '.join(special_flags)})" if special_flags else ""
-            profit_info = ""
-            if avg_price_paid > 0:
-                profit = total_sale - (avg_price_paid * count)
-                profit_info = f", profit: {profit:,} credits"
-            
-            return f"{self.commander_name} has sold {count} units of {item_type} for {sell_price:,} credits each (total: {total_sale:,} credits{profit_info}){special_info}."
-            
-        if event_name == 'MiningRefined':
-            mining_refined_event = cast(Dict[str, Any], content)
-            material_type = mining_refined_event.get('Type_Localised', mining_refined_event.get('Type', 'unknown material'))
-            
-            return f"{self.commander_name} has refined mining fragments into 1 ton of {material_type}."
+    @event_renderer('Loadout')
+    def _render_loadout(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
 
-        # Odyssey events
-        if event_name == 'Backpack':
-            # This is primarily for the backpack.json file, but we'll report it in the journal too
-            return f"{self.commander_name}'s backpack contents have been updated."
-            
-        if event_name == 'BackpackChange':
-            backpack_event = cast(Dict[str, Any], content)
-            if backpack_event.get('Added'):
-                item_list = backpack_event.get('Added', [])
-                item_names = [item.get('Name_Localised', item.get('Name', 'unknown item')) for item in item_list]
-                if len(item_names) == 1:
-                    return f"{self.commander_name} has added {item_names[0]} to their backpack."
-                else:
-                    return f"{self.commander_name} has added multiple items to their backpack: {', '.join(item_names)}."
-            elif backpack_event.get('Removed'):
-                item_list = backpack_event.get('Removed', [])
-                item_names = [item.get('Name_Localised', item.get('Name', 'unknown item')) for item in item_list]
-                if len(item_names) == 1:
-                    return f"{self.commander_name} has removed {item_names[0]} from their backpack."
-                else:
-                    return f"{self.commander_name} has removed multiple items from their backpack: {', '.join(item_names)}."
-            return f"{self.commander_name}'s backpack contents have changed."
-            
-        if event_name == 'BookDropship':
-            return f"{self.commander_name} has booked a combat dropship."
-            
-        if event_name == 'BookTaxi':
-            taxi_event = cast(Dict[str, Any], content)
-            cost = taxi_event.get('Cost', 0)
-            dest_sys = taxi_event.get('DestinationSystem', 'unknown system')
-            dest_loc = taxi_event.get('DestinationLocation', 'unknown location')
-            retreat = " to retreat from a combat zone" if taxi_event.get('Retreat') else ""
-            return f"{self.commander_name} has booked a taxi to {dest_loc} in {dest_sys} for {cost:,} credits{retreat}."
-            
-        if event_name == 'BuyMicroResources':
-            buy_event = cast(Dict[str, Any], content)
-            if buy_event.get('MicroResources'):
-                # New format with multiple items
-                total_cost = buy_event.get('Price', 0)
-                total_count = buy_event.get('TotalCount', 0)
-                resources = buy_event.get('MicroResources', [])
-                if len(resources) == 1:
-                    item = resources[0]
-                    item_name = item.get('Name_Localised', item.get('Name', 'unknown item'))
-                    count = item.get('Count', 0)
-                    return f"{self.commander_name} has purchased {count} units of {item_name} for {total_cost:,} credits."
-                else:
-                    return f"{self.commander_name} has purchased {total_count} units of various microresources for {total_cost:,} credits."
-            else:
-                # Old format with single item
-                name = buy_event.get('Name_Localised', buy_event.get('Name', 'unknown item'))
-                count = buy_event.get('Count', 0)
-                price = buy_event.get('Price', 0)
-                return f"{self.commander_name} has purchased {count} units of {name} for {price:,} credits."
-                
-        if event_name == 'BuySuit':
-            suit_event = cast(Dict[str, Any], content)
-            suit_name = suit_event.get('Name_Localised', suit_event.get('Name', 'unknown suit'))
-            price = suit_event.get('Price', 0)
-            return f"{self.commander_name} has purchased a {suit_name} for {price:,} credits."
-            
-        if event_name == 'BuyWeapon':
-            weapon_event = cast(Dict[str, Any], content)
-            weapon_name = weapon_event.get('Name_Localised', weapon_event.get('Name', 'unknown weapon'))
-            price = weapon_event.get('Price', 0)
-            return f"{self.commander_name} has purchased a {weapon_name} for {price:,} credits."
-            
-        if event_name == 'CancelDropship':
-            return f"{self.commander_name} has cancelled their combat dropship journey."
-            
-        if event_name == 'CancelTaxi':
-            taxi_event = cast(Dict[str, Any], content)
-            refund = taxi_event.get('Refund', 0)
-            return f"{self.commander_name} has cancelled their taxi journey and received a refund of {refund:,} credits."
-            
-        if event_name == 'CollectItems':
-            collect_event = cast(Dict[str, Any], content)
-            item_name = collect_event.get('Name_Localised', collect_event.get('Name', 'unknown item'))
-            count = collect_event.get('Count', 1)
-            stolen = " (stolen)" if collect_event.get('Stolen') else ""
-            if count == 1:
-                return f"{self.commander_name} has collected 1 {item_name}{stolen}."
-            else:
-                return f"{self.commander_name} has collected {count} {item_name}s{stolen}."
-            
-        if event_name == 'CreateSuitLoadout':
-            loadout_event = cast(Dict[str, Any], content)
-            loadout_name = loadout_event.get('LoadoutName', 'new loadout')
-            suit_name = loadout_event.get('SuitName_Localised', loadout_event.get('SuitName', 'unknown suit'))
-            return f"{self.commander_name} has created a new suit loadout named '{loadout_name}' for their {suit_name}."
-            
-        if event_name == 'DeleteSuitLoadout':
-            loadout_event = cast(Dict[str, Any], content)
-            loadout_name = loadout_event.get('LoadoutName', 'loadout')
-            suit_name = loadout_event.get('SuitName_Localised', loadout_event.get('SuitName', 'unknown suit'))
-            return f"{self.commander_name} has deleted the suit loadout named '{loadout_name}' for their {suit_name}."
-            
-        if event_name == 'Disembark':
-            disembark_event = cast(Dict[str, Any], content)
-            if disembark_event.get('SRV'):
-                vehicle = "SRV"
-            elif disembark_event.get('Taxi'):
-                vehicle = "taxi"
-            elif disembark_event.get('Multicrew'):
-                vehicle = "another commander's vessel"
-            else:
-                vehicle = "ship"
-            
-            if disembark_event.get('OnStation'):
-                location = f"at {disembark_event.get('StationName', 'a station')}"
-            elif disembark_event.get('OnPlanet'):
-                location = f"on {disembark_event.get('Body', 'a planet')}"
-            else:
-                location = ""
-                
-            return f"{self.commander_name} has disembarked from their {vehicle} {location}."
-            
-        if event_name == 'DropItems':
-            drop_event = cast(Dict[str, Any], content)
-            item_name = drop_event.get('Name_Localised', drop_event.get('Name', 'unknown item'))
-            count = drop_event.get('Count', 1)
-            if count == 1:
-                return f"{self.commander_name} has dropped 1 {item_name}."
-            else:
-                return f"{self.commander_name} has dropped {count} {item_name}s."
-            
-        if event_name == 'DropShipDeploy':
-            return f"{self.commander_name} has deployed from a dropship to a conflict zone."
-            
-        if event_name == 'Embark':
-            embark_event = cast(Dict[str, Any], content)
-            if embark_event.get('SRV'):
-                vehicle = "SRV"
-            elif embark_event.get('Taxi'):
-                vehicle = "taxi"
-            elif embark_event.get('Multicrew'):
-                vehicle = "another commander's vessel"
-            else:
-                vehicle = "ship"
-                
-            if embark_event.get('OnStation'):
-                location = f"at {embark_event.get('StationName', 'a station')}"
-            elif embark_event.get('OnPlanet'):
-                location = f"on {embark_event.get('Body', 'a planet')}"
-            else:
-                location = ""
-                
-            return f"{self.commander_name} has boarded their {vehicle} {location}."
-            
-        if event_name == 'FCMaterials':
-            fc_event = cast(Dict[str, Any], content)
-            carrier_name = fc_event.get('CarrierName', 'a Fleet Carrier')
-            return f"{self.commander_name} has accessed the materials bartender on {carrier_name}."
-            
-        if event_name == 'LoadoutEquipModule':
-            equip_event = cast(Dict[str, Any], content)
-            slot = equip_event.get('SlotName', 'a slot')
-            module = equip_event.get('ModuleName_Localised', equip_event.get('ModuleName', 'an item'))
-            loadout = equip_event.get('LoadoutName', 'loadout')
-            suit = equip_event.get('SuitName_Localised', equip_event.get('SuitName', 'suit'))
-            return f"{self.commander_name} has equipped {module} to {slot} on their {suit} loadout '{loadout}'."
-            
-        if event_name == 'LoadoutRemoveModule':
-            remove_event = cast(Dict[str, Any], content)
-            slot = remove_event.get('SlotName', 'a slot')
-            module = remove_event.get('ModuleName_Localised', remove_event.get('ModuleName', 'an item'))
-            loadout = remove_event.get('LoadoutName', 'loadout')
-            suit = remove_event.get('SuitName_Localised', remove_event.get('SuitName', 'suit'))
-            return f"{self.commander_name} has removed {module} from {slot} on their {suit} loadout '{loadout}'."
-            
-        if event_name == 'RenameSuitLoadout':
-            rename_event = cast(Dict[str, Any], content)
-            loadout = rename_event.get('LoadoutName', 'loadout')
-            suit = rename_event.get('SuitName_Localised', rename_event.get('SuitName', 'suit'))
-            return f"{self.commander_name} has renamed a loadout to '{loadout}' for their {suit}."
-            
-        if event_name == 'ScanOrganic':
-            scan_event = cast(Dict[str, Any], content)
-            scan_type = scan_event.get('ScanType', 'unknown')
-            species = scan_event.get('Species_Localised', scan_event.get('Species', 'unknown species'))
-            variant = scan_event.get('Variant_Localised', scan_event.get('Variant', ''))
-            if variant and variant != species:
-                life_form = f"{variant} ({species})"
-            else:
-                life_form = species
-                
-            if scan_type == 'Log':
-                action = "logged"
-            elif scan_type == 'Sample':
-                action = "taken a sample from"
-            elif scan_type == 'Analyse':
-                action = "analyzed"
-            else:
-                action = "scanned"
-                
-            return f"{self.commander_name} has {action} a {life_form} on planet {scan_event.get('Body', 'unknown body')}. {' The scan data can now be sold at the next station featuing a Vista Genomics.' if scan_type == 'Analyse' else ''}"
-            
-        if event_name == 'SellMicroResources':
-            sell_event = cast(Dict[str, Any], content)
-            resources = sell_event.get('MicroResources', [])
-            price = sell_event.get('Price', 0)
-            
-            if len(resources) == 1:
-                item = resources[0]
-                item_name = item.get('Name_Localised', item.get('Name', 'unknown item'))
-                count = item.get('Count', 0)
-                return f"{self.commander_name} has sold {count} units of {item_name} for {price:,} credits."
-            else:
-                item_names = [r.get('Name_Localised', r.get('Name', 'unknown item')) for r in resources]
-                return f"{self.commander_name} has sold various microresources ({', '.join(item_names)}) for {price:,} credits."
-                
-        if event_name == 'SellOrganicData':
-            data_event = cast(Dict[str, Any], content)
-            biodata = data_event.get('BioData', [])
-            total_value = sum(data.get('Value', 0) for data in biodata)
-            total_bonus = sum(data.get('Bonus', 0) for data in biodata)
-            
-            if len(biodata) == 1:
-                species = biodata[0].get('Species_Localised', biodata[0].get('Species', 'unknown species'))
-                variant = biodata[0].get('Variant_Localised', biodata[0].get('Variant', ''))
-                if variant and variant != species:
-                    life_form = f"{variant} ({species})"
-                else:
-                    life_form = species
-                    
-                value = biodata[0].get('Value', 0)
-                bonus = biodata[0].get('Bonus', 0)
-                total = value + bonus
-                return f"{self.commander_name} has sold organic data for {life_form} for {total:,} credits (base: {value:,}, bonus: {bonus:,})."
-            else:
-                total = total_value + total_bonus
-                return f"{self.commander_name} has sold organic data for {len(biodata)} species for a total of {total:,} credits (base: {total_value:,}, bonus: {total_bonus:,})."
-                
-        if event_name == 'SellSuit':
-            suit_event = cast(Dict[str, Any], content)
-            suit_name = suit_event.get('Name_Localised', suit_event.get('Name', 'unknown suit'))
-            price = suit_event.get('Price', 0)
-            return f"{self.commander_name} has sold their {suit_name} for {price:,} credits."
-            
-        if event_name == 'SellWeapon':
-            weapon_event = cast(Dict[str, Any], content)
-            weapon_name = weapon_event.get('Name_Localised', weapon_event.get('Name', 'unknown weapon'))
-            price = weapon_event.get('Price', 0)
-            return f"{self.commander_name} has sold their {weapon_name} for {price:,} credits."
-            
-        if event_name == 'ShipLocker':
-            return None
-            
-        if event_name == 'SuitLoadout':
-            loadout_event = cast(Dict[str, Any], content)
-            suit_name = loadout_event.get('SuitName_Localised', loadout_event.get('SuitName', 'unknown suit'))
-            loadout_name = loadout_event.get('LoadoutName', 'loadout')
-            return f"{self.commander_name} is using the '{loadout_name}' loadout for their {suit_name}."
-            
-        if event_name == 'SwitchSuitLoadout':
-            loadout_event = cast(Dict[str, Any], content)
-            suit_name = loadout_event.get('SuitName_Localised', loadout_event.get('SuitName', 'unknown suit'))
-            loadout_name = loadout_event.get('LoadoutName', 'loadout')
-            return f"{self.commander_name} has switched to the '{loadout_name}' loadout for their {suit_name}."
-            
-        if event_name == 'TransferMicroResources':
-            transfer_event = cast(Dict[str, Any], content)
-            transfers = transfer_event.get('Transfers', [])
-            
-            if len(transfers) == 1:
-                item = transfers[0]
+    # If we don't have a specific handler for this event
+    # Trade events
+    @event_renderer('AsteroidCracked')
+    def _render_asteroid_cracked(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        asteroid_cracked_event = cast(Dict[str, Any], content)
+        body = asteroid_cracked_event.get('Body', 'an unknown body')
+        return f"{self.commander_name} has cracked a motherlode asteroid near {body} for mining."
+
+    @event_renderer('BuyTradeData')
+    def _render_buy_trade_data(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        buy_trade_data_event = cast(Dict[str, Any], content)
+        system = buy_trade_data_event.get('System', 'Unknown system')
+        cost = buy_trade_data_event.get('Cost', 0)
+        return f"{self.commander_name} has purchased trade data for the {system} system for {cost:,} credits."
+
+    @event_renderer('CollectCargo')
+    def _render_collect_cargo(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        collect_cargo_event = cast(Dict[str, Any], content)
+        cargo_type = collect_cargo_event.get('Type_Localised', collect_cargo_event.get('Type', 'unknown cargo'))
+        stolen = " (stolen)" if collect_cargo_event.get('Stolen', False) else ""
+        mission_related = " for a mission" if collect_cargo_event.get('MissionID') else ""
+        return f"{self.commander_name} has collected {cargo_type}{stolen}{mission_related}."
+
+    @event_renderer('EjectCargo')
+    def _render_eject_cargo(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        eject_cargo_event = cast(Dict[str, Any], content)
+        cargo_type = eject_cargo_event.get('Type_Localised', eject_cargo_event.get('Type', 'unknown cargo'))
+        count = eject_cargo_event.get('Count', 1)
+        abandoned = "abandoned" if eject_cargo_event.get('Abandoned', False) else "ejected"
+        mission_related = " from a mission" if eject_cargo_event.get('MissionID') else ""
+        
+        powerplay_info = ""
+        if eject_cargo_event.get('PowerplayOrigin'):
+            powerplay_info = f" (from {eject_cargo_event.get('PowerplayOrigin')})"
+        
+        return f"{self.commander_name} has {abandoned} {count} units of {cargo_type}{mission_related}{powerplay_info}."
+
+    @event_renderer('MarketBuy')
+    def _render_market_buy(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        market_buy_event = cast(Dict[str, Any], content)
+        item_type = market_buy_event.get('Type_Localised', market_buy_event.get('Type', 'unknown goods'))
+        count = market_buy_event.get('Count', 0)
+        buy_price = market_buy_event.get('BuyPrice', 0)
+        total_cost = market_buy_event.get('TotalCost', 0)
+        
+        return f"{self.commander_name} has purchased {count} units of {item_type} for {buy_price:,} credits each (total: {total_cost:,} credits)."
+
+    @event_renderer('MarketSell')
+    def _render_market_sell(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        market_sell_event = cast(Dict[str, Any], content)
+        item_type = market_sell_event.get('Type_Localised', market_sell_event.get('Type', 'unknown goods'))
+        count = market_sell_event.get('Count', 0)
+        sell_price = market_sell_event.get('SellPrice', 0)
+        total_sale = market_sell_event.get('TotalSale', 0)
+        avg_price_paid = market_sell_event.get('AvgPricePaid', 0)
+        
+        special_flags = []
+        if market_sell_event.get('IllegalGoods'):
+            special_flags.append("illegal goods")
+        if market_sell_event.get('StolenGoods'):
+            special_flags.append("stolen goods")
+        if market_sell_event.get('BlackMarket'):
+            special_flags.append("using black market")
+            
+        special_info = f" ({', '.join(special_flags)})" if special_flags else ""
+        profit_info = ""
+        if avg_price_paid > 0:
+            profit = total_sale - (avg_price_paid * count)
+            profit_info = f", profit: {profit:,} credits"
+        
+        return f"{self.commander_name} has sold {count} units of {item_type} for {sell_price:,} credits each (total: {total_sale:,} credits{profit_info}){special_info}."
+
+    @event_renderer('MiningRefined')
+    def _render_mining_refined(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        mining_refined_event = cast(Dict[str, Any], content)
+        material_type = mining_refined_event.get('Type_Localised', mining_refined_event.get('Type', 'unknown material'))
+        
+        return f"{self.commander_name} has refined mining fragments into 1 ton of {material_type}."
+
+    # Odyssey events
+    @event_renderer('Backpack')
+    def _render_backpack(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        # This is primarily for the backpack.json file, but we'll report it in the journal too
+        return f"{self.commander_name}'s backpack contents have been updated."
+
+    @event_renderer('BackpackChange')
+    def _render_backpack_change(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        backpack_event = cast(Dict[str, Any], content)
+        if backpack_event.get('Added'):
+            item_list = backpack_event.get('Added', [])
+            item_names = [item.get('Name_Localised', item.get('Name', 'unknown item')) for item in item_list]
+            if len(item_names) == 1:
+                return f"{self.commander_name} has added {item_names[0]} to their backpack."
+            else:
+                return f"{self.commander_name} has added multiple items to their backpack: {', '.join(item_names)}."
+        elif backpack_event.get('Removed'):
+            item_list = backpack_event.get('Removed', [])
+            item_names = [item.get('Name_Localised', item.get('Name', 'unknown item')) for item in item_list]
+            if len(item_names) == 1:
+                return f"{self.commander_name} has removed {item_names[0]} from their backpack."
+            else:
+                return f"{self.commander_name} has removed multiple items from their backpack: {', '.join(item_names)}."
+        return f"{self.commander_name}'s backpack contents have changed."
+
+    @event_renderer('BookDropship')
+    def _render_book_dropship(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has booked a combat dropship."
+
+    @event_renderer('BookTaxi')
+    def _render_book_taxi(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        taxi_event = cast(Dict[str, Any], content)
+        cost = taxi_event.get('Cost', 0)
+        dest_sys = taxi_event.get('DestinationSystem', 'unknown system')
+        dest_loc = taxi_event.get('DestinationLocation', 'unknown location')
+        retreat = " to retreat from a combat zone" if taxi_event.get('Retreat') else ""
+        return f"{self.commander_name} has booked a taxi to {dest_loc} in {dest_sys} for {cost:,} credits{retreat}."
+
+    @event_renderer('BuyMicroResources')
+    def _render_buy_micro_resources(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        buy_event = cast(Dict[str, Any], content)
+        if buy_event.get('MicroResources'):
+            # New format with multiple items
+            total_cost = buy_event.get('Price', 0)
+            total_count = buy_event.get('TotalCount', 0)
+            resources = buy_event.get('MicroResources', [])
+            if len(resources) == 1:
+                item = resources[0]
                 item_name = item.get('Name_Localised', item.get('Name', 'unknown item'))
                 count = item.get('Count', 0)
-                direction = item.get('Direction', '')
-                
-                if direction == 'ToBackpack':
-                    return f"{self.commander_name} has transferred {count} units of {item_name} from their ship locker to their backpack."
-                else:
-                    return f"{self.commander_name} has transferred {count} units of {item_name} from their backpack to their ship locker."
+                return f"{self.commander_name} has purchased {count} units of {item_name} for {total_cost:,} credits."
             else:
-                to_backpack = any(t.get('Direction') == 'ToBackpack' for t in transfers)
-                if to_backpack:
-                    return f"{self.commander_name} has transferred multiple items from their ship locker to their backpack."
-                else:
-                    return f"{self.commander_name} has transferred multiple items from their backpack to their ship locker."
+                return f"{self.commander_name} has purchased {total_count} units of various microresources for {total_cost:,} credits."
+        else:
+            # Old format with single item
+            name = buy_event.get('Name_Localised', buy_event.get('Name', 'unknown item'))
+            count = buy_event.get('Count', 0)
+            price = buy_event.get('Price', 0)
+            return f"{self.commander_name} has purchased {count} units of {name} for {price:,} credits."
+
+    @event_renderer('BuySuit')
+    def _render_buy_suit(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        suit_event = cast(Dict[str, Any], content)
+        suit_name = suit_event.get('Name_Localised', suit_event.get('Name', 'unknown suit'))
+        price = suit_event.get('Price', 0)
+        return f"{self.commander_name} has purchased a {suit_name} for {price:,} credits."
+
+    @event_renderer('BuyWeapon')
+    def _render_buy_weapon(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        weapon_event = cast(Dict[str, Any], content)
+        weapon_name = weapon_event.get('Name_Localised', weapon_event.get('Name', 'unknown weapon'))
+        price = weapon_event.get('Price', 0)
+        return f"{self.commander_name} has purchased a {weapon_name} for {price:,} credits."
+
+    @event_renderer('CancelDropship')
+    def _render_cancel_dropship(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has cancelled their combat dropship journey."
+
+    @event_renderer('CancelTaxi')
+    def _render_cancel_taxi(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        taxi_event = cast(Dict[str, Any], content)
+        refund = taxi_event.get('Refund', 0)
+        return f"{self.commander_name} has cancelled their taxi journey and received a refund of {refund:,} credits."
+
+    @event_renderer('CollectItems')
+    def _render_collect_items(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        collect_event = cast(Dict[str, Any], content)
+        item_name = collect_event.get('Name_Localised', collect_event.get('Name', 'unknown item'))
+        count = collect_event.get('Count', 1)
+        stolen = " (stolen)" if collect_event.get('Stolen') else ""
+        if count == 1:
+            return f"{self.commander_name} has collected 1 {item_name}{stolen}."
+        else:
+            return f"{self.commander_name} has collected {count} {item_name}s{stolen}."
+
+    @event_renderer('CreateSuitLoadout')
+    def _render_create_suit_loadout(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        loadout_event = cast(Dict[str, Any], content)
+        loadout_name = loadout_event.get('LoadoutName', 'new loadout')
+        suit_name = loadout_event.get('SuitName_Localised', loadout_event.get('SuitName', 'unknown suit'))
+        return f"{self.commander_name} has created a new suit loadout named '{loadout_name}' for their {suit_name}."
+
+    @event_renderer('DeleteSuitLoadout')
+    def _render_delete_suit_loadout(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        loadout_event = cast(Dict[str, Any], content)
+        loadout_name = loadout_event.get('LoadoutName', 'loadout')
+        suit_name = loadout_event.get('SuitName_Localised', loadout_event.get('SuitName', 'unknown suit'))
+        return f"{self.commander_name} has deleted the suit loadout named '{loadout_name}' for their {suit_name}."
+
+    @event_renderer('Disembark')
+    def _render_disembark(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        disembark_event = cast(Dict[str, Any], content)
+        if disembark_event.get('SRV'):
+            vehicle = "SRV"
+        elif disembark_event.get('Taxi'):
+            vehicle = "taxi"
+        elif disembark_event.get('Multicrew'):
+            vehicle = "another commander's vessel"
+        else:
+            vehicle = "ship"
         
-        if event_name == 'TradeMicroResources':
-            trade_event = cast(Dict[str, Any], content)
-            offered = trade_event.get('Offered', [])
-            received = trade_event.get('Received_Localised', trade_event.get('Received', 'unknown resource'))
-            count_received = trade_event.get('Count', 0)
+        if disembark_event.get('OnStation'):
+            location = f"at {disembark_event.get('StationName', 'a station')}"
+        elif disembark_event.get('OnPlanet'):
+            location = f"on {disembark_event.get('Body', 'a planet')}"
+        else:
+            location = ""
             
-            if len(offered) == 1:
-                offered_name = offered[0].get('Name_Localised', offered[0].get('Name', 'unknown item'))
-                offered_count = offered[0].get('Count', 0)
-                return f"{self.commander_name} has traded {offered_count} units of {offered_name} for {count_received} units of {received}."
-            else:
-                offered_names = [o.get('Name_Localised', o.get('Name', 'unknown item')) for o in offered]
-                return f"{self.commander_name} has traded multiple resources ({', '.join(offered_names)}) for {count_received} units of {received}."
-        
-        if event_name == 'UpgradeSuit':
-            upgrade_event = cast(Dict[str, Any], content)
-            suit_name = upgrade_event.get('Name_Localised', upgrade_event.get('Name', 'unknown suit'))
-            class_level = upgrade_event.get('Class', 0)
-            cost = upgrade_event.get('Cost', 0)
-            resources = upgrade_event.get('Resources', [])
-            resource_names = [r.get('Name_Localised', r.get('Name', 'unknown material')) for r in resources]
+        return f"{self.commander_name} has disembarked from their {vehicle} {location}."
+
+    @event_renderer('DropItems')
+    def _render_drop_items(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        drop_event = cast(Dict[str, Any], content)
+        item_name = drop_event.get('Name_Localised', drop_event.get('Name', 'unknown item'))
+        count = drop_event.get('Count', 1)
+        if count == 1:
+            return f"{self.commander_name} has dropped 1 {item_name}."
+        else:
+            return f"{self.commander_name} has dropped {count} {item_name}s."
+
+    @event_renderer('DropShipDeploy')
+    def _render_drop_ship_deploy(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has deployed from a dropship to a conflict zone."
+
+    @event_renderer('Embark')
+    def _render_embark(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        embark_event = cast(Dict[str, Any], content)
+        if embark_event.get('SRV'):
+            vehicle = "SRV"
+        elif embark_event.get('Taxi'):
+            vehicle = "taxi"
+        elif embark_event.get('Multicrew'):
+            vehicle = "another commander's vessel"
+        else:
+            vehicle = "ship"
             
-            if resource_names:
-                material_info = f" using {', '.join(resource_names)}"
-            else:
-                material_info = ""
-                
-            return f"{self.commander_name} has upgraded their {suit_name} to class {class_level} for {cost:,} credits{material_info}."
-        
-        if event_name == 'UpgradeWeapon':
-            upgrade_event = cast(Dict[str, Any], content)
-            weapon_name = upgrade_event.get('Name_Localised', upgrade_event.get('Name', 'unknown weapon'))
-            class_level = upgrade_event.get('Class', 0)
-            cost = upgrade_event.get('Cost', 0)
-            resources = upgrade_event.get('Resources', [])
-            resource_names = [r.get('Name_Localised', r.get('Name', 'unknown material')) for r in resources]
+        if embark_event.get('OnStation'):
+            location = f"at {embark_event.get('StationName', 'a station')}"
+        elif embark_event.get('OnPlanet'):
+            location = f"on {embark_event.get('Body', 'a planet')}"
+        else:
+            location = ""
+            
+        return f"{self.commander_name} has boarded their {vehicle} {location}."
+
+    @event_renderer('LoadoutEquipModule')
+    def _render_loadout_equip_module(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        equip_event = cast(Dict[str, Any], content)
+        slot = equip_event.get('SlotName', 'a slot')
+        module = equip_event.get('ModuleName_Localised', equip_event.get('ModuleName', 'an item'))
+        loadout = equip_event.get('LoadoutName', 'loadout')
+        suit = equip_event.get('SuitName_Localised', equip_event.get('SuitName', 'suit'))
+        return f"{self.commander_name} has equipped {module} to {slot} on their {suit} loadout '{loadout}'."
+
+    @event_renderer('LoadoutRemoveModule')
+    def _render_loadout_remove_module(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        remove_event = cast(Dict[str, Any], content)
+        slot = remove_event.get('SlotName', 'a slot')
+        module = remove_event.get('ModuleName_Localised', remove_event.get('ModuleName', 'an item'))
+        loadout = remove_event.get('LoadoutName', 'loadout')
+        suit = remove_event.get('SuitName_Localised', remove_event.get('SuitName', 'suit'))
+        return f"{self.commander_name} has removed {module} from {slot} on their {suit} loadout '{loadout}'."
+
+    @event_renderer('RenameSuitLoadout')
+    def _render_rename_suit_loadout(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        rename_event = cast(Dict[str, Any], content)
+        loadout = rename_event.get('LoadoutName', 'loadout')
+        suit = rename_event.get('SuitName_Localised', rename_event.get('SuitName', 'suit'))
+        return f"{self.commander_name} has renamed a loadout to '{loadout}' for their {suit}."
+
+    @event_renderer('ScanOrganic')
+    def _render_scan_organic(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        scan_event = cast(Dict[str, Any], content)
+        scan_type = scan_event.get('ScanType', 'unknown')
+        species = scan_event.get('Species_Localised', scan_event.get('Species', 'unknown species'))
+        variant = scan_event.get('Variant_Localised', scan_event.get('Variant', ''))
+        if variant and variant != species:
+            life_form = f"{variant} ({species})"
+        else:
+            life_form = species
+            
+        if scan_type == 'Log':
+            action = "logged"
+        elif scan_type == 'Sample':
+            action = "taken a sample from"
+        elif scan_type == 'Analyse':
+            action = "analyzed"
+        else:
+            action = "scanned"
             
-            if resource_names:
-                material_info = f" using {', '.join(resource_names)}"
+        return f"{self.commander_name} has {action} a {life_form} on planet {scan_event.get('Body', 'unknown body')}. {' The scan data can now be sold at the next station featuing a Vista Genomics.' if scan_type == 'Analyse' else ''}"
+
+    @event_renderer('SellMicroResources')
+    def _render_sell_micro_resources(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        sell_event = cast(Dict[str, Any], content)
+        resources = sell_event.get('MicroResources', [])
+        price = sell_event.get('Price', 0)
+        
+        if len(resources) == 1:
+            item = resources[0]
+            item_name = item.get('Name_Localised', item.get('Name', 'unknown item'))
+            count = item.get('Count', 0)
+            return f"{self.commander_name} has sold {count} units of {item_name} for {price:,} credits."
+        else:
+            item_names = [r.get('Name_Localised', r.get('Name', 'unknown item')) for r in resources]
+            return f"{self.commander_name} has sold various microresources ({', '.join(item_names)}) for {price:,} credits."
+
+    @event_renderer('SellOrganicData')
+    def _render_sell_organic_data(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        data_event = cast(Dict[str, Any], content)
+        biodata = data_event.get('BioData', [])
+        total_value = sum(data.get('Value', 0) for data in biodata)
+        total_bonus = sum(data.get('Bonus', 0) for data in biodata)
+        
+        if len(biodata) == 1:
+            species = biodata[0].get('Species_Localised', biodata[0].get('Species', 'unknown species'))
+            variant = biodata[0].get('Variant_Localised', biodata[0].get('Variant', ''))
+            if variant and variant != species:
+                life_form = f"{variant} ({species})"
             else:
-                material_info = ""
+                life_form = species
                 
-            return f"{self.commander_name} has upgraded their {weapon_name} to class {class_level} for {cost:,} credits{material_info}."
-        
-        if event_name == 'UseConsumable':
-            use_event = cast(Dict[str, Any], content)
-            item_name = use_event.get('Name_Localised', use_event.get('Name', 'unknown consumable'))
-            return f"{self.commander_name} has used a {item_name}."
-
-        # Adding handlers for "Other Events" from the Journal documentation
-        if event_name == 'AfmuRepairs':
-            afmu_event = cast(Dict[str, Any], content)
-            module = afmu_event.get('Module_Localised', afmu_event.get('Module', 'a module'))
-            fully_repaired = "fully" if afmu_event.get('FullyRepaired') else "partially"
-            health = afmu_event.get('Health', 0) * 100
-            return f"{self.commander_name} has {fully_repaired} repaired {module} to {health:.1f}% health using the AFMU."
-
-        if event_name == 'ApproachSettlement':
-            approach_event = cast(Dict[str, Any], content)
-            name = approach_event.get('Name', 'a settlement')
-            body_name = approach_event.get('BodyName', '')
-            body_details = f" on {body_name}" if body_name else ""
-            return f"{self.commander_name} is approaching {name} settlement{body_details}."
-
-        if event_name == 'ChangeCrewRole':
-            crew_role_event = cast(Dict[str, Any], content)
-            role = crew_role_event.get('Role', 'Unknown')
-            telepresence = " via telepresence" if crew_role_event.get('Telepresence') else ""
-            return f"{self.commander_name} has switched to {role} crew role{telepresence}."
-
-        if event_name == 'CockpitBreached':
-            return f"{self.commander_name}'s ship cockpit has been breached! Emergency oxygen engaged."
-
-        if event_name == 'CommitCrime':
-            crime_event = cast(Dict[str, Any], content)
-            crime_type = crime_event.get('CrimeType', 'unknown crime')
-            faction = crime_event.get('Faction', 'local authorities')
-
-            details = ""
-            if crime_event.get('Victim'):
-                details += f" against {crime_event.get('Victim')}"
-
-            punishment = ""
-            if crime_event.get('Bounty'):
-                punishment = f" A bounty of {crime_event.get('Bounty'):,} credits has been issued."
-            elif crime_event.get('Fine'):
-                punishment = f" A fine of {crime_event.get('Fine'):,} credits has been issued."
-
-            return f"{self.commander_name} has committed a crime: {crime_type}{details} against {faction}.{punishment}"
-
-        # if event_name == 'Continued':
-        #     continued_event = cast(Dict[str, Any], content)
-        #     part = continued_event.get('Part', '?')
-        #     return f"Journal file continued in part {part}."
-
-        if event_name == 'CrewLaunchFighter':
-            crew_launch_event = cast(Dict[str, Any], content)
-            crew = crew_launch_event.get('Crew', 'A crew member')
-            telepresence = " via telepresence" if crew_launch_event.get('Telepresence') else ""
-            return f"{crew} has launched a fighter from {self.commander_name}'s ship{telepresence}."
-
-        if event_name == 'DatalinkScan':
-            datalink_event = cast(Dict[str, Any], content)
-            message = datalink_event.get('Message', 'No message received')
-            return f"{self.commander_name} has scanned a datalink and received: \"{message}\""
-
-        if event_name == 'DatalinkVoucher':
-            voucher_event = cast(Dict[str, Any], content)
-            reward = voucher_event.get('Reward', 0)
-            victim = voucher_event.get('VictimFaction', 'unknown faction')
-            payee = voucher_event.get('PayeeFaction', 'unknown faction')
-            return f"{self.commander_name} has received a datalink voucher worth {reward:,} credits from {payee} for data about {victim}."
-
-        if event_name == 'DataScanned':
-            data_scan_event = cast(Dict[str, Any], content)
-            scan_type = data_scan_event.get('Type', 'unknown data')
-            return f"{self.commander_name} has scanned a {scan_type}."
-
-        if event_name == 'DockFighter':
-            return f"{self.commander_name} has docked their fighter with the mothership."
-
-        if event_name == 'DockSRV':
-            srv_event = cast(Dict[str, Any], content)
-            srv_type = srv_event.get('SRVType_Localised')
-            return f"{self.commander_name} has docked their {srv_type} SRV with the ship."
-
-        if event_name == 'EndCrewSession':
-            end_crew_event = cast(Dict[str, Any], content)
-            reason = ""
-            if end_crew_event.get('OnCrime'):
-                reason = " due to criminal activity"
-            telepresence = " telepresence" if end_crew_event.get('Telepresence') else ""
-            return f"{self.commander_name} has ended the{telepresence} multicrew session{reason}."
-
-        if event_name == 'FighterRebuilt':
-            rebuild_event = cast(Dict[str, Any], content)
-            loadout = rebuild_event.get('Loadout', 'a fighter')
-            return f"{self.commander_name}'s {loadout} fighter has been rebuilt in the hangar."
-
-        if event_name == 'FuelScoop':
-            fuel_event = cast(Dict[str, Any], content)
-            scooped = fuel_event.get('Scooped', 0)
-            total = fuel_event.get('Total', 0)
-            return f"{self.commander_name} has scooped {scooped:.2f} tons of fuel. Tank now contains {total:.2f} tons."
-
-        if event_name == 'JetConeBoost':
-            boost_event = cast(Dict[str, Any], content)
-            boost = boost_event.get('BoostValue', 0)
-            return f"{self.commander_name} has received a {boost:.1f}x FSD boost from a jet cone."
-
-        if event_name == 'JetConeDamage':
-            damage_event = cast(Dict[str, Any], content)
-            module = damage_event.get('Module', 'a module')
-            return f"{self.commander_name}'s ship has suffered damage to {module} while flying through a jet cone."
-
-        if event_name == 'LaunchDrone':
-            drone_event = cast(Dict[str, Any], content)
-            drone_type = drone_event.get('Type', 'unknown drone')
-            type_map = {
-                'Prospector': 'a prospector drone',
-                'Collection': 'a collector drone',
-                'Hatchbreaker': 'a hatchbreaker drone',
-                'Recon': 'a recon limpet',
-                'Research': 'a research limpet',
-                'Decontamination': 'a decontamination limpet',
-                'Repair': 'a repair limpet',
-                'Fuel': 'a fuel transfer limpet'
-            }
-            drone_name = type_map.get(drone_type, f"a {drone_type} drone")
-            return f"{self.commander_name} has launched {drone_name}."
+            value = biodata[0].get('Value', 0)
+            bonus = biodata[0].get('Bonus', 0)
+            total = value + bonus
+            return f"{self.commander_name} has sold organic data for {life_form} for {total:,} credits (base: {value:,}, bonus: {bonus:,})."
+        else:
+            total = total_value + total_bonus
+            return f"{self.commander_name} has sold organic data for {len(biodata)} species for a total of {total:,} credits (base: {total_value:,}, bonus: {total_bonus:,})."
+
+    @event_renderer('SellSuit')
+    def _render_sell_suit(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        suit_event = cast(Dict[str, Any], content)
+        suit_name = suit_event.get('Name_Localised', suit_event.get('Name', 'unknown suit'))
+        price = suit_event.get('Price', 0)
+        return f"{self.commander_name} has sold their {suit_name} for {price:,} credits."
+
+    @event_renderer('SellWeapon')
+    def _render_sell_weapon(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        weapon_event = cast(Dict[str, Any], content)
+        weapon_name = weapon_event.get('Name_Localised', weapon_event.get('Name', 'unknown weapon'))
+        price = weapon_event.get('Price', 0)
+        return f"{self.commander_name} has sold their {weapon_name} for {price:,} credits."
+
+    @event_renderer('ShipLocker')
+    def _render_ship_locker(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
 
-        if event_name == 'LaunchFighter':
-            fighter_event = cast(Dict[str, Any], content)
-            return f"{self.commander_name if fighter_event.get('PlayerControlled') else 'An NPC crew'} has launched in a fighter."
+    @event_renderer('SuitLoadout')
+    def _render_suit_loadout(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        loadout_event = cast(Dict[str, Any], content)
+        suit_name = loadout_event.get('SuitName_Localised', loadout_event.get('SuitName', 'unknown suit'))
+        loadout_name = loadout_event.get('LoadoutName', 'loadout')
+        return f"{self.commander_name} is using the '{loadout_name}' loadout for their {suit_name}."
+
+    @event_renderer('SwitchSuitLoadout')
+    def _render_switch_suit_loadout(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        loadout_event = cast(Dict[str, Any], content)
+        suit_name = loadout_event.get('SuitName_Localised', loadout_event.get('SuitName', 'unknown suit'))
+        loadout_name = loadout_event.get('LoadoutName', 'loadout')
+        return f"{self.commander_name} has switched to the '{loadout_name}' loadout for their {suit_name}."
+
+    @event_renderer('TransferMicroResources')
+    def _render_transfer_micro_resources(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        transfer_event = cast(Dict[str, Any], content)
+        transfers = transfer_event.get('Transfers', [])
+        
+        if len(transfers) == 1:
+            item = transfers[0]
+            item_name = item.get('Name_Localised', item.get('Name', 'unknown item'))
+            count = item.get('Count', 0)
+            direction = item.get('Direction', '')
+            
+            if direction == 'ToBackpack':
+                return f"{self.commander_name} has transferred {count} units of {item_name} from their ship locker to their backpack."
+            else:
+                return f"{self.commander_name} has transferred {count} units of {item_name} from their backpack to their ship locker."
+        else:
+            to_backpack = any(t.get('Direction') == 'ToBackpack' for t in transfers)
+            if to_backpack:
+                return f"{self.commander_name} has transferred multiple items from their ship locker to their backpack."
+            else:
+                return f"{self.commander_name} has transferred multiple items from their backpack to their ship locker."
+
+    @event_renderer('TradeMicroResources')
+    def _render_trade_micro_resources(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        trade_event = cast(Dict[str, Any], content)
+        offered = trade_event.get('Offered', [])
+        received = trade_event.get('Received_Localised', trade_event.get('Received', 'unknown resource'))
+        count_received = trade_event.get('Count', 0)
+        
+        if len(offered) == 1:
+            offered_name = offered[0].get('Name_Localised', offered[0].get('Name', 'unknown item'))
+            offered_count = offered[0].get('Count', 0)
+            return f"{self.commander_name} has traded {offered_count} units of {offered_name} for {count_received} units of {received}."
+        else:
+            offered_names = [o.get('Name_Localised', o.get('Name', 'unknown item')) for o in offered]
+            return f"{self.commander_name} has traded multiple resources ({', '.join(offered_names)}) for {count_received} units of {received}."
+
+    @event_renderer('UpgradeSuit')
+    def _render_upgrade_suit(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        upgrade_event = cast(Dict[str, Any], content)
+        suit_name = upgrade_event.get('Name_Localised', upgrade_event.get('Name', 'unknown suit'))
+        class_level = upgrade_event.get('Class', 0)
+        cost = upgrade_event.get('Cost', 0)
+        resources = upgrade_event.get('Resources', [])
+        resource_names = [r.get('Name_Localised', r.get('Name', 'unknown material')) for r in resources]
+        
+        if resource_names:
+            material_info = f" using {', '.join(resource_names)}"
+        else:
+            material_info = ""
+            
+        return f"{self.commander_name} has upgraded their {suit_name} to class {class_level} for {cost:,} credits{material_info}."
+
+    @event_renderer('UpgradeWeapon')
+    def _render_upgrade_weapon(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        upgrade_event = cast(Dict[str, Any], content)
+        weapon_name = upgrade_event.get('Name_Localised', upgrade_event.get('Name', 'unknown weapon'))
+        class_level = upgrade_event.get('Class', 0)
+        cost = upgrade_event.get('Cost', 0)
+        resources = upgrade_event.get('Resources', [])
+        resource_names = [r.get('Name_Localised', r.get('Name', 'unknown material')) for r in resources]
+        
+        if resource_names:
+            material_info = f" using {', '.join(resource_names)}"
+        else:
+            material_info = ""
+            
+        return f"{self.commander_name} has upgraded their {weapon_name} to class {class_level} for {cost:,} credits{material_info}."
+
+    @event_renderer('UseConsumable')
+    def _render_use_consumable(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        use_event = cast(Dict[str, Any], content)
+        item_name = use_event.get('Name_Localised', use_event.get('Name', 'unknown consumable'))
+        return f"{self.commander_name} has used a {item_name}."
+
+    # Adding handlers for "Other Events" from the Journal documentation
+    @event_renderer('AfmuRepairs')
+    def _render_afmu_repairs(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        afmu_event = cast(Dict[str, Any], content)
+        module = afmu_event.get('Module_Localised', afmu_event.get('Module', 'a module'))
+        fully_repaired = "fully" if afmu_event.get('FullyRepaired') else "partially"
+        health = afmu_event.get('Health', 0) * 100
+        return f"{self.commander_name} has {fully_repaired} repaired {module} to {health:.1f}% health using the AFMU."
+
+    @event_renderer('ApproachSettlement')
+    def _render_approach_settlement(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        approach_event = cast(Dict[str, Any], content)
+        name = approach_event.get('Name', 'a settlement')
+        body_name = approach_event.get('BodyName', '')
+        body_details = f" on {body_name}" if body_name else ""
+        return f"{self.commander_name} is approaching {name} settlement{body_details}."
+
+    @event_renderer('ChangeCrewRole')
+    def _render_change_crew_role(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        crew_role_event = cast(Dict[str, Any], content)
+        role = crew_role_event.get('Role', 'Unknown')
+        telepresence = " via telepresence" if crew_role_event.get('Telepresence') else ""
+        return f"{self.commander_name} has switched to {role} crew role{telepresence}."
+
+    @event_renderer('CockpitBreached')
+    def _render_cockpit_breached(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name}'s ship cockpit has been breached! Emergency oxygen engaged."
+
+    @event_renderer('CommitCrime')
+    def _render_commit_crime(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        crime_event = cast(Dict[str, Any], content)
+        crime_type = crime_event.get('CrimeType', 'unknown crime')
+        faction = crime_event.get('Faction', 'local authorities')
+
+        details = ""
+        if crime_event.get('Victim'):
+            details += f" against {crime_event.get('Victim')}"
+
+        punishment = ""
+        if crime_event.get('Bounty'):
+            punishment = f" A bounty of {crime_event.get('Bounty'):,} credits has been issued."
+        elif crime_event.get('Fine'):
+            punishment = f" A fine of {crime_event.get('Fine'):,} credits has been issued."
+
+        return f"{self.commander_name} has committed a crime: {crime_type}{details} against {faction}.{punishment}"
+
+    # if event_name == 'Continued':
+    #     continued_event = cast(Dict[str, Any], content)
+    #     part = continued_event.get('Part', '?')
+    #     return f"Journal file continued in part {part}."
+    @event_renderer('CrewLaunchFighter')
+    def _render_crew_launch_fighter(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        crew_launch_event = cast(Dict[str, Any], content)
+        crew = crew_launch_event.get('Crew', 'A crew member')
+        telepresence = " via telepresence" if crew_launch_event.get('Telepresence') else ""
+        return f"{crew} has launched a fighter from {self.commander_name}'s ship{telepresence}."
+
+    @event_renderer('DatalinkScan')
+    def _render_datalink_scan(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        datalink_event = cast(Dict[str, Any], content)
+        message = datalink_event.get('Message', 'No message received')
+        return f"{self.commander_name} has scanned a datalink and received: \"{message}\""
+
+    @event_renderer('DatalinkVoucher')
+    def _render_datalink_voucher(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        voucher_event = cast(Dict[str, Any], content)
+        reward = voucher_event.get('Reward', 0)
+        victim = voucher_event.get('VictimFaction', 'unknown faction')
+        payee = voucher_event.get('PayeeFaction', 'unknown faction')
+        return f"{self.commander_name} has received a datalink voucher worth {reward:,} credits from {payee} for data about {victim}."
+
+    @event_renderer('DataScanned')
+    def _render_data_scanned(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        data_scan_event = cast(Dict[str, Any], content)
+        scan_type = data_scan_event.get('Type', 'unknown data')
+        return f"{self.commander_name} has scanned a {scan_type}."
+
+    @event_renderer('DockFighter')
+    def _render_dock_fighter(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has docked their fighter with the mothership."
+
+    @event_renderer('DockSRV')
+    def _render_dock_srv(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        srv_event = cast(Dict[str, Any], content)
+        srv_type = srv_event.get('SRVType_Localised')
+        return f"{self.commander_name} has docked their {srv_type} SRV with the ship."
+
+    @event_renderer('FighterRebuilt')
+    def _render_fighter_rebuilt(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        rebuild_event = cast(Dict[str, Any], content)
+        loadout = rebuild_event.get('Loadout', 'a fighter')
+        return f"{self.commander_name}'s {loadout} fighter has been rebuilt in the hangar."
+
+    @event_renderer('FuelScoop')
+    def _render_fuel_scoop(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        fuel_event = cast(Dict[str, Any], content)
+        scooped = fuel_event.get('Scooped', 0)
+        total = fuel_event.get('Total', 0)
+        return f"{self.commander_name} has scooped {scooped:.2f} tons of fuel. Tank now contains {total:.2f} tons."
+
+    @event_renderer('JetConeBoost')
+    def _render_jet_cone_boost(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        boost_event = cast(Dict[str, Any], content)
+        boost = boost_event.get('BoostValue', 0)
+        return f"{self.commander_name} has received a {boost:.1f}x FSD boost from a jet cone."
+
+    @event_renderer('JetConeDamage')
+    def _render_jet_cone_damage(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        damage_event = cast(Dict[str, Any], content)
+        module = damage_event.get('Module', 'a module')
+        return f"{self.commander_name}'s ship has suffered damage to {module} while flying through a jet cone."
+
+    @event_renderer('LaunchDrone')
+    def _render_launch_drone(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        drone_event = cast(Dict[str, Any], content)
+        drone_type = drone_event.get('Type', 'unknown drone')
+        type_map = {
+            'Prospector': 'a prospector drone',
+            'Collection': 'a collector drone',
+            'Hatchbreaker': 'a hatchbreaker drone',
+            'Recon': 'a recon limpet',
+            'Research': 'a research limpet',
+            'Decontamination': 'a decontamination limpet',
+            'Repair': 'a repair limpet',
+            'Fuel': 'a fuel transfer limpet'
+        }
+        drone_name = type_map.get(drone_type, f"a {drone_type} drone")
+        return f"{self.commander_name} has launched {drone_name}."
+
+    @event_renderer('LaunchFighter')
+    def _render_launch_fighter(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        fighter_event = cast(Dict[str, Any], content)
+        return f"{self.commander_name if fighter_event.get('PlayerControlled') else 'An NPC crew'} has launched in a fighter."
+
+    @event_renderer('LaunchSRV')
+    def _render_launch_srv(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        srv_event = cast(Dict[str, Any], content)
+        srv_type = srv_event.get('SRVType_Localised')
+        return f"{self.commander_name} has launched their {srv_type} SRV."
+
+    @event_renderer('ModuleInfo')
+    def _render_module_info(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has viewed their module information."
+
+    @event_renderer('Music')
+    def _render_music(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
 
-        if event_name == 'LaunchSRV':
-            srv_event = cast(Dict[str, Any], content)
-            srv_type = srv_event.get('SRVType_Localised')
-            return f"{self.commander_name} has launched their {srv_type} SRV."
+    @event_renderer('NpcCrewPaidWage')
+    def _render_npc_crew_paid_wage(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        wage_event = cast(Dict[str, Any], content)
+        name = wage_event.get('NpcCrewName', 'An NPC crew member')
+        amount = wage_event.get('Amount', 0)
+        if amount == 0:
+            return None
+        return f"{self.commander_name} has paid {name} a wage of {amount:,} credits."
+
+    @event_renderer('NpcCrewRank')
+    def _render_npc_crew_rank(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        rank_event = cast(Dict[str, Any], content)
+        name = rank_event.get('NpcCrewName', 'An NPC crew member')
+        rank = rank_event.get('RankCombat', 0)
+        return f"{self.commander_name}'s crew member {name} has reached combat rank {rank}."
+
+    @event_renderer('ProspectedAsteroid')
+    def _render_prospected_asteroid(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        prospect_event = cast(Dict[str, Any], content)
+        content_level = prospect_event.get('Content', 'Unknown')
+        remaining = prospect_event.get('Remaining', 100)
+
+        materials_info = ""
+        if prospect_event.get('Materials'):
+            materials = []
+            for material in prospect_event.get('Materials', []):
+                name = material.get('Name_Localised', material.get('Name', 'unknown material'))
+                proportion = material.get('Proportion', 0)
+                materials.append(f"{name} ({proportion:.1f}%)")
+            materials_info = f" Contains: {', '.join(materials)}."
+
+        motherlode = ""
+        if prospect_event.get('MotherlodeMaterial'):
+            motherlode = f" This is a motherlode asteroid with {prospect_event.get('MotherlodeMaterial')}!"
+
+        return f"{self.commander_name} has prospected an asteroid with {content_level} mineral content. {remaining}% remaining.{materials_info}{motherlode}"
+
+    @event_renderer('RebootRepair')
+    def _render_reboot_repair(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        repair_event = cast(Dict[str, Any], content)
+        modules = repair_event.get('Modules', [])
+        if modules:
+            repaired = ", ".join(modules)
+            return f"{self.commander_name} has performed an emergency reboot/repair. Repaired modules: {repaired}."
+        else:
+            return f"{self.commander_name} has performed an emergency reboot/repair."
+
+    @event_renderer('RepairDrone')
+    def _render_repair_drone(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        repair_drone_event = cast(Dict[str, Any], content)
+        repairs = []
+        if repair_drone_event.get('HullRepaired'):
+            repairs.append(f"hull: {repair_drone_event.get('HullRepaired')}")
+        if repair_drone_event.get('CockpitRepaired'):
+            repairs.append(f"cockpit: {repair_drone_event.get('CockpitRepaired')}")
+        if repair_drone_event.get('CorrosionRepaired'):
+            repairs.append(f"corrosion: {repair_drone_event.get('CorrosionRepaired')}")
+            
+        if repairs:
+            repair_details = ", ".join(repairs)
+            return f"{self.commander_name}'s ship has been repaired by a repair drone. Repairs: {repair_details}."
+        else:
+            return f"{self.commander_name}'s ship has been repaired by a repair drone."
 
-        if event_name == 'ModuleInfo':
-            return f"{self.commander_name} has viewed their module information."
+    @event_renderer('ReservoirReplenished')
+    def _render_reservoir_replenished(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
 
-        if event_name == 'Music':
-            return None
+    @event_renderer('Resurrect')
+    def _render_resurrect(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        resurrect_event = cast(Dict[str, Any], content)
+        option = resurrect_event.get('Option', 'unknown')
+        cost = resurrect_event.get('Cost', 0)
+        bankrupt = " and declared bankruptcy" if resurrect_event.get('Bankrupt') else ""
+        return f"{self.commander_name} has been resurrected (option: {option}) for {cost:,} credits{bankrupt}."
+
+    @event_renderer('Scanned')
+    def _render_scanned(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        scan_event = cast(Dict[str, Any], content)
+        scan_type = scan_event.get('ScanType', 'Unknown')
+        return f"{self.commander_name}'s ship has been scanned for {scan_type}."
+
+    @event_renderer('SelfDestruct')
+    def _render_self_destruct(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has initiated self-destruct sequence."
+
+    @event_renderer('Synthesis')
+    def _render_synthesis(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        synthesis_event = cast(Dict[str, Any], content)
+        blueprint = synthesis_event.get('Name', 'unknown synthesis')
+        
+        materials_info = ""
+        if synthesis_event.get('Materials'):
+            materials = []
+            for material in synthesis_event.get('Materials', []):
+                name = material.get('Name_Localised', material.get('Name', 'unknown material'))
+                count = material.get('Count', 0)
+                materials.append(f"{name} ({count})")
+            materials_info = f" using {', '.join(materials)}"
+        
+        return f"{self.commander_name} has synthesized {blueprint}{materials_info}."
 
-        if event_name == 'NpcCrewPaidWage':
-            wage_event = cast(Dict[str, Any], content)
-            name = wage_event.get('NpcCrewName', 'An NPC crew member')
-            amount = wage_event.get('Amount', 0)
-            if amount == 0:
-                return None
-            return f"{self.commander_name} has paid {name} a wage of {amount:,} credits."
-
-        if event_name == 'NpcCrewRank':
-            rank_event = cast(Dict[str, Any], content)
-            name = rank_event.get('NpcCrewName', 'An NPC crew member')
-            rank = rank_event.get('RankCombat', 0)
-            return f"{self.commander_name}'s crew member {name} has reached combat rank {rank}."
-
-        if event_name == 'ProspectedAsteroid':
-            prospect_event = cast(Dict[str, Any], content)
-            content_level = prospect_event.get('Content', 'Unknown')
-            remaining = prospect_event.get('Remaining', 100)
-
-            materials_info = ""
-            if prospect_event.get('Materials'):
-                materials = []
-                for material in prospect_event.get('Materials', []):
-                    name = material.get('Name_Localised', material.get('Name', 'unknown material'))
-                    proportion = material.get('Proportion', 0)
-                    materials.append(f"{name} ({proportion:.1f}%)")
-                materials_info = f" Contains: {', '.join(materials)}."
-
-            motherlode = ""
-            if prospect_event.get('MotherlodeMaterial'):
-                motherlode = f" This is a motherlode asteroid with {prospect_event.get('MotherlodeMaterial')}!"
-
-            return f"{self.commander_name} has prospected an asteroid with {content_level} mineral content. {remaining}% remaining.{materials_info}{motherlode}"
-
-        if event_name == 'RebootRepair':
-            repair_event = cast(Dict[str, Any], content)
-            modules = repair_event.get('Modules', [])
-            if modules:
-                repaired = ", ".join(modules)
-                return f"{self.commander_name} has performed an emergency reboot/repair. Repaired modules: {repaired}."
-            else:
-                return f"{self.commander_name} has performed an emergency reboot/repair."
-                
-        if event_name == 'RepairDrone':
-            repair_drone_event = cast(Dict[str, Any], content)
-            repairs = []
-            if repair_drone_event.get('HullRepaired'):
-                repairs.append(f"hull: {repair_drone_event.get('HullRepaired')}")
-            if repair_drone_event.get('CockpitRepaired'):
-                repairs.append(f"cockpit: {repair_drone_event.get('CockpitRepaired')}")
-            if repair_drone_event.get('CorrosionRepaired'):
-                repairs.append(f"corrosion: {repair_drone_event.get('CorrosionRepaired')}")
-                
-            if repairs:
-                repair_details = ", ".join(repairs)
-                return f"{self.commander_name}'s ship has been repaired by a repair drone. Repairs: {repair_details}."
-            else:
-                return f"{self.commander_name}'s ship has been repaired by a repair drone."
-                
-        if event_name == 'ReservoirReplenished':
-            return None
-            
-        if event_name == 'Resurrect':
-            resurrect_event = cast(Dict[str, Any], content)
-            option = resurrect_event.get('Option', 'unknown')
-            cost = resurrect_event.get('Cost', 0)
-            bankrupt = " and declared bankruptcy" if resurrect_event.get('Bankrupt') else ""
-            return f"{self.commander_name} has been resurrected (option: {option}) for {cost:,} credits{bankrupt}."
-            
-        if event_name == 'Scanned':
-            scan_event = cast(Dict[str, Any], content)
-            scan_type = scan_event.get('ScanType', 'Unknown')
-            return f"{self.commander_name}'s ship has been scanned for {scan_type}."
-            
-        if event_name == 'SelfDestruct':
-            return f"{self.commander_name} has initiated self-destruct sequence."
-            
-        if event_name == 'SendText':
-            send_text_event = cast(SendTextEvent, content)
-            return f'{self.commander_name} sent a message to {send_text_event.get("To")}: "{send_text_event.get("Message")}"'
-            
-        if event_name == 'Shutdown':
-            return f"{self.commander_name} is shutting down the game."
-            
-        if event_name == 'Synthesis':
-            synthesis_event = cast(Dict[str, Any], content)
-            blueprint = synthesis_event.get('Name', 'unknown synthesis')
-            
-            materials_info = ""
-            if synthesis_event.get('Materials'):
-                materials = []
-                for material in synthesis_event.get('Materials', []):
-                    name = material.get('Name_Localised', material.get('Name', 'unknown material'))
-                    count = material.get('Count', 0)
-                    materials.append(f"{name} ({count})")
-                materials_info = f" using {', '.join(materials)}"
-            
-            return f"{self.commander_name} has synthesized {blueprint}{materials_info}."
-            
-        if event_name == 'SystemsShutdown':
-            return f"{self.commander_name}'s ship systems have shut down unexpectedly."
-            
-        if event_name == 'USSDrop':
-            uss_event = cast(Dict[str, Any], content)
-            uss_type = uss_event.get('USSType', 'Unknown')
-            threat = uss_event.get('USSThreat', 0)
-            
-            threat_info = ""
-            if threat > 0:
-                threat_info = f" (Threat level: {threat})"
-                
-            return f"{self.commander_name} has dropped into an Unidentified Signal Source: {uss_type}{threat_info}."
-            
-        if event_name == 'VehicleSwitch':
-            vehicle_event = cast(Dict[str, Any], content)
-            to_vehicle = vehicle_event.get('To', 'Unknown')
-            
-            if to_vehicle == 'Mothership':
-                return f"{self.commander_name} has switched control back to their main ship."
-            elif to_vehicle == 'Fighter':
-                return f"{self.commander_name} has switched control to their fighter."
-            else:
-                return f"{self.commander_name} has switched control to: {to_vehicle}."
-                
-        if event_name == 'WingAdd':
-            wing_add_event = cast(WingAddEvent, content)
-            return f"{wing_add_event.get('Name')} has joined {self.commander_name}'s wing."
-            
-        if event_name == 'WingInvite':
-            wing_invite_event = cast(Dict[str, Any], content)
-            name = wing_invite_event.get('Name', 'Another commander')
-            return f"{self.commander_name} has been invited to join {name}'s wing."
-            
-        if event_name == 'WingJoin':
-            wing_join_event = cast(WingJoinEvent, content)
-            return f"{self.commander_name} has joined a wing."
-            
-        if event_name == 'WingLeave':
-            wing_leave_event = cast(WingLeaveEvent, content)
-            return f"{self.commander_name} has left their wing."
+    @event_renderer('SystemsShutdown')
+    def _render_systems_shutdown(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name}'s ship systems have shut down unexpectedly."
 
-        if event_name == 'Cargo':
-            return None
-        if event_name == 'CargoTransfer':
-            cargo_transfer_event = cast(Dict[str, Any], content)
-            transfers = cargo_transfer_event.get('Transfers', [])
-            
-            if len(transfers) == 0:
-                return f"{self.commander_name} has transferred cargo."
-                
-            if len(transfers) == 1:
-                transfer = transfers[0]
-                item_type = transfer.get('Type_Localised', transfer.get('Type', 'unknown item'))
-                count = transfer.get('Count', 0)
-                direction = transfer.get('Direction', '')
-                
-                if direction == 'tocarrier':
-                    return f"{self.commander_name} has transferred {count} units of {item_type} to their fleet carrier."
-                elif direction == 'toship':
-                    return f"{self.commander_name} has transferred {count} units of {item_type} to their ship."
-                elif direction == 'tosrv':
-                    return f"{self.commander_name} has transferred {count} units of {item_type} to their SRV."
-                elif direction == 'fromcarrier':
-                    return f"{self.commander_name} has transferred {count} units of {item_type} from their fleet carrier."
-                else:
-                    return f"{self.commander_name} has transferred {count} units of {item_type}."
-            else:
-                to_carrier = any(t.get('Direction') == 'tocarrier' for t in transfers)
-                to_ship = any(t.get('Direction') == 'toship' for t in transfers)
-                to_srv = any(t.get('Direction') == 'tosrv' for t in transfers)
-                
-                if to_carrier:
-                    return f"{self.commander_name} has transferred multiple cargo items to their fleet carrier."
-                elif to_ship:
-                    return f"{self.commander_name} has transferred multiple cargo items to their ship."
-                elif to_srv:
-                    return f"{self.commander_name} has transferred multiple cargo items to their SRV."
-                else:
-                    return f"{self.commander_name} has transferred multiple cargo items."
-                    
-        if event_name == 'SupercruiseDestinationDrop':
-            supercruise_destination_drop_event = cast(SupercruiseDestinationDropEvent, content)
-            threat = ""
-            if supercruise_destination_drop_event.get('Threat') is not None:
-                threat_level = int(supercruise_destination_drop_event.get('Threat', 0))
-                if threat_level > 2:
-                    threat = f" WARNING: Threat level {threat_level}!"
-                elif threat_level > 0:
-                    threat = f" (Threat level: {threat_level})"
+    @event_renderer('USSDrop')
+    def _render_uss_drop(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        uss_event = cast(Dict[str, Any], content)
+        uss_type = uss_event.get('USSType', 'Unknown')
+        threat = uss_event.get('USSThreat', 0)
+        
+        threat_info = ""
+        if threat > 0:
+            threat_info = f" (Threat level: {threat})"
             
-            destination = supercruise_destination_drop_event.get('Type_Localised', supercruise_destination_drop_event.get('Type'))
-            return f"{self.commander_name} is dropping from supercruise at {destination}{threat}"
+        return f"{self.commander_name} has dropped into an Unidentified Signal Source: {uss_type}{threat_info}."
 
-        if event_name == 'SquadronStartup':
-            return None
+    @event_renderer('VehicleSwitch')
+    def _render_vehicle_switch(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        vehicle_event = cast(Dict[str, Any], content)
+        to_vehicle = vehicle_event.get('To', 'Unknown')
+        
+        if to_vehicle == 'Mothership':
+            return f"{self.commander_name} has switched control back to their main ship."
+        elif to_vehicle == 'Fighter':
+            return f"{self.commander_name} has switched control to their fighter."
+        else:
+            return f"{self.commander_name} has switched control to: {to_vehicle}."
 
-        if event_name == 'EscapeInterdiction':
-            escape_event = cast(Dict[str, Any], content)
-            interdictor = escape_event.get('Interdictor', 'an unknown ship')
-            is_player = escape_event.get('IsPlayer', False)
-            is_thargoid = escape_event.get('IsThargoid', False)
-            
-            if is_thargoid:
-                return f"{self.commander_name} escaped a thargoid's attempt to pull them out of supercruise."
-            elif is_player:
-                return f"{self.commander_name} escaped Commander {interdictor}'s attempt to pull them out of supercruise."
-            else:
-                return f"{self.commander_name} escaped an attempt by {interdictor} to pull them out of supercruise."
-            
-        if event_name == 'FactionKillBond':
-            faction_bond_event = cast(Dict[str, Any], content)
-            reward = faction_bond_event.get('Reward', 0)
-            awarding_faction = faction_bond_event.get('AwardingFaction', 'a faction')
-            victim_faction = faction_bond_event.get('VictimFaction', 'enemy')
-            return f"{self.commander_name} has received a {reward:,} credit combat bond for killing a {victim_faction} ship on behalf of {awarding_faction}."
-            
-        if event_name == 'PVPKill':
-            pvp_kill_event = cast(Dict[str, Any], content)
-            victim = pvp_kill_event.get('Victim', 'another commander')
-            combat_rank = pvp_kill_event.get('CombatRank', -1)
-            rank_names = ["Harmless", "Mostly Harmless", "Novice", "Competent", "Expert", "Master", "Dangerous", "Deadly", "Elite"]
-            rank_text = f" (Combat Rank: {rank_names[combat_rank]})" if 0 <= combat_rank < len(rank_names) else ""
-            return f"{self.commander_name} has defeated Commander {victim}{rank_text} in combat."
-
-        # if event_name == 'Statistics':
-        #     return f"{self.commander_name}'s game statistics have been updated."
-
-        if event_name == 'ShipTargeted':
-            ship_targeted_event = cast(ShipTargetedEvent, content)
-            if ship_targeted_event.get('TargetLocked'):
-                pilot_name = ship_targeted_event.get('PilotName', '')
-                ship_name = ship_targeted_event.get('Ship_Localised', ship_targeted_event.get('Ship', 'ship'))
-                legal_status = ship_targeted_event.get('LegalStatus', '')
-                commander_name = pilot_name.partition('$cmdr_decorate:#name=')[2].partition(';')[0]
-                local_commander_name = get_state_dict(projected_states, 'Commander').get('Name', '') if projected_states else ''
-                is_own_ship = bool(commander_name) and commander_name.casefold() == local_commander_name.casefold()
-                target_description = None
-                if pilot_name.startswith('$RolePanel2_unmanned;') and commander_name:
-                    target_description = (
-                        f"your unmanned main ship, {ship_name}"
-                        if is_own_ship else f"{legal_status} unmanned {ship_name} belonging to CMDR {commander_name}"
-                    )
-                elif pilot_name.startswith('$RolePanel2_crew;') and commander_name:
-                    target_description = (
-                        f"your main ship, {ship_name}, steered by your NPC crew"
-                        if is_own_ship else f"{legal_status} {ship_name} steered by CMDR {commander_name}'s NPC crew"
-                    )
-                if target_description:
-                    if ship_targeted_event.get('Subsystem_Localised'):
-                        if is_own_ship and pilot_name.startswith('$RolePanel2_unmanned;'):
-                            return f"Weapons now targeting your unmanned main ship's {ship_targeted_event.get('Subsystem_Localised')}"
-                        if is_own_ship:
-                            return f"Weapons now targeting your main ship's {ship_targeted_event.get('Subsystem_Localised')}, operated by your NPC crew"
-                        return f"Weapons now targeting {target_description}'s {ship_targeted_event.get('Subsystem_Localised')}"
-                    return f"Sensors and weapons locked on to {target_description}"
-                if ship_targeted_event.get('Subsystem_Localised'):
-                    return f"Weapons now targeting {legal_status} pilot {ship_targeted_event.get('PilotName_Localised')}'s {ship_targeted_event.get('Subsystem_Localised')}"
-                if ship_targeted_event.get('PilotName_Localised'):
-                    return f"Sensors and weapons locked on to {legal_status} pilot {ship_targeted_event.get('PilotName_Localised')}'s {ship_targeted_event.get('Ship','ship').capitalize()}"
-                else:
-                    return f"Sensors and weapons locked on to the {ship_targeted_event.get('Ship','ship').capitalize()}"
-            else:
-                return f"Weapons' target lock lost."
+    @event_renderer('Cargo')
+    def _render_cargo(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
 
-        if event_name == 'UnderAttack':
-            under_attack_event = cast(UnderAttackEvent, content)
-            if under_attack_event.get('Target') == 'You':
-                return f"{self.commander_name} is under attack."
+    @event_renderer('CargoTransfer')
+    def _render_cargo_transfer(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        cargo_transfer_event = cast(Dict[str, Any], content)
+        transfers = cargo_transfer_event.get('Transfers', [])
+        
+        if len(transfers) == 0:
+            return f"{self.commander_name} has transferred cargo."
+            
+        if len(transfers) == 1:
+            transfer = transfers[0]
+            item_type = transfer.get('Type_Localised', transfer.get('Type', 'unknown item'))
+            count = transfer.get('Count', 0)
+            direction = transfer.get('Direction', '')
+            
+            if direction == 'tocarrier':
+                return f"{self.commander_name} has transferred {count} units of {item_type} to their fleet carrier."
+            elif direction == 'toship':
+                return f"{self.commander_name} has transferred {count} units of {item_type} to their ship."
+            elif direction == 'tosrv':
+                return f"{self.commander_name} has transferred {count} units of {item_type} to their SRV."
+            elif direction == 'fromcarrier':
+                return f"{self.commander_name} has transferred {count} units of {item_type} from their fleet carrier."
             else:
-                return f"{self.commander_name}'s {under_attack_event.get('Target')} is under attack."
-
-        if event_name == 'Bounty':
-            bounty_event = cast(BountyEvent, content)
-            rewards_text = ""
-            if bounty_event.get('Rewards'):
-                rewards = []
-                for reward in bounty_event.get('Rewards', []):
-                    rewards.append(f"{reward.get('Reward'):,} credits from {reward.get('Faction')}")
-                rewards_text = f" ({', '.join(rewards)})"
-            target = bounty_event.get('Target_Localised', bounty_event.get('Target', 'target'))
-            return f"{self.commander_name} has collected a {bounty_event.get('TotalReward'):,} credit bounty for eliminating {target}{rewards_text}."
-
-        if event_name == 'CapShipBond':
-            cap_ship_bond_event = cast(Dict[str, Any], content)
-            reward = cap_ship_bond_event.get('Reward', 0)
-            victim_faction = cap_ship_bond_event.get('VictimFaction', 'enemy')
-            awarding_faction = cap_ship_bond_event.get('AwardingFaction', 'allied')
-            return f"{self.commander_name} has received a {reward:,} credit capital ship combat bond from {awarding_faction} for combat against {victim_faction}."
-
-        if event_name == 'CargoDepot':
-            cargo_depot_event = cast(Dict[str, Any], content)
-            mission_id = cargo_depot_event.get('MissionID', 0)
-            operation = cargo_depot_event.get('UpdateType', 'unknown')
-            commodity = cargo_depot_event.get('CargoType', 'cargo')
-            count = cargo_depot_event.get('Count', 0)
-            total = cargo_depot_event.get('TotalCount', 0)
-            return f"{self.commander_name} has {operation} {count} units of {commodity} for mission {mission_id} (Total: {total})."
-
-        if event_name == 'CommunityGoal':
-            return None
+                return f"{self.commander_name} has transferred {count} units of {item_type}."
+        else:
+            to_carrier = any(t.get('Direction') == 'tocarrier' for t in transfers)
+            to_ship = any(t.get('Direction') == 'toship' for t in transfers)
+            to_srv = any(t.get('Direction') == 'tosrv' for t in transfers)
+            
+            if to_carrier:
+                return f"{self.commander_name} has transferred multiple cargo items to their fleet carrier."
+            elif to_ship:
+                return f"{self.commander_name} has transferred multiple cargo items to their ship."
+            elif to_srv:
+                return f"{self.commander_name} has transferred multiple cargo items to their SRV."
+            else:
+                return f"{self.commander_name} has transferred multiple cargo items."
 
-        if event_name == 'CrimeVictim':
-            # @ToDo: Filter only if offender isn't commander
-            # crime_victim_event = cast(Dict[str, Any], content)
-            # offender = crime_victim_event.get('Offender', 'Unknown perpetrator')
-            # crime_type = crime_victim_event.get('CrimeType', 'unknown crime')
-            # return f"{self.commander_name} has been the victim of {crime_type} by {offender}."
-            return None
+    @event_renderer('SquadronStartup')
+    def _render_squadron_startup(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
 
-        if event_name == 'Died':
-            died_event = cast(DiedEvent, content)
-            killers = died_event.get('Killers', [])
-            if killers:
-                killer_descriptions = ', '.join(
-                    f"{killer.get('Name', 'unknown killer')} ({killer.get('Ship', 'unknown ship')}, {killer.get('Rank', 'unknown rank')})"
-                    for killer in killers
+    @event_renderer('EscapeInterdiction')
+    def _render_escape_interdiction(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        escape_event = cast(Dict[str, Any], content)
+        interdictor = escape_event.get('Interdictor', 'an unknown ship')
+        is_player = escape_event.get('IsPlayer', False)
+        is_thargoid = escape_event.get('IsThargoid', False)
+        
+        if is_thargoid:
+            return f"{self.commander_name} escaped a thargoid's attempt to pull them out of supercruise."
+        elif is_player:
+            return f"{self.commander_name} escaped Commander {interdictor}'s attempt to pull them out of supercruise."
+        else:
+            return f"{self.commander_name} escaped an attempt by {interdictor} to pull them out of supercruise."
+
+    @event_renderer('FactionKillBond')
+    def _render_faction_kill_bond(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        faction_bond_event = cast(Dict[str, Any], content)
+        reward = faction_bond_event.get('Reward', 0)
+        awarding_faction = faction_bond_event.get('AwardingFaction', 'a faction')
+        victim_faction = faction_bond_event.get('VictimFaction', 'enemy')
+        return f"{self.commander_name} has received a {reward:,} credit combat bond for killing a {victim_faction} ship on behalf of {awarding_faction}."
+
+    @event_renderer('PVPKill')
+    def _render_pvp_kill(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        pvp_kill_event = cast(Dict[str, Any], content)
+        victim = pvp_kill_event.get('Victim', 'another commander')
+        combat_rank = pvp_kill_event.get('CombatRank', -1)
+        rank_names = ["Harmless", "Mostly Harmless", "Novice", "Competent", "Expert", "Master", "Dangerous", "Deadly", "Elite"]
+        rank_text = f" (Combat Rank: {rank_names[combat_rank]})" if 0 <= combat_rank < len(rank_names) else ""
+        return f"{self.commander_name} has defeated Commander {victim}{rank_text} in combat."
+
+    # if event_name == 'Statistics':
+    #     return f"{self.commander_name}'s game statistics have been updated."
+    @event_renderer('ShipTargeted', uses_projected_states=True)
+    def _render_ship_targeted(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        ship_targeted_event = cast(ShipTargetedEvent, content)
+        if ship_targeted_event.get('TargetLocked'):
+            pilot_name = ship_targeted_event.get('PilotName', '')
+            ship_name = ship_targeted_event.get('Ship_Localised', ship_targeted_event.get('Ship', 'ship'))
+            legal_status = ship_targeted_event.get('LegalStatus', '')
+            commander_name = pilot_name.partition('$cmdr_decorate:#name=')[2].partition(';')[0]
+            local_commander_name = get_state_dict(projected_states, 'Commander').get('Name', '') if projected_states else ''
+            is_own_ship = bool(commander_name) and commander_name.casefold() == local_commander_name.casefold()
+            target_description = None
+            if pilot_name.startswith('$RolePanel2_unmanned;') and commander_name:
+                target_description = (
+                    f"your unmanned main ship, {ship_name}"
+                    if is_own_ship else f"{legal_status} unmanned {ship_name} belonging to CMDR {commander_name}"
+                )
+            elif pilot_name.startswith('$RolePanel2_crew;') and commander_name:
+                target_description = (
+                    f"your main ship, {ship_name}, steered by your NPC crew"
+                    if is_own_ship else f"{legal_status} {ship_name} steered by CMDR {commander_name}'s NPC crew"
                 )
-                return f"{self.commander_name} has been killed by a wing: {killer_descriptions}."
-            if died_event.get('KillerName'):
-                return f"{self.commander_name} has been killed by {died_event.get('KillerName')} ({died_event.get('KillerShip', 'unknown ship')}, {died_event.get('KillerRank', 'unknown rank')})."
-            return f"{self.commander_name} has been killed."
+            if target_description:
+                if ship_targeted_event.get('Subsystem_Localised'):
+                    if is_own_ship and pilot_name.startswith('$RolePanel2_unmanned;'):
+                        return f"Weapons now targeting your unmanned main ship's {ship_targeted_event.get('Subsystem_Localised')}"
+                    if is_own_ship:
+                        return f"Weapons now targeting your main ship's {ship_targeted_event.get('Subsystem_Localised')}, operated by your NPC crew"
+                    return f"Weapons now targeting {target_description}'s {ship_targeted_event.get('Subsystem_Localised')}"
+                return f"Sensors and weapons locked on to {target_description}"
+            if ship_targeted_event.get('Subsystem_Localised'):
+                return f"Weapons now targeting {legal_status} pilot {ship_targeted_event.get('PilotName_Localised')}'s {ship_targeted_event.get('Subsystem_Localised')}"
+            if ship_targeted_event.get('PilotName_Localised'):
+                return f"Sensors and weapons locked on to {legal_status} pilot {ship_targeted_event.get('PilotName_Localised')}'s {ship_targeted_event.get('Ship','ship').capitalize()}"
+            else:
+                return f"Sensors and weapons locked on to the {ship_targeted_event.get('Ship','ship').capitalize()}"
+        else:
+            return f"Weapons' target lock lost."
 
-        if event_name == 'DockingCancelled':
-            docking_cancelled_event = cast(DockingCancelledEvent, content)
-            return f"{self.commander_name} has cancelled the docking request at {docking_cancelled_event.get('StationName')}."
+    @event_renderer('UnderAttack')
+    def _render_under_attack(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        under_attack_event = cast(UnderAttackEvent, content)
+        if under_attack_event.get('Target') == 'You':
+            return f"{self.commander_name} is under attack."
+        else:
+            return f"{self.commander_name}'s {under_attack_event.get('Target')} is under attack."
+
+    @event_renderer('Bounty')
+    def _render_bounty(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        bounty_event = cast(BountyEvent, content)
+        rewards_text = ""
+        if bounty_event.get('Rewards'):
+            rewards = []
+            for reward in bounty_event.get('Rewards', []):
+                rewards.append(f"{reward.get('Reward'):,} credits from {reward.get('Faction')}")
+            rewards_text = f" ({', '.join(rewards)})"
+        target = bounty_event.get('Target_Localised', bounty_event.get('Target', 'target'))
+        return f"{self.commander_name} has collected a {bounty_event.get('TotalReward'):,} credit bounty for eliminating {target}{rewards_text}."
+
+    @event_renderer('CapShipBond')
+    def _render_cap_ship_bond(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        cap_ship_bond_event = cast(Dict[str, Any], content)
+        reward = cap_ship_bond_event.get('Reward', 0)
+        victim_faction = cap_ship_bond_event.get('VictimFaction', 'enemy')
+        awarding_faction = cap_ship_bond_event.get('AwardingFaction', 'allied')
+        return f"{self.commander_name} has received a {reward:,} credit capital ship combat bond from {awarding_faction} for combat against {victim_faction}."
+
+    @event_renderer('CargoDepot')
+    def _render_cargo_depot(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        cargo_depot_event = cast(Dict[str, Any], content)
+        mission_id = cargo_depot_event.get('MissionID', 0)
+        operation = cargo_depot_event.get('UpdateType', 'unknown')
+        commodity = cargo_depot_event.get('CargoType', 'cargo')
+        count = cargo_depot_event.get('Count', 0)
+        total = cargo_depot_event.get('TotalCount', 0)
+        return f"{self.commander_name} has {operation} {count} units of {commodity} for mission {mission_id} (Total: {total})."
+
+    @event_renderer('CommunityGoal')
+    def _render_community_goal(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
 
-        if event_name == 'EngineerContribution':
-            return None
+    @event_renderer('CrimeVictim')
+    def _render_crime_victim(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        # @ToDo: Filter only if offender isn't commander
+        # crime_victim_event = cast(Dict[str, Any], content)
+        # offender = crime_victim_event.get('Offender', 'Unknown perpetrator')
+        # crime_type = crime_victim_event.get('CrimeType', 'unknown crime')
+        # return f"{self.commander_name} has been the victim of {crime_type} by {offender}."
+        return None
 
-        if event_name == 'EngineerLegacyConvert':
-            return None
+    @event_renderer('Died')
+    def _render_died(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        died_event = cast(DiedEvent, content)
+        killers = died_event.get('Killers', [])
+        if killers:
+            killer_descriptions = ', '.join(
+                f"{killer.get('Name', 'unknown killer')} ({killer.get('Ship', 'unknown ship')}, {killer.get('Rank', 'unknown rank')})"
+                for killer in killers
+            )
+            return f"{self.commander_name} has been killed by a wing: {killer_descriptions}."
+        if died_event.get('KillerName'):
+            return f"{self.commander_name} has been killed by {died_event.get('KillerName')} ({died_event.get('KillerShip', 'unknown ship')}, {died_event.get('KillerRank', 'unknown rank')})."
+        return f"{self.commander_name} has been killed."
 
-        if event_name == 'FetchRemoteModule':
-            fetch_module_event = cast(Dict[str, Any], content)
-            module = fetch_module_event.get('StoredItem_Localised', fetch_module_event.get('StoredItem', 'a module'))
-            cost = fetch_module_event.get('TransferCost', 0)
-            time = fetch_module_event.get('TransferTime', 0)
-            if time > 0:
-                return f"{self.commander_name} has requested transfer of {module} for {cost:,} credits, arriving in {time} seconds."
-            return f"{self.commander_name} has requested immediate transfer of {module} for {cost:,} credits."
-
-        if event_name == 'FighterDestroyed':
-            return f"{self.commander_name}'s fighter has been destroyed."
-
-        if event_name == 'HeatDamage':
-            return f"{self.commander_name}'s ship is taking heat damage!"
-
-        if event_name == 'HeatWarning':
-            return f"{self.commander_name}'s ship is overheating!"
-
-        if event_name == 'HullDamage':
-            hull_damage_event = cast(HullDamageEvent, content)
-            health = hull_damage_event.get('Health', 0) * 100
-            vehicle = "fighter" if hull_damage_event.get('Fighter') else "ship"
-            return f"{self.commander_name}'s {vehicle} hull integrity at {health:.1f}%."
-
-        if event_name == 'Interdicted':
-            interdicted_event = cast(InterdictedEvent, content)
-            if interdicted_event.get('IsThargoid'):
-                interdictor = "a thargoid"
-            elif interdicted_event.get('Interdictor'):
-                interdictor = interdicted_event.get('Interdictor_Localised', interdicted_event.get('Interdictor'))
-            else:
-                interdictor = "an unknown ship"
-            
-            if interdicted_event.get('Submitted'):
-                return f"{self.commander_name} submitted when {interdictor} tried to pull them out of supercruise."
-            return f"{self.commander_name} was pulled out of supercruise by {interdictor}."
-
-        if event_name == 'Interdiction':
-            interdiction_event = cast(Dict[str, Any], content)
-            target = interdiction_event.get('Target', 'unknown ship')
-            success = interdiction_event.get('Success', False)
-            if success:
-                return f"{self.commander_name} successfully pulled {target} out of supercruise."
-            return f"{self.commander_name} failed to pull {target} out of supercruise."
-
-        if event_name == 'MassModuleStore':
-            mass_store_event = cast(Dict[str, Any], content)
-            ship = mass_store_event.get('Ship', 'current ship')
-            items = mass_store_event.get('Items', [])
-            count = len(items)
-            return f"{self.commander_name} has stored {count} modules from their {ship}."
-
-        if event_name == 'ModuleSellRemote':
-            sell_remote_event = cast(Dict[str, Any], content)
-            module = sell_remote_event.get('SellItem_Localised', sell_remote_event.get('SellItem', 'a module'))
-            price = sell_remote_event.get('SellPrice', 0)
-            return f"{self.commander_name} has sold {module} from storage for {price:,} credits."
-
-        if event_name == 'Outfitting':
-            outfitting_event = cast(OutfittingEvent, content)
-            return f"{self.commander_name} is accessing outfitting services at {outfitting_event.get('StationName')} in {outfitting_event.get('StarSystem')}."
-
-        if event_name == 'ScientificResearch':
-            research_event = cast(Dict[str, Any], content)
-            name = research_event.get('Name', 'unknown')
-            category = research_event.get('Category', 'unknown category')
-            count = research_event.get('Count', 0)
-            return f"{self.commander_name} has contributed {count} {name} for scientific research in {category}."
-
-        if event_name == 'ShieldState':
-            shield_event = cast(Dict[str, Any], content)
-            state = "online" if shield_event.get('ShieldsUp') else "offline"
-            return f"{self.commander_name}'s shields are {state}."
-
-        if event_name == 'ShipyardNew':
-            new_ship_event = cast(Dict[str, Any], content)
-            ship_type = new_ship_event.get('ShipType_Localised', new_ship_event.get('ShipType', 'a new ship'))
-            return f"{self.commander_name} has purchased {ship_type}."
-
-        if event_name == 'SRVDestroyed':
-            srv_event = cast(SRVDestroyedEvent, content)
-            srv_type = srv_event.get('SRVType_Localised', srv_event.get('SRVType', 'SRV'))
-            return f"{self.commander_name}'s {srv_type} has been destroyed."
-
-        if event_name == 'Statistics':
-            return None
+    @event_renderer('EngineerContribution')
+    def _render_engineer_contribution(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
 
-        if event_name == 'WeaponSelected':
-            weapon_event = cast(Dict[str, Any], content)
-            weapon = weapon_event.get('Weapon_Localised', weapon_event.get('Weapon', 'unknown weapon'))
-            return f"{self.commander_name} has selected {weapon}."
-
-        if event_name == 'ColonisationSystemClaim':
-            claim_event = cast(Dict[str, Any], content)
-            system = claim_event.get('StarSystem', '')
-            return f"{self.commander_name} has claimed a system {system}."
-
-        if event_name == 'ColonisationSystemClaimRelease':
-            claim_event = cast(Dict[str, Any], content)
-            system = claim_event.get('StarSystem', '')
-            return f"{self.commander_name}'s claim on system {system} has been canceled."
-
-        # Synthetic Events
-        if event_name == 'ScanOrganicTooClose':
-            return f"{self.commander_name} is now too close to take another sample. Distance must be increased."
-        if event_name == 'ScanOrganicFarEnough':
-            return f"{self.commander_name} is now far enough away to take another sample."
-        if event_name == 'ScanOrganicFirst':
-            scan_event = cast(Dict[str, Any], content)
-            new_distance = scan_event.get('NewSampleDistance', 'unknown')
-            return f"{self.commander_name} took the first of three biological samples. New sample distance acquired: {new_distance}."
-        if event_name == 'ScanOrganicSecond':
-            return f"{self.commander_name} took the second of three biological samples."
-        if event_name == 'ScanOrganicThird':
-            return f"{self.commander_name} took the third and final biological sample."
-        if event_name == 'NoScoopableStars':
-            return f"{self.commander_name}'s fuel is insufficient to reach the destination and there are not enough scoopable stars on the route. Alternative route required."
-        if event_name == 'HGECandidateFound':
-            hge_event = cast(Dict[str, Any], content or {})
-            star_system = hge_event.get('StarSystem', 'this system')
-            materials = hge_event.get('HGECandidateMaterials', [])
-
-            if not isinstance(materials, list):
-                materials = []
-
-            if materials:
-                material_text = ', '.join(str(m) for m in materials)
-                return f"{self.commander_name} has entered HGE candidate system {star_system}. Potential high-grade materials available: {material_text}."
-
-            return f"{self.commander_name} has entered HGE candidate system {star_system}."
-        if event_name == 'HighValueLandmarksBody':
-            hvl_event = cast(Dict[str, Any], content or {})
-            star_system = hvl_event.get('StarSystem', 'this system')
-            body_name = hvl_event.get('BodyName', 'Unknown body')
-            value = hvl_event.get('Value', 0)
-            total_value = hvl_event.get('TotalValue', 0)
-            try:
-                value_fmt = f"{int(value):,}" if isinstance(value, (int, float)) else str(value)
-                total_fmt = f"{int(total_value):,}" if isinstance(total_value, (int, float)) else str(total_value)
-            except (TypeError, ValueError):
-                value_fmt, total_fmt = str(value), str(total_value)
-            return (
-                f"{self.commander_name} is in system {star_system}. "
-                f"Body {body_name} has high-value landmarks: max single value {value_fmt} credits, total value {total_fmt} credits."
-            )
-        if event_name == 'RememberLimpets':
-            return f"{self.commander_name} has cargo capacity available to buy limpets. Remember to buy more."
-        if event_name == 'BountyScanned':
-            bounty_value = (content or {}).get('Bounty')
-            if isinstance(bounty_value, (int, float)):
-                return f"{self.commander_name} has scanned a wanted ship with a bounty of {int(bounty_value):,} credits."
-            return f"{self.commander_name} has scanned a wanted ship with a bounty."
-        if event_name == 'CombatEntered':
-            return f"{self.commander_name} is now in combat."
-        if event_name == 'CombatExited':
-            return f"{self.commander_name} is no longer in combat."
-        if event_name == 'QuestEvent':
-            action = content.get('action')
-            if action in ('play_sound', 'npc_message'):
-                return None
-            quest_title = content.get('quest_title') or content.get('quest_id') or 'Unknown quest'
-            if action == 'advance_stage':
-                stage_name = content.get('stage_name') or content.get('stage_id') or 'unknown stage'
-                stage_description = content.get('stage_description')
-                stage_instructions = content.get('stage_instructions')
-                details = []
-                if stage_description:
-                    details.append(stage_description)
-                if stage_instructions:
-                    details.append(f"Instructions: {stage_instructions}")
-                detail_text = f" - {' '.join(details)}" if details else ""
-                return f"Quest updated: {quest_title} advanced to stage {stage_name}{detail_text}"
-            if action == 'set_active':
-                active = content.get('active')
-                state = 'activated' if active else 'deactivated'
-                return f"Quest {state}: {quest_title}."
-            return f"Quest update: {quest_title}."
-        if event_name == 'FirstPlayerSystemDiscovered':
-            return f"{self.commander_name} has a new system discovered."
-        if event_name == 'FSSBiologicalSignals':
-            body_name = (content or {}).get('BodyName') or 'unknown body'
-            count = (content or {}).get('Count', 0)
-            return f"{self.commander_name} found {count} biological signal(s) on {body_name}."
-        if event_name == 'FetchRemoteModuleCompleted':
-            module_event = cast(Dict[str, Any], content or {})
-            module_name = module_event.get('ModuleName') or 'module'
-            station = module_event.get('StationName') or 'a station'
-            system = module_event.get('StarSystem') or 'a system'
-            return f"{self.commander_name}'s module {module_name} has arrived at {station} in {system}."
-        if event_name == 'CarrierJumpWarning':
-            carrier_event = cast(Dict[str, Any], content or {})
-            carrier_type = carrier_event.get('CarrierType') or 'carrier'
-            system = carrier_event.get('SystemName') or 'a system'
-            departure_time = carrier_event.get('DepartureTime') or 'soon'
-            return f"{self.commander_name}'s {carrier_type} will jump to {system} in about 10 minutes (departure {departure_time})."
-        if event_name == 'CarrierJumpArrived':
-            carrier_event = cast(Dict[str, Any], content or {})
-            carrier_type = carrier_event.get('CarrierType') or 'carrier'
-            system = carrier_event.get('SystemName') or 'a system'
-            return f"{self.commander_name}'s {carrier_type} has arrived in {system}."
-        if event_name == 'CarrierJumpCooldownComplete':
-            carrier_event = cast(Dict[str, Any], content or {})
-            carrier_type = carrier_event.get('CarrierType') or 'carrier'
-            return f"{self.commander_name}'s {carrier_type} is ready to jump again."
-        if event_name == 'ShipyardTransferCompleted':
-            ship_event = cast(Dict[str, Any], content or {})
-            ship_name = ship_event.get('ShipName') or ship_event.get('ShipType') or 'ship'
-            station = ship_event.get('StationName') or 'a station'
-            system = ship_event.get('StarSystem') or 'a system'
-            return f"{self.commander_name}'s ship {ship_name} has arrived at {station} in {system}."
-        # if event_name == 'ExternalDiscordNotification':
-        #     twitch_event = cast(Dict[str, Any], content)
-        #     return f"Twitch Alert! {twitch_event.get('text','')}",
-        # "SpanshTradePlanner": "The Spansh API has suggested a Trade Planner route for Commander {commanderName}.",
-        # "SpanshNeutronPlotter": "The Spansh API has suggested a Neutron Plotter router for Commander {commanderName}.",
-        # "SpanshRoadToRiches": "The Spansh API has suggested a Road-to-Riches route for Commander {commanderName}.",
-        # if event_name == 'ExternalTwitchMessage':
-        #     twitch_event = cast(Dict[str, Any], content)
-        #     return f"Message received from {twitch_event.get('username','')} on Twitch Chat: {twitch_event.get('text','')}"
-        # if event_name == 'ExternalTwitchNotification':
-        #     twitch_event = cast(Dict[str, Any], content)
-        #     return f"{self.commander_name} has received a Discord notification."
-        if event_name == 'Idle':
-            return f"Your conversation with {self.commander_name} hasgone silent for a while. Get their attention by making a joke fitting to the current situation or self-reflecting on the recent past.",
-
-        if event_name == "InDockingRange":
-            return f"{self.commander_name}'s ship is now close enough to the station to make a docking request."
-
-        if event_name == "DockingComputerDocking":
-            return f"{self.commander_name}'s ship has initiated automated docking computer"
-
-        if event_name == "DockingComputerUndocking":
-            # we know it's a station as we only trigger undocking event if we are inside a station
-            return f"{self.commander_name}'s ship has initiated automated docking computer, we are leaving the station"
-
-        if event_name == "DockingComputerDeactivated":
-            return f"{self.commander_name}'s ship has deactivated the docking computer"
-
-        if event_name == "Market":
-            return None
+    @event_renderer('EngineerLegacyConvert')
+    def _render_engineer_legacy_convert(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
+
+    @event_renderer('FetchRemoteModule')
+    def _render_fetch_remote_module(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        fetch_module_event = cast(Dict[str, Any], content)
+        module = fetch_module_event.get('StoredItem_Localised', fetch_module_event.get('StoredItem', 'a module'))
+        cost = fetch_module_event.get('TransferCost', 0)
+        time = fetch_module_event.get('TransferTime', 0)
+        if time > 0:
+            return f"{self.commander_name} has requested transfer of {module} for {cost:,} credits, arriving in {time} seconds."
+        return f"{self.commander_name} has requested immediate transfer of {module} for {cost:,} credits."
+
+    @event_renderer('FighterDestroyed')
+    def _render_fighter_destroyed(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name}'s fighter has been destroyed."
+
+    @event_renderer('HeatDamage')
+    def _render_heat_damage(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name}'s ship is taking heat damage!"
+
+    @event_renderer('HeatWarning')
+    def _render_heat_warning(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name}'s ship is overheating!"
+
+    @event_renderer('HullDamage')
+    def _render_hull_damage(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        hull_damage_event = cast(HullDamageEvent, content)
+        health = hull_damage_event.get('Health', 0) * 100
+        vehicle = "fighter" if hull_damage_event.get('Fighter') else "ship"
+        return f"{self.commander_name}'s {vehicle} hull integrity at {health:.1f}%."
+
+    @event_renderer('Interdicted')
+    def _render_interdicted(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        interdicted_event = cast(InterdictedEvent, content)
+        if interdicted_event.get('IsThargoid'):
+            interdictor = "a thargoid"
+        elif interdicted_event.get('Interdictor'):
+            interdictor = interdicted_event.get('Interdictor_Localised', interdicted_event.get('Interdictor'))
+        else:
+            interdictor = "an unknown ship"
+        
+        if interdicted_event.get('Submitted'):
+            return f"{self.commander_name} submitted when {interdictor} tried to pull them out of supercruise."
+        return f"{self.commander_name} was pulled out of supercruise by {interdictor}."
+
+    @event_renderer('Interdiction')
+    def _render_interdiction(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        interdiction_event = cast(Dict[str, Any], content)
+        target = interdiction_event.get('Target', 'unknown ship')
+        success = interdiction_event.get('Success', False)
+        if success:
+            return f"{self.commander_name} successfully pulled {target} out of supercruise."
+        return f"{self.commander_name} failed to pull {target} out of supercruise."
+
+    @event_renderer('MassModuleStore')
+    def _render_mass_module_store(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        mass_store_event = cast(Dict[str, Any], content)
+        ship = mass_store_event.get('Ship', 'current ship')
+        items = mass_store_event.get('Items', [])
+        count = len(items)
+        return f"{self.commander_name} has stored {count} modules from their {ship}."
+
+    @event_renderer('ModuleSellRemote')
+    def _render_module_sell_remote(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        sell_remote_event = cast(Dict[str, Any], content)
+        module = sell_remote_event.get('SellItem_Localised', sell_remote_event.get('SellItem', 'a module'))
+        price = sell_remote_event.get('SellPrice', 0)
+        return f"{self.commander_name} has sold {module} from storage for {price:,} credits."
+
+    @event_renderer('Outfitting')
+    def _render_outfitting(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        outfitting_event = cast(OutfittingEvent, content)
+        return f"{self.commander_name} is accessing outfitting services at {outfitting_event.get('StationName')} in {outfitting_event.get('StarSystem')}."
+
+    @event_renderer('ScientificResearch')
+    def _render_scientific_research(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        research_event = cast(Dict[str, Any], content)
+        name = research_event.get('Name', 'unknown')
+        category = research_event.get('Category', 'unknown category')
+        count = research_event.get('Count', 0)
+        return f"{self.commander_name} has contributed {count} {name} for scientific research in {category}."
+
+    @event_renderer('ShieldState')
+    def _render_shield_state(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        shield_event = cast(Dict[str, Any], content)
+        state = "online" if shield_event.get('ShieldsUp') else "offline"
+        return f"{self.commander_name}'s shields are {state}."
+
+    @event_renderer('ShipyardNew')
+    def _render_shipyard_new(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        new_ship_event = cast(Dict[str, Any], content)
+        ship_type = new_ship_event.get('ShipType_Localised', new_ship_event.get('ShipType', 'a new ship'))
+        return f"{self.commander_name} has purchased {ship_type}."
+
+    @event_renderer('SRVDestroyed')
+    def _render_srv_destroyed(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        srv_event = cast(SRVDestroyedEvent, content)
+        srv_type = srv_event.get('SRVType_Localised', srv_event.get('SRVType', 'SRV'))
+        return f"{self.commander_name}'s {srv_type} has been destroyed."
+
+    @event_renderer('Statistics')
+    def _render_statistics(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
 
-        log('debug', f'fallback for event', event_name, content)
+    @event_renderer('WeaponSelected')
+    def _render_weapon_selected(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        weapon_event = cast(Dict[str, Any], content)
+        weapon = weapon_event.get('Weapon_Localised', weapon_event.get('Weapon', 'unknown weapon'))
+        return f"{self.commander_name} has selected {weapon}."
+
+    @event_renderer('ColonisationSystemClaim')
+    def _render_colonisation_system_claim(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        claim_event = cast(Dict[str, Any], content)
+        system = claim_event.get('StarSystem', '')
+        return f"{self.commander_name} has claimed a system {system}."
+
+    @event_renderer('ColonisationSystemClaimRelease')
+    def _render_colonisation_system_claim_release(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        claim_event = cast(Dict[str, Any], content)
+        system = claim_event.get('StarSystem', '')
+        return f"{self.commander_name}'s claim on system {system} has been canceled."
+
+    # Synthetic Events
+    @event_renderer('ScanOrganicTooClose')
+    def _render_scan_organic_too_close(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} is now too close to take another sample. Distance must be increased."
+
+    @event_renderer('ScanOrganicFarEnough')
+    def _render_scan_organic_far_enough(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} is now far enough away to take another sample."
+
+    @event_renderer('ScanOrganicFirst')
+    def _render_scan_organic_first(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        scan_event = cast(Dict[str, Any], content)
+        new_distance = scan_event.get('NewSampleDistance', 'unknown')
+        return f"{self.commander_name} took the first of three biological samples. New sample distance acquired: {new_distance}."
+
+    @event_renderer('ScanOrganicSecond')
+    def _render_scan_organic_second(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} took the second of three biological samples."
+
+    @event_renderer('ScanOrganicThird')
+    def _render_scan_organic_third(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} took the third and final biological sample."
+
+    @event_renderer('NoScoopableStars')
+    def _render_no_scoopable_stars(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name}'s fuel is insufficient to reach the destination and there are not enough scoopable stars on the route. Alternative route required."
+
+    @event_renderer('HGECandidateFound')
+    def _render_hge_candidate_found(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        hge_event = cast(Dict[str, Any], content or {})
+        star_system = hge_event.get('StarSystem', 'this system')
+        materials = hge_event.get('HGECandidateMaterials', [])
+
+        if not isinstance(materials, list):
+            materials = []
+
+        if materials:
+            material_text = ', '.join(str(m) for m in materials)
+            return f"{self.commander_name} has entered HGE candidate system {star_system}. Potential high-grade materials available: {material_text}."
+
+        return f"{self.commander_name} has entered HGE candidate system {star_system}."
+
+    @event_renderer('HighValueLandmarksBody')
+    def _render_high_value_landmarks_body(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        hvl_event = cast(Dict[str, Any], content or {})
+        star_system = hvl_event.get('StarSystem', 'this system')
+        body_name = hvl_event.get('BodyName', 'Unknown body')
+        value = hvl_event.get('Value', 0)
+        total_value = hvl_event.get('TotalValue', 0)
+        try:
+            value_fmt = f"{int(value):,}" if isinstance(value, (int, float)) else str(value)
+            total_fmt = f"{int(total_value):,}" if isinstance(total_value, (int, float)) else str(total_value)
+        except (TypeError, ValueError):
+            value_fmt, total_fmt = str(value), str(total_value)
+        return (
+            f"{self.commander_name} is in system {star_system}. "
+            f"Body {body_name} has high-value landmarks: max single value {value_fmt} credits, total value {total_fmt} credits."
+        )
 
-        return f"Event: {event_name}\n{yaml.dump(content)}"
+    @event_renderer('RememberLimpets')
+    def _render_remember_limpets(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has cargo capacity available to buy limpets. Remember to buy more."
+
+    @event_renderer('BountyScanned')
+    def _render_bounty_scanned(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        bounty_value = (content or {}).get('Bounty')
+        if isinstance(bounty_value, (int, float)):
+            return f"{self.commander_name} has scanned a wanted ship with a bounty of {int(bounty_value):,} credits."
+        return f"{self.commander_name} has scanned a wanted ship with a bounty."
+
+    @event_renderer('CombatEntered')
+    def _render_combat_entered(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} is now in combat."
+
+    @event_renderer('CombatExited')
+    def _render_combat_exited(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} is no longer in combat."
+
+    @event_renderer('QuestEvent')
+    def _render_quest_event(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        action = content.get('action')
+        if action in ('play_sound', 'npc_message'):
+            return None
+        quest_title = content.get('quest_title') or content.get('quest_id') or 'Unknown quest'
+        if action == 'advance_stage':
+            stage_name = content.get('stage_name') or content.get('stage_id') or 'unknown stage'
+            stage_description = content.get('stage_description')
+            stage_instructions = content.get('stage_instructions')
+            details = []
+            if stage_description:
+                details.append(stage_description)
+            if stage_instructions:
+                details.append(f"Instructions: {stage_instructions}")
+            detail_text = f" - {' '.join(details)}" if details else ""
+            return f"Quest updated: {quest_title} advanced to stage {stage_name}{detail_text}"
+        if action == 'set_active':
+            active = content.get('active')
+            state = 'activated' if active else 'deactivated'
+            return f"Quest {state}: {quest_title}."
+        return f"Quest update: {quest_title}."
+
+    @event_renderer('FirstPlayerSystemDiscovered')
+    def _render_first_player_system_discovered(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name} has a new system discovered."
+
+    @event_renderer('FSSBiologicalSignals')
+    def _render_fss_biological_signals(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        body_name = (content or {}).get('BodyName') or 'unknown body'
+        count = (content or {}).get('Count', 0)
+        return f"{self.commander_name} found {count} biological signal(s) on {body_name}."
+
+    @event_renderer('FetchRemoteModuleCompleted')
+    def _render_fetch_remote_module_completed(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        module_event = cast(Dict[str, Any], content or {})
+        module_name = module_event.get('ModuleName') or 'module'
+        station = module_event.get('StationName') or 'a station'
+        system = module_event.get('StarSystem') or 'a system'
+        return f"{self.commander_name}'s module {module_name} has arrived at {station} in {system}."
+
+    @event_renderer('CarrierJumpWarning')
+    def _render_carrier_jump_warning(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_event = cast(Dict[str, Any], content or {})
+        carrier_type = carrier_event.get('CarrierType') or 'carrier'
+        system = carrier_event.get('SystemName') or 'a system'
+        departure_time = carrier_event.get('DepartureTime') or 'soon'
+        return f"{self.commander_name}'s {carrier_type} will jump to {system} in about 10 minutes (departure {departure_time})."
+
+    @event_renderer('CarrierJumpArrived')
+    def _render_carrier_jump_arrived(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_event = cast(Dict[str, Any], content or {})
+        carrier_type = carrier_event.get('CarrierType') or 'carrier'
+        system = carrier_event.get('SystemName') or 'a system'
+        return f"{self.commander_name}'s {carrier_type} has arrived in {system}."
+
+    @event_renderer('CarrierJumpCooldownComplete')
+    def _render_carrier_jump_cooldown_complete(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        carrier_event = cast(Dict[str, Any], content or {})
+        carrier_type = carrier_event.get('CarrierType') or 'carrier'
+        return f"{self.commander_name}'s {carrier_type} is ready to jump again."
+
+    @event_renderer('ShipyardTransferCompleted')
+    def _render_shipyard_transfer_completed(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        ship_event = cast(Dict[str, Any], content or {})
+        ship_name = ship_event.get('ShipName') or ship_event.get('ShipType') or 'ship'
+        station = ship_event.get('StationName') or 'a station'
+        system = ship_event.get('StarSystem') or 'a system'
+        return f"{self.commander_name}'s ship {ship_name} has arrived at {station} in {system}."
+
+    # if event_name == 'ExternalDiscordNotification':
+    #     twitch_event = cast(Dict[str, Any], content)
+    #     return f"Twitch Alert! {twitch_event.get('text','')}",
+    # "SpanshTradePlanner": "The Spansh API has suggested a Trade Planner route for Commander {commanderName}.",
+    # "SpanshNeutronPlotter": "The Spansh API has suggested a Neutron Plotter router for Commander {commanderName}.",
+    # "SpanshRoadToRiches": "The Spansh API has suggested a Road-to-Riches route for Commander {commanderName}.",
+    # if event_name == 'ExternalTwitchMessage':
+    #     twitch_event = cast(Dict[str, Any], content)
+    #     return f"Message received from {twitch_event.get('username','')} on Twitch Chat: {twitch_event.get('text','')}"
+    # if event_name == 'ExternalTwitchNotification':
+    #     twitch_event = cast(Dict[str, Any], content)
+    #     return f"{self.commander_name} has received a Discord notification."
+    @event_renderer('Idle')
+    def _render_idle(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"Your conversation with {self.commander_name} hasgone silent for a while. Get their attention by making a joke fitting to the current situation or self-reflecting on the recent past.",
+
+    @event_renderer('InDockingRange')
+    def _render_in_docking_range(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name}'s ship is now close enough to the station to make a docking request."
+
+    @event_renderer('DockingComputerDocking')
+    def _render_docking_computer_docking(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name}'s ship has initiated automated docking computer"
+
+    @event_renderer('DockingComputerUndocking')
+    def _render_docking_computer_undocking(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        # we know it's a station as we only trigger undocking event if we are inside a station
+        return f"{self.commander_name}'s ship has initiated automated docking computer, we are leaving the station"
+
+    @event_renderer('DockingComputerDeactivated')
+    def _render_docking_computer_deactivated(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return f"{self.commander_name}'s ship has deactivated the docking computer"
+
+    @event_renderer('Market')
+    def _render_market(self, content: Any, projected_states: ProjectedStates | None) -> str | None:
+        return None
 
     def get_status_event_template(self, event: StatusEvent):
         status: Any = event.status
@@ -2987,10 +3374,64 @@ class PromptGenerator:
         return quests
 
     def generate_status_message(self, projected_states: ProjectedStates, search_agent_context: bool = False):
+        """
+        Renders the status sections as YAML. When the projection revisions are known, a section whose projections
+        (and derived values like the vehicle) didn't change since the last call reuses its previously rendered text.
+        """
+        revisions = self.get_projection_revisions() if self.get_projection_revisions else None
+        current_status = get_state_dict(projected_states, 'CurrentStatus')
+
+        rendered_sections: list[str] = []
+        for name, projection_names, get_extra_key, build_section in self.status_sections:
+            key = None
+            if revisions is not None:
+                extra_key = get_extra_key(current_status, projected_states) if get_extra_key else None
+                key = (search_agent_context, tuple(revisions.get(projection_name) for projection_name in projection_names), extra_key)
+                cached = self._status_section_cache.get((name, search_agent_context))
+                if cached is not None and cached[0] == key:
+                    if cached[1]:
+                        rendered_sections.append(cached[1])
+                    continue
+
+            status_entries, cacheable = build_section(projected_states, search_agent_context)
+            rendered = self._render_status_entries(status_entries)
+            if key is not None and cacheable:
+                self._status_section_cache[(name, search_agent_context)] = (key, rendered)
+            if rendered:
+                rendered_sections.append(rendered)
+
+        # Format and return the final status message
+        return "\n\n".join(rendered_sections)
+
+    def set_projection_revisions(self, get_projection_revisions: Callable[[], dict[str, int]] | None):
+        """Enables the status section cache, the revisions must describe the projected states passed to generate_status_message."""
+        self.get_projection_revisions = get_projection_revisions
+        self._status_section_cache.clear()
+
+    def _render_status_entries(self, status_entries: list[tuple[str, Any]]) -> str:
+        return "\n\n".join(['# '+entry[0]+'\n' + yaml.dump(entry[1], Dumper=StatusDumper, sort_keys=False) for entry in status_entries])
+
+    def _get_vehicle_key(self, current_status: dict, projected_states: ProjectedStates) -> tuple:
+        flags = current_status.get('flags') or {}
+        flags2 = current_status.get('flags2') or {}
+        return (
+            bool(current_status.get('Fuel')),
+            flags.get('InMainShip'), flags.get('InFighter'), flags.get('InSRV'), flags2.get('OnFoot'),
+            # the section shows the current time with minute resolution
+            datetime.now().strftime('%Y-%m-%d %H:%M'),
+        )
+
+    def _get_location_key(self, current_status: dict, projected_states: ProjectedStates) -> Any:
+        location = projected_states.get('Location')
+        system_name = location.get('StarSystem') if isinstance(location, dict) else getattr(location, 'StarSystem', None)
+        # stations and bodies are fetched in the background and updated by scans, neither changes the Location projection
+        data_version = self.system_db.get_data_version(system_name) if system_name else None
+        return current_status.get('Altitude', None), data_version
+
+    def _build_vehicle_status_section(self, projected_states: ProjectedStates, search_agent_context: bool) -> tuple[list[tuple[str, Any]], bool]:
         status_entries: list[tuple[str, Any]] = []
 
         current_status = get_state_dict(projected_states, 'CurrentStatus')
-        status_fuel = current_status.get('Fuel')
         gravity = current_status.get('Gravity', None)
         if gravity:
             status_entries.append(("Gravity", gravity))
@@ -3010,6 +3451,17 @@ class PromptGenerator:
             if guifocus != "NoFocus":
                 status_entries.append(("Current active window: ", guifocus))
 
+        return status_entries, True
+
+    def _build_ship_section(self, projected_states: ProjectedStates, search_agent_context: bool) -> tuple[list[tuple[str, Any]], bool]:
+        status_entries: list[tuple[str, Any]] = []
+
+        current_status = get_state_dict(projected_states, 'CurrentStatus')
+        status_fuel = current_status.get('Fuel')
+        in_combat = get_state_dict(projected_states, 'InCombat')
+        ship_info = get_state_dict(projected_states, 'ShipInfo')
+        active_mode, _ = self.generate_vehicle_status(current_status, in_combat, ship_info)
+
         # Get ship and cargo info
         cargo_info = get_state_dict(projected_states, 'Cargo')
         fighters = ship_info.get('Fighters', [])
@@ -3242,6 +3694,15 @@ class PromptGenerator:
 
         status_entries.append(("Main Ship", ship_display))
 
+        # the remaining rebuild time of fighters changes every second
+        cacheable = not any(fighter.get('Status') == 'BeingRebuilt' for fighter in fighters)
+        return status_entries, cacheable
+
+    def _build_location_section(self, projected_states: ProjectedStates, search_agent_context: bool) -> tuple[list[tuple[str, Any]], bool]:
+        status_entries: list[tuple[str, Any]] = []
+        cacheable = True
+
+        current_status = get_state_dict(projected_states, 'CurrentStatus')
         # Get location info
         location_info = get_state_dict(projected_states, 'Location')
         
@@ -3292,6 +3753,13 @@ class PromptGenerator:
                     status_entries.append(("Factions in local system", self.format_local_factions(system_factions)))
                 status_entries.append(("Stations in local system (in ls to primary star)", stations_info))
                 status_entries.append(("Bodies in local system", bodies_info))
+            # the system info is fetched in the background, until it arrives the section is rebuilt every time
+            cacheable = system_info is not None
+
+        return status_entries, cacheable
+
+    def _build_community_goal_section(self, projected_states: ProjectedStates, search_agent_context: bool) -> tuple[list[tuple[str, Any]], bool]:
+        status_entries: list[tuple[str, Any]] = []
 
         # Community Goal
         community_goal = get_state_dict(projected_states, 'CommunityGoal')
@@ -3324,6 +3792,12 @@ class PromptGenerator:
                 
                 status_entries.append(("Community Goals", goals_info))
 
+        return status_entries, True
+
+    def _build_nav_route_section(self, projected_states: ProjectedStates, search_agent_context: bool) -> tuple[list[tuple[str, Any]], bool]:
+        status_entries: list[tuple[str, Any]] = []
+        cacheable = True
+
         # Nav Route 
         nav_info = get_state_dict(projected_states, 'NavInfo')
         if nav_info and nav_info.get("NavRoute"):
@@ -3355,6 +3829,9 @@ class PromptGenerator:
                             for key in ["Government", "Population", "Unexplored", "Economy"]:
                                 if key in formatted_info:
                                     system_data[key] = formatted_info[key]
+                    else:
+                        # system data is fetched in the background, render the route again once it arrived
+                        cacheable = False
                 
                 enhanced_nav_route.append(system_data)
             
@@ -3368,6 +3845,11 @@ class PromptGenerator:
             
             status_entries.append((nav_route_title, enhanced_nav_route_dict))
 
+        return status_entries, cacheable
+
+    def _build_target_section(self, projected_states: ProjectedStates, search_agent_context: bool) -> tuple[list[tuple[str, Any]], bool]:
+        status_entries: list[tuple[str, Any]] = []
+
         # Target
         if not search_agent_context:
             target_info = get_state_dict(projected_states, 'Target')
@@ -3376,8 +3858,10 @@ class PromptGenerator:
             if target_info.get('Ship', False):
                 status_entries.append(("Weapons' target", target_info))
 
-        # Market and station information
-        storedModules = get_state_dict(projected_states, 'StoredModules')
+        return status_entries, True
+
+    def _build_fleet_carrier_section(self, projected_states: ProjectedStates, search_agent_context: bool) -> tuple[list[tuple[str, Any]], bool]:
+        status_entries: list[tuple[str, Any]] = []
 
         fleet_carriers = get_state_dict(projected_states, 'FleetCarriers')
         carriers = fleet_carriers.get('Carriers', {})
@@ -3397,6 +3881,15 @@ class PromptGenerator:
                 carrier_entries.append(f"{name} ({type_label}): {star_system} system")
             status_entries.append(("Fleet Carriers", carrier_entries))
 
+        return status_entries, True
+
+    def _build_transit_section(self, projected_states: ProjectedStates, search_agent_context: bool) -> tuple[list[tuple[str, Any]], bool]:
+        status_entries: list[tuple[str, Any]] = []
+        cacheable = True
+
+        location_info = get_state_dict(projected_states, 'Location')
+        storedModules = get_state_dict(projected_states, 'StoredModules')
+
         # Show modules in transit to current system
         if len(storedModules.get('ItemsInTransit', [])) > 0:
             current_system = location_info.get('StarSystem')
@@ -3440,6 +3933,8 @@ class PromptGenerator:
                     })
 
             if itemsInTransit:
+                # the remaining transfer time changes every second
+                cacheable = False
                 status_entries.append(("Modules in transit to this system", itemsInTransit))
 
         # Show ships in transit to current system
@@ -3491,8 +3986,14 @@ class PromptGenerator:
                     })
 
             if shipsInTransit:
+                # the remaining transfer time changes every second
+                cacheable = False
                 status_entries.append(("Ships in transit to this system", shipsInTransit))
 
+        return status_entries, cacheable
+
+    def _build_missions_section(self, projected_states: ProjectedStates, search_agent_context: bool) -> tuple[list[tuple[str, Any]], bool]:
+        status_entries: list[tuple[str, Any]] = []
 
         # Missions
         missions_info = get_state_dict(projected_states, 'Missions')
@@ -3500,6 +4001,11 @@ class PromptGenerator:
         if missions_info and 'Active' in missions_info:
             status_entries.append(("Active missions", missions_info))
 
+        return status_entries, True
+
+    def _build_quest_section(self, projected_states: ProjectedStates, search_agent_context: bool) -> tuple[list[tuple[str, Any]], bool]:
+        status_entries: list[tuple[str, Any]] = []
+
         active_quest_entries = self._get_active_quest_entries()
         if active_quest_entries and len(active_quest_entries) > 0:
             if len(active_quest_entries) == 1:
@@ -3507,6 +4013,12 @@ class PromptGenerator:
             else:
                 status_entries.append(("Active quests", active_quest_entries))
 
+        # quests are not projected, this section is always rendered
+        return status_entries, False
+
+    def _build_colonisation_section(self, projected_states: ProjectedStates, search_agent_context: bool) -> tuple[list[tuple[str, Any]], bool]:
+        status_entries: list[tuple[str, Any]] = []
+
         # Add colonisation construction status if available
         colonisation_info = get_state_dict(projected_states, 'ColonisationConstruction')
         if colonisation_info and colonisation_info.get('StarSystem', 'Unknown') != 'Unknown':
@@ -3540,6 +4052,11 @@ class PromptGenerator:
 
             status_entries.append(("Colonisation Construction", construction_status))
 
+        return status_entries, True
+
+    def _build_friends_section(self, projected_states: ProjectedStates, search_agent_context: bool) -> tuple[list[tuple[str, Any]], bool]:
+        status_entries: list[tuple[str, Any]] = []
+
         # Add friends status (always include this entry)
         if not search_agent_context:
             friends_info = get_state_dict(projected_states, 'Friends')
@@ -3554,6 +4071,11 @@ class PromptGenerator:
             else:
                 status_entries.append(("Friends Status", "No friends currently online"))
 
+        return status_entries, True
+
+    def _build_engineers_section(self, projected_states: ProjectedStates, search_agent_context: bool) -> tuple[list[tuple[str, Any]], bool]:
+        status_entries: list[tuple[str, Any]] = []
+
         # Engineer status
         engineer_systems = {
             "Tod 'The Blaster' McQuinn": "Wolf 397",
@@ -3609,7 +4131,12 @@ class PromptGenerator:
 
             if available_engineers:
                 status_entries.append(("Available Engineers and their home system", available_engineers))
-        
+
+        return status_entries, True
+
+    def _build_plugin_status_section(self, projected_states: ProjectedStates, search_agent_context: bool) -> tuple[list[tuple[str, Any]], bool]:
+        status_entries: list[tuple[str, Any]] = []
+
         # Process plugin status messages
         for status_generator in self.registered_status_generators:
             try:
@@ -3617,32 +4144,18 @@ class PromptGenerator:
             except Exception as e:
                 log('error', f"Error executing status generator: {e}", traceback.format_exc())
 
-        def float_representer(dumper, value):
-            text = '{:.3f}'.format(value)
-            if '.' in text:
-                text = text.rstrip('0').rstrip('.')
-            # Check if it's effectively an integer (no decimal part left or was never there)
-            if '.' not in text or text.endswith('.'):
-                text = text.rstrip('.')
-                return dumper.represent_scalar('tag:yaml.org,2002:int', text)
-            return dumper.represent_scalar('tag:yaml.org,2002:float', text)
-
-        class CustomDumper(yaml.SafeDumper):
-            pass
-
-        CustomDumper.add_representer(float, float_representer)
-
-        # Format and return the final status message
-        return "\n\n".join(['# '+entry[0]+'\n' + yaml.dump(entry[1], Dumper=CustomDumper, sort_keys=False) for entry in status_entries])
+        # plugins can read anything, this section is always rendered
+        return status_entries, False
 
     # TODO use events as passed from db, not in mem copy, pending (new not yet reated to), short_term (reacted to but not yet part of summary memory), memories (historc summaries of events)
     @observe()
     def generate_prompt(self, events: list[Event], projected_states: ProjectedStates, pending_events: list[Event], memories: list[MemoryEvent]) -> tuple[list[dict[str, str]], PromptUsageStats]:
+        if self.cache_friendly_layout:
+            return self._generate_cache_friendly_prompt(events, projected_states, pending_events, memories)
+
         # Fine the most recent event
         last_event = events[-1]
-        reference_time = datetime.fromisoformat(last_event.content.get('timestamp') if isinstance(last_event, GameEvent) else last_event.timestamp)
-        if not reference_time.tzinfo:
-            reference_time = reference_time.astimezone()
+        reference_time = self._get_event_time(last_event)
 
         # Collect the last 50 conversational pieces
         conversational_pieces: list = list()
@@ -3654,78 +4167,90 @@ class PromptGenerator:
             if len(conversational_pieces) >= 50:
                 break
 
-            is_pending = event in pending_events
-            event_time = datetime.fromisoformat(
-                event.content.get('timestamp') if isinstance(event, GameEvent) else event.timestamp)
-            if not event_time.tzinfo:
-                event_time = event_time.astimezone()
-
-            delta = reference_time - event_time
+            delta = reference_time - self._get_event_time(event)
             if delta.total_seconds() < 60:
                 time_offset = "less than a minute ago"
             else:
                 time_offset = humanize.naturaltime(delta)
-            
-            piece = None
 
-            if isinstance(event, GameEvent) or isinstance(event, ProjectedEvent) or isinstance(event, ExternalEvent) or isinstance(event, QuestEvent):
-                # Skip disabled events
-                event_type = event.content.get('event')
-                if event_type in self.disabled_game_events:
-                    continue
+            pieces = self._history_pieces(event, time_offset, event in pending_events, projected_states, len(conversational_pieces) < 20)
+            for piece in pieces:
+                conversational_pieces.append(piece)
+                usage_stats.conversation_chars += len(json.dumps(piece))
 
-                if len(conversational_pieces) < 20:
-                    is_important = is_pending and event_type in self.important_game_events
-                    message = self.event_message(event, time_offset, is_important, projected_states)
-                    if message:
-                        piece = message
-                        conversational_pieces.append(piece)
-
-            if isinstance(event, StatusEvent):
-                # Skip disabled events
-                event_type = event.status.get('event')
-                if event_type in self.disabled_game_events:
-                    continue
+        status_msg_content = self.generate_status_message(projected_states)
+        usage_stats.status_chars = len(status_msg_content)
+        conversational_pieces.append(
+            {
+                "role": "user",
+                "content": status_msg_content,
+            }
+        )
+        
+        conversational_pieces += self._memory_pieces(memories, usage_stats)
 
-                if (
-                    len(conversational_pieces) < 20
-                    and event_type != "Status"
-                ):
-                    is_important = is_pending and event_type in self.important_game_events
-                    message = self.status_messages(event, time_offset, is_important)
-                    if message:
-                        piece = message
-                        conversational_pieces.append(piece)
-
-            if isinstance(event, ConversationEvent) and event.kind in ['user', 'assistant']:
-                piece = self.conversation_message(event)
-                conversational_pieces.append(piece)
+        system_piece = self._system_piece(usage_stats)
+        if system_piece:
+            conversational_pieces.append(system_piece)
+            usage_stats.cacheable_prefix_chars = len(json.dumps([system_piece])) - 1
 
-            if isinstance(event, QuestEvent):
-                quest_piece = self.quest_conversation_message(event)
-                if quest_piece:
-                    piece = quest_piece
-                    conversational_pieces.append(piece)
+        conversational_pieces.reverse()  # Restore the original order
 
-            if isinstance(event, ToolEvent):
-                tool_messages = self.tool_messages(event)
-                conversational_pieces += tool_messages
+        self._log_prompt_change(conversational_pieces, usage_stats)
 
-            for handler in self.registered_prompt_event_handlers:
-                try:
-                    res = handler(event)
-                    if res:
-                        piece = {
-                            "role": "user",
-                            "content": f"[External Event, {time_offset}] {res}",
-                        }
-                        conversational_pieces += [piece]
-                except Exception as e:
-                    log('error', f"Error executing prompt event handler for {event}: {e}", traceback.format_exc())
-            
-            # If we added a single piece, add its length to history
-            if piece:
+        return conversational_pieces, usage_stats
+
+    def _generate_cache_friendly_prompt(self, events: list[Event], projected_states: ProjectedStates, pending_events: list[Event], memories: list[MemoryEvent]) -> tuple[list[dict[str, str]], PromptUsageStats]:
+        """
+        Lays the prompt out as an append-only prefix (system prompt, then the history with absolute timestamps)
+        followed by the volatile tail (memories, then the status). The history window starts at an anchored event and
+        only grows, until it exceeds `history_max_pieces` and is cut back to the newest `history_min_pieces`, so
+        consecutive prompts share everything up to the newest events and the provider can serve it from its prompt cache.
+        """
+        usage_stats = PromptUsageStats()
+
+        entries: list[tuple[tuple, list[dict], bool]] = []
+        piece_count = 0
+        anchor_found = False
+        for event in events[::-1]:
+            event_key = (event.kind, event.timestamp, event.processed_at)
+            is_pending = event in pending_events
+            pieces = self._history_pieces(event, self._format_event_time(self._get_event_time(event)), is_pending, projected_states, True)
+            entries.append((event_key, pieces, is_pending))
+            piece_count += len(pieces)
+            if event_key == self._history_anchor:
+                anchor_found = True
+                break
+            if piece_count > self.history_max_pieces:
+                break
+
+        if not anchor_found or piece_count > self.history_max_pieces:
+            # start a new window with the newest events, the history is no longer reused from here on
+            kept_count = 0
+            for index, (event_key, pieces, _) in enumerate(entries):
+                kept_count += len(pieces)
+                if kept_count >= self.history_min_pieces:
+                    entries = entries[:index + 1]
+                    break
+            self._history_anchor = entries[-1][0] if entries else None
+
+        conversational_pieces: list = []
+        system_piece = self._system_piece(usage_stats)
+        if system_piece:
+            conversational_pieces.append(system_piece)
+
+        # responded events don't change anymore, the pending ones may lose their IMPORTANT marker on the next reply
+        cacheable_piece_count = len(conversational_pieces)
+        for _, pieces, is_pending in reversed(entries):
+            for piece in reversed(pieces):
+                conversational_pieces.append(piece)
                 usage_stats.conversation_chars += len(json.dumps(piece))
+            if not is_pending and cacheable_piece_count == len(conversational_pieces) - len(pieces):
+                cacheable_piece_count = len(conversational_pieces)
+        if cacheable_piece_count:
+            usage_stats.cacheable_prefix_chars = len(json.dumps(conversational_pieces[:cacheable_piece_count])) - 1
+
+        conversational_pieces += reversed(self._memory_pieces(memories, usage_stats))
 
         status_msg_content = self.generate_status_message(projected_states)
         usage_stats.status_chars = len(status_msg_content)
@@ -3735,21 +4260,87 @@ class PromptGenerator:
                 "content": status_msg_content,
             }
         )
-        
-        # Add memories
-        memory_pieces_count = 0
+
+        self._log_prompt_change(conversational_pieces, usage_stats)
+
+        return conversational_pieces, usage_stats
+
+    def _get_event_time(self, event: Event) -> datetime:
+        event_time = datetime.fromisoformat(
+            event.content.get('timestamp') if isinstance(event, GameEvent) else event.timestamp)
+        if not event_time.tzinfo:
+            event_time = event_time.astimezone()
+        return event_time
+
+    def _format_event_time(self, event_time: datetime) -> str:
+        # Elite Dangerous time (minute resolution), in local time like the elite_time of the status
+        event_time = event_time.astimezone()
+        return f"{event_time.year + 1286}-{event_time.strftime('%m-%d %H:%M')}"
+
+    def _history_pieces(self, event: Event, time_label: str, is_pending: bool, projected_states: ProjectedStates, include_game_events: bool) -> list[dict]:
+        """Returns the conversational pieces of a single event, newest first like the history is collected."""
+        pieces: list = []
+
+        if isinstance(event, GameEvent) or isinstance(event, ProjectedEvent) or isinstance(event, ExternalEvent) or isinstance(event, QuestEvent):
+            # Skip disabled events
+            event_type = event.content.get('event')
+            if event_type in self.disabled_game_events:
+                return pieces
+
+            if include_game_events:
+                is_important = is_pending and event_type in self.important_game_events
+                message = self.event_message(event, time_label, is_important, projected_states)
+                if message:
+                    pieces.append(message)
+
+        if isinstance(event, StatusEvent):
+            # Skip disabled events
+            event_type = event.status.get('event')
+            if event_type in self.disabled_game_events:
+                return pieces
+
+            if include_game_events and event_type != "Status":
+                is_important = is_pending and event_type in self.important_game_events
+                message = self.status_messages(event, time_label, is_important)
+                if message:
+                    pieces.append(message)
+
+        if isinstance(event, ConversationEvent) and event.kind in ['user', 'assistant']:
+            pieces.append(self.conversation_message(event))
+
+        if isinstance(event, QuestEvent):
+            quest_piece = self.quest_conversation_message(event)
+            if quest_piece:
+                pieces.append(quest_piece)
+
+        if isinstance(event, ToolEvent):
+            pieces += self.tool_messages(event)
+
+        for handler in self.registered_prompt_event_handlers:
+            try:
+                res = handler(event)
+                if res:
+                    pieces.append({
+                        "role": "user",
+                        "content": f"[External Event, {time_label}] {res}",
+                    })
+            except Exception as e:
+                log('error', f"Error executing prompt event handler for {event}: {e}", traceback.format_exc())
+
+        return pieces
+
+    def _memory_pieces(self, memories: list[MemoryEvent], usage_stats: PromptUsageStats) -> list[dict]:
+        """Returns the memory pieces newest first."""
+        memory_pieces: list = []
         for event in memories:
-            if memory_pieces_count > 5:
+            if len(memory_pieces) > 5:
                 break
-            memory_pieces_count += 1
 
             if isinstance(event, MemoryEvent):
                 event_time = datetime.fromtimestamp(
                     cast(float,event.metadata.get('time_until', 0.0)),
                     tz=timezone.utc
                 )
-                if not event_time.tzinfo:
-                    event_time = event_time.astimezone()
 
                 # Elite Dangerous time (minute resolution)
                 ed_year = event_time.year + 1286
@@ -3757,11 +4348,13 @@ class PromptGenerator:
 
                 memory_content = f"[Ship logbook, {timestamp}] {event.content}"
                 usage_stats.memory_chars += len(memory_content)
-                conversational_pieces.append({
+                memory_pieces.append({
                     "role": "user",
                     "content": memory_content,
                 })
+        return memory_pieces
 
+    def _system_piece(self, usage_stats: PromptUsageStats) -> dict | None:
         try:
             system_prompt_content = "The universe of Elite:Dangerous is your reality. Never mention it or refer to it as a game. " \
                     + "I will provide game events in parentheses; do not create new ones. Only react to game events marked with 'IMPORTANT:'.  " \
@@ -3774,24 +4367,23 @@ class PromptGenerator:
                     + "Your character prompt is: " + self.character_prompt.format(commander_name=self.commander_name)
             
             usage_stats.system_chars = len(system_prompt_content)
-            conversational_pieces.append(
-                {
-                    "role": "system",
-                    "content": system_prompt_content,
-                }
-            )
+            return {
+                "role": "system",
+                "content": system_prompt_content,
+            }
         except Exception as e:
             log('error', e, traceback.format_exc())
             log('error', 'Invalid character prompt, please keep the {commander_name} placeholder in the prompt.')
+            return None
 
-        conversational_pieces.reverse()  # Restore the original order
-
+    def _log_prompt_change(self, conversational_pieces: list, usage_stats: PromptUsageStats):
         #log('debug', 'states', json.dumps(projected_states))
         prompt_json = json.dumps(conversational_pieces)
         log('debug', 'conversation', prompt_json)
         if self.previous_prompt_json:
             # find first changed character position, debug log the previous and next 30 characters
-            for i in range(min(len(self.previous_prompt_json), len(prompt_json))):
+            usage_stats.reuse_chars = min(len(self.previous_prompt_json), len(prompt_json))
+            for i in range(usage_stats.reuse_chars):
                 if self.previous_prompt_json[i] != prompt_json[i]:
                     start = max(0, i - 30)
                     end = min(len(prompt_json), i + 30)
@@ -3799,12 +4391,17 @@ class PromptGenerator:
                     usage_stats.reuse_chars = i
                     break
         self.previous_prompt_json = prompt_json
-
-        return conversational_pieces, usage_stats
     
     def register_prompt_event_handler(self, prompt_event_handler: Callable[[Event], str|None]):
         self.registered_prompt_event_handlers.append(prompt_event_handler)
     
+    def register_event_renderer(self, event_name: str, renderer: EventRenderer):
+        """Replaces the template for `event_name`. Registered renderers are never memoized, since they may depend on outside state."""
+        self.event_renderers[event_name] = renderer
+        self.cacheable_event_templates.discard(event_name)
+        with self._event_template_cache_lock:
+            self._event_template_cache.clear()
+
     def register_status_generator(self, status_generator: Callable[[dict[str, dict]], list[tuple [str, Any]]]):
         self.registered_status_generators.append(status_generator)
 
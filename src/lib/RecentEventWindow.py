@@ -0,0 +1,129 @@
+import threading
+from bisect import bisect_right
+from typing import Any
+
+from .Database import EventStore
+from .Event import ConversationEvent, Event, ToolEvent
+
+
+class RecentEventWindow:
+    """
+    In-memory copy of the newest not yet memorized events of an EventStore, ordered by processed_at, with their
+    responded/memorized markers kept in sync with the store. Writes go to both, reads are served from memory,
+    so the store is only queried once at startup and for reads that reach past the events kept in memory.
+    """
+
+    def __init__(self, store: EventStore, max_size: int = 1000):
+        self.store = store
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # oldest first, _processed_at holds the sort key of every event
+        self._events: list[Event] = []
+        self._processed_at: list[float] = []
+        # the leading events that are known to be responded, replied_before continues from there
+        self._responded_count = 0
+        # whether older unmemorized events were dropped from memory and only exist in the store
+        self._truncated = False
+        self._conversational_count = 0
+        self.reload()
+
+    def reload(self) -> None:
+        """Replaces the events in memory with the latest ones of the store, e.g. after a rolled back transaction."""
+        events = self.store.get_latest(limit=self.max_size)
+        with self._lock:
+            self._events = list(reversed(events))
+            self._processed_at = [event.processed_at for event in self._events]
+            self._truncated = len(events) >= self.max_size
+            self._recount()
+
+    def _recount(self) -> None:
+        self._conversational_count = sum(1 for event in self._events if self._is_conversational(event))
+        self._responded_count = 0
+        while self._responded_count < len(self._events) and self._events[self._responded_count].responded_at is not None:
+            self._responded_count += 1
+
+    def _is_conversational(self, event: Event) -> bool:
+        return isinstance(event, (ConversationEvent, ToolEvent))
+
+    def insert_event(self, event: Event, processed_at: float, commit: bool = True) -> None:
+        self.store.insert_event(event, processed_at, commit=commit)
+        # same values as the freshly inserted row
+        event.processed_at = processed_at
+        event.memorized_at = None
+        event.responded_at = None
+        with self._lock:
+            index = len(self._events)
+            if self._processed_at and processed_at < self._processed_at[-1]:
+                # events replayed with an older timestamp, e.g. projected from history
+                index = bisect_right(self._processed_at, processed_at)
+            self._events.insert(index, event)
+            self._processed_at.insert(index, processed_at)
+            self._responded_count = min(self._responded_count, index)
+            if self._is_conversational(event):
+                self._conversational_count += 1
+            # dropped in batches, so a full window doesn't shift the list on every insert
+            if len(self._events) > self.max_size + self.max_size // 4:
+                self._drop_oldest(len(self._events) - self.max_size)
+                self._truncated = True
+
+    def _drop_oldest(self, count: int) -> list[Event]:
+        dropped = self._events[:count]
+        del self._events[:count]
+        del self._processed_at[:count]
+        self._responded_count = max(0, self._responded_count - count)
+        self._conversational_count -= sum(1 for event in dropped if self._is_conversational(event))
+        return dropped
+
+    def get_latest(self, limit: int = 100) -> list[Event]:
+        """Returns up to `limit` unmemorized events, newest first. The events are shared and must not be modified."""
+        with self._lock:
+            if limit <= len(self._events) or not self._truncated:
+                return self._events[:-limit - 1:-1] if limit > 0 else []
+        return self.store.get_latest(limit=limit)
+
+    def get_counts(self) -> tuple[int, int]:
+        """Returns the number of unmemorized events in memory, and how many of them are conversation or tool events."""
+        with self._lock:
+            return len(self._events), self._conversational_count
+
+    def replied_before(self, processed_at: float) -> None:
+        self.store.replied_before(processed_at)
+        with self._lock:
+            index = self._responded_count
+            while index < len(self._events) and self._processed_at[index] <= processed_at:
+                if self._events[index].responded_at is None:
+                    self._events[index].responded_at = processed_at
+                index += 1
+            self._responded_count = index
+
+    def memorize_before(self, processed_at: float) -> None:
+        self.store.memorize_before(processed_at)
+        with self._lock:
+            for event in self._drop_oldest(bisect_right(self._processed_at, processed_at)):
+                if event.memorized_at is None:
+                    event.memorized_at = processed_at
+
+    def delete_classes(self, class_names: list[str]) -> None:
+        self.store.delete_classes(class_names)
+        with self._lock:
+            kept = [
+                (event, processed_at) for event, processed_at in zip(self._events, self._processed_at)
+                if event.__class__.__name__ not in class_names
+            ]
+            self._events = [event for event, _ in kept]
+            self._processed_at = [processed_at for _, processed_at in kept]
+            self._recount()
+        if self._truncated:
+            # the deleted events may have made room for older ones that are only in the store
+            self.reload()
+
+    def delete_all(self) -> None:
+        self.store.delete_all()
+        with self._lock:
+            self._events = []
+            self._processed_at = []
+            self._truncated = False
+            self._recount()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.store, name)
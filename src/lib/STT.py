@@ -1,9 +1,11 @@
 import queue
 import threading
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from time import sleep, time
-from typing import Literal, final
+from typing import Callable, Literal, final
 
+import numpy as np
 import pyaudio
 import speech_recognition as sr
 from pysilero_vad import SileroVoiceActivityDetector
@@ -17,6 +19,7 @@ from .Logger import (
     observe,
     show_chat_message,
 )
+from .EventBus import EventBus
 from .Models import STTModel, LLMError
 
 
@@ -33,14 +36,174 @@ class STTResult:
     def __repr__(self):
         return self.text
 
+@final
+class VoiceActivityBuffer:
+    """
+    Preallocated ring of fixed-size microphone chunks and their VAD scores.
+    Keeps running counts of voiced chunks, overall and over the trailing `window` chunks,
+    so appending a chunk and checking for speech or a pause both take constant time.
+    """
+
+    def __init__(self, chunk_samples: int, capacity: int, window: int, threshold: float):
+        self.chunk_samples = chunk_samples
+        self.capacity = capacity
+        self.window = window
+        self.threshold = threshold
+        self.chunks = np.zeros((capacity, chunk_samples), dtype=np.int16)
+        self.scores = np.zeros(capacity, dtype=np.float32)
+        self.start = 0
+        self.count = 0
+        self.voiced_count = 0
+        self.window_voiced_count = 0
+
+    def append(self, chunk: bytes, score: float) -> None:
+        if self.count == self.capacity:
+            self._drop_oldest()
+        samples = np.frombuffer(chunk, dtype=np.int16)[:self.chunk_samples]
+        index = (self.start + self.count) % self.capacity
+        self.chunks[index, :samples.shape[0]] = samples
+        self.chunks[index, samples.shape[0]:] = 0
+        self.scores[index] = score
+        self.count += 1
+        if score >= self.threshold:
+            self.voiced_count += 1
+            self.window_voiced_count += 1
+        if self.count > self.window:
+            # the chunk that just left the trailing window
+            left_index = (self.start + self.count - 1 - self.window) % self.capacity
+            if self.scores[left_index] >= self.threshold:
+                self.window_voiced_count -= 1
+
+    def keep_last(self, count: int) -> None:
+        while self.count > count:
+            self._drop_oldest()
+
+    def clear(self) -> None:
+        self.start = 0
+        self.count = 0
+        self.voiced_count = 0
+        self.window_voiced_count = 0
+
+    def is_full(self) -> bool:
+        return self.count == self.capacity
+
+    def get_duration(self, rate: int) -> float:
+        return self.count * self.chunk_samples / rate
+
+    def get_audio(self, start: int = 0, end: int | None = None) -> bytes:
+        return self.chunks[self._ordered_indices(start, end)].tobytes()
+
+    def get_scores(self, start: int = 0, end: int | None = None) -> list[float]:
+        return self.scores[self._ordered_indices(start, end)].tolist()
+
+    def _ordered_indices(self, start: int, end: int | None) -> np.ndarray:
+        end = self.count if end is None else min(end, self.count)
+        return (self.start + np.arange(start, end)) % self.capacity
+
+    def _drop_oldest(self) -> None:
+        if self.scores[self.start] >= self.threshold:
+            self.voiced_count -= 1
+            if self.count <= self.window:
+                self.window_voiced_count -= 1
+        self.start = (self.start + 1) % self.capacity
+        self.count -= 1
+
+
+@final
+class StreamingTranscription:
+    """
+    Transcribes a phrase while it is still being spoken.
+    Once the open segment grows beyond `segment_duration` it is cut at its quietest chunk and its text is fixed,
+    in between the open segment is re-transcribed every `interval` seconds to publish partial hypotheses.
+    When the phrase ends, only the open segment is left to transcribe.
+    """
+
+    def __init__(
+        self,
+        stt_model: STTModel,
+        executor: ThreadPoolExecutor,
+        on_partial: Callable[[str], None],
+        chunk_duration: float,
+        interval: float,
+        segment_duration: float,
+    ):
+        self.stt_model = stt_model
+        self.executor = executor
+        self.on_partial = on_partial
+        self.chunk_duration = chunk_duration
+        self.interval = interval
+        self.segment_duration = segment_duration
+        self.segments: list[Future[str]] = []
+        self.segment_start = 0
+        self.partial_end = 0
+        self.partial: Future[None] | None = None
+        self.rest: Future[str] | None = None
+        # partials still running when the phrase ends are dropped, the final text supersedes them
+        self._finished = False
+        self._publish_lock = threading.Lock()
+
+    def update(self, phrase: VoiceActivityBuffer) -> None:
+        open_chunks = phrase.count - self.segment_start
+        if open_chunks * self.chunk_duration >= self.segment_duration:
+            # cut at the quietest chunk of the segment's last third, most likely a pause between words
+            search_start = self.segment_start + open_chunks * 2 // 3
+            cut = search_start + int(np.argmin(phrase.get_scores(search_start))) + 1
+            self.segments.append(self.executor.submit(self.stt_model.transcribe_pcm, phrase.get_audio(self.segment_start, cut)))
+            self.segment_start = cut
+
+        if (phrase.count - self.partial_end) * self.chunk_duration < self.interval:
+            return
+        if self.partial is not None and not self.partial.done():
+            return
+        self.partial_end = phrase.count
+        # the worker runs jobs in order, so the segments submitted so far are done before the partial runs
+        self.partial = self.executor.submit(
+            self._publish_partial,
+            list(self.segments),
+            phrase.get_audio(self.segment_start),
+        )
+
+    def finish(self, phrase: VoiceActivityBuffer) -> None:
+        with self._publish_lock:
+            self._finished = True
+        if self.partial is not None:
+            self.partial.cancel()
+        self.rest = self.executor.submit(self.stt_model.transcribe_pcm, phrase.get_audio(self.segment_start))
+
+    def get_text(self) -> str:
+        """Waits for all segments and returns the text of the whole phrase."""
+        segments = self.segments + ([self.rest] if self.rest is not None else [])
+        return self._join([segment.result() for segment in segments])
+
+    def _publish_partial(self, segments: list[Future[str]], pcm: bytes) -> None:
+        try:
+            texts = [segment.result() for segment in segments]
+            texts.append(self.stt_model.transcribe_pcm(pcm))
+        except Exception as e:
+            log('debug', 'Partial transcription failed', e)
+            return
+        text = self._join(texts)
+        with self._publish_lock:
+            if text and not self._finished:
+                self.on_partial(text)
+
+    def _join(self, texts: list[str]) -> str:
+        return ' '.join(text.strip() for text in texts if text and text.strip())
+
+
 @final
 class STT:
     listening = False
-    recording = False
-    resultQueue = queue.Queue()
 
-    def __init__(self, stt_model: STTModel | None, input_device_name, required_word=None):
+    def __init__(self, stt_model: STTModel | None, input_device_name, required_word=None, event_bus: EventBus | None = None, streaming: bool = False):
         self.stt_model = stt_model
+        self.event_bus = event_bus
+        self._recording = False
+        self.resultQueue: queue.Queue[STTResult] = event_bus.create_queue() if event_bus else queue.Queue()
+        # partial hypotheses of the phrase that is still being spoken, only filled in streaming mode
+        self.partialQueue: queue.Queue[str] = event_bus.create_queue() if event_bus else queue.Queue()
+        self.streaming = streaming
+        self._streaming_executor: ThreadPoolExecutor | None = None
         self.vad = SileroVoiceActivityDetector()
         self.input_device_name = input_device_name
         self.required_word = required_word
@@ -52,6 +215,22 @@ class STT:
 
         self.vad_threshold = 0.2
         self.phrase_end_pause = 1.0
+        # longer phrases are transcribed once the buffer is full, instead of dropping their beginning
+        self.max_phrase_duration = 60.0
+        self.partial_interval = 1.0
+        self.partial_segment_duration = 6.0
+
+    @property
+    def recording(self) -> bool:
+        return self._recording
+
+    @recording.setter
+    def recording(self, value: bool):
+        changed = value != self._recording
+        self._recording = value
+        # the main loop reacts to recording changes, e.g. to interrupt TTS when the user starts speaking
+        if changed and self.event_bus:
+            self.event_bus.notify()
 
     def listen_once_start(self):
         log('debug', 'listen_once_start')
@@ -78,15 +257,17 @@ class STT:
         try:
             timestamp = time()
             frames = []
+            vad_scores = []
             while self.listening:
                 buffer = self._read_stream_buffer(source)
                 if len(buffer) == 0: break  # reached end of the stream
                 frames.append(buffer)
+                vad_scores.append(self.vad(buffer))
             source.close()
 
             audio_raw = b''.join(frames)
             audio_data = sr.AudioData(audio_raw, self.rate, self.sample_width)
-            text = self._transcribe(audio_data)
+            text = self._transcribe(audio_data, vad_scores)
         finally:
             self.recording = False
         
@@ -117,50 +298,69 @@ class STT:
     def _listen_continuous_loop(self):
         source: pyaudio.Stream = self._get_microphone()
         timestamp = time()
-        frames = []
-        activity = []
+        chunk_duration = self.frames_per_buffer / self.rate
+        phrase = VoiceActivityBuffer(
+            chunk_samples=self.frames_per_buffer,
+            capacity=int(self.max_phrase_duration / chunk_duration),
+            window=int(self.phrase_end_pause / chunk_duration),
+            threshold=self.vad_threshold,
+        )
+        streaming: StreamingTranscription | None = None
         while self.listening:
             buffer = self._read_stream_buffer(source)
             if self.continuous_listening_paused:
                 self.recording = False
                 continue
             if len(buffer) == 0: break  # reached end of the stream
-            frames.append(buffer)
-            frames_duration = len(frames) * self.frames_per_buffer / self.rate
-            activity.append(self.vad(buffer))
-            if frames_duration > 0.5:
-                #log('debug','checking for voice activity in', frames_duration, 'seconds of audio')
-                audio_raw = b''.join(frames)
-                if all([v < self.vad_threshold for v in activity]):
-                    # no voice detected in the recording so far, so clear the buffer
-                    # and keep only last 0.1 seconds of audio for the next iteration
-                    #log('debug','no voice detected, clearing buffer')
-                    keep = int(0.1 * self.rate / self.frames_per_buffer)
-                    frames = frames[-keep:]
-                    activity = activity[-keep:]
-                    timestamp = time()
-                    continue
-                else:
-                    self.recording = True
-                    # we have voice activity in current recording
-                    # check if there is voice in the last phrase_end_pause seconds
-                    #log('debug','voice detected, checking for pause in the last phrase_end_pause seconds')
-                    end_slice = int(self.phrase_end_pause * self.rate / self.frames_per_buffer)
-                    activity_end_slice = activity[-end_slice:]
-                    if all([v < self.vad_threshold for v in activity_end_slice]):
-                        # no voice in the last 0.5 seconds, so we know the user has stopped speaking
-                        # so we can transcribe the audio
-                        #log('debug','no voice detected in the last 0.5 seconds, transcribing')
-                        audio_data = sr.AudioData(audio_raw, self.rate, self.sample_width)
-                        text = self._transcribe(audio_data)
-                        frames = []
-                        activity = []
-                        if text:
-                            self.resultQueue.put(STTResult(text, audio_data, timestamp))
-                        self.recording = False
+            phrase.append(buffer, self.vad(buffer))
+            if phrase.get_duration(self.rate) <= 0.5:
+                continue
+
+            if phrase.voiced_count == 0:
+                # no voice detected in the recording so far, so clear the buffer
+                # and keep only last 0.1 seconds of audio for the next iteration
+                phrase.keep_last(int(0.1 / chunk_duration))
+                timestamp = time()
+                continue
+
+            self.recording = True
+            if streaming is None and self.streaming:
+                streaming = self._start_streaming(chunk_duration)
+            # we have voice activity in current recording, the user stopped speaking
+            # once there was no voice in the last phrase_end_pause seconds
+            if phrase.window_voiced_count > 0 and not phrase.is_full():
+                if streaming is not None:
+                    streaming.update(phrase)
+                continue
+
+            audio_data = sr.AudioData(phrase.get_audio(), self.rate, self.sample_width)
+            if streaming is not None:
+                streaming.finish(phrase)
+                text = self._transcribe(audio_data, phrase.get_scores(), streaming)
+            else:
+                text = self._transcribe(audio_data, phrase.get_scores())
+            streaming = None
+            phrase.clear()
+            if text:
+                self.resultQueue.put(STTResult(text, audio_data, timestamp))
+            self.recording = False
         source.close()
         self.recording = False
 
+    def _start_streaming(self, chunk_duration: float) -> StreamingTranscription | None:
+        if self.stt_model is None:
+            return None
+        if self._streaming_executor is None:
+            self._streaming_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='stt-streaming')
+        return StreamingTranscription(
+            self.stt_model,
+            self._streaming_executor,
+            self.partialQueue.put,
+            chunk_duration,
+            self.partial_interval,
+            self.partial_segment_duration,
+        )
+
     def _read_stream_buffer(self, source: pyaudio.Stream) -> bytes:
         try:
             return source.read(self.frames_per_buffer, exception_on_overflow=False)
@@ -206,7 +406,11 @@ class STT:
         return source
 
     @observe()
-    def _transcribe(self, audio: sr.AudioData) -> str:
+    def _transcribe(self, audio: sr.AudioData, vad_scores: list[float] | None = None, streaming: StreamingTranscription | None = None) -> str:
+        """
+        Transcribes the audio, reusing the VAD scores computed while recording it, if given.
+        With `streaming`, the text is assembled from the segments it already transcribed while the user was speaking.
+        """
         log('debug', 'Transcribing audio...')
         if self.stt_model is None:
             raise ValueError('Speech recognition is disabled')
@@ -216,7 +420,9 @@ class STT:
         if audio_length < 0.2:
             log('debug', 'skipping short audio')
             return ''
-        if all([a < self.vad_threshold for a in self.vad.process_chunks(audio_raw)]):
+        if vad_scores is None:
+            vad_scores = list(self.vad.process_chunks(audio_raw))
+        if all(a < self.vad_threshold for a in vad_scores):
             log('debug', 'skipping audio without voice')
             return ''
 
@@ -225,7 +431,7 @@ class STT:
         start_time = time()
         
         try:
-            text = self.stt_model.transcribe(audio)
+            text = streaming.get_text() if streaming is not None else self.stt_model.transcribe(audio)
         except LLMError as e:
             log('error', 'STT Error:', e)
             show_chat_message('error', 'STT Error:', str(e))
@@ -0,0 +1,96 @@
+import threading
+
+import numpy as np
+
+from .Database import KeyValueStore
+from .Logger import log
+from .Models import EmbeddingModel
+
+
+class SemanticActionCache:
+    """
+    Small in-memory vector index over the inputs of confirmed action cache entries, so a rephrased command
+    ("deploy landing gear please" instead of "lower the landing gear") can reuse the cached tool call.
+    Embeddings are stored per embedding model, so every input is only embedded once.
+    """
+
+    def __init__(self, embedding_model: EmbeddingModel, threshold: float = 0.92):
+        self.embedding_model = embedding_model
+        self.threshold = threshold
+        self.embedding_store = KeyValueStore("action_cache_embeddings")
+        self._lock = threading.Lock()
+        self._inputs: list[str] = []
+        self._indexed: set[str] = set()
+        self._rows: list[np.ndarray] = []
+        # the rows stacked into one matrix, rebuilt on the first lookup after inputs were added
+        self._vectors: np.ndarray | None = None
+
+    def sync(self, inputs: dict[str, str]) -> None:
+        """Indexes the cleaned inputs, mapped to the text to embed. Inputs that are not embedded yet are embedded one by one."""
+        stored = self.embedding_store.get_all()
+        for cleaned_input, text in inputs.items():
+            if cleaned_input in self._indexed:
+                continue
+            vector = stored.get(self._get_store_key(cleaned_input))
+            if vector is None:
+                vector = self._embed(text)
+                if vector is None:
+                    # the embedding provider is failing, try again on the next sync
+                    return
+                self.embedding_store.set(self._get_store_key(cleaned_input), vector)
+            self._add_vector(cleaned_input, vector)
+
+    def add(self, cleaned_input: str, text: str) -> None:
+        self.sync({cleaned_input: text})
+
+    def find(self, text: str) -> list[tuple[str, float]]:
+        """Returns the indexed inputs at least `threshold` similar to `text`, most similar first."""
+        with self._lock:
+            if not self._inputs:
+                return []
+        vector = self._embed(text)
+        if vector is None:
+            return []
+        query = self._normalize(vector)
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.vstack(self._rows)
+            if query.shape[0] != self._vectors.shape[1]:
+                return []
+            similarities = self._vectors @ query
+            inputs = list(self._inputs)
+        order = np.argsort(-similarities)
+        return [
+            (inputs[index], float(similarities[index]))
+            for index in order
+            if similarities[index] >= self.threshold
+        ]
+
+    def _get_store_key(self, cleaned_input: str) -> str:
+        return f"{self.embedding_model.model_name}:{cleaned_input}"
+
+    def _embed(self, text: str) -> list[float] | None:
+        try:
+            _, embedding = self.embedding_model.create_embedding(text)
+            return embedding
+        except Exception as e:
+            log("warn", "Cache: Failed to embed action input", e)
+            return None
+
+    def _normalize(self, vector: list[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(array))
+        return array / norm if norm > 0 else array
+
+    def _add_vector(self, cleaned_input: str, vector: list[float]) -> None:
+        normalized = self._normalize(vector)
+        with self._lock:
+            if cleaned_input in self._indexed:
+                return
+            if self._rows and self._rows[0].shape != normalized.shape:
+                log("warn", "Cache: Embedding dimension changed, skipping", cleaned_input)
+                return
+            self._inputs.append(cleaned_input)
+            self._indexed.add(cleaned_input)
+            self._rows.append(normalized)
+            self._vectors = None
@@ -0,0 +1,53 @@
+import re
+
+# A sentence ends at terminal punctuation (optionally followed by closing quotes or brackets) followed by whitespace,
+# or at a line break. Decimal numbers like "3.5" are never split, since the dot isn't followed by whitespace.
+SENTENCE_END = re.compile(r'[.!?…]+["\')\]*]*\s+|\n+')
+CLAUSE_END = re.compile(r'[,;:—]\s+')
+ABBREVIATIONS = {'cmdr', 'mr', 'mrs', 'ms', 'dr', 'st', 'vs', 'etc', 'e.g', 'i.e', 'approx'}
+
+
+class SentenceSegmenter:
+    """
+    Splits streamed text into speakable segments, so speech synthesis can start on the first sentence
+    while the rest of the reply is still being generated.
+    Very short sentences are merged into the next one to keep the prosody natural, and overly long
+    sentences are split at clause boundaries so they don't hold back the audio.
+    """
+
+    def __init__(self, min_length: int = 20, max_length: int = 200):
+        self.min_length = min_length
+        self.max_length = max_length
+        self.buffer = ''
+
+    def feed(self, text: str) -> list[str]:
+        """Adds a text delta and returns the segments it completed."""
+        self.buffer += text
+        segments: list[str] = []
+        start = 0
+        for match in SENTENCE_END.finditer(self.buffer):
+            if match.group().startswith('.') and self._is_abbreviation(self.buffer[start:match.start()]):
+                continue
+            if match.end() - start < self.min_length:
+                continue
+            segments.append(self.buffer[start:match.end()].strip())
+            start = match.end()
+        self.buffer = self.buffer[start:]
+
+        if len(self.buffer) > self.max_length:
+            clause_ends = [match.end() for match in CLAUSE_END.finditer(self.buffer) if match.end() >= self.min_length]
+            if clause_ends:
+                segments.append(self.buffer[:clause_ends[-1]].strip())
+                self.buffer = self.buffer[clause_ends[-1]:]
+
+        return [segment for segment in segments if segment]
+
+    def flush(self) -> str | None:
+        """Returns whatever is left once the stream ended."""
+        segment = self.buffer.strip()
+        self.buffer = ''
+        return segment or None
+
+    def _is_abbreviation(self, text: str) -> bool:
+        words = text.rsplit(None, 1)
+        return bool(words) and words[-1].lower() in ABBREVIATIONS
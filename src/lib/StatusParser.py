@@ -8,6 +8,8 @@ from time import sleep
 from typing import Any, Literal, Optional
 from typing import TypedDict
 
+from .EventBus import EventBus
+from .FileWatcher import FileWatcher, create_file_watcher
 from .Logger import log
 
 
@@ -246,14 +248,22 @@ def parse_status_json(value: dict[str, Any]) -> Status:
 
 
 class StatusParser:
-    def __init__(self, journals_path: str):
+    def __init__(self, journals_path: str, event_bus: EventBus | None = None):
         self.file_path = os.path.join(journals_path, "Status.json")
+        # seconds between safety checks of the status file, in case the watcher missed a notification
+        self.rescan_interval: float = 1.0
+        # seconds until a partially written status file is read again
+        self.partial_write_retry: float = 0.05
+        self.watcher: FileWatcher = create_file_watcher(journals_path)
+        self.watcher.track("Status.json")
+        self._file_signature: tuple[int, int] | None = None
+        self._file_content: bytes | None = None
 
         current_status_raw = self._read_status_file()
         self.current_status = parse_status_json(current_status_raw)
+        self.status_queue: queue.Queue[dict[str, Any]] = event_bus.create_queue() if event_bus else queue.Queue()
         self.watch_thread = threading.Thread(target=self._watch_file_thread, daemon=True)
         self.watch_thread.start()
-        self.status_queue = queue.Queue()
         
     def _watch_file_thread(self):
         backoff = 1
@@ -267,19 +277,54 @@ class StatusParser:
                 backoff *= 2
 
     def _watch_file(self):
-        """Detects changes in the Status.json file."""
+        """Detects changes in the Status.json file, waking up on file changes and only parsing changed content."""
         while True:
-            status_raw = self._read_status_file()
-            status = parse_status_json(status_raw)
-        
-            if status != self.current_status:
-                log('debug', 'Status changed', status)
-                self.status_queue.put({"event": "Status", **status})
-                events = self._create_delta_events(self.current_status, status)
-                for event in events:
-                    self.status_queue.put(event)
-                self.current_status = status
-            sleep(1)
+            try:
+                status_raw = self._read_status_file_if_changed()
+            except json.JSONDecodeError:
+                # the game is still writing the file, read it again after the write completed
+                self.watcher.wait(timeout=self.partial_write_retry)
+                continue
+
+            if status_raw is not None:
+                status = parse_status_json(status_raw)
+                if status != self.current_status:
+                    log('debug', 'Status changed', status)
+                    self.status_queue.put({"event": "Status", **status})
+                    events = self._create_delta_events(self.current_status, status)
+                    for event in events:
+                        self.status_queue.put(event)
+                    self.current_status = status
+            self.watcher.wait(timeout=self.rescan_interval)
+
+    def _read_status_file_if_changed(self) -> dict | None:
+        """
+        Returns the parsed status file, or None if neither its size and mtime nor its content changed since the last read,
+        or if the file is empty.
+        Raises json.JSONDecodeError if the file is only partially written.
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        signature = (stat.st_size, stat.st_mtime_ns)
+        if signature == self._file_signature:
+            return None
+
+        with open(self.file_path, 'rb') as file:
+            raw = file.read()
+        if raw == self._file_content:
+            self._file_signature = signature
+            return None
+
+        if not raw.strip():
+            # the game truncated the file and has not written the new status yet
+            return None
+        data = json.loads(raw.decode('utf-8'))
+        # only remember the file once it was parsed successfully, so partial writes are retried
+        self._file_signature = signature
+        self._file_content = raw
+        return data
 
     def _read_status_file(self) -> dict:
         """Loads data from the JSON file and returns a cleaned version"""
@@ -27,6 +27,10 @@ class SystemDatabase:
         self._fetch_locks = {}
         self._fetch_locks_lock = threading.Lock()
 
+        # system name -> number of writes to its record in this session, so cached renderings can tell it changed
+        self._data_versions: Dict[str, int] = {}
+        self._data_versions_lock = threading.Lock()
+
         # Register a background timer to periodically check and dump database contents
         from threading import Timer
         self.check_timer = Timer(60.0, self.periodic_check)
@@ -116,6 +120,13 @@ class SystemDatabase:
             WHERE name = ?
         ''', (*values, system_name))
         conn.commit()
+        with self._data_versions_lock:
+            self._data_versions[system_name] = self._data_versions.get(system_name, 0) + 1
+
+    def get_data_version(self, system_name: str) -> int:
+        """Returns a number that changes whenever the stored data of the system changes, e.g. by a fetch or a scan."""
+        with self._data_versions_lock:
+            return self._data_versions.get(system_name, 0)
 
     def _get_system_record_by_address(self, star_address: int) -> Optional[Dict[str, Any]]:
         conn = get_connection()
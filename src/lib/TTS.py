@@ -21,6 +21,7 @@ import strip_markdown
 from numpy.typing import NDArray
 from num2words import num2words
 
+from .AudioFilters import apply_one_pole, one_pole_highpass_coefficient, one_pole_lowpass_coefficients
 from .Config import (
     CharacterTTSChorusConfig,
     CharacterTTSDistortionConfig,
@@ -31,9 +32,11 @@ from .Config import (
     get_default_character_tts_postprocessing,
     map_character_tts_postprocessing,
 )
+from .EventBus import EventBus
 from .Logger import log, observe, show_chat_message
 from .Logger import AudioUsageStats, LatencyUsageStats, TextUsageStats, log_tts_usage
 from .Models import TTSModel, OpenAITTSModel
+from .TTSCache import TTSCache
 
 
 class TTSLine:
@@ -64,6 +67,28 @@ class TTSLine:
         self._completed.wait()
 
 
+class PreparedLine:
+    """A queued item whose audio is synthesized and post-processed ahead of its playback."""
+
+    def __init__(self, item: dict[str, Any]) -> None:
+        self.item = item
+        self.text = ""
+        self.cached = False
+        self.chunks: queue.Queue[bytes | None] = queue.Queue()
+        self.cancelled = threading.Event()
+        self.metrics: dict[str, float | None] = {
+            "response_ms": None,
+            "time_to_first_byte_ms": None,
+        }
+
+    def iter_chunks(self) -> Generator[bytes, None, None]:
+        while True:
+            chunk = self.chunks.get()
+            if chunk is None:
+                return
+            yield chunk
+
+
 @dataclass
 class LowpassState:
     y_prev: float = 0.0
@@ -114,8 +139,13 @@ class TTS:
         postprocessing_config: CharacterTTSPostprocessingConfig | None = None,
         output_device: Optional[str] = None,
         output_volume_multiplier: float = 1.0,
+        event_bus: EventBus | None = None,
+        lookahead: int = 2,
+        cache: TTSCache | None = None,
     ):
         self.tts_model = tts_model
+        self.cache = cache
+        self.event_bus = event_bus
         self.voice = voice
         self.speed = speed
         self.postprocessing_config = map_character_tts_postprocessing(
@@ -126,7 +156,15 @@ class TTS:
         self.output_device = output_device
         self.output_volume_multiplier = max(0.0, min(1.5, float(output_volume_multiplier)))
         self.read_queue = queue.Queue()
+        # lines that are already being synthesized while the current one plays
+        self.prepared_queue: queue.Queue[PreparedLine] = queue.Queue(maxsize=max(1, lookahead))
+        self._preparing: PreparedLine | None = None
+        self._playing: PreparedLine | None = None
+        self._queued_items = 0
+        self._queue_lock = threading.Lock()
         self.is_aborted = False
+        # counts calls to abort, so callers still queueing lines can tell they were interrupted
+        self.abort_count = 0
         self._is_playing = False
         self.prebuffer_size = 4
         self.output_format = pyaudio.paInt16
@@ -145,6 +183,10 @@ class TTS:
         thread.daemon = True
         thread.start()
 
+        synthesis_thread = threading.Thread(target=self._synthesis_thread)
+        synthesis_thread.daemon = True
+        synthesis_thread.start()
+
     def _normalize_queue_item(self, item: Any) -> dict[str, Any]:
         if isinstance(item, str):
             return {
@@ -213,6 +255,133 @@ class TTS:
                 substring_match = i
         return substring_match
 
+    def _synthesis_thread(self):
+        while True:
+            try:
+                self._synthesis_loop()
+            except Exception as e:
+                log('error', 'An error occurred during speech synthesis', e, traceback.format_exc())
+                sleep(1)
+
+    def _synthesis_loop(self):
+        while True:
+            item = self._normalize_queue_item(self.read_queue.get())
+            prepared = PreparedLine(item)
+            self._preparing = prepared
+            try:
+                drop_if = item.get("drop_if")
+                if callable(drop_if) and drop_if():
+                    self._finish_unplayed(prepared)
+                    continue
+                text = item.get("text")
+                if item.get("type") != "audio_file" and isinstance(text, str) and text:
+                    prepared.text = self._normalize_text(text)
+                # blocks while `lookahead` lines are already waiting for playback
+                queued = False
+                while not prepared.cancelled.is_set():
+                    try:
+                        self.prepared_queue.put(prepared, timeout=0.1)
+                        queued = True
+                        break
+                    except queue.Full:
+                        continue
+                if not queued:
+                    self._finish_unplayed(prepared)
+                    continue
+                # once queued, the playback loop owns the line, even if it was cancelled in the meantime
+                try:
+                    if prepared.text and not prepared.cancelled.is_set():
+                        self._prepare_one(prepared)
+                finally:
+                    prepared.chunks.put(None)
+            finally:
+                self._preparing = None
+
+    @observe()
+    def _prepare_one(self, prepared: PreparedLine):
+        item = prepared.item
+        voice = item.get("voice")
+        postprocessing_override = item.get("postprocessing")
+        postprocessing_layers = item.get("postprocessing_layers")
+        self._reset_postprocessing_state()
+        postprocessing = self._get_effective_postprocessing_config(
+            cast(CharacterTTSPostprocessingConfig | None, postprocessing_override if isinstance(postprocessing_override, dict) else None),
+            cast(list[CharacterTTSPostprocessingConfig | None] | None, postprocessing_layers if isinstance(postprocessing_layers, list) else None),
+        )
+        voice_override = voice if isinstance(voice, str) else None
+        cache_key = self.cache.make_key(self.tts_model, voice_override or self.voice, prepared.text) if self.cache else None
+        cached_audio = self.cache.get(cache_key) if self.cache and cache_key else None
+        if cached_audio is not None:
+            prepared.cached = True
+            audio_stream = self._iter_cached_audio(cached_audio)
+        else:
+            audio_stream = self._stream_audio(prepared.text, voice_override, prepared.metrics)
+            if cache_key:
+                audio_stream = self._store_audio(audio_stream, cache_key, prepared.metrics)
+        if postprocessing:
+            audio_stream = self._postprocess_audio(audio_stream, postprocessing)
+
+        for chunk in audio_stream:
+            if prepared.cancelled.is_set():
+                break
+            prepared.chunks.put(chunk)
+
+    def _normalize_text(self, text: str) -> str:
+        # Fix numberformatting for different providers
+        text = re.sub(r"\d+(,\d{3})*(\.\d+)?", self._number_to_text, text)
+        return strip_markdown.strip_markdown(text)
+
+    def _iter_cached_audio(self, pcm: bytes) -> Generator[bytes, None, None]:
+        chunk_size = self.frames_per_buffer * self.sample_size
+        for start in range(0, len(pcm), chunk_size):
+            yield pcm[start:start + chunk_size]
+
+    def _store_audio(self, audio_stream: Generator[bytes, None, None], cache_key: str, metrics: dict[str, float | None]) -> Generator[bytes, None, None]:
+        chunks: list[bytes] = []
+        for chunk in audio_stream:
+            chunks.append(chunk)
+            yield chunk
+        # only complete syntheses are stored, the response time is missing if the request failed
+        if self.cache and chunks and metrics.get("response_ms") is not None:
+            self.cache.put(cache_key, b"".join(chunks))
+
+    def prewarm_cache(self, lines: list[tuple[str, str | None]]) -> None:
+        """Synthesizes (text, voice) pairs that aren't cached yet in the background, so they play instantly later on."""
+        if not self.cache or not self.tts_model:
+            return
+
+        def prewarm():
+            synthesized = 0
+            for text, voice in lines:
+                text = self._normalize_text(text)
+                cache_key = self.cache.make_key(self.tts_model, voice or self.voice, text) if self.cache else None
+                if not self.cache or not cache_key or self.cache.contains(cache_key):
+                    continue
+                metrics: dict[str, float | None] = {"response_ms": None, "time_to_first_byte_ms": None}
+                for _ in self._store_audio(self._stream_audio(text, voice, metrics), cache_key, metrics):
+                    pass
+                if metrics.get("response_ms") is None:
+                    log('debug', 'TTS cache prewarm stopped after a failed synthesis')
+                    break
+                synthesized += 1
+            log('debug', f'TTS cache prewarmed {synthesized} of {len(lines)} lines')
+
+        thread = threading.Thread(target=prewarm, daemon=True)
+        thread.start()
+
+    def _enqueue(self, item: Any) -> None:
+        with self._queue_lock:
+            self._queued_items += 1
+        self.read_queue.put(item)
+
+    def _finish_unplayed(self, prepared: PreparedLine) -> None:
+        with self._queue_lock:
+            self._queued_items -= 1
+        prepared.cancelled.set()
+        line = prepared.item.get("line")
+        if isinstance(line, TTSLine):
+            line.mark_completed()
+
     def _playback_thread(self):
         backoff = 1
         while True:
@@ -239,101 +408,88 @@ class TTS:
             self.is_aborted = False
             stream.start_stream()
             while not self.is_aborted:
-                if not self.read_queue.empty():
-                    self._is_playing = True
-                    item = self._normalize_queue_item(self.read_queue.get())
-                    item_type = item.get("type")
-                    text = item.get("text")
-                    context = item.get("context")
-                    file_path = item.get("file_path")
-                    voice = item.get("voice")
-                    postprocessing = item.get("postprocessing")
-                    postprocessing_layers = item.get("postprocessing_layers")
-                    on_start = item.get("on_start")
-                    on_complete = item.get("on_complete")
-                    drop_if = item.get("drop_if")
-                    line = item.get("line")
-                    if callable(drop_if) and drop_if():
-                        if isinstance(line, TTSLine):
-                            line.mark_completed()
-                        continue
-                    requeued = False
-                    try:
-                        if isinstance(line, TTSLine):
-                            line.mark_speaking()
-                        if callable(on_start):
-                            try:
-                                on_start()
-                            except Exception as callback_error:
-                                log('warn', 'TTS on_start callback failed', callback_error)
-                        if item_type == "audio_file":
-                            if not isinstance(file_path, str) or not file_path:
-                                continue
-                            self._playback_audio_file(file_path, stream)
-                        else:
-                            if not isinstance(text, str) or not text:
-                                continue
-                            self._playback_one(
-                                text,
-                                stream,
-                                context if isinstance(context, str) else "speech",
-                                voice if isinstance(voice, str) else None,
-                                cast(CharacterTTSPostprocessingConfig | None, postprocessing if isinstance(postprocessing, dict) else None),
-                                cast(list[CharacterTTSPostprocessingConfig | None] | None, postprocessing_layers if isinstance(postprocessing_layers, list) else None),
-                            )
-                    except Exception as e:
-                        self.read_queue.put(item)
-                        requeued = True
-                        raise e
-                    finally:
-                        if isinstance(line, TTSLine) and not requeued:
-                            line.mark_completed()
-                        if callable(on_complete):
-                            try:
-                                on_complete()
-                            except Exception as callback_error:
-                                log('warn', 'TTS on_complete callback failed', callback_error)
-
-                self._is_playing = False
-
-                sleep(0.1)
-            self._is_playing = False
+                try:
+                    prepared = self.prepared_queue.get(timeout=0.1)
+                except queue.Empty:
+                    self._set_playing(False)
+                    continue
+                self._set_playing(True)
+                item = prepared.item
+                item_type = item.get("type")
+                context = item.get("context")
+                file_path = item.get("file_path")
+                on_start = item.get("on_start")
+                on_complete = item.get("on_complete")
+                drop_if = item.get("drop_if")
+                line = item.get("line")
+                if prepared.cancelled.is_set() or (callable(drop_if) and drop_if()):
+                    self._finish_unplayed(prepared)
+                    continue
+                with self._queue_lock:
+                    self._queued_items -= 1
+                self._playing = prepared
+                try:
+                    if isinstance(line, TTSLine):
+                        line.mark_speaking()
+                    if callable(on_start):
+                        try:
+                            on_start()
+                        except Exception as callback_error:
+                            log('warn', 'TTS on_start callback failed', callback_error)
+                    if item_type == "audio_file":
+                        if not isinstance(file_path, str) or not file_path:
+                            continue
+                        self._playback_audio_file(file_path, stream)
+                    else:
+                        if not prepared.text:
+                            continue
+                        self._playback_one(
+                            prepared,
+                            stream,
+                            context if isinstance(context, str) else "speech",
+                        )
+                except Exception as e:
+                    # the audio is consumed while it plays, a retry would repeat what was already heard and
+                    # requeueing would play it after the lines prepared behind it, so the line is dropped
+                    prepared.cancelled.set()
+                    log('error', 'TTS playback failed, skipping the line', e, traceback.format_exc())
+                finally:
+                    self._playing = None
+                    if isinstance(line, TTSLine):
+                        line.mark_completed()
+                    if callable(on_complete):
+                        try:
+                            on_complete()
+                        except Exception as callback_error:
+                            log('warn', 'TTS on_complete callback failed', callback_error)
+
+                if not self.has_queued_items():
+                    self._set_playing(False)
+            self._set_playing(False)
             stream.stop_stream()
 
+    def _set_playing(self, is_playing: bool):
+        changed = is_playing != self._is_playing
+        self._is_playing = is_playing
+        # lets the main loop resume replying or listening as soon as playback ends
+        if changed and self.event_bus:
+            self.event_bus.notify()
+
     @observe()
     def _playback_one(
         self,
-        text: str,
+        prepared: PreparedLine,
         stream: pyaudio.Stream,
         context: str = "speech",
-        voice_override: str | None = None,
-        postprocessing_override: CharacterTTSPostprocessingConfig | None = None,
-        postprocessing_layers: list[CharacterTTSPostprocessingConfig | None] | None = None,
     ):
-        # Fix numberformatting for different providers
-        text = re.sub(r"\d+(,\d{3})*(\.\d+)?", self._number_to_text, text)
-        text = strip_markdown.strip_markdown(text)
-        # print('reading:', text)
         start_time = time()
         first_byte_time = None
         total_audio_bytes = 0
         first_chunk = True
         underflow_count = 0
         empty_buffer_available = stream.get_write_available()
-        self._reset_postprocessing_state()
-        postprocessing = self._get_effective_postprocessing_config(
-            postprocessing_override,
-            postprocessing_layers,
-        )
-        stream_metrics: dict[str, float | None] = {
-            "response_ms": None,
-            "time_to_first_byte_ms": None,
-        }
-        audio_stream = self._stream_audio(text, voice_override, stream_metrics)
-        if postprocessing:
-            audio_stream = self._postprocess_audio(audio_stream, postprocessing)
 
-        for chunk in audio_stream:
+        for chunk in prepared.iter_chunks():
             total_audio_bytes += len(chunk)
             if first_byte_time is None:
                 first_byte_time = time()
@@ -361,6 +517,10 @@ class TTS:
             self.prebuffer_size *= 2
             log('debug', 'tts underflow detected, total', underflow_count, 'increasing prebuffer size to', self.prebuffer_size)
 
+        if prepared.cached:
+            # played from the cache, no request was made
+            return
+
         output_audio_duration_ms = 0.0
         if total_audio_bytes > 0:
             output_audio_duration_ms = (
@@ -372,13 +532,13 @@ class TTS:
             provider=getattr(self.tts_model, "provider_name", None),
             model_name=getattr(self.tts_model, "model_name", None),
             latency_usage=LatencyUsageStats(
-                response_ms=stream_metrics.get("response_ms"),
-                time_to_first_byte_ms=stream_metrics.get("time_to_first_byte_ms"),
+                response_ms=prepared.metrics.get("response_ms"),
+                time_to_first_byte_ms=prepared.metrics.get("time_to_first_byte_ms"),
             ),
             audio_usage=AudioUsageStats(
                 output_audio_duration_ms=output_audio_duration_ms,
             ),
-            text_usage=TextUsageStats(input_chars=len(text)),
+            text_usage=TextUsageStats(input_chars=len(prepared.text)),
         )
 
 
@@ -858,29 +1018,6 @@ class TTS:
             return trimmed_audio
         return audio_array
 
-    def _apply_one_pole_recursive(
-        self,
-        audio_array: NDArray[np.float32],
-        a: float,
-        b: float,
-        y_prev: float,
-    ) -> tuple[NDArray[np.float32], float]:
-        if audio_array.size == 0:
-            return audio_array, y_prev
-
-        # The closed-form version was numerically unstable for long audio blocks
-        # when `a` approached 1.0, which caused the filters to collapse into clicks.
-        output = np.empty_like(audio_array, dtype=np.float32)
-        previous = float(y_prev)
-        coefficient_a = float(a)
-        coefficient_b = float(b)
-
-        for index, sample in enumerate(audio_array):
-            previous = coefficient_a * previous + coefficient_b * float(sample)
-            output[index] = previous
-
-        return output, previous
-
     def _apply_one_pole_lowpass_state(
         self,
         audio_array: NDArray[np.float32],
@@ -891,10 +1028,8 @@ class TTS:
         if cutoff <= 0 or cutoff >= sample_rate / 2 or audio_array.size == 0:
             return audio_array, y_prev
 
-        rc = 1.0 / (2.0 * math.pi * cutoff)
-        dt = 1.0 / sample_rate
-        alpha = dt / (rc + dt)
-        return self._apply_one_pole_recursive(audio_array, 1.0 - alpha, alpha, y_prev)
+        a, b = one_pole_lowpass_coefficients(sample_rate, cutoff)
+        return apply_one_pole(audio_array, a, b, y_prev)
 
     def _apply_one_pole_highpass_state(
         self,
@@ -907,14 +1042,12 @@ class TTS:
         if cutoff <= 0 or cutoff >= sample_rate / 2 or audio_array.size == 0:
             return audio_array, y_prev, x_prev
 
-        rc = 1.0 / (2.0 * math.pi * cutoff)
-        dt = 1.0 / sample_rate
-        alpha = rc / (rc + dt)
+        alpha = one_pole_highpass_coefficient(sample_rate, cutoff)
         delta = np.empty_like(audio_array)
         delta[0] = audio_array[0] - x_prev
         if audio_array.shape[0] > 1:
             delta[1:] = np.diff(audio_array)
-        output, y_last = self._apply_one_pole_recursive(delta, alpha, alpha, y_prev)
+        output, y_last = apply_one_pole(delta, alpha, alpha, y_prev)
         return output, y_last, float(audio_array[-1])
 
     def _build_reverb_impulse_response(
@@ -1360,7 +1493,7 @@ class TTS:
         drop_if: Callable[[], bool] | None = None,
     ) -> TTSLine:
         line = TTSLine()
-        self.read_queue.put(
+        self._enqueue(
             {
                 "text": text,
                 "context": context,
@@ -1383,7 +1516,7 @@ class TTS:
         on_complete: Callable[[], None] | None = None,
         drop_if: Callable[[], bool] | None = None,
     ):
-        self.read_queue.put(
+        self._enqueue(
             {
                 "type": "audio_file",
                 "file_path": file_path,
@@ -1404,19 +1537,31 @@ class TTS:
         )
 
     def abort(self):
+        # stops the synthesis of the line in flight first, so it can't slip into the queue after it was drained
+        for prepared in (self._preparing, self._playing):
+            if prepared:
+                prepared.cancelled.set()
         while not self.read_queue.empty():
-            item = self._normalize_queue_item(self.read_queue.get())
-            line = item.get("line")
-            if isinstance(line, TTSLine):
-                line.mark_completed()
+            try:
+                item = self._normalize_queue_item(self.read_queue.get_nowait())
+            except queue.Empty:
+                break
+            self._finish_unplayed(PreparedLine(item))
+        while not self.prepared_queue.empty():
+            try:
+                prepared = self.prepared_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._finish_unplayed(prepared)
 
+        self.abort_count += 1
         self.is_aborted = True
 
     def get_is_playing(self):
-        return self._is_playing or not self.read_queue.empty()
+        return self._is_playing or self.has_queued_items()
 
     def has_queued_items(self) -> bool:
-        return not self.read_queue.empty()
+        return self._queued_items > 0
 
     @observe()
     def wait_for_completion(self):
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from typing import TYPE_CHECKING
+
+from .Logger import log
+
+if TYPE_CHECKING:
+    from .Models import TTSModel
+
+
+class TTSCache:
+    """
+    Content-addressed on-disk cache of synthesized speech, stored as raw 24 kHz 16-bit mono PCM.
+    Entries are keyed by everything that changes the synthesized audio, as reported by the model's cache_key_parts(),
+    and the normalized text. The least recently played entries are evicted
+    once the cache grows beyond `max_bytes`.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024, compress: bool = True):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self._lock = threading.Lock()
+        # file name -> (size on disk, last access)
+        self._entries: dict[str, tuple[int, float]] = {}
+        self._total_bytes = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        for file_name in os.listdir(cache_dir):
+            if not file_name.endswith(('.pcm', '.pcm.z')):
+                continue
+            stat = os.stat(os.path.join(cache_dir, file_name))
+            self._entries[file_name] = (stat.st_size, stat.st_mtime)
+            self._total_bytes += stat.st_size
+
+    def make_key(self, tts_model: 'TTSModel | None', voice: str, text: str) -> str | None:
+        """Returns the cache key for `text`, or None if the model's output must not be cached."""
+        if tts_model is None or not tts_model.cacheable:
+            return None
+        key_parts = tts_model.cache_key_parts(voice)
+        if key_parts is None:
+            return None
+        normalized_text = ' '.join(text.split())
+        if not normalized_text:
+            return None
+        key_parts = {**key_parts, 'text': normalized_text}
+        return hashlib.sha256(json.dumps(key_parts, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            file_name = self._find_file_name(key)
+            if file_name is None:
+                return None
+            size, _ = self._entries[file_name]
+            now = time.time()
+            self._entries[file_name] = (size, now)
+        path = os.path.join(self.cache_dir, file_name)
+        try:
+            with open(path, 'rb') as handle:
+                data = handle.read()
+            os.utime(path, (now, now))
+            return zlib.decompress(data) if file_name.endswith('.z') else data
+        except (OSError, zlib.error) as e:
+            log('warn', 'Failed to read cached speech', file_name, e)
+            self._remove(file_name)
+            return None
+
+    def put(self, key: str, pcm: bytes) -> None:
+        file_name = f'{key}.pcm.z' if self.compress else f'{key}.pcm'
+        data = zlib.compress(pcm, 1) if self.compress else pcm
+        path = os.path.join(self.cache_dir, file_name)
+        temp_path = f'{path}.{threading.get_ident()}.tmp'
+        try:
+            with open(temp_path, 'wb') as handle:
+                handle.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            log('warn', 'Failed to write cached speech', file_name, e)
+            return
+        with self._lock:
+            previous = self._entries.get(file_name)
+            if previous:
+                self._total_bytes -= previous[0]
+            self._entries[file_name] = (len(data), time.time())
+            self._total_bytes += len(data)
+            evicted = self._evict()
+        for evicted_file_name in evicted:
+            self._delete_file(evicted_file_name)
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            return self._find_file_name(key) is not None
+
+    def get_size(self) -> int:
+        return self._total_bytes
+
+    def _find_file_name(self, key: str) -> str | None:
+        for file_name in (f'{key}.pcm.z', f'{key}.pcm'):
+            if file_name in self._entries:
+                return file_name
+        return None
+
+    def _evict(self) -> list[str]:
+        evicted: list[str] = []
+        if self._total_bytes <= self.max_bytes:
+            return evicted
+        for file_name, (size, _) in sorted(self._entries.items(), key=lambda entry: entry[1][1]):
+            if self._total_bytes <= self.max_bytes:
+                break
+            del self._entries[file_name]
+            self._total_bytes -= size
+            evicted.append(file_name)
+        return evicted
+
+    def _remove(self, file_name: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(file_name, None)
+            if entry:
+                self._total_bytes -= entry[0]
+        self._delete_file(file_name)
+
+    def _delete_file(self, file_name: str) -> None:
+        try:
+            os.remove(os.path.join(self.cache_dir, file_name))
+        except OSError:
+            pass
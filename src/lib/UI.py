@@ -22,6 +22,10 @@ class StatesMessage(TypedDict):
     type: Literal['states']
     states: dict
 
+class StatesPatchMessage(TypedDict):
+    type: Literal['states_patch']
+    patches: dict[str, list[dict]]
+
 class EventMessage(TypedDict):
     type: Literal['event']
     event: Any
@@ -46,6 +50,36 @@ def serialize_object(obj: Any) -> Any:
         return obj.isoformat()
     return obj
     
+
+def _escape_json_pointer(key: Any) -> str:
+    return str(key).replace('~', '~0').replace('/', '~1')
+
+
+def make_json_patch(old: Any, new: Any, path: str = '') -> list[dict[str, Any]]:
+    """
+    Creates a JSON patch (RFC 6902) that turns `old` into `new`.
+    Dicts are diffed key by key, lists of equal length item by item, everything else is replaced as a whole.
+    """
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        operations: list[dict[str, Any]] = []
+        for key, value in old.items():
+            if key not in new:
+                operations.append({'op': 'remove', 'path': f'{path}/{_escape_json_pointer(key)}'})
+            else:
+                operations.extend(make_json_patch(value, new[key], f'{path}/{_escape_json_pointer(key)}'))
+        for key, value in new.items():
+            if key not in old:
+                operations.append({'op': 'add', 'path': f'{path}/{_escape_json_pointer(key)}', 'value': value})
+        return operations
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        operations = []
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            operations.extend(make_json_patch(old_item, new_item, f'{path}/{index}'))
+        return operations
+    return [{'op': 'replace', 'path': path, 'value': new}]
+
 _writer_lock = threading.Lock()
 
 
@@ -29,6 +29,7 @@ class BackpackStateModel(BaseModel):
 
 class Backpack(Projection[BackpackStateModel]):
     StateModel = BackpackStateModel
+    subscribed_events = {"Backpack", "BackpackChange"}
 
     @override
     def process(self, event: Event) -> None:
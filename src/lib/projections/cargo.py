@@ -29,6 +29,7 @@ class CargoState(BaseModel):
 
 class Cargo(Projection[CargoState]):
     StateModel = CargoState
+    subscribed_events = {"Cargo", "Loadout", "Status"}
 
     @override
     def process(self, event: Event) -> None:
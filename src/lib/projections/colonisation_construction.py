@@ -37,6 +37,14 @@ class ColonisationConstructionStateModel(BaseModel):
 
 class ColonisationConstruction(Projection[ColonisationConstructionStateModel]):
     StateModel = ColonisationConstructionStateModel
+    subscribed_events = {
+        "ColonisationConstructionDepot",
+        "Docked",
+        "Location",
+        "SupercruiseEntry",
+        "SupercruiseExit",
+        "FSDJump",
+    }
 
     @override
     def process(self, event: Event) -> None:
@@ -17,6 +17,7 @@ class CommanderStateModel(BaseModel):
 
 class Commander(Projection[CommanderStateModel]):
     StateModel = CommanderStateModel
+    subscribed_events = {"Commander"}
 
     @override
     def process(self, event: Event) -> None:
@@ -64,6 +64,7 @@ class CommunityGoalStateModel(BaseModel):
 
 class CommunityGoal(Projection[CommunityGoalStateModel]):
     StateModel = CommunityGoalStateModel
+    subscribed_events = {"CommunityGoal", "LoadGame"}
 
     @override
     def process(self, event: Event) -> None:
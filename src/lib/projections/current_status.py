@@ -149,6 +149,7 @@ class CurrentStatusState(BaseModel):
 
 class CurrentStatus(Projection[CurrentStatusState]):
     StateModel = CurrentStatusState
+    subscribed_events = {"Status"}
 
     @override
     def process(self, event: Event) -> None:
@@ -27,6 +27,16 @@ class DockingEventsStateModel(BaseModel):
 
 class DockingEvents(Projection[DockingEventsStateModel]):
     StateModel = DockingEventsStateModel
+    subscribed_events = {
+        "Docked",
+        "Undocked",
+        "DockingGranted",
+        "DockingRequested",
+        "DockingCanceled",
+        "DockingDenied",
+        "DockingTimeout",
+        "Music",
+    }
 
     @override
     def process(self, event: Event) -> list[ProjectedEvent] | None:
@@ -29,6 +29,7 @@ class EngineerProgressStateModel(BaseModel):
 
 class EngineerProgress(Projection[EngineerProgressStateModel]):
     StateModel = EngineerProgressStateModel
+    subscribed_events = {"EngineerProgress"}
 
     @staticmethod
     def _normalize_progress(value: object) -> ENGINEER_PROGRESS_LITERAL | None:
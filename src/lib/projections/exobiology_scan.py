@@ -28,6 +28,7 @@ class ExobiologyScanStateModel(BaseModel):
 
 class ExobiologyScan(Projection[ExobiologyScanStateModel]):
     StateModel = ExobiologyScanStateModel
+    subscribed_events = {"Status", "ScanOrganic", "SupercruiseEntry", "FSDJump", "Died", "Shutdown", "JoinACrew"}
     with open(get_asset_path("exobiology_colony_sizes.json"), encoding="utf-8") as handle:
         colony_size = json.load(handle)
 
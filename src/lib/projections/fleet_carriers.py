@@ -61,6 +61,20 @@ class FleetCarriersStateModel(BaseModel):
 
 class FleetCarriers(Projection[FleetCarriersStateModel]):
     StateModel = FleetCarriersStateModel
+    subscribed_events = {
+        "CarrierLocation",
+        "CarrierStats",
+        "CarrierJumpRequest",
+        "CarrierJumpCancelled",
+        "CarrierNameChanged",
+        "CarrierDecommission",
+        "CarrierCancelDecommission",
+        "CarrierBankTransfer",
+        "CarrierDepositFuel",
+        "CarrierCrewServices",
+        "CarrierFinance",
+        "CarrierTradeOrder",
+    }
 
     def _ensure_entry(self, carrier_id: int, carrier_type: str) -> FleetCarrierEntry:
         entry = self.state.Carriers.get(carrier_id)
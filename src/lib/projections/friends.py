@@ -16,6 +16,7 @@ class OnlineFriendsStateModel(BaseModel):
 
 class Friends(Projection[OnlineFriendsStateModel]):
     StateModel = OnlineFriendsStateModel
+    subscribed_events = {"Fileheader", "Friends"}
 
     @override
     def process(self, event: Event) -> None:
@@ -26,6 +26,7 @@ class FSSSignalsStateModel(BaseModel):
 
 class FSSSignals(Projection[FSSSignalsStateModel]):
     StateModel = FSSSignalsStateModel
+    subscribed_events = {"Location", "FSSSignalDiscovered", "FSDJump", "SupercruiseExit", "FSSDiscoveryScan"}
 
     def _reset_state(self, system_address: int) -> None:
         self.state.SystemAddress = system_address
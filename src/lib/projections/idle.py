@@ -1,9 +1,10 @@
 from datetime import datetime, timezone
+from typing import get_args
 
 from typing_extensions import override
 from pydantic import BaseModel, Field
 
-from ..Event import ConversationEvent, Event, GameEvent, ProjectedEvent, StatusEvent
+from ..Event import ConversationEvent, ConversationEventKind, Event, GameEvent, ProjectedEvent, StatusEvent
 from ..EventManager import Projection
 
 
@@ -15,6 +16,7 @@ class IdleStateModel(BaseModel):
 
 class Idle(Projection[IdleStateModel]):
     StateModel = IdleStateModel
+    subscribed_events = {"game", "status", *get_args(ConversationEventKind)}
 
     def __init__(self, idle_timeout: int):
         super().__init__()
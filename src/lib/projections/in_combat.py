@@ -15,6 +15,7 @@ class InCombatStateModel(BaseModel):
 
 class InCombat(Projection[InCombatStateModel]):
     StateModel = InCombatStateModel
+    subscribed_events = {"Music"}
 
     @override
     def process(self, event: Event) -> list[ProjectedEvent] | None:
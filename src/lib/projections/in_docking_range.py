@@ -23,6 +23,17 @@ class InDockingRangeStateModel(BaseModel):
 
 class InDockingRange(Projection[InDockingRangeStateModel]):
     StateModel = InDockingRangeStateModel
+    subscribed_events = {
+        "FsdMassLocked",
+        "SupercruiseExit",
+        "ReceiveText",
+        "DockingGranted",
+        "DockingDenied",
+        "DockingCancelled",
+        "DockingCanceled",
+        "DockingTimeout",
+        "DockingRequested",
+    }
 
     @override
     def process(self, event: Event) -> list[ProjectedEvent]:
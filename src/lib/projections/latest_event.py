@@ -14,6 +14,7 @@ class LatestEventState(BaseModel):
 def latest_event_projection_factory(projectionName: str, gameEvent: str):
     class LatestEvent(Projection[LatestEventState]):
         StateModel = LatestEventState
+        subscribed_events = {gameEvent} if gameEvent else set()
 
         @override
         def process(self, event: Event) -> None:
@@ -72,6 +72,7 @@ class LoadoutState(BaseModel):
 
 class Loadout(Projection[LoadoutState]):
     StateModel = LoadoutState
+    subscribed_events = {"Loadout", "HullDamage", "RepairAll", "Died"}
 
     @override
     def process(self, event: Event) -> None:
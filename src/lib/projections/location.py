@@ -46,6 +46,21 @@ class LocationState(BaseModel):
 
 class Location(Projection[LocationState]):
     StateModel = LocationState
+    subscribed_events = {
+        "SquadronStartup",
+        "Location",
+        "SupercruiseEntry",
+        "SupercruiseExit",
+        "FSDJump",
+        "CarrierJump",
+        "Docked",
+        "Undocked",
+        "Touchdown",
+        "Liftoff",
+        "ApproachSettlement",
+        "ApproachBody",
+        "LeaveBody",
+    }
 
     @staticmethod
     def _normalize_name(value: str) -> str:
@@ -38,6 +38,7 @@ class MarketState(BaseModel):
 
 class Market(Projection[MarketState]):
     StateModel = MarketState
+    subscribed_events = {"Market"}
 
     @override
     def process(self, event: Event) -> None:
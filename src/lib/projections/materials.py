@@ -39,6 +39,14 @@ class MaterialsStateModel(BaseModel):
 
 class Materials(Projection[MaterialsStateModel]):
     StateModel = MaterialsStateModel
+    subscribed_events = {
+        "Materials",
+        "MaterialTrade",
+        "MaterialCollected",
+        "TechnologyBroker",
+        "EngineerCraft",
+        "Synthesis",
+    }
     MATERIAL_CATEGORIES: tuple[MaterialsCategory, ...] = ("Raw", "Manufactured", "Encoded")
     TEMPLATE = MATERIAL_TEMPLATE
     LOOKUP = MATERIAL_NAME_LOOKUP
@@ -49,6 +49,16 @@ class MissionsStateModel(BaseModel):
 
 class Missions(Projection[MissionsStateModel]):
     StateModel = MissionsStateModel
+    subscribed_events = {
+        "Missions",
+        "MissionAccepted",
+        "MissionCompleted",
+        "MissionRedirected",
+        "Undocked",
+        "Docked",
+        "MissionAbandoned",
+        "MissionFailed",
+    }
 
     @override
     def process(self, event: Event) -> None:
@@ -35,6 +35,7 @@ class ModuleInfoState(BaseModel):
 
 class ModuleInfo(Projection[ModuleInfoState]):
     StateModel = ModuleInfoState
+    subscribed_events = {"ModuleInfo"}
 
     @override
     def process(self, event: Event) -> None:
@@ -26,6 +26,7 @@ class NavInfoStateModel(BaseModel):
 
 class NavInfo(Projection[NavInfoStateModel]):
     StateModel = NavInfoStateModel
+    subscribed_events = {"NavRoute", "NavRouteClear", "FSDJump", "FSDTarget", "Scan", "FSSBodySignals"}
 
     def __init__(self, system_db: SystemDatabase):
         super().__init__()
@@ -31,6 +31,7 @@ class OutfittingState(BaseModel):
 
 class Outfitting(Projection[OutfittingState]):
     StateModel = OutfittingState
+    subscribed_events = {"Outfitting"}
 
     @override
     def process(self, event: Event) -> None:
@@ -19,6 +19,14 @@ class PowerplayStateModel(BaseModel):
 
 class Powerplay(Projection[PowerplayStateModel]):
     StateModel = PowerplayStateModel
+    subscribed_events = {
+        "Powerplay",
+        "PowerplayMerits",
+        "PowerplayRank",
+        "PowerplayJoin",
+        "PowerplayDefect",
+        "PowerplayLeave",
+    }
 
     def _reset_state(self) -> None:
         self.state.Power = "Unknown"
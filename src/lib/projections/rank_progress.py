@@ -30,6 +30,7 @@ class RankProgressStateModel(BaseModel):
 
 class RankProgress(Projection[RankProgressStateModel]):
     StateModel = RankProgressStateModel
+    subscribed_events = {"Rank", "Progress", "Promotion"}
 
     _category_keys = [
         "Combat",
@@ -18,6 +18,7 @@ class ReputationStateModel(BaseModel):
 
 class Reputation(Projection[ReputationStateModel]):
     StateModel = ReputationStateModel
+    subscribed_events = {"Reputation"}
 
     @override
     def process(self, event: Event) -> None:
@@ -88,6 +88,26 @@ class ShipInfoStateModel(BaseModel):
 
 class ShipInfo(Projection[ShipInfoStateModel]):
     StateModel = ShipInfoStateModel
+    subscribed_events = {
+        "Status",
+        "Loadout",
+        "JetConeBoost",
+        "Synthesis",
+        "FSDJump",
+        "Died",
+        "SRVDestroyed",
+        "Cargo",
+        "RefuelAll",
+        "RepairAll",
+        "BuyAmmo",
+        "SetUserShipName",
+        "LaunchFighter",
+        "DockFighter",
+        "DockSRV",
+        "FighterDestroyed",
+        "FighterRebuilt",
+        "VehicleSwitch",
+    }
 
     @override
     def process(self, event: Event) -> list[ProjectedEvent]:
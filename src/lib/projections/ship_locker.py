@@ -53,6 +53,7 @@ class ShipLockerState(BaseModel):
 
 class ShipLocker(Projection[ShipLockerState]):
     StateModel = ShipLockerState
+    subscribed_events = {"ShipLocker"}
 
     @override
     def process(self, event: Event) -> None:
@@ -34,6 +34,7 @@ class ShipyardState(BaseModel):
 
 class Shipyard(Projection[ShipyardState]):
     StateModel = ShipyardState
+    subscribed_events = {"Shipyard"}
 
     @override
     def process(self, event: Event) -> None:
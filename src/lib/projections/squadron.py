@@ -20,6 +20,18 @@ class SquadronStateModel(BaseModel):
 
 class Squadron(Projection[SquadronStateModel]):
     StateModel = SquadronStateModel
+    subscribed_events = {
+        "SquadronStartup",
+        "AppliedToSquadron",
+        "InvitedToSquadron",
+        "JoinedSquadron",
+        "SquadronCreated",
+        "SquadronPromotion",
+        "SquadronDemotion",
+        "LeftSquadron",
+        "KickedFromSquadron",
+        "DisbandedSquadron",
+    }
 
     def _reset_state(self) -> None:
         self.state.SquadronID = 0
@@ -15,6 +15,7 @@ class StatisticsStateModel(BaseModel):
 
 class Statistics(Projection[StatisticsStateModel]):
     StateModel = StatisticsStateModel
+    subscribed_events = {"Statistics"}
 
     @override
     def process(self, event: Event) -> None:
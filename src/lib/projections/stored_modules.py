@@ -48,6 +48,7 @@ class StoredModulesStateModel(BaseModel):
 
 class StoredModules(Projection[StoredModulesStateModel]):
     StateModel = StoredModulesStateModel
+    subscribed_events = {"StoredModules", "FetchRemoteModule"}
 
     def _get_event_time(self, event: Event | None) -> datetime:
         if isinstance(event, GameEvent) and "timestamp" in event.content:
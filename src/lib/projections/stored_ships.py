@@ -55,6 +55,7 @@ class StoredShipsStateModel(BaseModel):
 
 class StoredShips(Projection[StoredShipsStateModel]):
     StateModel = StoredShipsStateModel
+    subscribed_events = {"StoredShips", "ShipyardTransfer"}
 
     def _get_event_time(self, event: Event | None) -> datetime:
         if isinstance(event, GameEvent) and "timestamp" in event.content:
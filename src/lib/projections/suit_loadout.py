@@ -31,6 +31,7 @@ class SuitLoadoutStateModel(BaseModel):
 
 class SuitLoadout(Projection[SuitLoadoutStateModel]):
     StateModel = SuitLoadoutStateModel
+    subscribed_events = {"SuitLoadout"}
 
     @override
     def process(self, event: Event) -> None:
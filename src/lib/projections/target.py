@@ -26,6 +26,21 @@ class TargetStateModel(BaseModel):
 
 class Target(Projection[TargetStateModel]):
     StateModel = TargetStateModel
+    subscribed_events = {
+        "LoadGame",
+        "Shutdown",
+        "Died",
+        "DockSRV",
+        "LaunchSRV",
+        "SRVDestroyed",
+        "SupercruiseEntry",
+        "Disembark",
+        "Embark",
+        "LaunchFighter",
+        "DockFighter",
+        "ShipDestroyed",
+        "ShipTargeted",
+    }
 
     def __init__(self, minimum_bounty: int = 1):
         super().__init__()
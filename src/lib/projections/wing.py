@@ -12,6 +12,7 @@ class WingStateModel(BaseModel):
 
 class Wing(Projection[WingStateModel]):
     StateModel = WingStateModel
+    subscribed_events = {"WingJoin", "WingAdd", "WingLeave", "LoadGame"}
 
     @override
     def process(self, event: Event) -> None:
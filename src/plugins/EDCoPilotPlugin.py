@@ -215,6 +215,7 @@ def _build_edcopilot_panel_contents_status(contents: dict[str, Any] | None) -> s
 
 class EDCoPilotPanelContents(Projection[EDCoPilotPanelContentsState]):
     StateModel = EDCoPilotPanelContentsState
+    subscribed_events = {"EdCoPilotPanelContentsEvent"}
 
     @override
     def process(self, event: Event) -> None:
@@ -271,6 +272,7 @@ class EDCoPilotDominantTTSModel(TTSModel):
     TTS model that generates silence, allowing EDCoPilot to handle speech output.
     This is used when EDCoPilot is in "Dominant" mode.
     """
+    cacheable = False
     
     def __init__(self, speed: float = 1.0):
         super().__init__("edcopilot-dominant")
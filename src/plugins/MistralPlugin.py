@@ -230,6 +230,16 @@ class MistralTTSModel(TTSModel):
         if pcm16_buffer:
             yield bytes(pcm16_buffer)
 
+    @override
+    def cache_key_parts(self, voice: str) -> dict[str, Any] | None:
+        # the configured voice is always used, whatever voice is requested
+        return {
+            'provider': self.provider_name,
+            'base_url': str(self.client.base_url),
+            'model': self.model_name,
+            'voice': self.default_voice,
+        }
+
     @override
     def synthesize(self, text: str, voice: str) -> Iterable[bytes]:
         try:
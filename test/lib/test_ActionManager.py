@@ -3,6 +3,7 @@ from collections.abc import Generator
 from pathlib import Path
 import sys
 
+import pysqlite3 as sqlite3
 import pytest
 from openai.types.chat import ChatCompletionMessageFunctionToolCall
 
@@ -11,6 +12,19 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from src.lib.ActionManager import ActionManager
+from src.lib.Database import set_connection_for_testing
+
+
+@pytest.fixture(autouse=True)
+def mock_connection(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[sqlite3.Connection, None, None]:
+    db_path = str(tmp_path / "test.db")
+    monkeypatch.setattr('src.lib.Database.get_db_path', lambda: db_path)
+    conn = sqlite3.connect(db_path)
+    set_connection_for_testing(conn)
+    try:
+        yield conn
+    finally:
+        conn.close()
 
 
 @pytest.fixture(autouse=True)
@@ -199,3 +213,64 @@ def test_station_actions_require_docked_status() -> None:
     assert undocked_tools == []
     assert [tool["function"]["name"] for tool in docked_tools] == ["stationAction"]
     assert fighter_tools == []
+
+
+def test_tool_list_is_reused_until_actions_change() -> None:
+    manager = ActionManager()
+    manager.registerAction("firstAction", "Test action", {}, lambda args, states: "done")
+
+    tools = manager.getToolsList("ship", True, False, False, {"unusedPermission": False})
+    assert manager.getToolsList("ship", True, False, False, {}) is tools
+    assert manager.getToolsList("ship", True, True, False, {}) is not tools
+
+    manager.registerAction("secondAction", "Test action", {}, lambda args, states: "done")
+    updated_tools = manager.getToolsList("ship", True, False, False, {})
+
+    assert [tool["function"]["name"] for tool in tools] == ["firstAction"]
+    assert [tool["function"]["name"] for tool in updated_tools] == ["firstAction", "secondAction"]
+
+
+def test_cache_key_matches_previous_hash_format() -> None:
+    from hashlib import md5
+
+    manager = ActionManager()
+    manager.registerAction("landingGear", "Toggle landing gear", {"type": "object"}, lambda args, states: "ok")
+    tool = manager.actions["landingGear"]["tool"]
+
+    expected = md5(json.dumps(["deploylandinggear", tool]).encode()).hexdigest()
+    assert manager.hash_action_input("Deploy landing gear!", tool) == expected
+    assert manager.hash_action_input("Deploy landing gear!", json.loads(json.dumps(tool))) == expected
+
+
+def test_predict_action_uses_confirmed_entries_for_current_schema() -> None:
+    manager = ActionManager()
+    manager.registerAction(
+        "landingGear", "Toggle landing gear", {"type": "object"}, lambda args, states: "ok",
+        cache_prefill={"deploy landing gear": {}},
+    )
+    manager.registerAction("fireWeapons", "Fire", {"type": "object"}, lambda args, states: "ok")
+    tools = [action["tool"] for action in manager.actions.values()]
+
+    prediction = manager.predict_action("Deploy landing gear.", tools)
+    assert prediction is not None
+    assert prediction[0].function.name == "landingGear"
+    # only tools that are currently available are predicted
+    assert manager.predict_action("deploy landing gear", [manager.actions["fireWeapons"]["tool"]]) is None
+
+    # a learned action is available as soon as it is confirmed
+    fire = make_tool_call("fireWeapons", {"group": 1})
+    manager.suggest_action_for_cache("open fire", fire, tools)
+    assert manager.predict_action("open fire", tools) is None
+    manager.confirm_action_in_cache("open fire", fire, tools)
+    prediction = manager.predict_action("Open fire!", tools)
+    assert prediction is not None
+    assert json.loads(prediction[0].function.arguments) == {"group": 1}
+
+    # changing the schema invalidates the entries stored for the old one
+    manager.registerAction("fireWeapons", "Fire", {"type": "object", "properties": {}}, lambda args, states: "ok")
+    tools = [action["tool"] for action in manager.actions.values()]
+    assert manager.predict_action("open fire", tools) is None
+    assert manager.predict_action("deploy landing gear", tools) is not None
+
+    ActionManager.clear_action_cache()
+    assert manager.predict_action("deploy landing gear", tools) is None
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from src.lib.AudioFilters import apply_one_pole
+
+
+def one_pole_reference(signal: np.ndarray, a: float, b: float, y_prev: float) -> tuple[np.ndarray, float]:
+    output = np.empty(signal.shape[0], dtype=np.float64)
+    for index, sample in enumerate(signal):
+        y_prev = a * y_prev + b * float(sample)
+        output[index] = y_prev
+    return output, y_prev
+
+
+@pytest.mark.parametrize("a", [0.0, 0.001, 0.5, 0.995, 0.99999])
+@pytest.mark.parametrize("length", [1, 63, 64, 65, 1024, 24_000])
+def test_apply_one_pole_matches_sample_by_sample_recursion(a: float, length: int) -> None:
+    signal = np.random.default_rng(length).standard_normal(length).astype(np.float32)
+    expected, expected_last = one_pole_reference(signal, a, 1.0 - a, 0.3)
+
+    output, last = apply_one_pole(signal, a, 1.0 - a, 0.3)
+
+    assert output.dtype == np.float32
+    np.testing.assert_allclose(output, expected, atol=1e-5)
+    assert last == pytest.approx(expected_last, abs=1e-6)
+
+
+def test_apply_one_pole_carries_state_across_chunks() -> None:
+    signal = np.random.default_rng(0).standard_normal(5000).astype(np.float32)
+    whole, _ = apply_one_pole(signal, 0.9, 0.1, 0.0)
+
+    chunks = []
+    y_prev = 0.0
+    for start in range(0, signal.shape[0], 777):
+        chunk, y_prev = apply_one_pole(signal[start:start + 777], 0.9, 0.1, y_prev)
+        chunks.append(chunk)
+
+    np.testing.assert_allclose(np.concatenate(chunks), whole, atol=1e-6)
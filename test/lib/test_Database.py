@@ -11,7 +11,9 @@ import sys
 ROOT_DIR = Path(__file__).resolve().parents[2]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
-from src.lib.Database import EventStore, KeyValueStore, ModelUsageStore, VectorStore, set_connection_for_testing
+from src.lib.Database import ConnectionPool, EventStore, KeyValueStore, ModelUsageStore, VectorStore, get_connection, release_connection, set_connection_for_testing, transaction
+import src.lib.Database as Database
+import threading
 from src.lib.Event import ToolProcessingEvent
 import sqlite_vec
 
@@ -44,6 +46,7 @@ def mock_connection(db_path: str, monkeypatch: pytest.MonkeyPatch) -> Generator[
     # Reset tables that might exist from other tests
     cursor = conn.cursor()
     cursor.execute("DROP TABLE IF EXISTS test_events_v1")
+    cursor.execute("DROP TABLE IF EXISTS test_events_archive_v1")
     cursor.execute("DROP TABLE IF EXISTS test_store_v1")
     cursor.execute("DROP TABLE IF EXISTS test_vectors_v1")
     cursor.execute("DROP TABLE IF EXISTS test_vectors_vec_v1")
@@ -161,6 +164,33 @@ def test_event_store_get_latest_skips_unknown_classes(event_store: EventStore, m
     assert isinstance(events[0], SampleEvent1)
     assert events[0].name == "known"
 
+def test_event_store_get_latest_uses_unmemorized_index(event_store: EventStore, mock_connection: sqlite3.Connection) -> None:
+    plan = mock_connection.execute(
+        "EXPLAIN QUERY PLAN SELECT class FROM test_events_v1 WHERE memorized_at is NULL ORDER BY processed_at DESC LIMIT 10"
+    ).fetchall()
+    assert any("test_events_v1_unmemorized_idx" in row[-1] for row in plan)
+
+def test_event_store_archive_memorized(event_store: EventStore, mock_connection: sqlite3.Connection) -> None:
+    event_store.delete_all()
+    event_store.insert_event(SampleEvent1(name="old", value=1), 100.0)
+    event_store.insert_event(SampleEvent1(name="recent", value=2), 200.0)
+    event_store.insert_event(SampleEvent2(message="unmemorized"), 300.0)
+    event_store.memorize_before(250.0)
+
+    assert event_store.archive_memorized(before=150.0) == 1
+    assert event_store.archive_memorized(before=150.0) == 0
+
+    remaining = mock_connection.execute("SELECT processed_at FROM test_events_v1 ORDER BY processed_at").fetchall()
+    assert [row[0] for row in remaining] == [200.0, 300.0]
+    archived = event_store.get_archived()
+    assert len(archived) == 1
+    assert isinstance(archived[0], SampleEvent1)
+    assert archived[0].name == "old"
+    assert archived[0].memorized_at == 250.0
+
+    event_store.delete_all()
+    assert event_store.get_archived() == []
+
 def test_event_store_delete_all(event_store: EventStore) -> None:
     """Test deleting all events"""
     event = SampleEvent1(name="test", value=42)
@@ -222,6 +252,19 @@ def test_kv_store_set_get(kv_store: KeyValueStore) -> None:
     assert kv_store.get("key1") == "updated"
     assert kv_store.get("nonexistent", "default") == "default"
 
+def test_kv_store_set_many(kv_store: KeyValueStore) -> None:
+    """Test bulk upserting new and existing keys"""
+    # Clean start
+    kv_store.delete_all()
+
+    kv_store.init("key1", "2.0", "value1")
+    kv_store.set_many({"key1": "updated", "key2": {"nested": [1, 2]}})
+
+    assert kv_store.get("key1") == "updated"
+    assert kv_store.get_version("key1") == "2.0"
+    assert kv_store.get("key2") == {"nested": [1, 2]}
+    assert kv_store.get_version("key2") == "1.0"
+
 def test_kv_store_get_all(kv_store: KeyValueStore) -> None:
     """Test getting all values"""
     # Clean start
@@ -352,3 +395,85 @@ def test_model_usage_store_time_window_history(model_usage_store: ModelUsageStor
     assert rows[0]["timestamp"] == "2026-03-20T10:00:00.000000Z"
     assert rows[0]["payload"]["context"] == "genui"
     assert rows[0]["payload"]["model_usage"]["total_tokens"] == 22
+
+def test_transaction_groups_writes(kv_store: KeyValueStore, db_path: str) -> None:
+    with transaction():
+        kv_store.set("key1", "value1")
+        with transaction():
+            kv_store.set("key2", "value2")
+        # nothing is committed until the outermost transaction ends
+        other = sqlite3.connect(db_path)
+        assert other.execute("SELECT COUNT(*) FROM test_store_v1").fetchone()[0] == 0
+        other.close()
+    assert kv_store.get("key1") == "value1"
+    assert kv_store.get("key2") == "value2"
+
+def test_transaction_rolls_back_on_error(kv_store: KeyValueStore) -> None:
+    with pytest.raises(RuntimeError):
+        with transaction():
+            kv_store.set("key1", "value1")
+            raise RuntimeError("failed")
+    assert kv_store.get("key1") is None
+
+def test_connection_pool_reuses_connections(mock_connection: sqlite3.Connection) -> None:
+    _ = mock_connection
+    pool = ConnectionPool(max_idle=1)
+    first = pool.acquire()
+    second = pool.acquire()
+    assert first is not second
+    assert first.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    pool.release(first)
+    pool.release(second)  # exceeds max_idle and is closed
+    assert pool.acquire() is first
+    with pytest.raises(sqlite3.ProgrammingError):
+        second.execute("SELECT 1")
+    pool.close()
+
+
+def test_connection_pool_blocks_until_a_connection_is_released(mock_connection: sqlite3.Connection) -> None:
+    _ = mock_connection
+    pool = ConnectionPool(max_connections=1, acquire_timeout=0.05)
+    first = pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+
+    released = threading.Timer(0.05, pool.release, args=(first,))
+    released.start()
+    assert pool.acquire(timeout=5) is first
+    released.join()
+    pool.close()
+
+def test_release_connection_returns_the_thread_connection(mock_connection: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch) -> None:
+    _ = mock_connection
+    pool = ConnectionPool(max_connections=1, acquire_timeout=1)
+    monkeypatch.setattr(Database, "_pool", pool)
+    connections: list[object] = []
+    def worker() -> None:
+        try:
+            connections.append(get_connection())
+        finally:
+            release_connection()
+    for _ in range(2):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+    # the second worker only gets a connection because the first one released it
+    assert len(connections) == 2
+    assert connections[0] is connections[1]
+    pool.close()
+
+def test_store_pragmas_apply_to_pooled_connections(mock_connection: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch) -> None:
+    pool = ConnectionPool(max_idle=1)
+    monkeypatch.setattr(Database, "_pool", pool)
+    idle = pool.acquire()
+    pool.release(idle)
+
+    KeyValueStore("test_store", pragmas={"cache_size": -2000})
+    assert mock_connection.execute("PRAGMA cache_size").fetchone()[0] == -2000
+    # connections configured before the store asked for it get it when they are handed out again
+    conn = pool.acquire()
+    assert conn is idle
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -2000
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    pool.release(conn)
+    pool.close()
@@ -104,3 +104,104 @@ def test_edjournal_switch_to_new_file(journal_dir):
     event = journal.events.get(timeout=1)
     assert event["event"] == "File2Event1"
     assert file2.name in event["id"]
+
+def test_edjournal_partial_line(journal_file):
+    """Test that a line written in two parts is only parsed once complete"""
+    journal = EDJournal(Path(journal_file).parent.as_posix())
+    time.sleep(0.1)
+
+    line = json.dumps({"timestamp": "2024-01-01T12:00:01Z", "event": "PartialEvent"})
+    with open(journal_file, "a") as f:
+        f.write(line[:10])
+    time.sleep(0.1)
+    assert journal.events.empty()
+    with open(journal_file, "a") as f:
+        f.write(line[10:] + "\n")
+
+    event = journal.events.get(timeout=1)
+    assert event["event"] == "PartialEvent"
+    assert event["id"].endswith(".000003")
+
+class DictStore:
+    """In-memory stand-in for KeyValueStore"""
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+def test_edjournal_resume_from_index(journal_file):
+    """Test that a persisted index skips already loaded lines on the next startup"""
+    store = DictStore()
+    journal = EDJournal(Path(journal_file).parent.as_posix(), index_store=store)
+    assert len(journal.historic_events) == 2
+    # nothing is persisted before the events are committed
+    assert store.get(Path(journal_file).name) is None
+    journal.commit_position(journal.historic_events[-1]["id"])
+
+    index = store.get(Path(journal_file).name)
+    assert index["line_count"] == 2
+    assert index["offset"] == Path(journal_file).stat().st_size
+    assert index["last_event_id"].endswith(".000002")
+
+    with open(journal_file, "a") as f:
+        f.write(json.dumps({"timestamp": "2024-01-01T12:05:00Z", "event": "Music"}) + "\n")
+
+    resumed = EDJournal(Path(journal_file).parent.as_posix(), index_store=store)
+    assert [e["event"] for e in resumed.historic_events] == ["Music"]
+    assert resumed.historic_events[0]["id"].endswith(".000003")
+
+    # the live reader continues after the resumed position without replaying old lines
+    new_event = write_event(journal_file)
+    event = resumed.events.get(timeout=1)
+    assert event["event"] == new_event["event"]
+    assert event["id"].endswith(".000004")
+
+def test_edjournal_uncommitted_events_are_read_again(journal_file):
+    """Test that live events are only skipped on the next startup once they were committed"""
+    store = DictStore()
+    journal = EDJournal(Path(journal_file).parent.as_posix(), index_store=store)
+    journal.commit_position(journal.historic_events[-1]["id"])
+
+    first = write_event(journal_file, "First")
+    assert journal.events.get(timeout=1)["event"] == first["event"]
+    write_event(journal_file, "Second")
+    second = journal.events.get(timeout=1)
+    assert second["event"] == "Second"
+
+    resumed = EDJournal(Path(journal_file).parent.as_posix(), index_store=store)
+    assert [e["event"] for e in resumed.historic_events] == ["First", "Second"]
+
+    resumed.commit_position(resumed.historic_events[-1]["id"])
+    write_event(journal_file, "Third")
+    restarted = EDJournal(Path(journal_file).parent.as_posix(), index_store=store)
+    assert [e["event"] for e in restarted.historic_events] == ["Third"]
+    assert [e["event"] for e in restarted.read_skipped_history()] == ["Startup", "LoadGame", "First", "Second"]
+
+def test_edjournal_index_ignored_for_replaced_file(journal_file):
+    """Test that a journal that shrank is read from the start again"""
+    store = DictStore()
+    journal = EDJournal(Path(journal_file).parent.as_posix(), index_store=store)
+    journal.commit_position(journal.historic_events[-1]["id"])
+
+    with open(journal_file, "w") as f:
+        f.write(json.dumps({"timestamp": "2024-01-01T12:00:00Z", "event": "Fileheader"}) + "\n")
+
+    journal = EDJournal(Path(journal_file).parent.as_posix(), index_store=store)
+    assert [e["event"] for e in journal.historic_events] == ["Fileheader"]
+
+def test_edjournal_history_augments_only_latest(journal_dir):
+    """Test that only the last companion-file event of each kind is augmented during history load"""
+    journal_path = Path(journal_dir) / "Journal.2024-01-01T120000.01.log"
+    with open(journal_path, "w") as f:
+        f.write(json.dumps({"timestamp": "2024-01-01T12:00:00Z", "event": "Market"}) + "\n")
+        f.write(json.dumps({"timestamp": "2024-01-01T12:10:00Z", "event": "Market"}) + "\n")
+    with open(Path(journal_dir) / "Market.json", "w") as f:
+        json.dump({"timestamp": "2024-01-01T12:10:00Z", "event": "Market", "Items": [1]}, f)
+
+    journal = EDJournal(journal_dir)
+    assert "Items" not in journal.historic_events[0]
+    assert journal.historic_events[1]["Items"] == [1]
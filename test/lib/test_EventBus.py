@@ -0,0 +1,31 @@
+import threading
+import time
+
+from src.lib.EventBus import EventBus
+
+
+def test_wait_times_out_without_notification() -> None:
+    bus = EventBus()
+    start = time.monotonic()
+    assert bus.wait(timeout=0.05) is False
+    assert time.monotonic() - start >= 0.04
+
+
+def test_notification_before_wait_is_not_lost() -> None:
+    bus = EventBus()
+    bus.notify()
+    assert bus.wait(timeout=0) is True
+    # the notification is consumed by the first wait
+    assert bus.wait(timeout=0) is False
+
+
+def test_queue_put_wakes_up_waiting_thread() -> None:
+    bus = EventBus()
+    queue = bus.create_queue()
+    timer = threading.Timer(0.05, lambda: queue.put("event"))
+    timer.start()
+    try:
+        assert bus.wait(timeout=5) is True
+        assert queue.get_nowait() == "event"
+    finally:
+        timer.cancel()
@@ -0,0 +1,300 @@
+from collections.abc import Generator
+from pathlib import Path
+
+import pysqlite3 as sqlite3
+import pytest
+import sqlite_vec
+from pydantic import BaseModel
+from typing_extensions import override
+
+from src.lib.Database import set_connection_for_testing
+from src.lib.Event import ConversationEvent, Event, GameEvent, StatusEvent
+from src.lib.EventManager import EventManager, Projection
+from src.lib.RecentEventWindow import RecentEventWindow
+
+
+class CounterState(BaseModel):
+    count: int = 0
+
+
+class Counter(Projection[CounterState]):
+    StateModel = CounterState
+
+    @override
+    def process(self, event: Event) -> None:
+        if isinstance(event, GameEvent) and event.content.get("event") == "Counted":
+            self.state.count += 1
+
+
+class SubscribedCounter(Projection[CounterState]):
+    StateModel = CounterState
+    subscribed_events = {"Counted", "status"}
+
+    def __init__(self):
+        super().__init__()
+        self.seen: list[str] = []
+
+    @override
+    def process(self, event: Event) -> None:
+        self.seen.append(event.kind)
+        self.state.count += 1
+
+
+@pytest.fixture
+def mock_connection(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[sqlite3.Connection, None, None]:
+    db_path = str(tmp_path / "test.db")
+    monkeypatch.setattr('src.lib.Database.get_db_path', lambda: db_path)
+    conn = sqlite3.connect(db_path)
+    conn.enable_load_extension(True)
+    sqlite_vec.load(conn)
+    conn.enable_load_extension(False)
+    set_connection_for_testing(conn)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def event_manager(mock_connection: sqlite3.Connection, request: pytest.FixtureRequest) -> Generator[EventManager, None, None]:
+    _ = mock_connection
+    manager = EventManager(game_events=[], projection_flush_interval=60.0, **getattr(request, "param", {}))
+    try:
+        yield manager
+    finally:
+        manager._timer_stop_event.set()
+
+
+def stored_count(manager: EventManager) -> int | None:
+    stored = manager.projection_store.get("Counter")
+    return stored["state"]["count"] if stored else None
+
+
+def test_projection_states_are_flushed_in_batches(event_manager: EventManager) -> None:
+    event_manager.register_projection(Counter())
+    event_manager.save_projections(force=True)
+    assert stored_count(event_manager) == 0
+
+    event_manager.add_game_event({"event": "Counted", "timestamp": "2024-01-01T00:00:00Z"})
+    event_manager.process()
+    # still inside the flush interval, nothing is written yet
+    assert stored_count(event_manager) == 0
+
+    event_manager.save_projections(force=True)
+    assert stored_count(event_manager) == 1
+
+
+def test_unchanged_projection_states_are_not_rewritten(event_manager: EventManager, monkeypatch: pytest.MonkeyPatch) -> None:
+    projection = Counter()
+    event_manager.register_projection(projection)
+    event_manager.save_projections(force=True)
+
+    writes: list[list[str]] = []
+    original_set_many = event_manager.projection_store.set_many
+    def recording_set_many(values):
+        writes.append(list(values.keys()))
+        original_set_many(values)
+    monkeypatch.setattr(event_manager.projection_store, "set_many", recording_set_many)
+
+    event_manager.mark_projection_dirty(projection)
+    event_manager.save_projections(force=True)
+    assert writes == []
+
+    projection.state.count = 5
+    event_manager.mark_projection_dirty(projection)
+    event_manager.save_projections(force=True)
+    assert writes == [["Counter"]]
+    assert stored_count(event_manager) == 5
+
+
+def test_events_are_only_routed_to_subscribed_projections(event_manager: EventManager) -> None:
+    subscribed = SubscribedCounter()
+    catch_all = Counter()
+    event_manager.register_projection(subscribed)
+    event_manager.register_projection(catch_all)
+
+    event_manager.add_game_event({"event": "Ignored", "timestamp": "2024-01-01T00:00:00Z"})
+    event_manager.add_game_event({"event": "Counted", "timestamp": "2024-01-01T00:00:01Z"})
+    event_manager.add_status_event({"event": "Status"})
+    event_manager.process()
+
+    assert subscribed.seen == ["game", "status"]
+    assert catch_all.state.count == 1
+    assert event_manager.get_subscribed_projections(GameEvent(content={"event": "Ignored"}, historic=False)) == [catch_all]
+    assert event_manager.get_subscribed_projections(StatusEvent(status={"event": "Status"})) == [subscribed, catch_all]
+
+
+def test_projection_revisions_only_change_with_state(event_manager: EventManager) -> None:
+    event_manager.register_projection(Counter())
+    revision = event_manager.get_projection_revisions()["Counter"]
+
+    event_manager.add_game_event({"event": "Ignored", "timestamp": "2024-01-01T00:00:00Z"})
+    event_manager.process()
+    assert event_manager.get_projection_revisions()["Counter"] == revision
+
+    event_manager.add_game_event({"event": "Counted", "timestamp": "2024-01-01T00:00:01Z"})
+    event_manager.process()
+    assert event_manager.get_projection_revisions()["Counter"] == revision + 1
+    assert event_manager.get_projection_state_dump("Counter") == {"count": 1}
+
+
+def test_maintenance_archives_old_memorized_events(event_manager: EventManager, mock_connection: sqlite3.Connection) -> None:
+    assert mock_connection.execute("PRAGMA auto_vacuum").fetchone()[0] == 2  # INCREMENTAL
+    event_manager.short_term_memory.insert_event(GameEvent(content={"event": "Old"}, historic=False), 100.0)
+    event_manager.short_term_memory.memorize_before(100.0)
+    event_manager.event_retention_days = 1
+
+    assert event_manager.run_maintenance() == 1
+    assert mock_connection.execute("SELECT COUNT(*) FROM events_v1").fetchone()[0] == 0
+
+
+def test_short_term_memory_matches_the_store(event_manager: EventManager) -> None:
+    store = event_manager.short_term_memory.store
+    window = event_manager.short_term_memory
+    window.insert_event(GameEvent(content={"event": "First"}, historic=False), 10.0)
+    window.insert_event(ConversationEvent(kind="user", content="hello"), 30.0)
+    # replayed out of order
+    window.insert_event(GameEvent(content={"event": "Second"}, historic=False), 20.0)
+    window.insert_event(ConversationEvent(kind="assistant", content="hi"), 40.0)
+    window.replied_before(30.0)
+    window.memorize_before(10.0)
+
+    def summary(events: list[Event]) -> list[tuple[str, float, float | None, float | None]]:
+        return [(event.kind, event.processed_at, event.responded_at, event.memorized_at) for event in events]
+
+    assert summary(event_manager.get_short_term_memory(10)) == summary(store.get_latest(10))
+    assert event_manager.get_short_term_memory_counts() == (3, 2)
+
+    window.delete_classes(["ConversationEvent"])
+    assert summary(event_manager.get_short_term_memory(10)) == summary(store.get_latest(10))
+    assert event_manager.get_short_term_memory_counts() == (1, 0)
+
+
+def test_recent_event_window_falls_back_to_the_store_past_its_size(event_manager: EventManager) -> None:
+    window = RecentEventWindow(event_manager.short_term_memory.store, max_size=4)
+    for index in range(10):
+        window.insert_event(GameEvent(content={"event": f"Event{index}"}, historic=False), float(index))
+
+    assert window.get_counts()[0] <= 5
+    assert [event.content["event"] for event in window.get_latest(3)] == ["Event9", "Event8", "Event7"]
+    assert len(window.get_latest(10)) == 10
+
+
+@pytest.mark.parametrize("event_manager", [{"history_max_events": 3}], indirect=True)
+def test_history_spills_old_events_and_still_replays_them(event_manager: EventManager) -> None:
+    # journal entries older than the loaded history
+    event_manager.min_history_id = event_manager.max_history_id = "m"
+    event_manager.add_historic_game_events([
+        {"event": "Counted", "id": "a", "timestamp": "2024-01-01T00:00:00Z"},
+        {"event": "Counted", "id": "b", "timestamp": "2024-01-01T00:00:01Z"},
+    ])
+    assert [event.content["id"] for event in event_manager.processed.recent()] == ["a", "b"]
+    for index in range(3):
+        event_manager.add_game_event({"event": "Counted", "timestamp": f"2024-01-01T00:01:0{index}Z"})
+        event_manager.process()
+
+    # historic events count as processed at 0.0 and are spilled first
+    assert all(not isinstance(event, GameEvent) or not event.historic for event in event_manager.processed.recent())
+    assert len(event_manager.processed) <= 3
+
+    event_manager.register_projection(Counter())
+    assert event_manager.get_projection_state("Counter").count == 5
+
+
+def test_register_projections_replays_history_once_for_all(event_manager: EventManager, monkeypatch: pytest.MonkeyPatch) -> None:
+    for index in range(3):
+        event_manager.add_game_event({"event": "Counted", "id": f"{index}", "timestamp": f"2024-01-01T00:00:0{index}Z"})
+    event_manager.process()
+
+    counter = Counter()
+    subscribed = SubscribedCounter()
+    event_manager.register_projections([counter, subscribed])
+    assert counter.state.count == 3
+    assert subscribed.seen == ["game", "game", "game"]
+    assert event_manager.projections == [counter, subscribed]
+
+    # versions are reused while the module file is unchanged
+    def fail_getsource(_: object) -> str:
+        raise AssertionError("source should not be read again")
+    monkeypatch.setattr("src.lib.EventManager.inspect.getsource", fail_getsource)
+    restarted = EventManager(game_events=[], projection_flush_interval=60.0)
+    try:
+        restarted.register_projections([Counter()])
+        assert restarted.get_projection_state("Counter").count == 3
+    finally:
+        restarted._timer_stop_event.set()
+
+
+def test_reset_projections_replay_skipped_journal_history(event_manager: EventManager) -> None:
+    skipped = [
+        {"event": "Counted", "id": "Journal.01.log.000001", "timestamp": "2024-01-01T00:00:00Z"},
+        {"event": "Counted", "id": "Journal.01.log.000002", "timestamp": "2024-01-01T00:00:01Z"},
+    ]
+    event_manager.set_history_loader(lambda: skipped)
+    committed: list[list[Event]] = []
+    event_manager.register_commit_hook(committed.append)
+
+    # new projection, its state has to be rebuilt from the whole journal
+    event_manager.register_projections([Counter()])
+    assert event_manager.get_projection_state("Counter").count == 2
+    event_manager.save_projections(force=True)
+
+    event_manager.add_game_event({"event": "Counted", "id": "Journal.01.log.000003", "timestamp": "2024-01-01T00:00:02Z"})
+    event_manager.process()
+    assert [[event.content["id"] for event in batch if isinstance(event, GameEvent)] for batch in committed] == [["Journal.01.log.000003"]]
+
+    # the stored state already includes the skipped lines
+    restarted = EventManager(game_events=[], projection_flush_interval=60.0)
+    try:
+        restarted.set_history_loader(lambda: skipped)
+        restarted.register_projections([Counter()])
+        assert restarted.get_projection_state("Counter").count == 3
+    finally:
+        restarted._timer_stop_event.set()
+
+
+def test_sideeffects_run_after_the_events_are_committed(event_manager: EventManager, mock_connection: sqlite3.Connection) -> None:
+    db_path = mock_connection.execute("PRAGMA database_list").fetchone()[2]
+    stored_when_triggered: list[int] = []
+    def count_stored(event: Event, states) -> None:
+        other = sqlite3.connect(db_path)
+        try:
+            stored_when_triggered.append(other.execute("SELECT COUNT(*) FROM events_v1").fetchone()[0])
+        finally:
+            other.close()
+    event_manager.register_sideeffect(count_stored)
+
+    event_manager.add_game_event({"event": "Counted", "timestamp": "2024-01-01T00:00:00Z"})
+    event_manager.add_game_event({"event": "Counted", "timestamp": "2024-01-01T00:00:01Z"})
+    event_manager.process()
+
+    # each event is visible to other connections before its sideeffects run
+    assert stored_when_triggered == [1, 2]
+
+
+def test_rolled_back_events_are_written_again(event_manager: EventManager, monkeypatch: pytest.MonkeyPatch) -> None:
+    projection = Counter()
+    event_manager.register_projection(projection)
+    committed: list[list[Event]] = []
+    event_manager.register_commit_hook(committed.append)
+    triggered: list[Event] = []
+    event_manager.register_sideeffect(lambda event, states: triggered.append(event))
+
+    store = event_manager.short_term_memory.store
+    original_insert = store.insert_event
+    failures = [sqlite3.OperationalError("database is locked")]
+    def failing_insert(*args, **kwargs):
+        if failures:
+            raise failures.pop()
+        return original_insert(*args, **kwargs)
+    monkeypatch.setattr(store, "insert_event", failing_insert)
+
+    event_manager.add_game_event({"event": "Counted", "timestamp": "2024-01-01T00:00:00Z"})
+    event_manager.process()
+
+    assert projection.state.count == 1
+    assert len(triggered) == 1
+    assert len(committed) == 1
+    assert [event.kind for event in event_manager.get_short_term_memory(10)] == ["game"]
+    assert [event.kind for event in store.get_latest(limit=10)] == ["game"]
+    assert stored_count(event_manager) == 1
@@ -0,0 +1,47 @@
+import sys
+import pytest
+
+from src.lib.FileWatcher import InotifyFileWatcher, PollingFileWatcher, create_file_watcher
+
+
+def test_polling_watcher_reports_created_and_modified(tmp_path):
+    watcher = PollingFileWatcher(str(tmp_path), poll_interval=0.01)
+    journal = tmp_path / "Journal.2024-01-01T120000.01.log"
+    journal.write_text("{}\n")
+
+    changes = watcher.wait(timeout=1)
+    assert [(c.kind, c.name) for c in changes] == [("created", journal.name)]
+
+    watcher.track(journal.name)
+    with open(journal, "a") as f:
+        f.write("{}\n")
+    changes = watcher.wait(timeout=1)
+    assert [(c.kind, c.name) for c in changes] == [("modified", journal.name)]
+
+
+def test_polling_watcher_times_out_without_changes(tmp_path):
+    watcher = PollingFileWatcher(str(tmp_path), poll_interval=0.01)
+    assert watcher.wait(timeout=0.05) == []
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+def test_inotify_watcher_reports_appends(tmp_path):
+    journal = tmp_path / "Journal.2024-01-01T120000.01.log"
+    journal.write_text("{}\n")
+    watcher = InotifyFileWatcher(str(tmp_path))
+    try:
+        assert watcher.wait(timeout=0.05) == []
+        with open(journal, "a") as f:
+            f.write("{}\n")
+        changes = watcher.wait(timeout=1)
+        assert ("modified", journal.name) in [(c.kind, c.name) for c in changes]
+    finally:
+        watcher.close()
+
+
+def test_create_file_watcher_handles_missing_directory(tmp_path):
+    watcher = create_file_watcher(str(tmp_path / "missing"))
+    try:
+        assert watcher.wait(timeout=0.05) == []
+    finally:
+        watcher.close()
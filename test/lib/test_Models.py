@@ -1,9 +1,15 @@
 from pathlib import Path
 import sys
+import types
 from unittest.mock import MagicMock
 
-from openai.types.chat import ChatCompletion, ChatCompletionMessage
+import numpy as np
+import pytest
+
+from openai.types.chat import ChatCompletion, ChatCompletionChunk, ChatCompletionMessage
 from openai.types.chat.chat_completion import Choice
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice, ChoiceDelta, ChoiceDeltaToolCall, ChoiceDeltaToolCallFunction
+from openai.types.completion_usage import CompletionUsage
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 if str(ROOT_DIR) not in sys.path:
@@ -13,7 +19,7 @@ if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
 from src.plugins.MistralPlugin import MistralLLMModel
-from src.lib.Models import OpenAILLMModel, OpenAIResponsesLLMModel
+from src.lib.Models import FasterWhisperSTTModel, LLMError, OpenAILLMModel, OpenAIResponsesLLMModel, _normalize_tools_for_chat_template
 
 
 class ContentChunk:
@@ -33,6 +39,22 @@ class RawResponse:
         return self.value
 
 
+class FakeStream(list):
+    def close(self) -> None:
+        pass
+
+
+def create_chat_chunk(delta: ChoiceDelta | None = None, usage: CompletionUsage | None = None) -> ChatCompletionChunk:
+    return ChatCompletionChunk.model_construct(
+        id="chunk",
+        choices=[ChunkChoice.model_construct(index=0, delta=delta, finish_reason=None)] if delta else [],
+        created=0,
+        model="test-model",
+        object="chat.completion.chunk",
+        usage=usage,
+    )
+
+
 def create_chat_completion(text: str = "Recovered") -> ChatCompletion:
     message = ChatCompletionMessage.model_construct(role="assistant", content=text)
     return ChatCompletion.model_construct(
@@ -217,3 +239,132 @@ def test_chat_completion_json_encodes_structured_tool_prompt() -> None:
 
     request_messages = model.client.chat.completions.with_raw_response.create.call_args.kwargs["messages"]
     assert request_messages[0]["content"] == '{"systems": ["Sol"]}'
+
+
+def test_tool_schemas_are_normalized_once_and_stay_identical() -> None:
+    tools = [{
+        "type": "function",
+        "function": {
+            "name": "setSpeed",
+            "description": "Set speed",
+            "parameters": {"properties": {"speed": {"enum": ["full", "zero"]}}},
+        },
+    }]
+
+    normalized = _normalize_tools_for_chat_template(tools)
+    assert normalized[0]["function"]["parameters"]["type"] == "object"
+    assert normalized[0]["function"]["parameters"]["properties"]["speed"]["description"] == ""
+    assert "type" not in tools[0]["function"]["parameters"]
+    assert _normalize_tools_for_chat_template(list(tools))[0] is normalized[0]
+
+    model = OpenAIResponsesLLMModel(
+        base_url="https://api.openai.com/v1",
+        api_key="test-key",
+        model_name="gpt-5-mini",
+        temperature=1.0,
+    )
+    converted = model._convert_tools(tools)
+    assert converted[0]["name"] == "setSpeed"
+    assert model._convert_tools(tools) is converted
+
+
+def test_chat_completion_stream_yields_text_and_assembles_tool_calls() -> None:
+    model = OpenAILLMModel(
+        base_url="https://api.openai.com/v1",
+        api_key="test-key",
+        model_name="gpt-test",
+        temperature=1.0,
+        provider_name="openai",
+    )
+    chunks = FakeStream([
+        create_chat_chunk(ChoiceDelta.model_construct(content="Deploying ")),
+        create_chat_chunk(ChoiceDelta.model_construct(content="gear.")),
+        create_chat_chunk(ChoiceDelta.model_construct(tool_calls=[ChoiceDeltaToolCall.model_construct(
+            index=0, id="call-1", function=ChoiceDeltaToolCallFunction.model_construct(name="landingGear", arguments='{"deplo'),
+        )])),
+        create_chat_chunk(ChoiceDelta.model_construct(tool_calls=[ChoiceDeltaToolCall.model_construct(
+            index=0, id=None, function=ChoiceDeltaToolCallFunction.model_construct(name=None, arguments='y": true}'),
+        )])),
+        create_chat_chunk(usage=CompletionUsage(prompt_tokens=10, completion_tokens=5, total_tokens=15)),
+    ])
+    model.client.chat.completions.with_raw_response.create = MagicMock(return_value=RawResponse(chunks, retries_taken=1))
+
+    deltas = list(model.generate_stream([{"role": "user", "content": "Gear down"}]))
+
+    assert [delta.text for delta in deltas if delta.text] == ["Deploying ", "gear."]
+    assert [delta.tool_call_started for delta in deltas].count(True) == 1
+    final = deltas[-1]
+    assert final.tool_calls is not None and len(final.tool_calls) == 1
+    assert final.tool_calls[0].id == "call-1"
+    assert final.tool_calls[0].function.name == "landingGear"
+    assert final.tool_calls[0].function.arguments == '{"deploy": true}'
+    assert final.usage is not None
+    assert final.usage.total_tokens == 15
+    assert final.usage.output_chars == len("Deploying gear.")
+    assert final.usage.retry_attempts == 1
+    assert model.client.chat.completions.with_raw_response.create.call_args.kwargs["stream"] is True
+
+
+def test_responses_stream_yields_text_and_final_usage() -> None:
+    model = OpenAIResponsesLLMModel(
+        base_url="https://api.openai.com/v1",
+        api_key="test-key",
+        model_name="gpt-test",
+        temperature=1.0,
+        provider_name="openai",
+    )
+    response = MagicMock()
+    response.usage = None
+    response.output = []
+    events = FakeStream([
+        MagicMock(type="response.output_text.delta", delta="Hello"),
+        MagicMock(type="response.output_text.delta", delta=" there."),
+        MagicMock(type="response.completed", response=response),
+    ])
+    model.client.responses.with_raw_response.create = MagicMock(return_value=RawResponse(events))
+
+    deltas = list(model.generate_stream([{"role": "user", "content": "Hello"}]))
+
+    assert "".join(delta.text for delta in deltas if delta.text) == "Hello there."
+    assert deltas[-1].tool_calls is None
+    assert deltas[-1].usage is not None
+    assert deltas[-1].usage.output_chars == len("Hello there.")
+
+
+class FakeWhisperModel:
+    def __init__(self, model_name: str, device: str, compute_type: str):
+        self.model_name = model_name
+        self.device = device
+        self.compute_type = compute_type
+        self.calls: list[np.ndarray] = []
+
+    def transcribe(self, samples: np.ndarray, **kwargs):
+        self.calls.append(samples)
+        text = ' Hello' if samples.any() else ''
+        return iter([types.SimpleNamespace(text=text), types.SimpleNamespace(text=' commander. ')]), None
+
+
+def test_faster_whisper_warms_up_and_transcribes_raw_pcm(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "faster_whisper", types.SimpleNamespace(WhisperModel=FakeWhisperModel))
+
+    model = FasterWhisperSTTModel("base", language="en", provider_name="local-whisper")
+    pcm = (np.full(8000, 0.25) * 32767).astype(np.int16).tobytes()
+
+    assert model.transcribe_pcm(pcm) == "Hello commander."
+    assert model._model.compute_type == "int8"
+    warm_up, request = model._model.calls
+    assert not warm_up.any()
+    assert request.dtype == np.float32
+    assert request[0] == pytest.approx(0.25, abs=1e-4)
+
+
+def test_faster_whisper_reports_load_failure(monkeypatch) -> None:
+    def failing_model(*args, **kwargs):
+        raise RuntimeError("model not found")
+
+    monkeypatch.setitem(sys.modules, "faster_whisper", types.SimpleNamespace(WhisperModel=failing_model))
+
+    model = FasterWhisperSTTModel("missing")
+
+    with pytest.raises(LLMError, match="model not found"):
+        model.transcribe_pcm(b"\x00\x00" * 1600)
@@ -0,0 +1,172 @@
+from collections.abc import Generator
+from datetime import datetime
+import json
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pysqlite3 as sqlite3
+import pytest
+
+from src.lib.Database import set_connection_for_testing
+from src.lib.Event import ConversationEvent, GameEvent
+from src.lib.PromptGenerator import PromptGenerator
+from src.lib.SystemDatabase import SystemDatabase
+
+
+@pytest.fixture(autouse=True)
+def mock_connection(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[sqlite3.Connection, None, None]:
+    db_path = str(tmp_path / "test.db")
+    monkeypatch.setattr('src.lib.Database.get_db_path', lambda: db_path)
+    conn = sqlite3.connect(db_path)
+    set_connection_for_testing(conn)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def make_generator() -> PromptGenerator:
+    return PromptGenerator("Jameson", "", [], MagicMock())
+
+
+def test_event_template_dispatch() -> None:
+    generator = make_generator()
+    event = GameEvent(content={"event": "LoadGame", "GameMode": "Solo"}, historic=False)
+    assert generator.get_event_template(event) == "Jameson is logging into the game in Solo mode."
+    assert generator.get_event_template(GameEvent(content={"event": "Materials"}, historic=False)) is None
+    assert generator.get_event_template(GameEvent(content={"event": "Unknown", "Value": 1}, historic=False)) == "Event: Unknown\nValue: 1\nevent: Unknown\n"
+
+
+def test_event_template_memoized_per_event() -> None:
+    generator = make_generator()
+    calls: list[str] = []
+    render_load_game = generator.event_renderers["LoadGame"]
+    generator.event_renderers["LoadGame"] = lambda content, states: calls.append(content["event"]) or render_load_game(content, states)
+
+    event = GameEvent(content={"event": "LoadGame", "GameMode": "Open"}, historic=False)
+    first = generator.get_event_template(event)
+    assert generator.get_event_template(event) == first
+    assert len(calls) == 1
+
+    generator.get_event_template(GameEvent(content={"event": "LoadGame", "GameMode": "Open"}, historic=False))
+    assert len(calls) == 2
+
+
+def test_registered_event_renderer_is_not_memoized() -> None:
+    generator = make_generator()
+    event = GameEvent(content={"event": "LoadGame"}, historic=False)
+    generator.get_event_template(event)
+
+    counter = iter(range(10))
+    generator.register_event_renderer("LoadGame", lambda content, states: f"render {next(counter)}")
+    assert generator.get_event_template(event) == "render 0"
+    assert generator.get_event_template(event) == "render 1"
+
+
+def make_conversation(count: int, start: int = 0) -> list[ConversationEvent]:
+    return [
+        ConversationEvent(
+            kind="user" if index % 2 == 0 else "assistant",
+            content=f"message {index}",
+            timestamp=f"2026-01-01T12:{index // 60:02d}:{index % 60:02d}+00:00",
+            processed_at=float(index),
+        )
+        for index in range(start, start + count)
+    ]
+
+
+def test_cache_friendly_prompt_keeps_history_prefix_stable(monkeypatch: pytest.MonkeyPatch) -> None:
+    generator = PromptGenerator("Jameson", "", [], MagicMock(), cache_friendly_layout=True)
+    status = iter(range(100))
+    monkeypatch.setattr(generator, "generate_status_message", lambda states: f"# status {next(status)}")
+    events: list = make_conversation(30)
+
+    first_prompt, _ = generator.generate_prompt(events, {}, [], [])
+    events += make_conversation(2, start=30)
+    second_prompt, second_usage = generator.generate_prompt(events, {}, events[-2:], [])
+
+    assert first_prompt[0]["role"] == "system"
+    assert second_prompt[-1]["content"] == "# status 1"
+    assert second_prompt[:-1] == first_prompt[:-1] + second_prompt[-3:-1]
+    assert second_usage.cacheable_prefix_chars == len(json.dumps(first_prompt[:-1])) - 1
+    assert second_usage.reuse_chars >= second_usage.cacheable_prefix_chars
+
+    # the window only shrinks once it exceeds history_max_pieces
+    events += make_conversation(30, start=32)
+    third_prompt, _ = generator.generate_prompt(events, {}, [], [])
+    assert [piece["content"] for piece in third_prompt[1:-1]] == [f"message {index}" for index in range(37, 62)]
+
+
+def test_cache_friendly_prompt_uses_absolute_event_times(monkeypatch: pytest.MonkeyPatch) -> None:
+    generator = PromptGenerator("Jameson", "", [], MagicMock(), cache_friendly_layout=True)
+    monkeypatch.setattr(generator, "generate_status_message", lambda states: "# status")
+    event = GameEvent(content={"event": "LoadGame", "GameMode": "Solo", "timestamp": "2026-01-01T12:00:00+00:00"}, historic=False)
+    later = make_conversation(1, start=3000)
+
+    prompt, _ = generator.generate_prompt([event] + later, {}, [], [])
+
+    local_time = datetime.fromisoformat("2026-01-01T12:00:00+00:00").astimezone()
+    assert prompt[1]["content"] == f"[Game Event, 3312-{local_time.strftime('%m-%d %H:%M')}] Jameson is logging into the game in Solo mode."
+
+
+def test_status_sections_are_reused_until_their_projections_change() -> None:
+    system_db = MagicMock()
+    system_db.get_system_info.return_value = {"name": "Sol"}
+    system_db.get_stations.return_value = []
+    system_db.get_bodies.return_value = []
+    system_db.get_data_version.return_value = 0
+    generator = PromptGenerator("Jameson", "", [], system_db)
+    get_active_quest_entries = MagicMock(return_value=[])
+    generator._get_active_quest_entries = get_active_quest_entries
+    revisions = {"Location": 1, "Missions": 1}
+    generator.set_projection_revisions(lambda: dict(revisions))
+    projected_states: dict = {
+        "CurrentStatus": {"flags": {"InMainShip": True}, "flags2": {}, "GuiFocus": "NoFocus"},
+        "Location": {"StarSystem": "Sol"},
+        "Missions": {"Active": [{"Name": "Courier"}]},
+    }
+
+    first = generator.generate_status_message(projected_states)
+    second = generator.generate_status_message(projected_states)
+    assert second == first
+    assert system_db.get_system_info.call_count == 1
+    assert get_active_quest_entries.call_count == 2
+
+    projected_states["Missions"] = {"Active": [{"Name": "Smuggling"}]}
+    assert "Smuggling" not in generator.generate_status_message(projected_states)
+    revisions["Missions"] = 2
+    assert "Smuggling" in generator.generate_status_message(projected_states)
+    assert system_db.get_system_info.call_count == 1
+
+
+def test_location_section_is_rebuilt_when_the_system_data_changes() -> None:
+    system_db = SystemDatabase()
+    system_db.check_timer.cancel()
+    # fetched recently, so nothing is requested from EDSM or Spansh
+    system_db._upsert_system_fields("Sol", {
+        "system_info": {"name": "Sol", "primaryStar": {"type": "G (White-Yellow) Star"}},
+        "fetch_attempted": 1,
+        "last_updated": time.time(),
+    })
+    generator = PromptGenerator("Jameson", "", [], system_db)
+    generator._get_active_quest_entries = MagicMock(return_value=[])
+    generator.set_projection_revisions(lambda: {"Location": 1})
+    projected_states: dict = {
+        "CurrentStatus": {"flags": {"InMainShip": True}, "flags2": {}, "GuiFocus": "NoFocus"},
+        "Location": {"StarSystem": "Sol"},
+    }
+
+    assert "Total bodies" not in generator.generate_status_message(projected_states)
+
+    # a scan updates the system data without touching the Location projection
+    system_db.record_scan({
+        "event": "Scan",
+        "StarSystem": "Sol",
+        "SystemAddress": 10477373803,
+        "BodyID": 3,
+        "BodyName": "Earth",
+        "PlanetClass": "Earthlike body",
+        "ScanType": "Detailed",
+    })
+    assert "Total bodies: 1" in generator.generate_status_message(projected_states)
@@ -7,7 +7,7 @@ import io
 import queue
 from time import sleep
 import openai
-from src.lib.STT import STT, STTResult
+from src.lib.STT import STT, STTResult, StreamingTranscription, VoiceActivityBuffer
 
 def read_no_voice(x):
     """Return silence"""
@@ -132,7 +132,7 @@ def test_get_microphone_fallback(mock_pyaudio, stt):
 
 def test_continuous_listening(stt, mock_pyaudio: dict[str, MagicMock], mock_vad: MagicMock, mock_openai, monkeypatch):
     """Test continuous listening flow"""
-    monkeypatch.setattr('src.lib.STT.STT._transcribe', lambda self, audio: "Test transcription sdf")
+    monkeypatch.setattr('src.lib.STT.STT._transcribe', lambda self, audio, vad_scores=None: "Test transcription sdf")
     mock_pyaudio['stream'].read.side_effect = read_no_voice
     
     stt.listen_continuous()
@@ -164,7 +164,7 @@ def test_continuous_listening(stt, mock_pyaudio: dict[str, MagicMock], mock_vad:
 
 def test_push_to_talk(stt, mock_pyaudio, mock_openai, monkeypatch):
     """Test push-to-talk flow"""
-    monkeypatch.setattr('src.lib.STT.STT._transcribe', lambda self, audio: "Test transcription asd")
+    monkeypatch.setattr('src.lib.STT.STT._transcribe', lambda self, audio, vad_scores=None: "Test transcription asd")
     mock_pyaudio['stream'].read.side_effect = read_voice
     sleep(0.01)  # Simulate button press duration
     
@@ -197,6 +197,98 @@ def test_transcribe(stt, mock_openai, mock_vad):
     assert res == 'Test transcription via API'
 
 
+def test_transcribe_reuses_recorded_vad_scores(stt, mock_vad):
+    """Test VAD scores computed while recording skip the second VAD pass"""
+    import speech_recognition as sr
+
+    audio = sr.AudioData(b'\xff\xff' * 16000, 16000, pyaudio.get_sample_size(pyaudio.paInt16))
+    assert stt._transcribe(audio, [0.0, 0.0]) == ''
+    assert stt._transcribe(audio, [0.0, 0.9]) == 'Test transcription via API'
+    mock_vad.process_chunks.assert_not_called()
+
+
+def test_voice_activity_buffer_tracks_trailing_window():
+    """Test running voiced counts as chunks enter and leave the ring"""
+    silence = b'\x00\x00' * 4
+    phrase = VoiceActivityBuffer(chunk_samples=4, capacity=5, window=2, threshold=0.5)
+
+    phrase.append(silence, 0.0)
+    phrase.append(b'\x01\x00' * 4, 0.9)
+    assert (phrase.voiced_count, phrase.window_voiced_count) == (1, 1)
+
+    phrase.append(silence, 0.0)
+    phrase.append(silence, 0.0)
+    assert (phrase.voiced_count, phrase.window_voiced_count) == (1, 0)
+
+    phrase.append(silence, 0.1)
+    assert phrase.is_full()
+
+    # overflowing the ring drops the oldest chunks, including the voiced one
+    phrase.append(silence, 0.2)
+    phrase.append(silence, 0.3)
+    assert phrase.voiced_count == 0
+    assert phrase.get_scores() == pytest.approx([0.0, 0.0, 0.1, 0.2, 0.3])
+    assert phrase.get_audio() == silence * 5
+
+    phrase.keep_last(1)
+    assert phrase.get_scores() == pytest.approx([0.3])
+
+
+def test_streaming_transcription_publishes_partials_and_only_transcribes_the_rest():
+    """Test streaming mode fixes long segments and leaves only the open one for the end of the phrase"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    model = MagicMock()
+    model.transcribe_pcm.side_effect = lambda pcm: f"{len(pcm) // 2} samples"
+    partials: list[str] = []
+    phrase = VoiceActivityBuffer(chunk_samples=10, capacity=100, window=5, threshold=0.5)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        streaming = StreamingTranscription(model, executor, partials.append, chunk_duration=0.1, interval=0.5, segment_duration=3.0)
+        for index in range(40):
+            # a pause between words at chunk 27
+            phrase.append(b'\x01\x00' * 10, 0.1 if index == 27 else 0.9)
+            streaming.update(phrase)
+            if streaming.partial is not None:
+                streaming.partial.result()
+        streaming.finish(phrase)
+
+        assert streaming.get_text() == "280 samples 120 samples"
+
+    assert partials[0] == "50 samples"
+    assert partials[-1].startswith("280 samples ")
+    # the committed segment is transcribed once, not again when the phrase ends
+    transcribed = [call.args[0] for call in model.transcribe_pcm.call_args_list]
+    assert sum(len(pcm) == 560 for pcm in transcribed) == 1
+
+
+def test_streaming_transcription_drops_partials_that_finish_after_the_phrase():
+    """Test a partial still being transcribed when the phrase ends is not published"""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    started = threading.Event()
+    release = threading.Event()
+    def transcribe(pcm):
+        started.set()
+        release.wait(5)
+        return "partial"
+    model = MagicMock()
+    model.transcribe_pcm.side_effect = transcribe
+    partials: list[str] = []
+    phrase = VoiceActivityBuffer(chunk_samples=10, capacity=100, window=5, threshold=0.5)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        streaming = StreamingTranscription(model, executor, partials.append, chunk_duration=0.1, interval=0.5, segment_duration=3.0)
+        for _ in range(6):
+            phrase.append(b'\x01\x00' * 10, 0.9)
+            streaming.update(phrase)
+        assert started.wait(5)
+        streaming.finish(phrase)
+        release.set()
+        assert streaming.get_text() == "partial"
+
+    assert partials == []
+
+
 def test_read_stream_buffer_disables_overflow_exceptions(stt):
     source = MagicMock()
     source.read.return_value = b'audio'
@@ -0,0 +1,113 @@
+import json
+from collections.abc import Generator
+from pathlib import Path
+
+import pysqlite3 as sqlite3
+import pytest
+
+from src.lib.ActionManager import ActionManager
+from src.lib.Database import set_connection_for_testing
+from src.lib.Models import EmbeddingModel
+from src.lib.SemanticActionCache import SemanticActionCache
+
+VOCABULARY = ["landing", "gear", "deploy", "lower", "retract", "raise", "fire", "weapons", "please", "the"]
+
+
+class BagOfWordsEmbeddingModel(EmbeddingModel):
+    def __init__(self):
+        super().__init__("bag-of-words")
+        self.calls: list[str] = []
+
+    def create_embedding(self, input_text: str) -> tuple[str, list[float]]:
+        self.calls.append(input_text)
+        words = input_text.lower().replace("!", "").split()
+        return self.model_name, [float(words.count(word)) for word in VOCABULARY]
+
+
+@pytest.fixture(autouse=True)
+def mock_connection(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[sqlite3.Connection, None, None]:
+    db_path = str(tmp_path / "test.db")
+    monkeypatch.setattr('src.lib.Database.get_db_path', lambda: db_path)
+    conn = sqlite3.connect(db_path)
+    set_connection_for_testing(conn)
+    original_actions = ActionManager.actions
+    ActionManager.actions = {}
+    try:
+        yield conn
+    finally:
+        ActionManager.actions = original_actions
+        conn.close()
+
+
+def test_find_returns_similar_inputs_and_embeds_each_input_once() -> None:
+    model = BagOfWordsEmbeddingModel()
+    cache = SemanticActionCache(model, threshold=0.8)
+    cache.sync({"deploylandinggear": "deploy landing gear", "fireweapons": "fire weapons"})
+
+    matches = cache.find("deploy the landing gear please")
+    assert [cleaned_input for cleaned_input, _ in matches] == []
+    matches = cache.find("deploy landing gear please")
+    assert [cleaned_input for cleaned_input, _ in matches] == ["deploylandinggear"]
+
+    # embeddings are stored, a new index doesn't request them again
+    model.calls.clear()
+    SemanticActionCache(model, threshold=0.8).sync({"deploylandinggear": "deploy landing gear"})
+    assert model.calls == []
+
+
+def test_predict_action_reuses_cached_action_for_rephrased_input() -> None:
+    manager = ActionManager()
+    manager.registerAction(
+        "landingGear", "Toggle landing gear", {"type": "object"}, lambda args, states: "ok",
+        cache_prefill={"deploy landing gear": {}},
+    )
+    tools = [action["tool"] for action in manager.actions.values()]
+    semantic_cache = SemanticActionCache(BagOfWordsEmbeddingModel(), threshold=0.8)
+    manager.set_semantic_cache(semantic_cache)
+    semantic_cache.sync({"deploylandinggear": "deploy landing gear"})
+
+    prediction = manager.predict_action("deploy landing gear please", tools)
+    assert prediction is not None
+    assert prediction[0].function.name == "landingGear"
+    assert manager.predict_action("fire weapons", tools) is None
+
+
+def test_predict_action_skips_ambiguous_semantic_matches() -> None:
+    manager = ActionManager()
+    manager.registerAction(
+        "deployLandingGear", "Deploy landing gear", {"type": "object"}, lambda args, states: "ok",
+        cache_prefill={"lower landing gear": {}},
+    )
+    manager.registerAction(
+        "retractLandingGear", "Retract landing gear", {"type": "object"}, lambda args, states: "ok",
+        cache_prefill={"raise landing gear": {}},
+    )
+    tools = [action["tool"] for action in manager.actions.values()]
+    semantic_cache = SemanticActionCache(BagOfWordsEmbeddingModel(), threshold=0.5)
+    manager.set_semantic_cache(semantic_cache)
+    semantic_cache.sync({"lowerlandinggear": "lower landing gear", "raiselandinggear": "raise landing gear"})
+
+    assert manager.predict_action("landing gear please", tools) is None
+    prediction = manager.predict_action("lower the landing gear", tools)
+    assert prediction is not None
+    assert prediction[0].function.name == "deployLandingGear"
+
+
+def test_predict_action_does_not_reuse_arguments_of_similar_inputs() -> None:
+    manager = ActionManager()
+    manager.registerAction(
+        "landingGear", "Set landing gear", {"type": "object"}, lambda args, states: "ok",
+        cache_prefill={"lower landing gear": {"down": True}},
+    )
+    tools = [action["tool"] for action in manager.actions.values()]
+    semantic_cache = SemanticActionCache(BagOfWordsEmbeddingModel(), threshold=0.5)
+    manager.set_semantic_cache(semantic_cache)
+    semantic_cache.sync({"lowerlandinggear": "lower landing gear"})
+
+    # similar enough, but it could ask for other arguments than the cached input
+    assert manager.predict_action("raise landing gear", tools) is None
+    assert manager.predict_action("lower the landing gear", tools) is None
+    # the exact input still hits the cache
+    prediction = manager.predict_action("lower landing gear", tools)
+    assert prediction is not None
+    assert json.loads(prediction[0].function.arguments) == {"down": True}
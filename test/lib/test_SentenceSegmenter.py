@@ -0,0 +1,36 @@
+from src.lib.SentenceSegmenter import SentenceSegmenter
+
+
+def segment(text: str, step: int = 3, **kwargs) -> list[str]:
+    segmenter = SentenceSegmenter(**kwargs)
+    segments: list[str] = []
+    for i in range(0, len(text), step):
+        segments += segmenter.feed(text[i:i + step])
+    remainder = segmenter.flush()
+    return segments + ([remainder] if remainder else [])
+
+
+def test_splits_streamed_text_into_sentences() -> None:
+    text = "Sure thing, Cmdr. Jameson. The jump to Sol is 3.5 light years away! Shall I plot it? Okay.\nDone"
+    assert segment(text) == [
+        "Sure thing, Cmdr. Jameson.",
+        "The jump to Sol is 3.5 light years away!",
+        "Shall I plot it? Okay.",
+        "Done",
+    ]
+
+
+def test_emits_sentence_as_soon_as_it_is_complete() -> None:
+    segmenter = SentenceSegmenter()
+    assert segmenter.feed("Landing gear is deployed.") == []
+    assert segmenter.feed(" Docking") == ["Landing gear is deployed."]
+    assert segmenter.flush() == "Docking"
+    assert segmenter.flush() is None
+
+
+def test_splits_long_sentences_at_clauses() -> None:
+    text = "First clause that runs on for quite a while, second clause that keeps going, third clause without end"
+    assert segment(text, max_length=60) == [
+        "First clause that runs on for quite a while,",
+        "second clause that keeps going, third clause without end",
+    ]
@@ -52,3 +52,48 @@ def test_statusparser_file_update(status_file_path):
 
     landinggear_event = parser.status_queue.get(timeout=10)
     assert landinggear_event["event"] == "LandingGearDown"
+
+def test_statusparser_skips_unchanged_file(status_file_path):
+    parser = StatusParser(str(status_file_path))
+    time.sleep(0.1)  # Let the watch thread read the file
+    file_path = os.path.join(status_file_path, "Status.json")
+
+    assert parser._read_status_file_if_changed() is None
+
+    # rewriting identical content is detected by comparing the content
+    with open(file_path, "rb") as f:
+        content = f.read()
+    with open(file_path, "wb") as f:
+        f.write(content)
+    assert parser._read_status_file_if_changed() is None
+    assert parser.status_queue.empty()
+
+def test_statusparser_retries_partial_write(status_file_path):
+    parser = StatusParser(str(status_file_path))
+    time.sleep(0.1)  # Let the watch thread start
+    file_path = os.path.join(status_file_path, "Status.json")
+
+    with open(file_path, "w") as f:
+        f.write('{"Flags": 16777220, "Gui')
+    with pytest.raises(json.JSONDecodeError):
+        parser._read_status_file_if_changed()
+
+    time.sleep(0.1)
+    with open(file_path, "w") as f:
+        f.write('{"Flags": 16777220, "GuiFocus": 1}')
+
+    status_event = parser.status_queue.get(timeout=1)
+    assert status_event["event"] == "Status"
+    assert status_event["flags"]["LandingGearDown"] == True
+
+def test_statusparser_detects_changes_quickly(status_file_path):
+    parser = StatusParser(str(status_file_path))
+    time.sleep(0.1)  # Let the watch thread start
+
+    start = time.monotonic()
+    with open(os.path.join(status_file_path, "Status.json"), "w") as f:
+        json.dump({"Flags": 16777220, "GuiFocus": 1}, f)
+
+    status_event = parser.status_queue.get(timeout=1)
+    assert status_event["flags"]["LandingGearDown"] == True
+    assert time.monotonic() - start < 0.5
@@ -2,10 +2,12 @@ import base64
 from math import ceil
 from httpx import Response
 import pytest
+import threading
 from unittest.mock import MagicMock
 from time import sleep
 from src.lib.Config import map_character_tts_postprocessing
 from src.lib.TTS import TTS
+from src.lib.TTSCache import TTSCache
 from src.lib.Models import OpenAITTSModel, EdgeTTSModel
 from src.plugins.MistralPlugin import MistralTTSModel
 import numpy as np
@@ -247,6 +249,135 @@ def test_tts_dropped_line_completes_without_speaking(mock_pyaudio):
     assert mock_model.synthesize.call_count == 0
 
 
+def test_tts_synthesizes_next_line_while_current_plays(mock_pyaudio):
+    release = threading.Event()
+    mock_pyaudio['stream'].write.side_effect = lambda *args, **kwargs: release.wait(5)
+    synthesized: list[str] = []
+    mock_model = MagicMock(spec=OpenAITTSModel)
+    mock_model.synthesize.side_effect = lambda text, voice: synthesized.append(text) or [b'\x00\x00' * 1024]
+
+    tts = TTS(mock_model, voice="nova", speed=1.0)
+    first = tts.say("First line")
+    second = tts.say("Second line")
+
+    assert first.wait_for_speaking() is True
+    for _ in range(50):
+        if len(synthesized) == 2:
+            break
+        sleep(0.1)
+
+    assert synthesized == ["First line", "Second line"]
+    assert not second.is_speaking()
+    release.set()
+    second.wait_for_completion()
+    assert second.is_completed()
+
+
+def test_tts_abort_discards_prepared_lines(mock_pyaudio):
+    release = threading.Event()
+    mock_pyaudio['stream'].write.side_effect = lambda *args, **kwargs: release.wait(5)
+    mock_model = MagicMock(spec=OpenAITTSModel)
+    mock_model.synthesize.return_value = [b'\x00\x00' * 1024]
+
+    tts = TTS(mock_model, voice="nova", speed=1.0)
+    lines = [tts.say(f"Line {index}") for index in range(4)]
+    assert lines[0].wait_for_speaking() is True
+
+    tts.abort()
+    release.set()
+
+    for line in lines[1:]:
+        assert line.wait_for_speaking() is False
+    assert not tts.has_queued_items()
+
+
+def test_tts_abort_while_synthesis_waits_for_a_full_queue(mock_pyaudio):
+    release = threading.Event()
+    mock_pyaudio['stream'].write.side_effect = lambda *args, **kwargs: release.wait(5)
+    mock_model = MagicMock(spec=OpenAITTSModel)
+    mock_model.synthesize.return_value = [b'\x00\x00' * 1024]
+
+    tts = TTS(mock_model, voice="nova", speed=1.0, lookahead=1)
+    playing = tts.say("Playing line")
+    assert playing.wait_for_speaking() is True
+    waiting = tts.say("Waiting line")
+    # without drop_if, like action descriptions
+    blocked = tts.say("Blocked line")
+    for _ in range(50):
+        if tts._preparing is not None and tts._preparing.item.get("text") == "Blocked line":
+            break
+        sleep(0.05)
+
+    # the drained queue lets the blocked put through after the drain loop ended, but before the line is cancelled
+    original_get_nowait = tts.prepared_queue.get_nowait
+    original_empty = tts.prepared_queue.empty
+    drained = threading.Event()
+    def get_nowait_and_wait_for_put():
+        prepared = original_get_nowait()
+        for _ in range(50):
+            if tts.prepared_queue.full():
+                break
+            sleep(0.01)
+        drained.set()
+        return prepared
+    tts.prepared_queue.get_nowait = get_nowait_and_wait_for_put
+    tts.prepared_queue.empty = lambda: drained.is_set() or original_empty()
+    tts.abort()
+    tts.prepared_queue.get_nowait = original_get_nowait
+    tts.prepared_queue.empty = original_empty
+    release.set()
+
+    assert waiting.wait_for_speaking() is False
+    assert blocked.wait_for_speaking() is False
+    blocked.wait_for_completion()
+    assert blocked.is_completed()
+    for _ in range(50):
+        if not tts.has_queued_items():
+            break
+        sleep(0.05)
+    assert tts._queued_items == 0
+
+    # playback keeps working after the abort
+    tts.say("Next line").wait_for_completion()
+    assert tts._queued_items == 0
+
+
+def test_tts_drops_a_line_that_fails_to_play_and_keeps_the_order(mock_pyaudio):
+    chunks = {"First line": b'\x01\x00' * 1024, "Second line": b'\x02\x00' * 1024, "Third line": b'\x03\x00' * 1024}
+    mock_model = MagicMock(spec=OpenAITTSModel)
+    mock_model.synthesize.side_effect = lambda text, voice: [chunks[text]]
+    written: list[bytes] = []
+    def write(data, **kwargs):
+        if data == chunks["First line"]:
+            raise RuntimeError("device lost")
+        written.append(bytes(data))
+    mock_pyaudio['stream'].write.side_effect = write
+
+    tts = TTS(mock_model, voice="nova", speed=1.0)
+    lines = [tts.say(text) for text in chunks]
+    for line in lines:
+        line.wait_for_completion()
+
+    assert all(line.is_completed() for line in lines)
+    # the failed line is neither retried nor played after the lines behind it
+    assert written == [chunks["Second line"], chunks["Third line"]]
+
+
+def test_tts_plays_repeated_lines_from_cache(mock_pyaudio, tmp_path):
+    mock_model = MagicMock(spec=OpenAITTSModel)
+    mock_model.cacheable = True
+    mock_model.cache_key_parts.return_value = {"provider": "openai", "model": "tts-test", "voice": "nova"}
+    mock_model.synthesize.return_value = [b'\x01\x00' * 1024, b'\x02\x00' * 512]
+
+    tts = TTS(mock_model, voice="nova", speed=1.0, cache=TTSCache(str(tmp_path)))
+    tts.say("Deploying landing gear").wait_for_completion()
+    tts.say("Deploying landing gear").wait_for_completion()
+
+    assert mock_model.synthesize.call_count == 1
+    written = b"".join(call.args[0] for call in mock_pyaudio['stream'].write.call_args_list)
+    assert written == (b'\x01\x00' * 1024 + b'\x02\x00' * 512) * 2
+
+
 def test_postprocess_audio_applies_volume_and_distortion(mock_pyaudio):
     """Test TTS postprocessing reshapes synthesized audio"""
     tts = TTS(
@@ -0,0 +1,86 @@
+import os
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from lib.Models import EdgeTTSModel, OpenAITTSModel, TTSModel
+from lib.TTSCache import TTSCache
+from plugins.MistralPlugin import MistralTTSModel
+
+
+def make_model(speed: float = 1.0, voice_instructions: str | None = None) -> OpenAITTSModel:
+    return OpenAITTSModel(
+        base_url="https://api.openai.com/v1",
+        api_key="test",
+        model_name="tts-test",
+        speed=speed,
+        voice_instructions=voice_instructions,
+        provider_name="openai",
+    )
+
+
+class UnknownTTSModel(TTSModel):
+    def synthesize(self, text: str, voice: str):
+        return []
+
+
+def test_key_depends_on_everything_that_changes_the_audio(tmp_path: Path) -> None:
+    cache = TTSCache(str(tmp_path))
+    model = make_model()
+    key = cache.make_key(model, "nova", "Deploying  landing gear")
+
+    assert key == cache.make_key(model, "nova", "Deploying landing gear ")
+    assert key != cache.make_key(model, "onyx", "Deploying landing gear")
+    assert key != cache.make_key(make_model(speed=1.2), "nova", "Deploying landing gear")
+    assert key != cache.make_key(make_model(voice_instructions="Whisper"), "nova", "Deploying landing gear")
+    assert key != cache.make_key(EdgeTTSModel("edge-tts", provider_name="edge-tts"), "nova", "Deploying landing gear")
+    assert cache.make_key(None, "nova", "Deploying landing gear") is None
+
+
+def test_key_uses_the_voice_the_model_speaks_with(tmp_path: Path) -> None:
+    cache = TTSCache(str(tmp_path))
+    model = MistralTTSModel(base_url="https://api.mistral.ai/v1", api_key="test", model_name="voxtral", default_voice="alloy")
+    other_voice = MistralTTSModel(base_url="https://api.mistral.ai/v1", api_key="test", model_name="voxtral", default_voice="echo")
+
+    # the requested voice is ignored by the model, so it must not split the cache, the configured one must
+    assert cache.make_key(model, "nova", "Deploying landing gear") == cache.make_key(model, "onyx", "Deploying landing gear")
+    assert cache.make_key(model, "nova", "Deploying landing gear") != cache.make_key(other_voice, "nova", "Deploying landing gear")
+
+
+def test_models_without_cache_key_parts_are_not_cached(tmp_path: Path) -> None:
+    cache = TTSCache(str(tmp_path))
+    model = make_model()
+    model.cacheable = False
+
+    assert cache.make_key(model, "nova", "Deploying landing gear") is None
+    assert cache.make_key(UnknownTTSModel("custom"), "nova", "Deploying landing gear") is None
+
+
+def test_round_trip_survives_restart(tmp_path: Path) -> None:
+    pcm = bytes(range(256)) * 40
+    cache = TTSCache(str(tmp_path))
+    cache.put("abc", pcm)
+
+    assert cache.get("abc") == pcm
+    assert cache.get("missing") is None
+    assert TTSCache(str(tmp_path)).get("abc") == pcm
+    assert TTSCache(str(tmp_path), compress=False).get("abc") == pcm
+
+
+def test_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    cache = TTSCache(str(tmp_path), max_bytes=2500, compress=False)
+    cache.put("first", b"\x01" * 1000)
+    cache.put("second", b"\x02" * 1000)
+    os.utime(tmp_path / "first.pcm", (0, 0))
+    cache = TTSCache(str(tmp_path), max_bytes=2500, compress=False)
+    assert cache.get("first") is not None
+
+    cache.put("third", b"\x03" * 1000)
+
+    assert cache.contains("first")
+    assert not cache.contains("second")
+    assert not (tmp_path / "second.pcm").exists()
+    assert cache.get_size() == 2000
@@ -0,0 +1,22 @@
+from src.lib.UI import make_json_patch
+
+
+def test_make_json_patch_identical() -> None:
+    assert make_json_patch({"a": [1, 2]}, {"a": [1, 2]}) == []
+
+
+def test_make_json_patch_nested_changes() -> None:
+    old = {"Cargo": {"Inventory": [{"Name": "gold", "Count": 1}], "Capacity": 8}, "Removed": True}
+    new = {"Cargo": {"Inventory": [{"Name": "gold", "Count": 3}], "Capacity": 8}, "Added/Key": 1}
+    assert make_json_patch(old, new) == [
+        {"op": "replace", "path": "/Cargo/Inventory/0/Count", "value": 3},
+        {"op": "remove", "path": "/Removed"},
+        {"op": "add", "path": "/Added~1Key", "value": 1},
+    ]
+
+
+def test_make_json_patch_replaces_resized_lists() -> None:
+    assert make_json_patch({"items": [1]}, {"items": [1, 2]}) == [
+        {"op": "replace", "path": "/items", "value": [1, 2]},
+    ]
+    assert make_json_patch(1, 2) == [{"op": "replace", "path": "", "value": 2}]
@@ -12,13 +12,14 @@ import { Subscription } from "rxjs";
   templateUrl: "./chat-container.component.html",
   styleUrl: "./chat-container.component.css",
   host: {
-    "[style.display]": "chat.length ? null : 'none'",
+    "[style.display]": "chat.length || partialTranscript ? null : 'none'",
   },
 })
 export class ChatContainerComponent implements AfterViewChecked, OnChanges, OnDestroy {
   @Input() limit?: number;
 
   chat: ChatMessage[] = [];
+  partialTranscript = "";
   private fullChat: ChatMessage[] = [];
   private readonly filteredEventNames = new Set([
     "materials",
@@ -45,6 +46,7 @@ export class ChatContainerComponent implements AfterViewChecked, OnChanges, OnDe
   private shouldScroll: boolean = false;
   private currentCharacter: Character | null = null;
   private characterSubscription?: Subscription;
+  private partialTranscriptSubscription?: Subscription;
 
   private element!: ElementRef<HTMLElement>;
 
@@ -65,6 +67,13 @@ export class ChatContainerComponent implements AfterViewChecked, OnChanges, OnDe
       }
     });
     
+    this.partialTranscriptSubscription = this.chatService.partialTranscript$.subscribe((text) => {
+      if (text && !this.partialTranscript) {
+        this.shouldScroll = true;
+      }
+      this.partialTranscript = text;
+    });
+
     // Subscribe to character changes
     this.characterSubscription = this.characterService.character$.subscribe((character) => {
       this.currentCharacter = character;
@@ -73,6 +82,7 @@ export class ChatContainerComponent implements AfterViewChecked, OnChanges, OnDe
 
   ngOnDestroy(): void {
     this.characterSubscription?.unsubscribe();
+    this.partialTranscriptSubscription?.unsubscribe();
   }
 
   ngOnChanges(changes: SimpleChanges): void {
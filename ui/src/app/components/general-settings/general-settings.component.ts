@@ -374,6 +374,8 @@ export class GeneralSettingsComponent implements OnDestroy {
                 return "Edge TTS";
             case "local-ai-server":
                 return "Local AIServer";
+            case "local-whisper":
+                return "Local Whisper";
             case "custom":
                 return "Custom";
             case "custom-multi-modal":
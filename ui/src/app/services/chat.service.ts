@@ -39,6 +39,11 @@ export interface EventMessage extends BaseMessage {
     event: ToolEvent | ToolProcessingEvent;
 }
 
+export interface SttPartialMessage extends BaseMessage {
+    type: 'stt_partial';
+    text: string;
+}
+
 @Injectable({
     providedIn: "root",
 })
@@ -52,6 +57,10 @@ export class ChatService {
     private searchResultSubject = new BehaviorSubject<any | null>(null);
     public searchResult$ = this.searchResultSubject.asObservable();
 
+    // what the commander is saying while they are still speaking, empty once the phrase is transcribed
+    private partialTranscriptSubject = new BehaviorSubject<string>("");
+    public partialTranscript$ = this.partialTranscriptSubject.asObservable();
+
     private readonly activeToolActionMessages = new Map<string, ChatMessage>();
     private readonly completedSyntheticActionMessages = new Set<string>();
 
@@ -66,12 +75,23 @@ export class ChatService {
                 if (this.shouldSuppressCompletedSyntheticAction(chatMessage)) {
                     return;
                 }
+                if (chatMessage.role === "cmdr") {
+                    this.partialTranscriptSubject.next("");
+                }
                 this.chatMessageSubject.next(chatMessage);
                 const currentLogs = this.chatHistorySubject.getValue();
                 this.chatHistorySubject.next([...currentLogs, chatMessage]);
             }
         });
 
+        this.tauriService.output$.pipe(
+            filter((message): message is SttPartialMessage =>
+                message.type === "stt_partial"
+            ),
+        ).subscribe((partialMessage) => {
+            this.partialTranscriptSubject.next(partialMessage.text ?? "");
+        });
+
         this.tauriService.output$.pipe(
             filter((message): message is EventMessage =>
                 message.type === "event" && ["tool", "tool_processing"].includes((message as any).event?.kind)
@@ -95,6 +115,7 @@ export class ChatService {
 
     public clearChat(): void {
         this.chatHistorySubject.next([]);
+        this.partialTranscriptSubject.next("");
         this.activeToolActionMessages.clear();
         this.completedSyntheticActionMessages.clear();
     }
@@ -113,6 +113,7 @@ export interface Config {
         | "google-ai-studio"
         | "none"
         | "local-ai-server"
+        | "local-whisper"
         | string;
     stt_model_name: string;
     stt_api_key: string;
@@ -130,6 +131,7 @@ export interface Config {
     embedding_api_key: string;
     embedding_endpoint: string;
     tools_var: boolean;
+    cache_friendly_prompt_var: boolean;
     vision_var: boolean;
     ptt_var: "voice_activation" | "push_to_talk" | "push_to_mute" | "toggle";
     ptt_inverted_var: boolean;
@@ -138,6 +140,8 @@ export interface Config {
     web_search_actions_var: boolean;
     ui_actions_var: boolean;
     use_action_cache_var: boolean;
+    use_semantic_action_cache_var: boolean;
+    semantic_action_cache_threshold: number;
     allowed_actions: Record<string, boolean>;
     discovery_primary_var: boolean;
     discovery_firegroup_var: number;
@@ -1,6 +1,7 @@
 import { Injectable } from "@angular/core";
 import { BehaviorSubject } from "rxjs";
 import { BaseMessage, TauriService } from "./tauri.service";
+import { applyJsonPatch, JsonPatchOperation } from "./json-patch";
 
 /**
  * Message interface for GenUI code updates from backend
@@ -18,6 +19,14 @@ interface StatesMessage extends BaseMessage {
     states: Record<string, any>;
 }
 
+/**
+ * Message interface for incremental state updates from backend
+ */
+interface StatesPatchMessage extends BaseMessage {
+    type: "states_patch";
+    patches: Record<string, JsonPatchOperation[]>;
+}
+
 /**
  * GenUiService - Manages the LLM-generated UI code and game state
  * 
@@ -56,6 +65,14 @@ export class GenUiService {
                 // Transform projected states to the format expected by UI components
                 const state = this.transformState(statesMessage.states);
                 this.setUiState(state);
+            } else if (message.type === 'states_patch') {
+                const patchMessage = message as StatesPatchMessage;
+                const currentState = this.getCurrentState() ?? {};
+                const patchedStates: Record<string, any> = {};
+                Object.entries(patchMessage.patches).forEach(([key, patch]) => {
+                    patchedStates[key] = applyJsonPatch(currentState[key], patch);
+                });
+                this.setUiState(this.transformState(patchedStates));
             }
         });
     }
@@ -0,0 +1,46 @@
+/**
+ * A single JSON patch (RFC 6902) operation as emitted by the backend in "states_patch" messages.
+ */
+export interface JsonPatchOperation {
+    op: "add" | "remove" | "replace";
+    path: string;
+    value?: any;
+}
+
+function unescapePointerSegment(segment: string): string {
+    return segment.replace(/~1/g, "/").replace(/~0/g, "~");
+}
+
+/**
+ * Applies the patch without mutating `document`. Only the containers along the patched paths are copied,
+ * so unchanged parts of the state keep their identity.
+ */
+export function applyJsonPatch(document: any, operations: JsonPatchOperation[]): any {
+    let result = document;
+    for (const operation of operations) {
+        if (operation.path === "") {
+            result = operation.value;
+            continue;
+        }
+        const segments = operation.path.split("/").slice(1).map(unescapePointerSegment);
+        const root = Array.isArray(result) ? [...result] : { ...result };
+        let container: any = root;
+        for (const segment of segments.slice(0, -1)) {
+            const child = container[segment];
+            container[segment] = Array.isArray(child) ? [...child] : { ...child };
+            container = container[segment];
+        }
+        const last = segments[segments.length - 1];
+        if (operation.op === "remove") {
+            if (Array.isArray(container)) {
+                container.splice(Number(last), 1);
+            } else {
+                delete container[last];
+            }
+        } else {
+            container[last] = operation.value;
+        }
+        result = root;
+    }
+    return result;
+}
@@ -41,6 +41,7 @@ export interface PromptUsageBreakdown {
     webSearchChars: number;
     genuiChars: number;
     reuseChars: number;
+    cacheablePrefixChars: number;
     totalChars: number;
 }
 
@@ -306,6 +307,7 @@ export class ModelUsageService implements OnDestroy {
             webSearchChars: this.toNumber(promptUsage["web_search_chars"]),
             genuiChars: this.toNumber(promptUsage["genui_chars"]),
             reuseChars: this.toNumber(promptUsage["reuse_chars"]),
+            cacheablePrefixChars: this.toNumber(promptUsage["cacheable_prefix_chars"]),
             totalChars: 0,
         };
         normalizedPromptUsage.totalChars = this.toNumber(
@@ -1,12 +1,18 @@
 import { Injectable } from "@angular/core";
 import { BehaviorSubject, Observable, filter, map } from "rxjs";
 import { BaseMessage, TauriService } from "./tauri.service";
+import { applyJsonPatch, JsonPatchOperation } from "./json-patch";
 
 export interface StatesMessage extends BaseMessage {
     type: "states";
     states: Record<string, any>;
 }
 
+export interface StatesPatchMessage extends BaseMessage {
+    type: "states_patch";
+    patches: Record<string, JsonPatchOperation[]>;
+}
+
 @Injectable({
     providedIn: "root",
 })
@@ -129,17 +135,33 @@ export class ProjectionsService {
         this.tauriService.output$.pipe(
             filter((message): message is StatesMessage => message.type === "states")
         ).subscribe((message) => {
-            const currentState = this.projectionsSubject.getValue()
-            const newState = {...currentState, ...message.states};
-            this.projectionsSubject.next(newState);
-
-            // Update individual projection subjects
-            Object.entries(message.states).forEach(([key, value]) => {
-                const subject = this.projectionSubjects[key];
-                if (subject) {
-                    subject.next(value);
-                }
+            this.updateProjections(message.states);
+        });
+
+        // Changed projections are sent as JSON patches against the previously sent state
+        this.tauriService.output$.pipe(
+            filter((message): message is StatesPatchMessage => message.type === "states_patch")
+        ).subscribe((message) => {
+            const currentState = this.projectionsSubject.getValue();
+            const patchedStates: Record<string, any> = {};
+            Object.entries(message.patches).forEach(([key, patch]) => {
+                patchedStates[key] = applyJsonPatch(currentState[key], patch);
             });
+            this.updateProjections(patchedStates);
+        });
+    }
+
+    private updateProjections(states: Record<string, any>) {
+        const currentState = this.projectionsSubject.getValue()
+        const newState = {...currentState, ...states};
+        this.projectionsSubject.next(newState);
+
+        // Update individual projection subjects
+        Object.entries(states).forEach(([key, value]) => {
+            const subject = this.projectionSubjects[key];
+            if (subject) {
+                subject.next(value);
+            }
         });
     }
 